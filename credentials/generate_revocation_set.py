@@ -22,20 +22,32 @@
 #     python ./credentials/generate-revocation-set.py --help
 
 import base64
+import concurrent.futures
 import dataclasses
+import datetime
+import functools
+import hashlib
+import http.server
+import io
 import json
 import logging
 import os
+import random
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from enum import Enum
+from unittest import mock
 
 import click
 import requests
 from click_option_group import AllOptionGroup, RequiredMutuallyExclusiveOptionGroup, optgroup
 from cryptography import x509
-from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.x509.extensions import ExtensionNotFound
 from cryptography.x509.oid import NameOID
@@ -245,6 +257,18 @@ def validate_vid_pid(revocation_point: RevocationPoint, crl_signer_certificate:
     return True
 
 
+def format_serial_number(serial_number: int) -> str:
+    '''
+    Format a serial number as in the revocation set.
+    '''
+    # Ensure the serial number is always a 2-byte aligned hex string.
+    # TestDACRevocationDelegateImpl encodes the serial number as an even-length hex string
+    # using BytesToHex in src/lib/support/BytesToHex.cpp.
+    # As the primary consumer of this data, we should use the same here.
+    serialnumber = '{:02X}'.format(serial_number)
+    return serialnumber if len(serialnumber) % 2 == 0 else '0' + serialnumber
+
+
 def generate_revocation_set_from_crl(crl_file: x509.CertificateRevocationList,
                                      crl_signer_certificate: x509.Certificate,
                                      certificate_authority_name: x509.Name,
@@ -282,13 +306,7 @@ def generate_revocation_set_from_crl(crl_file: x509.CertificateRevocationList,
         except Exception:
             pass
 
-        # Ensure the serial number is always a 2-byte aligned hex string.
-        # TestDACRevocationDelegateImpl encodes the serial number as an even-length hex string
-        # using BytesToHex in src/lib/support/BytesToHex.cpp.
-        # As the primary consumer of this data, we should use the same here.
-        serialnumber = '{:02X}'.format(revoked_cert.serial_number)
-        serialnumber = serialnumber if len(serialnumber) % 2 == 0 else '0' + serialnumber
-        serialnumber_list.append(serialnumber)
+        serialnumber_list.append(format_serial_number(revoked_cert.serial_number))
 
     entry = RevocationSet(
         type='revocation_set',
@@ -360,11 +378,192 @@ def fetch_crl_from_url(url: str, timeout: int) -> x509.CertificateRevocationList
         log.error("Failed to fetch a valid CRL: %s", e)
 
 
+def write_file_atomically(path: str, data: bytes):
+    '''
+    Write data to the file at path, through a temporary file renamed over it, so that concurrent runs never read a
+    partially written file.
+    '''
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class CrlCache:
+    '''
+    On-disk cache of the CRLs fetched from revocation point URLs, keyed by URL.
+
+    A cached CRL is revalidated with a conditional request (ETag / Last-Modified), so that a CRL which did not change
+    is not downloaded again. A downloaded CRL with an older thisUpdate than the cached one is ignored.
+    Safe to use from several threads.
+    '''
+
+    def __init__(self, directory: str):
+        '''
+        Initialize the cache.
+
+        Parameters
+        ----------
+        directory: str
+            Directory holding the cached CRLs, created if missing.
+        '''
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.crls: dict[str, x509.CertificateRevocationList] = {}
+        self.downloads = 0
+        self.revalidations = 0
+
+    def get_paths(self, url: str) -> tuple[str, str]:
+        '''
+        Get the paths of the CRL file and of its metadata file for the given URL.
+        '''
+        name = os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest())
+        return name + '.der', name + '.json'
+
+    def load(self, url: str) -> tuple[bytes | None, dict]:
+        '''
+        Load the cached CRL and its metadata (url, etag, last_modified) for the given URL.
+        '''
+        crl_path, metadata_path = self.get_paths(url)
+        try:
+            with open(crl_path, 'rb') as f:
+                crl_der = f.read()
+            with open(metadata_path) as f:
+                return crl_der, json.load(f)
+        except (OSError, ValueError):
+            return None, {}
+
+    def store(self, url: str, crl_der: bytes, etag: str | None, last_modified: str | None):
+        '''
+        Store a downloaded CRL and its metadata for the given URL.
+        '''
+        crl_path, metadata_path = self.get_paths(url)
+        write_file_atomically(crl_path, crl_der)
+        write_file_atomically(metadata_path,
+                              json.dumps({'url': url, 'etag': etag, 'last_modified': last_modified}).encode('utf-8'))
+
+    def fetch_crl(self, url: str, timeout: int) -> x509.CertificateRevocationList:
+        '''
+        Get the CRL at the given URL, downloading it only if it changed since it was cached.
+
+        Parameters
+        ----------
+        url: str
+            URL of the DER encoded CRL.
+        timeout: int
+            Timeout of the request, in seconds.
+
+        Returns
+        -------
+        x509.CertificateRevocationList
+            The CRL, None if it could not be fetched.
+        '''
+        with self.lock:
+            if url in self.crls:
+                return self.crls[url]
+
+        cached_der, metadata = self.load(url)
+        headers = {}
+        if cached_der is not None:
+            if metadata.get('etag'):
+                headers['If-None-Match'] = metadata['etag']
+            if metadata.get('last_modified'):
+                headers['If-Modified-Since'] = metadata['last_modified']
+
+        r = requests.get(url, headers=headers, timeout=timeout)
+        if r.status_code == 304 and cached_der is not None:
+            log.debug("CRL at %s did not change", url)
+            crl = x509.load_der_x509_crl(cached_der)
+            with self.lock:
+                self.revalidations += 1
+        else:
+            r.raise_for_status()
+            log.debug("Fetched CRL: %s", r.content)
+            crl = x509.load_der_x509_crl(r.content)
+            cached_crl = x509.load_der_x509_crl(cached_der) if cached_der is not None else None
+            if cached_crl is not None and cached_crl.last_update_utc > crl.last_update_utc:
+                log.warning("CRL at %s is older than the cached one, using the cached one", url)
+                crl = cached_crl
+            else:
+                self.store(url, r.content, r.headers.get('ETag'), r.headers.get('Last-Modified'))
+            with self.lock:
+                self.downloads += 1
+
+        with self.lock:
+            self.crls[url] = crl
+        return crl
+
+
+class CertificateCache:
+    '''
+    On-disk cache of the approved certificates found in DCL, keyed by subject name and subject key ID.
+
+    The certificate of a subject name and key ID does not change, but it may be revoked in DCL: a cached certificate is
+    only used for max_age seconds after it was fetched. Lookups which found no approved certificate are not cached.
+    Safe to use from several threads.
+    '''
+
+    def __init__(self, directory: str, max_age: float):
+        '''
+        Initialize the cache.
+
+        Parameters
+        ----------
+        directory: str
+            Directory holding the cached certificates, created if missing.
+        max_age: float
+            Time during which a cached certificate is used, in seconds.
+        '''
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.hits = 0
+
+    def get_path(self, subject_name: x509.name.Name, skid_hex: str) -> str:
+        '''
+        Get the path of the cached certificate of the given subject name and subject key ID.
+        '''
+        key = hashlib.sha256(subject_name.public_bytes() + skid_hex.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key + '.certificate.json')
+
+    def load(self, subject_name: x509.name.Name, skid_hex: str) -> tuple[bool, x509.Certificate] | None:
+        '''
+        Load the cached (is_paa, certificate) of the given subject name and subject key ID, None if it is not cached
+        or too old.
+        '''
+        try:
+            with open(self.get_path(subject_name, skid_hex)) as f:
+                cached = json.load(f)
+            if time.time() - cached['fetched'] > self.max_age:
+                return None
+            certificate = x509.load_pem_x509_certificate(cached['certificate'].encode('utf-8'))
+        except (OSError, ValueError, KeyError):
+            return None
+        with self.lock:
+            self.hits += 1
+        return cached['is_paa'], certificate
+
+    def store(self, subject_name: x509.name.Name, skid_hex: str, is_paa: bool, certificate: x509.Certificate):
+        '''
+        Store the approved certificate of the given subject name and subject key ID.
+        '''
+        write_file_atomically(self.get_path(subject_name, skid_hex), json.dumps({
+            'is_paa': is_paa,
+            'certificate': certificate.public_bytes(serialization.Encoding.PEM).decode('utf-8'),
+            'fetched': time.time(),
+        }).encode('utf-8'))
+
+
 class DclClientInterface:
     '''
     An interface for interacting with DCLD.
     '''
 
+    # Cache used by get_crl_file() for the CRLs fetched from revocation point URLs, if any.
+    crl_cache: CrlCache = None
+
     def send_get_request(self, url: str) -> dict:
         '''
         Send a GET request for a json object.
@@ -456,6 +655,8 @@ class DclClientInterface:
                      crl_signer_certificate: x509.Certificate) -> x509.CertificateRevocationList:
         """Obtain the CRL."""
         try:
+            if self.crl_cache is not None:
+                return self.crl_cache.fetch_crl(revocation_point.dataURL, timeout=5)
             r = requests.get(revocation_point.dataURL, timeout=5)
             log.debug("Fetched CRL: %s", r.content)
             return x509.load_der_x509_crl(r.content)
@@ -675,6 +876,14 @@ class LocalFilesDclClient(DclClientInterface):
                                   for r in json.load(revocation_points_response_file)["PkiRevocationDistributionPoint"]]
         self.authoritative_certs = self.get_authoritative_certificates(dcl_certificates)
 
+        # Lookup tables, so that large sets of revocation points do not need a scan per point.
+        self.crls_by_issuer = {}
+        for crl in self.crls:
+            self.crls_by_issuer.setdefault(crl.issuer.public_bytes(), crl)
+        self.revocation_points_by_skid = {}
+        for point in self.revocation_points:
+            self.revocation_points_by_skid.setdefault(point.issuerSubjectKeyID, []).append(point)
+
     def get_lookup_key(self, certificate: x509.Certificate) -> str:
         '''
         Get key used in this class to lookup certificates.
@@ -795,11 +1004,7 @@ class LocalFilesDclClient(DclClientInterface):
         list[RevocationPoint]
             List of revocation points with the same issuer subject key ID.
         '''
-        same_issuer_points = []
-        for point in self.revocation_points:
-            if point.issuerSubjectKeyID == issuer_subject_key_id:
-                same_issuer_points.append(point)
-        return same_issuer_points
+        return list(self.revocation_points_by_skid.get(issuer_subject_key_id, []))
 
     def get_approved_certificate(self, subject_name: x509.name.Name, skid_hex: str) -> tuple[bool, x509.Certificate]:
         '''
@@ -842,12 +1047,427 @@ class LocalFilesDclClient(DclClientInterface):
         x509.CertificateRevocationList
             CRL signed by the CRL signer certificate.
         '''
-        for crl in self.crls:
-            if crl.issuer.public_bytes() == crl_signer_certificate.subject.public_bytes():
-                log.debug("Found CRL for issuer: %s", crl.issuer.rfc4514_string())
-                return crl
+        crl = self.crls_by_issuer.get(crl_signer_certificate.subject.public_bytes())
+        if crl is not None:
+            log.debug("Found CRL for issuer: %s", crl.issuer.rfc4514_string())
+        return crl
+
+
+class CachingDclClient(DclClientInterface):
+    '''
+    A client remembering the certificates and same-issuer revocation points returned by another client.
+
+    Revocation points sharing a certification path query DCL once for it. Once get_revocation_points() was called,
+    the same-issuer revocation points are found in the list it returned instead of being queried. With a
+    certificate_cache, the approved certificates are also kept across runs.
+    Safe to use from several threads.
+    '''
+
+    def __init__(self, client: DclClientInterface, certificate_cache: CertificateCache | None = None):
+        '''
+        Initialize the client.
+
+        Parameters
+        ----------
+        client: DclClientInterface
+            Client used for the queries that are not cached yet.
+        certificate_cache: CertificateCache
+            On-disk cache of the approved certificates, if any.
+        '''
+        self.client = client
+        self.certificate_cache = certificate_cache
+        self.lock = threading.Lock()
+        self.approved_certificates: dict[tuple[bytes, str], tuple[bool, x509.Certificate]] = {}
+        self.revocation_points_by_skid: dict[str, list[RevocationPoint]] = {}
+        self.all_revocation_points_by_skid: dict[str, list[RevocationPoint]] | None = None
+
+    def get_revocation_points(self) -> list[RevocationPoint]:
+        points = self.client.get_revocation_points()
+        points_by_skid: dict[str, list[RevocationPoint]] = {}
+        for point in points:
+            points_by_skid.setdefault(point.issuerSubjectKeyID, []).append(point)
+        with self.lock:
+            self.all_revocation_points_by_skid = points_by_skid
+        return points
+
+    def get_revocation_points_by_skid(self, issuer_subject_key_id) -> list[RevocationPoint]:
+        with self.lock:
+            if self.all_revocation_points_by_skid is not None:
+                return list(self.all_revocation_points_by_skid.get(issuer_subject_key_id, []))
+            if issuer_subject_key_id in self.revocation_points_by_skid:
+                return self.revocation_points_by_skid[issuer_subject_key_id]
+        points = self.client.get_revocation_points_by_skid(issuer_subject_key_id)
+        with self.lock:
+            return self.revocation_points_by_skid.setdefault(issuer_subject_key_id, points)
+
+    def get_approved_certificate(self, subject_name: x509.name.Name, skid_hex: str) -> tuple[bool, x509.Certificate]:
+        key = (subject_name.public_bytes(), skid_hex)
+        with self.lock:
+            if key in self.approved_certificates:
+                return self.approved_certificates[key]
+        result = self.certificate_cache.load(subject_name, skid_hex) if self.certificate_cache is not None else None
+        if result is None:
+            result = self.client.get_approved_certificate(subject_name, skid_hex)
+            if self.certificate_cache is not None and result[1] is not None:
+                self.certificate_cache.store(subject_name, skid_hex, *result)
+        with self.lock:
+            return self.approved_certificates.setdefault(key, result)
+
+    def get_crl_file(self,
+                     revocation_point: RevocationPoint,
+                     crl_signer_certificate: x509.Certificate) -> x509.CertificateRevocationList:
+        return self.client.get_crl_file(revocation_point, crl_signer_certificate)
+
+
+def get_revocation_set_entry(dcld_client: DclClientInterface, revocation_point: RevocationPoint) -> RevocationSet | None:
+    """Validate a revocation point and generate its revocation set entry.
+
+    Implements the steps of the generation algorithm from Matter Spec section 6.2.4.1 for one revocation point.
+
+    Args:
+        dcld_client: Client used to query DCL and fetch the CRL
+        revocation_point: The revocation point
+
+    Returns:
+        RevocationSet entry of the revocation point, None if the revocation point is not valid
+    """
+    # 1. Validate Revocation Type
+    if revocation_point.revocationType != RevocationType.CRL.value:
+        log.warning("Revocation Type is not CRL, continue...")
         return None
 
+    # 2. Parse the certificate
+    try:
+        crl_signer_certificate = x509.load_pem_x509_certificate(bytes(revocation_point.crlSignerCertificate, 'utf-8'))
+    except Exception:
+        log.warning("CRL Signer Certificate is not valid, continue...")
+        return None
+
+    # Parse the crl signer delegator
+    crl_signer_delegator_cert = None
+    if revocation_point.crlSignerDelegator:
+        crl_signer_delegator_cert_pem = revocation_point.crlSignerDelegator
+        log.debug("CRLSignerDelegator: %s", crl_signer_delegator_cert_pem)
+        try:
+            crl_signer_delegator_cert = x509.load_pem_x509_certificate(bytes(crl_signer_delegator_cert_pem, 'utf-8'))
+        except Exception:
+            log.warning("CRL Signer Delegator Certificate not found...")
+
+    # 3. and 4. Validate VID/PID
+    if not validate_vid_pid(revocation_point, crl_signer_certificate, crl_signer_delegator_cert):
+        log.warning("Failed to validate VID/PID, continue...")
+        return None
+
+    # 5. Validate the certification path containing CRLSignerCertificate.
+    paa_certificate_object = dcld_client.get_paa_cert(crl_signer_certificate)
+    if paa_certificate_object is None:
+        log.warning("PAA Certificate not found, continue...")
+        return None
+
+    if validate_cert_chain(crl_signer_certificate, crl_signer_delegator_cert, paa_certificate_object) is False:
+        log.warning("Failed to validate CRL Signer Certificate chain, continue...")
+        return None
+
+    # 6. Obtain the CRL
+    crl_file = dcld_client.get_crl_file(revocation_point, crl_signer_certificate)
+    if crl_file is None:
+        log.warning("CRL file not found for revocation point, continue...")
+        return None
+
+    # 7. Perform CRL File Validation
+    # a.
+    try:
+        crl_signer_skid = get_skid(crl_signer_certificate)
+    except ExtensionNotFound:
+        log.warning("CRL Signer SKID not found, continue...")
+        return None
+    try:
+        crl_akid = get_akid(crl_file)
+    except ExtensionNotFound:
+        log.warning("CRL AKID is not found, continue...")
+        return None
+    if crl_akid != crl_signer_skid:
+        log.warning("CRL AKID is not CRL Signer SKID, continue...")
+        return None
+
+    # b.
+    same_issuer_points = dcld_client.get_revocation_points_by_skid(crl_akid)
+    count_with_matching_vid_issuer_skid = sum(item.vid == revocation_point.vid for item in same_issuer_points)
+
+    if count_with_matching_vid_issuer_skid > 1:
+        try:
+            issuing_distribution_point = crl_file.extensions.get_extension_for_oid(
+                x509.oid.ExtensionOID.ISSUING_DISTRIBUTION_POINT).value
+        except Exception:
+            log.warning("CRL Issuing Distribution Point not found, continue...")
+            return None
+
+        uri_list = issuing_distribution_point.full_name
+        if len(uri_list) == 1 and isinstance(uri_list[0], x509.UniformResourceIdentifier):
+            if uri_list[0].value != revocation_point.dataURL:
+                log.warning("CRL Issuing Distribution Point URI is not CRL URL, continue...")
+                return None
+        else:
+            log.warning("CRL Issuing Distribution Point URI is not CRL URL, continue...")
+            return None
+
+    # TODO: 8. Validate CRL as per Section 6.3 of RFC 5280
+
+    # 9. Decide on certificate authority name and AKID
+    certificate_authority_name, certificate_akid_hex = get_certificate_authority_details(
+        crl_signer_certificate, crl_signer_delegator_cert, paa_certificate_object, revocation_point.isPAA)
+
+    # validate issuer skid matchces with the one in revocation points
+    log.debug("revocation_point.issuerSubjectKeyID: %s", revocation_point.issuerSubjectKeyID)
+
+    if revocation_point.issuerSubjectKeyID != certificate_akid_hex:
+        log.warning("CRL Issuer Subject Key ID is not CRL Signer Subject Key ID, continue...")
+        return None
+
+    # 10. Iterate through the Revoked Certificates List
+    entry = generate_revocation_set_from_crl(crl_file, crl_signer_certificate,
+                                             certificate_authority_name, certificate_akid_hex, crl_signer_delegator_cert)
+    log.debug("Entry to append: %s", entry)
+    return entry
+
+
+def generate_revocation_set(dcld_client: DclClientInterface, revocation_points: list[RevocationPoint],
+                            workers: int = 1) -> list[RevocationSet]:
+    """Generate the revocation set of a list of revocation points.
+
+    The revocation points are processed by a pool of worker threads, as most of the time is spent waiting for DCL
+    and for the CRL downloads. The entries are in the order of the revocation points, whatever the number of workers.
+
+    Args:
+        dcld_client: Client used to query DCL and fetch the CRLs, shared by the workers
+        revocation_points: The revocation points
+        workers: Maximum number of revocation points processed concurrently
+
+    Returns:
+        List of the RevocationSet entries of the valid revocation points
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        entries = executor.map(functools.partial(get_revocation_set_entry, dcld_client), revocation_points)
+        return [entry for entry in entries if entry is not None]
+
+
+# Binary revocation set format, written by write_binary_revocation_set() and read by RevocationSetIndex.
+# All integers are little-endian.
+#
+# - Header: magic, version, number of Bloom filter hash functions, number of entries, size of the Bloom filter in
+#   bytes and total number of serial numbers.
+# - Index: one record per entry, sorted by issuer SKID: SKID length, SKID (zero padded) and offset of the entry.
+# - Bloom filter over the (issuer SKID, serial number) pairs, so that most lookups of serial numbers which are not
+#   revoked do not need to search the entries.
+# - Entries: serial number width, lengths of the DER issuer name, CRL signer and CRL signer delegator certificates,
+#   number of serial numbers, followed by these DER blobs and by the sorted, deduplicated serial numbers, each
+#   big-endian and zero padded to the serial number width, so that they can be binary searched.
+BINARY_REVOCATION_SET_MAGIC = b'MRVS'
+BINARY_REVOCATION_SET_VERSION = 1
+BINARY_REVOCATION_SET_HEADER = struct.Struct('<4sBBxxIII')
+BINARY_REVOCATION_SET_INDEX_RECORD = struct.Struct('<B32sQ')
+BINARY_REVOCATION_SET_ENTRY = struct.Struct('<BHHHI')
+
+
+def get_serial_number_bytes(serial_number: int) -> bytes:
+    return serial_number.to_bytes(max(1, (serial_number.bit_length() + 7) // 8), 'big')
+
+
+def get_bloom_filter_hashes(skid: bytes, serial_number: int) -> tuple[int, int]:
+    '''
+    Get the two hashes of a serial number from which the bits of the Bloom filter are derived (double hashing).
+    '''
+    h1, h2 = struct.unpack('<QQ', hashlib.blake2b(bytes([len(skid)]) + skid + get_serial_number_bytes(serial_number),
+                                                  digest_size=16).digest())
+    return h1, h2 | 1
+
+
+def write_binary_revocation_set(revocation_set: list[RevocationSet], outfile, bloom_bits_per_serial: int = 10):
+    """Write a revocation set in the binary format.
+
+    Args:
+        revocation_set: The revocation set entries
+        outfile: Binary file to write to
+        bloom_bits_per_serial: Size of the Bloom filter, in bits per serial number. About 1% of the lookups of
+            serial numbers which are not revoked search the entries with 10 bits per serial number.
+    """
+    entries = []
+    for entry in revocation_set:
+        skid = bytes.fromhex(entry.issuer_subject_key_id)
+        if len(skid) > 32:
+            raise ValueError(f"Issuer subject key ID {entry.issuer_subject_key_id} is too long")
+        serial_numbers = sorted({int(serial_number, 16) for serial_number in entry.revoked_serial_numbers})
+        width = len(get_serial_number_bytes(serial_numbers[-1])) if serial_numbers else 1
+        entries.append((skid, entry, serial_numbers, width))
+    entries.sort(key=lambda e: e[0])
+
+    serial_count = sum(len(serial_numbers) for _, _, serial_numbers, _ in entries)
+    hash_count = max(1, round(bloom_bits_per_serial * 0.693))
+    bloom_filter = bytearray(max(8, (serial_count * bloom_bits_per_serial + 7) // 8))
+    bit_count = len(bloom_filter) * 8
+    for skid, _, serial_numbers, _ in entries:
+        for serial_number in serial_numbers:
+            h1, h2 = get_bloom_filter_hashes(skid, serial_number)
+            for i in range(hash_count):
+                bit = (h1 + i * h2) % bit_count
+                bloom_filter[bit >> 3] |= 1 << (bit & 7)
+
+    blocks = []
+    offset = (BINARY_REVOCATION_SET_HEADER.size + len(entries) * BINARY_REVOCATION_SET_INDEX_RECORD.size
+              + len(bloom_filter))
+    index = bytearray()
+    for skid, entry, serial_numbers, width in entries:
+        issuer_name = base64.b64decode(entry.issuer_name)
+        crl_signer_cert = base64.b64decode(entry.crl_signer_cert)
+        crl_signer_delegator = base64.b64decode(entry.crl_signer_delegator) if entry.crl_signer_delegator else b''
+        block = b''.join([BINARY_REVOCATION_SET_ENTRY.pack(width, len(issuer_name), len(crl_signer_cert),
+                                                           len(crl_signer_delegator), len(serial_numbers)),
+                          issuer_name, crl_signer_cert, crl_signer_delegator,
+                          b''.join(serial_number.to_bytes(width, 'big') for serial_number in serial_numbers)])
+        index += BINARY_REVOCATION_SET_INDEX_RECORD.pack(len(skid), skid, offset)
+        blocks.append(block)
+        offset += len(block)
+
+    outfile.write(BINARY_REVOCATION_SET_HEADER.pack(BINARY_REVOCATION_SET_MAGIC, BINARY_REVOCATION_SET_VERSION, hash_count,
+                                                    len(entries), len(bloom_filter), serial_count))
+    outfile.write(index)
+    outfile.write(bloom_filter)
+    for block in blocks:
+        outfile.write(block)
+
+
+class RevocationSetIndex:
+    '''
+    Lookup of revoked serial numbers in a revocation set in the binary format.
+
+    A lookup is a Bloom filter check followed, for the serial numbers which might be revoked, by a binary search in the
+    entries of the issuer.
+    '''
+
+    def __init__(self, data: bytes):
+        '''
+        Initialize the index.
+
+        Parameters
+        ----------
+        data: bytes
+            Revocation set written by write_binary_revocation_set().
+        '''
+        if len(data) < BINARY_REVOCATION_SET_HEADER.size:
+            raise ValueError("Binary revocation set is truncated")
+        magic, version, hash_count, entry_count, bloom_size, serial_count = BINARY_REVOCATION_SET_HEADER.unpack_from(data)
+        if magic != BINARY_REVOCATION_SET_MAGIC or version != BINARY_REVOCATION_SET_VERSION:
+            raise ValueError(f"Not a version {BINARY_REVOCATION_SET_VERSION} binary revocation set")
+
+        self.data = data
+        self.hash_count = hash_count
+        self.serial_count = serial_count
+        bloom_offset = BINARY_REVOCATION_SET_HEADER.size + entry_count * BINARY_REVOCATION_SET_INDEX_RECORD.size
+        self.bloom_filter = data[bloom_offset:bloom_offset + bloom_size]
+        self.bloom_bit_count = bloom_size * 8
+
+        # Entries by issuer SKID: (issuer SKID, entry offset, serial numbers offset, serial number count, width).
+        self.entries: dict[bytes, list[tuple[bytes, int, int, int, int]]] = {}
+        for i in range(entry_count):
+            skid_length, skid, offset = BINARY_REVOCATION_SET_INDEX_RECORD.unpack_from(
+                data, BINARY_REVOCATION_SET_HEADER.size + i * BINARY_REVOCATION_SET_INDEX_RECORD.size)
+            skid = skid[:skid_length]
+            width, name_length, signer_length, delegator_length, count = BINARY_REVOCATION_SET_ENTRY.unpack_from(data, offset)
+            serials_offset = offset + BINARY_REVOCATION_SET_ENTRY.size + name_length + signer_length + delegator_length
+            if serials_offset + count * width > len(data):
+                raise ValueError("Binary revocation set is truncated")
+            self.entries.setdefault(skid, []).append((skid, offset, serials_offset, count, width))
+
+    @classmethod
+    def from_file(cls, path: str) -> 'RevocationSetIndex':
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def __len__(self) -> int:
+        return self.serial_count
+
+    def might_be_revoked(self, skid: bytes, serial_number: int) -> bool:
+        '''
+        Check the Bloom filter. False if the serial number is not revoked, True if it might be.
+        '''
+        bloom_filter = self.bloom_filter
+        bit_count = self.bloom_bit_count
+        h1, h2 = get_bloom_filter_hashes(skid, serial_number)
+        for i in range(self.hash_count):
+            bit = (h1 + i * h2) % bit_count
+            if not bloom_filter[bit >> 3] >> (bit & 7) & 1:
+                return False
+        return True
+
+    def is_revoked(self, issuer_subject_key_id: str, serial_number: str | int) -> bool:
+        '''
+        Check if a certificate is revoked.
+
+        Parameters
+        ----------
+        issuer_subject_key_id: str
+            Subject Key ID of the issuer of the certificate, in hex format.
+        serial_number: str | int
+            Serial number of the certificate, in hex format or as an integer.
+
+        Returns
+        -------
+        bool
+            True if the serial number is revoked by an entry of the issuer.
+        '''
+        skid = bytes.fromhex(issuer_subject_key_id)
+        entries = self.entries.get(skid)
+        if not entries:
+            return False
+        if isinstance(serial_number, str):
+            serial_number = int(serial_number, 16)
+        if not self.might_be_revoked(skid, serial_number):
+            return False
+
+        data = self.data
+        for _, _, offset, count, width in entries:
+            if serial_number.bit_length() > width * 8:
+                continue
+            target = serial_number.to_bytes(width, 'big')
+            low, high = 0, count
+            while low < high:
+                middle = (low + high) // 2
+                start = offset + middle * width
+                value = data[start:start + width]
+                if value == target:
+                    return True
+                if value < target:
+                    low = middle + 1
+                else:
+                    high = middle
+        return False
+
+    def get_revocation_set(self) -> list[RevocationSet]:
+        '''
+        Decode the entries of the revocation set, sorted by issuer SKID.
+        '''
+        revocation_set = []
+        for entries in self.entries.values():
+            for skid, offset, serials_offset, count, width in entries:
+                _, name_length, signer_length, delegator_length, _ = BINARY_REVOCATION_SET_ENTRY.unpack_from(self.data, offset)
+                start = offset + BINARY_REVOCATION_SET_ENTRY.size
+                issuer_name = self.data[start:start + name_length]
+                start += name_length
+                crl_signer_cert = self.data[start:start + signer_length]
+                start += signer_length
+                crl_signer_delegator = self.data[start:start + delegator_length]
+                revocation_set.append(RevocationSet(
+                    type='revocation_set',
+                    issuer_subject_key_id=skid.hex().upper(),
+                    issuer_name=base64.b64encode(issuer_name).decode('utf-8'),
+                    revoked_serial_numbers=[
+                        format_serial_number(int.from_bytes(self.data[i:i + width], 'big'))
+                        for i in range(serials_offset, serials_offset + count * width, width)],
+                    crl_signer_cert=base64.b64encode(crl_signer_cert).decode('utf-8'),
+                    crl_signer_delegator=base64.b64encode(crl_signer_delegator).decode('utf-8') if crl_signer_delegator else None,
+                ))
+        return revocation_set
+
 
 @click.group()
 def cli():
@@ -866,13 +1486,22 @@ def cli():
 @optgroup.option('--certificates', type=click.File('rb'), multiple=True, help='Paths to PEM formated certificates (i.e. PAA) in DCL but missing from the revocation-points-response file.')
 @optgroup.option('--crls', type=click.File('rb'), multiple=True, help='Paths to the crl der files')
 @optgroup.option('--revocation-points-response', type=click.File('rb'), help='Path to the get-revocation-points response json file.')
+@optgroup.group('Optional fetch arguments')
+@optgroup.option('--workers', default=8, show_default=True, type=click.IntRange(min=1),
+                 help='Number of revocation points processed concurrently.')
+@optgroup.option('--cache-dir', type=click.Path(file_okay=False), metavar='PATH',
+                 help='Directory caching the fetched CRLs, so that only the CRLs which changed are downloaded again, and the approved certificates found in DCL.')
+@optgroup.option('--certificate-cache-max-age', default=168, show_default=True, type=click.FloatRange(min=0), metavar='HOURS',
+                 help='Hours during which an approved certificate cached in --cache-dir is used before being queried again, so that certificates revoked in DCL are noticed.')
 @optgroup.group('Optional output arguments')
 @optgroup.option('--output', default='sample_revocation_set_list.json', type=str, metavar='FILEPATH',
                  help="Output filename (default: sample_revocation_set_list.json)")
+@optgroup.option('--output-format', default='json', show_default=True, type=click.Choice(['json', 'binary']),
+                 help="Format of the output: JSON list of revocation sets, or indexed binary revocation set (see RevocationSetIndex)")
 @optgroup.option('--log-level', default='INFO', show_default=True, type=click.Choice(__LOG_LEVELS__.keys(),
                                                                                      case_sensitive=False), callback=lambda c, p, v: __LOG_LEVELS__[v],
                  help='Determines the verbosity of script output')
-def from_dcl(use_main_net_dcld: str, use_test_net_dcld: str, use_main_net_http: bool, use_test_net_http: bool, use_local_data: bool, revocation_points_response: str, crls: [], certificates: [], output: str, log_level: str):
+def from_dcl(use_main_net_dcld: str, use_test_net_dcld: str, use_main_net_http: bool, use_test_net_http: bool, use_local_data: bool, revocation_points_response: str, crls: [], certificates: [], workers: int, cache_dir: str, certificate_cache_max_age: float, output: str, output_format: str, log_level: str):
     """Generate revocation set from DCL using generation algorithm from Matter Spec section 6.2.4.1."""
     logging.basicConfig(
         level=log_level,
@@ -887,112 +1516,74 @@ def from_dcl(use_main_net_dcld: str, use_test_net_dcld: str, use_main_net_http:
     else:
         dcld_client = NodeDclClient(use_main_net_dcld or use_test_net_dcld, bool(use_test_net_dcld))
 
-    revocation_point_list = dcld_client.get_revocation_points()
-    revocation_set = []
-    for revocation_point in revocation_point_list:
-        # 1. Validate Revocation Type
-        if revocation_point.revocationType != RevocationType.CRL.value:
-            log.warning("Revocation Type is not CRL, continue...")
-            continue
+    crl_cache = certificate_cache = None
+    if cache_dir:
+        crl_cache = dcld_client.crl_cache = CrlCache(cache_dir)
+        certificate_cache = CertificateCache(cache_dir, certificate_cache_max_age * 3600)
 
-        # 2. Parse the certificate
-        try:
-            crl_signer_certificate = x509.load_pem_x509_certificate(bytes(revocation_point.crlSignerCertificate, 'utf-8'))
-        except Exception:
-            log.warning("CRL Signer Certificate is not valid, continue...")
-            continue
-
-        # Parse the crl signer delegator
-        crl_signer_delegator_cert = None
-        if revocation_point.crlSignerDelegator:
-            crl_signer_delegator_cert_pem = revocation_point.crlSignerDelegator
-            log.debug("CRLSignerDelegator: %s", crl_signer_delegator_cert_pem)
-            try:
-                crl_signer_delegator_cert = x509.load_pem_x509_certificate(bytes(crl_signer_delegator_cert_pem, 'utf-8'))
-            except Exception:
-                log.warning("CRL Signer Delegator Certificate not found...")
-
-        # 3. and 4. Validate VID/PID
-        if not validate_vid_pid(revocation_point, crl_signer_certificate, crl_signer_delegator_cert):
-            log.warning("Failed to validate VID/PID, continue...")
-            continue
-
-        # 5. Validate the certification path containing CRLSignerCertificate.
-        paa_certificate_object = dcld_client.get_paa_cert(crl_signer_certificate)
-        if paa_certificate_object is None:
-            log.warning("PAA Certificate not found, continue...")
-            continue
+    dcld_client = CachingDclClient(dcld_client, certificate_cache)
+    revocation_set = generate_revocation_set(dcld_client, dcld_client.get_revocation_points(), workers)
+    log.info("Generated %d revocation set entries", len(revocation_set))
+    if crl_cache is not None:
+        log.info("Downloaded %d CRLs, %d cached CRLs did not change", crl_cache.downloads, crl_cache.revalidations)
+        log.info("Used %d cached certificates", certificate_cache.hits)
 
-        if validate_cert_chain(crl_signer_certificate, crl_signer_delegator_cert, paa_certificate_object) is False:
-            log.warning("Failed to validate CRL Signer Certificate chain, continue...")
-            continue
-
-        # 6. Obtain the CRL
-        crl_file = dcld_client.get_crl_file(revocation_point, crl_signer_certificate)
-        if crl_file is None:
-            log.warning("CRL file not found for revocation point, continue...")
-            continue
-
-        # 7. Perform CRL File Validation
-        # a.
-        try:
-            crl_signer_skid = get_skid(crl_signer_certificate)
-        except ExtensionNotFound:
-            log.warning("CRL Signer SKID not found, continue...")
-            continue
-        try:
-            crl_akid = get_akid(crl_file)
-        except ExtensionNotFound:
-            log.warning("CRL AKID is not found, continue...")
-            continue
-        if crl_akid != crl_signer_skid:
-            log.warning("CRL AKID is not CRL Signer SKID, continue...")
-            continue
-
-        # b.
-        same_issuer_points = dcld_client.get_revocation_points_by_skid(crl_akid)
-        count_with_matching_vid_issuer_skid = sum(item.vid == revocation_point.vid for item in same_issuer_points)
-
-        if count_with_matching_vid_issuer_skid > 1:
-            try:
-                issuing_distribution_point = crl_file.extensions.get_extension_for_oid(
-                    x509.oid.ExtensionOID.ISSUING_DISTRIBUTION_POINT).value
-            except Exception:
-                log.warning("CRL Issuing Distribution Point not found, continue...")
-                continue
-
-            uri_list = issuing_distribution_point.full_name
-            if len(uri_list) == 1 and isinstance(uri_list[0], x509.UniformResourceIdentifier):
-                if uri_list[0].value != revocation_point.dataURL:
-                    log.warning("CRL Issuing Distribution Point URI is not CRL URL, continue...")
-                    continue
-            else:
-                log.warning("CRL Issuing Distribution Point URI is not CRL URL, continue...")
-                continue
-
-        # TODO: 8. Validate CRL as per Section 6.3 of RFC 5280
-
-        # 9. Decide on certificate authority name and AKID
-        certificate_authority_name, certificate_akid_hex = get_certificate_authority_details(
-            crl_signer_certificate, crl_signer_delegator_cert, paa_certificate_object, revocation_point.isPAA)
-
-        # validate issuer skid matchces with the one in revocation points
-        log.debug("revocation_point.issuerSubjectKeyID: %s", revocation_point.issuerSubjectKeyID)
-
-        if revocation_point.issuerSubjectKeyID != certificate_akid_hex:
-            log.warning("CRL Issuer Subject Key ID is not CRL Signer Subject Key ID, continue...")
-            continue
-
-        # 10. Iterate through the Revoked Certificates List
-        entry = generate_revocation_set_from_crl(crl_file, crl_signer_certificate,
-                                                 certificate_authority_name, certificate_akid_hex, crl_signer_delegator_cert)
-        log.debug("Entry to append: %s", entry)
-        revocation_set.append(entry)
+    if output_format == 'binary':
+        with open(output, 'wb') as outfile:
+            write_binary_revocation_set(revocation_set, outfile)
+        return
 
     with open(output, 'w+') as outfile:
         json.dump([revocation.asDict() for revocation in revocation_set], outfile, indent=4)
 
 
+@cli.command('benchmark-lookup')
+@click.help_option('-h', '--help')
+@click.option('--serials', default=1000000, show_default=True, type=click.IntRange(min=1), help='Number of revoked serial numbers.')
+@click.option('--issuers', default=100, show_default=True, type=click.IntRange(min=1), help='Number of revocation set entries.')
+@click.option('--lookups', default=100000, show_default=True, type=click.IntRange(min=1), help='Number of lookups in the binary format.')
+@click.option('--json-lookups', default=100, show_default=True, type=click.IntRange(min=1), help='Number of lookups in the JSON format.')
+def benchmark_lookup(serials: int, issuers: int, lookups: int, json_lookups: int):
+    """Compare serial number lookups in the JSON and binary revocation set formats, on a synthetic revocation set."""
+    rng = random.Random(0)
+    revocation_set = [RevocationSet(
+        type='revocation_set',
+        issuer_subject_key_id=rng.randbytes(20).hex().upper(),
+        issuer_name=base64.b64encode(rng.randbytes(48)).decode('utf-8'),
+        revoked_serial_numbers=[format_serial_number(rng.getrandbits(64)) for _ in range(serials // issuers)],
+        crl_signer_cert=base64.b64encode(rng.randbytes(450)).decode('utf-8'),
+    ) for _ in range(issuers)]
+    queries = [(entry.issuer_subject_key_id, rng.choice(entry.revoked_serial_numbers) if rng.random() < 0.5
+                else format_serial_number(rng.getrandbits(64)))
+               for entry in (rng.choice(revocation_set) for _ in range(lookups))]
+
+    start = time.perf_counter()
+    json_size = len(json.dumps([revocation.asDict() for revocation in revocation_set]))
+    click.echo(f"JSON: {json_size} bytes, written in {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    outfile = io.BytesIO()
+    write_binary_revocation_set(revocation_set, outfile)
+    click.echo(f"Binary: {len(outfile.getvalue())} bytes, written in {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    index = RevocationSetIndex(outfile.getvalue())
+    click.echo(f"Binary: loaded in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    json_revoked = [any(entry.issuer_subject_key_id == skid and serial_number in entry.revoked_serial_numbers
+                        for entry in revocation_set)
+                    for skid, serial_number in queries[:json_lookups]]
+    json_lookup_us = (time.perf_counter() - start) * 1e6 / len(json_revoked)
+    start = time.perf_counter()
+    binary_revoked = [index.is_revoked(skid, serial_number) for skid, serial_number in queries]
+    binary_lookup_us = (time.perf_counter() - start) * 1e6 / len(binary_revoked)
+
+    if binary_revoked[:json_lookups] != json_revoked:
+        raise click.ClickException("Binary and JSON lookups disagree")
+    click.echo(f"JSON linear scan: {json_lookup_us:.1f} us per lookup")
+    click.echo(f"Binary index: {binary_lookup_us:.1f} us per lookup ({sum(binary_revoked)} of {lookups} revoked)")
+
+
 class TestRevocationSetGeneration(unittest.TestCase):
     """Test class for revocation set generation"""
 
@@ -1067,6 +1658,202 @@ class TestRevocationSetGeneration(unittest.TestCase):
         self.compare_revocation_sets(revocation_set, self.get_expected_revocation_set(2))
 
 
+def make_test_paa_with_crl(index: int, this_update: datetime.datetime) -> tuple[x509.Certificate, x509.CertificateRevocationList]:
+    '''
+    Make a synthetic self-signed PAA certificate, and a CRL signed by it revoking the serial number index + 1.
+    '''
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, f"Synthetic PAA {index}")])
+    skid = x509.SubjectKeyIdentifier.from_public_key(key.public_key())
+    certificate = (x509.CertificateBuilder()
+                   .subject_name(name)
+                   .issuer_name(name)
+                   .public_key(key.public_key())
+                   .serial_number(index + 1)
+                   .not_valid_before(this_update)
+                   .not_valid_after(this_update + datetime.timedelta(days=365))
+                   .add_extension(skid, critical=False)
+                   .add_extension(x509.AuthorityKeyIdentifier.from_issuer_subject_key_identifier(skid), critical=False)
+                   .sign(key, hashes.SHA256()))
+    revoked = x509.RevokedCertificateBuilder().serial_number(index + 1).revocation_date(this_update).build()
+    crl = (x509.CertificateRevocationListBuilder()
+           .issuer_name(name)
+           .last_update(this_update)
+           .next_update(this_update + datetime.timedelta(days=30))
+           .add_revoked_certificate(revoked)
+           .add_extension(x509.AuthorityKeyIdentifier.from_issuer_subject_key_identifier(skid), critical=False)
+           .sign(key, hashes.SHA256()))
+    return certificate, crl
+
+
+class TestRevocationSetPipeline(unittest.TestCase):
+    """Test class for the concurrent and cached revocation set generation"""
+
+    def make_revocation_point(self, index: int, certificate: x509.Certificate) -> dict:
+        return dataclasses.asdict(RevocationPoint(
+            vid=0xFFF1, label=f"synthetic-{index}", issuerSubjectKeyID=get_skid(certificate), pid=0, isPAA=True,
+            crlSignerCertificate=certificate.public_bytes(serialization.Encoding.PEM).decode('utf-8'),
+            dataURL=f"https://example.com/crl/{index}.crl", dataFileSize="", dataDigest="", dataDigestType=0,
+            revocationType=RevocationType.CRL.value, schemaVersion=0, crlSignerDelegator=""))
+
+    def test_concurrent_generation(self):
+        """Test that concurrent generation of a large revocation set matches the sequential one"""
+        now = datetime.datetime.now(datetime.UTC)
+        points, crls = [], []
+        for index in range(1000):
+            certificate, crl = make_test_paa_with_crl(index, now)
+            points.append(self.make_revocation_point(index, certificate))
+            # Every 10th point has no CRL, and is left out of the revocation set.
+            if index % 10:
+                crls.append(io.BytesIO(crl.public_bytes(serialization.Encoding.DER)))
+        response = io.BytesIO(json.dumps({"PkiRevocationDistributionPoint": points}).encode('utf-8'))
+        client = CachingDclClient(LocalFilesDclClient(crls, [], response))
+
+        sequential = generate_revocation_set(client, client.get_revocation_points())
+        concurrent = generate_revocation_set(client, client.get_revocation_points(), workers=16)
+
+        self.assertEqual(len(sequential), 900)
+        self.assertEqual([entry.asDict() for entry in concurrent], [entry.asDict() for entry in sequential])
+        self.assertEqual([entry.revoked_serial_numbers for entry in sequential[:3]], [['02'], ['03'], ['04']])
+        self.assertEqual(len(client.approved_certificates), 1000)
+
+    def test_certificate_cache(self):
+        """Test that approved certificates are kept across runs, and same-issuer points are not queried"""
+        now = datetime.datetime.now(datetime.UTC)
+        certificate, crl = make_test_paa_with_crl(0, now)
+        points = [self.make_revocation_point(0, certificate), self.make_revocation_point(1, certificate)]
+
+        def make_client():
+            response = io.BytesIO(json.dumps({"PkiRevocationDistributionPoint": points}).encode('utf-8'))
+            client = LocalFilesDclClient([io.BytesIO(crl.public_bytes(serialization.Encoding.DER))], [], response)
+            client.get_approved_certificate = mock.Mock(wraps=client.get_approved_certificate)
+            client.get_revocation_points_by_skid = mock.Mock(wraps=client.get_revocation_points_by_skid)
+            return client
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            wrapped = make_client()
+            client = CachingDclClient(wrapped, CertificateCache(cache_dir, max_age=3600))
+            first_run = generate_revocation_set(client, client.get_revocation_points())
+            self.assertEqual(wrapped.get_approved_certificate.call_count, 1)
+            wrapped.get_revocation_points_by_skid.assert_not_called()
+
+            # A new run reads the certificate from the cache.
+            wrapped = make_client()
+            cache = CertificateCache(cache_dir, max_age=3600)
+            client = CachingDclClient(wrapped, cache)
+            second_run = generate_revocation_set(client, client.get_revocation_points())
+            wrapped.get_approved_certificate.assert_not_called()
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual([entry.asDict() for entry in second_run], [entry.asDict() for entry in first_run])
+
+            # Once too old, the certificate is queried again.
+            wrapped = make_client()
+            client = CachingDclClient(wrapped, CertificateCache(cache_dir, max_age=0))
+            generate_revocation_set(client, client.get_revocation_points())
+            self.assertEqual(wrapped.get_approved_certificate.call_count, 1)
+
+    def test_crl_cache(self):
+        """Test that cached CRLs are only downloaded again when they changed"""
+        now = datetime.datetime.now(datetime.UTC)
+        _, crl = make_test_paa_with_crl(0, now)
+        served = {'crl': crl.public_bytes(serialization.Encoding.DER), 'etag': '"1"'}
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.headers.get('If-None-Match') == served['etag']:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('ETag', served['etag'])
+                self.send_header('Content-Length', str(len(served['crl'])))
+                self.end_headers()
+                self.wfile.write(served['crl'])
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}/crl"
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = CrlCache(cache_dir)
+            self.assertEqual(cache.fetch_crl(url, timeout=5), crl)
+            self.assertEqual(cache.fetch_crl(url, timeout=5), crl)
+            self.assertEqual((cache.downloads, cache.revalidations), (1, 0))
+
+            # A new run revalidates the cached CRL.
+            cache = CrlCache(cache_dir)
+            self.assertEqual(cache.fetch_crl(url, timeout=5), crl)
+            self.assertEqual((cache.downloads, cache.revalidations), (0, 1))
+
+            # A newer CRL is downloaded, an older one is ignored.
+            _, newer_crl = make_test_paa_with_crl(0, now + datetime.timedelta(hours=1))
+            served.update(crl=newer_crl.public_bytes(serialization.Encoding.DER), etag='"2"')
+            self.assertEqual(CrlCache(cache_dir).fetch_crl(url, timeout=5), newer_crl)
+            served.update(crl=crl.public_bytes(serialization.Encoding.DER), etag='"3"')
+            self.assertEqual(CrlCache(cache_dir).fetch_crl(url, timeout=5), newer_crl)
+
+
+class TestBinaryRevocationSet(unittest.TestCase):
+    """Test class for the binary revocation set format"""
+
+    def setUp(self):
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               'test/revoked-attestation-certificates/revocation-sets/revocation-set.json')) as f:
+            self.revocation_set = [RevocationSet(**entry) for entry in json.load(f)]
+
+    def write(self, revocation_set: list[RevocationSet]) -> RevocationSetIndex:
+        outfile = io.BytesIO()
+        write_binary_revocation_set(revocation_set, outfile)
+        return RevocationSetIndex(outfile.getvalue())
+
+    def test_round_trip(self):
+        """Test that the binary format holds the same entries as the JSON one"""
+        index = self.write(self.revocation_set)
+
+        expected = sorted(self.revocation_set, key=lambda entry: bytes.fromhex(entry.issuer_subject_key_id))
+        for entry in expected:
+            entry.revoked_serial_numbers = sorted(set(entry.revoked_serial_numbers), key=lambda s: int(s, 16))
+        self.assertEqual([entry.asDict() for entry in index.get_revocation_set()], [entry.asDict() for entry in expected])
+        self.assertEqual(len(index), sum(len(entry.revoked_serial_numbers) for entry in expected))
+
+    def test_lookup(self):
+        """Test lookups of revoked and not revoked serial numbers"""
+        rng = random.Random(0)
+        serial_numbers = {format_serial_number(rng.getrandbits(rng.choice([8, 64, 159]))) for _ in range(5000)}
+        entry = dataclasses.replace(self.revocation_set[0], revoked_serial_numbers=sorted(serial_numbers) + ['00FF', '00FF'])
+        index = self.write([entry] + self.revocation_set[1:])
+        skid = entry.issuer_subject_key_id
+
+        for serial_number in serial_numbers:
+            self.assertTrue(index.is_revoked(skid, serial_number))
+        self.assertTrue(index.is_revoked(skid, 0xFF))
+        not_revoked = [serial_number for serial_number in (rng.getrandbits(64) for _ in range(5000))
+                       if format_serial_number(serial_number) not in serial_numbers]
+        self.assertFalse(any(index.is_revoked(skid, serial_number) for serial_number in not_revoked))
+        self.assertFalse(index.is_revoked(skid, 1 << 200))
+        self.assertFalse(index.is_revoked('00' * 20, next(iter(serial_numbers))))
+        # The Bloom filter spares the binary search for most of the serial numbers which are not revoked.
+        self.assertLess(sum(index.might_be_revoked(bytes.fromhex(skid), s) for s in not_revoked), len(not_revoked) // 20)
+
+        for entry in self.revocation_set[1:]:
+            for serial_number in entry.revoked_serial_numbers:
+                self.assertTrue(index.is_revoked(entry.issuer_subject_key_id, serial_number))
+
+    def test_invalid_data(self):
+        """Test that data not in the binary format is rejected"""
+        with self.assertRaises(ValueError):
+            RevocationSetIndex(b'[{"type": "revocation_set"}]')
+        outfile = io.BytesIO()
+        write_binary_revocation_set(self.revocation_set, outfile)
+        with self.assertRaises(ValueError):
+            RevocationSetIndex(outfile.getvalue()[:-1])
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == 'test':
         # Remove the 'test' argument and run tests
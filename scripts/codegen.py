@@ -18,6 +18,7 @@
 from python_path import PythonPath
 
 with PythonPath('py_matter_idl', relative_to=__file__):
+    from matter.idl.generators import SetJinjaBytecodeCache
     from matter.idl.generators.path_resolution import expand_path_for_idl
     from matter.idl.generators.registry import GENERATORS, CodeGenerator
     from matter.idl.generators.storage import FileSystemGeneratorStorage, GeneratorStorage
@@ -25,15 +26,11 @@ with PythonPath('py_matter_idl', relative_to=__file__):
 
 import logging
 import os.path
-import subprocess
 import sys
-import tempfile
-import traceback
-import urllib.request
-from pathlib import Path
 
 import click
-from tools.zap.clang_format import getClangFormatBinary
+import jinja2
+from pregenerate.formatting import FormatGeneratedFiles
 
 try:
     import coloredlogs
@@ -101,31 +98,23 @@ __LOG_LEVELS__ = logging.getLevelNamesMapping()
     type=click.Path(exists=True),
     default=None,
     help='A file containing all expected outputs. Script will fail if outputs do not match')
+@click.option(
+    '--idl-cache-dir',
+    type=click.Path(file_okay=False),
+    envvar='MATTER_IDL_CACHE_DIR',
+    default=None,
+    help='Directory where parsed IDL files are cached, so that invocations on the same input parse it only once')
+@click.option(
+    '--jinja-cache-dir',
+    type=click.Path(file_okay=False),
+    envvar='MATTER_IDL_JINJA_CACHE_DIR',
+    default=None,
+    help='Directory where compiled templates are cached, so that invocations compile each template only once')
 @click.argument(
     'idl_path',
     type=click.Path(exists=True))
-def main(log_level, generator, option, output_dir, dry_run, name_only, expected_outputs, idl_path):
-
-    def formatKotlinFiles(paths):
-        try:
-            log.info("Prettifying %d kotlin files:", len(paths))
-            for name in paths:
-                log.info("    '%s'", name)
-
-            VERSION = "0.58"
-            JAR_NAME = f"ktfmt-{VERSION}-with-dependencies.jar"
-            jar_url = f"https://repo1.maven.org/maven2/com/facebook/ktfmt/{VERSION}/{JAR_NAME}"
-
-            # ensure we have some headers otherwise maven seems to 403 us
-            opener = urllib.request.build_opener()
-            opener.addheaders = [('User-agent', 'Mozilla/5.0')]
-            urllib.request.install_opener(opener)
-
-            with tempfile.TemporaryDirectory(prefix='ktfmt') as tmpdir:
-                path, _ = urllib.request.urlretrieve(jar_url, Path(tmpdir).joinpath(JAR_NAME).as_posix())
-                subprocess.check_call(['java', '-jar', path, '--google-style'] + paths)
-        except Exception:
-            traceback.print_exc()
+def main(log_level, generator, option, output_dir, dry_run, name_only, expected_outputs, idl_cache_dir, jinja_cache_dir, idl_path):
+
     """
     Parses MATTER IDL files (.matter) and performs SDK code generation
     as set up by the program arguments.
@@ -145,9 +134,13 @@ def main(log_level, generator, option, output_dir, dry_run, name_only, expected_
     else:
         storage = FileSystemGeneratorStorage(output_dir)
 
+    if jinja_cache_dir:
+        os.makedirs(jinja_cache_dir, exist_ok=True)
+        SetJinjaBytecodeCache(jinja2.FileSystemBytecodeCache(jinja_cache_dir))
+
     log.info("Parsing idl from '%s'", idl_path)
     with open(idl_path) as f:
-        idl_tree = CreateParser().parse(f.read(), file_name=idl_path)
+        idl_tree = CreateParser(cache_dir=idl_cache_dir).parse(f.read(), file_name=idl_path)
 
     plugin_module = None
     if generator.startswith('custom:'):
@@ -176,28 +169,7 @@ def main(log_level, generator, option, output_dir, dry_run, name_only, expected_
 
     outputs = [os.path.join(output_dir, name) for name in storage.generated_paths if name]
 
-    # Split output files by extension,
-    name_dict = {}
-    for name in outputs:
-        _, extension = os.path.splitext(name)
-        name_dict[extension] = name_dict.get(extension, []) + [name]
-
-    if name_dict.get('.kt', []):
-        try:
-            log.debug("Formatting kt_files: '%s'", name_dict['.kt'])
-        except Exception:
-            traceback.print_exc()
-        formatKotlinFiles(name_dict['.kt'])
-
-    cpp_files = []
-    for ext in [".h", ".cpp", ".c", ".hpp"]:
-        cpp_files.extend(name_dict.get(ext, []))
-    if cpp_files:
-        try:
-            log.debug("Formatting cpp_files: '%s'", cpp_files)
-            subprocess.check_call([getClangFormatBinary(), "-i"] + cpp_files)
-        except Exception:
-            traceback.print_exc()
+    FormatGeneratedFiles(outputs)
 
     if expected_outputs:
         with open(expected_outputs) as fin:
@@ -14,11 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import itertools
 import logging
 import multiprocessing
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 import click
@@ -31,6 +33,7 @@ except ImportError:
 
 from pregenerate.executors import DryRunner, ShellRunner
 from pregenerate.type_definitions import IdlFileType
+from pregenerate.using_codegen import CodegenTarget, GenerateInProcess
 
 try:
     import coloredlogs
@@ -53,6 +56,14 @@ def _ParallelGenerateOne(arg):
     arg[0].Generate(arg[1])
 
 
+def _ParallelGenerateInProcess(arg):
+    """
+    Helper method to be passed to multiprocessing parallel generation of
+    all the codegen targets of one IDL file.
+    """
+    return GenerateInProcess(*arg)
+
+
 @click.command()
 @click.option(
     '--log-level',
@@ -86,8 +97,18 @@ def _ParallelGenerateOne(arg):
     default=None,
     multiple=True,
     help='Path to an external app root (where .zap/.matter files exist).')
+@click.option(
+    '--in-process/--no-in-process',
+    default=True,
+    help='Run codegen.py generators inside this tool, parsing every IDL file once, instead of running codegen.py per target.')
+@click.option(
+    '--idl-cache-dir',
+    type=click.Path(file_okay=False),
+    envvar='MATTER_IDL_CACHE_DIR',
+    default=None,
+    help='Directory where parsed IDL files are cached. Defaults to a temporary directory for the duration of the run.')
 @click.argument('output_dir')
-def main(log_level, parallel, dry_run, generator, input_glob, sdk_root, external_root, output_dir):
+def main(log_level, parallel, dry_run, generator, input_glob, sdk_root, external_root, in_process, idl_cache_dir, output_dir):
     if _has_coloredlogs:
         coloredlogs.install(level=__LOG_LEVELS__[
                             log_level], fmt='%(asctime)s %(levelname)-7s %(message)s')
@@ -98,6 +119,10 @@ def main(log_level, parallel, dry_run, generator, input_glob, sdk_root, external
             datefmt='%Y-%m-%d %H:%M:%S'
         )
 
+    if in_process:
+        # Same verbosity as the codegen.py invocations (`--log-level fatal`)
+        logging.getLogger('matter.idl').setLevel(logging.FATAL)
+
     if not sdk_root:
         sdk_root = next(filter(lambda p: (p / 'SPECIFICATION_VERSION').is_file(), Path(__file__).parents))
 
@@ -122,17 +147,45 @@ def main(log_level, parallel, dry_run, generator, input_glob, sdk_root, external
     elif generator == 'codegen':
         target_filter.file_type = IdlFileType.MATTER
 
-    targets = FindPregenerationTargets(sdk_root, external_root, target_filter, runner)
+    targets = list(FindPregenerationTargets(sdk_root, external_root, target_filter, runner))
 
-    runner.ensure_directory_exists(output_dir)
-    if parallel:
-        target_and_dir = zip(targets, itertools.repeat(output_dir))
-        with multiprocessing.Pool() as pool:
-            for _ in pool.imap_unordered(_ParallelGenerateOne, target_and_dir):
-                pass
-    else:
+    # Codegen targets generated in-process, grouped by IDL file
+    in_process_targets: dict[str, list[CodegenTarget]] = {}
+    if in_process:
         for target in targets:
-            target.Generate(output_dir)
+            if isinstance(target, CodegenTarget):
+                in_process_targets.setdefault(target.idl.full_path, []).append(target)
+        targets = [target for target in targets if not isinstance(target, CodegenTarget)]
+
+    runner.ensure_directory_exists(output_dir)
+
+    # Several generators run on the same .matter files: share the parsed IDL
+    # between the codegen.py invocations, so that every file is parsed once.
+    with contextlib.ExitStack() as stack:
+        if not idl_cache_dir:
+            idl_cache_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix='idl-cache'))
+        os.environ['MATTER_IDL_CACHE_DIR'] = idl_cache_dir
+
+        in_process_args = [(idl_targets, output_dir, dry_run) for idl_targets in in_process_targets.values()]
+        results = []
+        if parallel:
+            target_and_dir = zip(targets, itertools.repeat(output_dir))
+            with multiprocessing.Pool() as pool:
+                # Generate the (slower) targets run as separate processes first
+                pending = pool.map_async(_ParallelGenerateOne, target_and_dir)
+                for idl_results in pool.imap_unordered(_ParallelGenerateInProcess, in_process_args):
+                    results.extend(idl_results)
+                pending.get()
+        else:
+            for target in targets:
+                target.Generate(output_dir)
+            for args in in_process_args:
+                results.extend(GenerateInProcess(*args))
+
+    if results:
+        log.info("In-process generation of %d targets took %.2f seconds:", len(results), sum(r.seconds for r in results))
+        for result in sorted(results, key=lambda r: r.seconds, reverse=True):
+            log.info("    %6.2fs %s:%s", result.seconds, result.target.generator, result.target.idl.relative_path)
 
     log.info("Done")
 
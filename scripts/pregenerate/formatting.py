@@ -0,0 +1,77 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import subprocess
+import tempfile
+import traceback
+import urllib.request
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+
+def FormatKotlinFiles(paths: list[str]):
+    try:
+        log.info("Prettifying %d kotlin files:", len(paths))
+        for name in paths:
+            log.info("    '%s'", name)
+
+        VERSION = "0.58"
+        JAR_NAME = f"ktfmt-{VERSION}-with-dependencies.jar"
+        jar_url = f"https://repo1.maven.org/maven2/com/facebook/ktfmt/{VERSION}/{JAR_NAME}"
+
+        # ensure we have some headers otherwise maven seems to 403 us
+        opener = urllib.request.build_opener()
+        opener.addheaders = [('User-agent', 'Mozilla/5.0')]
+        urllib.request.install_opener(opener)
+
+        with tempfile.TemporaryDirectory(prefix='ktfmt') as tmpdir:
+            path, _ = urllib.request.urlretrieve(jar_url, Path(tmpdir).joinpath(JAR_NAME).as_posix())
+            subprocess.check_call(['java', '-jar', path, '--google-style'] + paths)
+    except Exception:
+        traceback.print_exc()
+
+
+def FormatCppFiles(paths: list[str]):
+    from tools.zap.clang_format import getClangFormatBinary
+
+    try:
+        log.debug("Formatting cpp_files: '%s'", paths)
+        subprocess.check_call([getClangFormatBinary(), "-i"] + paths)
+    except Exception:
+        traceback.print_exc()
+
+
+def FormatGeneratedFiles(paths: list[str]):
+    """
+    Formats the files generated by codegen, based on their extension.
+
+    Formatting failures are reported, but are not fatal.
+    """
+    # Split output files by extension,
+    name_dict = {}
+    for name in paths:
+        _, extension = os.path.splitext(name)
+        name_dict[extension] = name_dict.get(extension, []) + [name]
+
+    if name_dict.get('.kt', []):
+        FormatKotlinFiles(name_dict['.kt'])
+
+    cpp_files = []
+    for ext in [".h", ".cpp", ".c", ".hpp"]:
+        cpp_files.extend(name_dict.get(ext, []))
+    if cpp_files:
+        FormatCppFiles(cpp_files)
@@ -15,7 +15,12 @@
 import logging
 import os
 import shlex
+import time
+from dataclasses import dataclass
 
+from python_path import PythonPath
+
+from .formatting import FormatGeneratedFiles
 from .type_definitions import IdlFileType, InputIdlFile
 
 log = logging.getLogger(__name__)
@@ -62,6 +67,68 @@ class CodegenTarget:
         self.runner.run(cmd)
 
 
+@dataclass
+class InProcessResult:
+    target: CodegenTarget
+    seconds: float
+
+
+def GenerateInProcess(targets: list[CodegenTarget], output_root: str, dry_run: bool = False) -> list[InProcessResult]:
+    """
+    Generates the given targets in the current process, instead of running
+    codegen.py for every target.
+
+    All targets MUST be for the same IDL file, which is parsed only once and
+    shared by the code generators. Compiled templates are shared by all code
+    generators of the process, and by other processes as well if
+    MATTER_IDL_JINJA_CACHE_DIR is set.
+
+    Generates the same outputs as `CodegenTarget.Generate`, including the
+    formatting of the outputs.
+    """
+    import jinja2
+
+    # Same py_matter_idl as used by codegen.py
+    with PythonPath('..', 'py_matter_idl', relative_to=__file__):
+        from matter.idl.generators import GetJinjaBytecodeCache, InMemoryBytecodeCache, SetJinjaBytecodeCache
+        from matter.idl.generators.registry import CodeGenerator
+        from matter.idl.generators.storage import FileSystemGeneratorStorage
+        from matter.idl.matter_idl_parser import CreateParser
+
+    if GetJinjaBytecodeCache() is None:
+        if jinja_cache_dir := os.environ.get('MATTER_IDL_JINJA_CACHE_DIR'):
+            # Same persistent cache as used by codegen.py
+            os.makedirs(jinja_cache_dir, exist_ok=True)
+            SetJinjaBytecodeCache(jinja2.FileSystemBytecodeCache(jinja_cache_dir))
+        else:
+            SetJinjaBytecodeCache(InMemoryBytecodeCache())
+
+    idl_paths = {target.idl.full_path for target in targets}
+    if len(idl_paths) != 1:
+        raise Exception(f"In-process generation expects targets of a single IDL file, got {idl_paths}")
+
+    idl_path = idl_paths.pop()
+    with open(idl_path) as f:
+        idl_tree = CreateParser(cache_dir=os.environ.get('MATTER_IDL_CACHE_DIR')).parse(f.read(), file_name=idl_path)
+
+    results = []
+    for target in targets:
+        start = time.monotonic()
+        output_dir = os.path.join(output_root, target.idl.pregen_subdir, target.generator)
+        log.info("Generating in-process: '%s:%s' into '%s'", target.generator, idl_path, output_dir)
+
+        extra_args = dict(option.split(':') for option in target.options)
+        storage = FileSystemGeneratorStorage(output_dir)
+        generator = CodeGenerator.FromString(target.generator).Create(storage, idl=idl_tree, **extra_args)
+        generator.render(dry_run)
+
+        if not dry_run:
+            FormatGeneratedFiles([os.path.join(output_dir, name) for name in storage.generated_paths if name])
+
+        results.append(InProcessResult(target=target, seconds=time.monotonic() - start))
+    return results
+
+
 class CodegenJavaJNIPregenerator:
     """Pregeneration logic for "java" codegen.py outputs"""
 
@@ -0,0 +1,66 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for caches kept in files and shared between processes."""
+
+import contextlib
+import os
+import tempfile
+
+
+class FileLock:
+    """
+    Exclusive lock held on the given lock file, shared between processes.
+
+    Used to let a single process build a cache entry while the others
+    wait for it. Where file locks are not available, the lock does nothing
+    and concurrent processes may all build the same entry.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+
+    def __enter__(self):
+        try:
+            import fcntl
+        except ImportError:
+            return self
+        self.file = open(self.path, 'wb')
+        fcntl.flock(self.file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *args):
+        if self.file:
+            self.file.close()  # also releases the lock
+            self.file = None
+
+
+@contextlib.contextmanager
+def AtomicWrite(path: str):
+    """
+    Opens a binary file whose content replaces the file at path once written.
+
+    The content is written to a temporary file of the same directory first,
+    so that readers never see partial content. Nothing is replaced if the
+    block raises.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
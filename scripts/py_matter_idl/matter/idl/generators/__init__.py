@@ -24,6 +24,45 @@ from .storage import GeneratorStorage
 
 log = logging.getLogger(__name__)
 
+# Bytecode cache used by the jinja environments of all code generators, if any.
+_jinja_bytecode_cache: jinja2.BytecodeCache | None = None
+
+
+class InMemoryBytecodeCache(jinja2.BytecodeCache):
+    """
+    Keeps compiled templates in memory, so that code generators created in the
+    same process compile each template only once.
+    """
+
+    def __init__(self):
+        self._bytecode: dict[str, bytes] = {}
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket):
+        if (data := self._bytecode.get(bucket.key)) is not None:
+            bucket.bytecode_from_string(data)
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket):
+        self._bytecode[bucket.key] = bucket.bytecode_to_string()
+
+    def clear(self):
+        self._bytecode.clear()
+
+
+def SetJinjaBytecodeCache(cache: jinja2.BytecodeCache | None):
+    """
+    Sets the bytecode cache used by code generators created after this call.
+
+    By default no cache is used and every code generator compiles the templates
+    it renders.
+    """
+    global _jinja_bytecode_cache
+    _jinja_bytecode_cache = cache
+
+
+def GetJinjaBytecodeCache() -> jinja2.BytecodeCache | None:
+    """Returns the bytecode cache set by SetJinjaBytecodeCache, if any."""
+    return _jinja_bytecode_cache
+
 
 class CodeGenerator:
     """
@@ -61,7 +100,7 @@ class CodeGenerator:
         self.storage = storage
         self.idl = idl
         self.jinja_env = jinja2.Environment(
-            loader=loader, keep_trailing_newline=True)
+            loader=loader, keep_trailing_newline=True, bytecode_cache=_jinja_bytecode_cache)
         self.dry_run = False
 
         RegisterCommonFilters(self.jinja_env.filters)
@@ -12,16 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import dataclasses
 import functools
+import hashlib
 import logging
+import os
+import pickle
 import pprint
+import sys
 
 import click
 from lark import Lark
 from lark.lexer import Token
 from lark.visitors import Transformer, v_args
 
+from matter.idl.file_cache import AtomicWrite, FileLock
 from matter.idl.matter_idl_types import (AccessPrivilege, ApiMaturity, Attribute, AttributeInstantiation, AttributeOperation,
                                          AttributeQuality, AttributeStorage, Bitmap, Cluster, Command, CommandInstantiation,
                                          CommandQuality, ConstantEntry, DataType, DeviceType, Endpoint, Enum, Event, EventPriority,
@@ -706,27 +712,85 @@ def _merge_global_types_into_clusters(idl: Idl) -> Idl:
     return dataclasses.replace(idl, clusters=[mapping.merge_global_types_into_cluster(cluster) for cluster in idl.clusters])
 
 
+@functools.cache
+def _parser_sources_digest() -> bytes:
+    """
+    Digest of everything that determines the IDL produced for a given input:
+    the grammar, the code transforming the parse tree and the types making up
+    the IDL.
+    """
+    digest = hashlib.sha256(repr(sys.version_info[:2]).encode())
+    directory = os.path.dirname(__file__)
+    for name in ('matter_grammar.lark', 'matter_idl_parser.py', 'matter_idl_types.py'):
+        with open(os.path.join(directory, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
 class ParserWithLines:
-    def __init__(self, skip_meta: bool, merge_globals: bool):
+    def __init__(self, skip_meta: bool, merge_globals: bool, cache_dir: str | None = None):
         self.transformer = MatterIdlTransformer(skip_meta)
+        self.skip_meta = skip_meta
         self.merge_globals = merge_globals
-
-        # NOTE: LALR parser is fast. While Earley could parse more ambigous grammars,
-        #       earley is much slower:
-        #    - 0.39s LALR parsing of all-clusters-app.matter
-        #    - 2.26s Earley parsing of the same thing.
-        # For this reason, every attempt should be made to make the grammar context free
-        self.parser = Lark.open(
-            'matter_grammar.lark', rel_to=__file__, start='idl', parser='lalr', propagate_positions=True,
-            maybe_placeholders=True,
-            # separate callbacks to ignore from regular parsing (no tokens)
-            # while still getting notified about them
-            lexer_callbacks={
-                'C_COMMENT': self.transformer.c_comment,
-            }
-        )
+        self.cache_dir = cache_dir
+        self._parser = None
+
+    @property
+    def parser(self) -> Lark:
+        # Only built when needed, as parsing may be served from the cache entirely
+        if self._parser is None:
+            # NOTE: LALR parser is fast. While Earley could parse more ambigous grammars,
+            #       earley is much slower:
+            #    - 0.39s LALR parsing of all-clusters-app.matter
+            #    - 2.26s Earley parsing of the same thing.
+            # For this reason, every attempt should be made to make the grammar context free
+            # Lark validates the cached tables against the grammar and options
+            cache_path = os.path.join(self.cache_dir, 'matter_grammar.lark.cache') if self.cache_dir else None
+            with FileLock(cache_path + '.lock') if cache_path else contextlib.nullcontext():
+                self._parser = Lark.open(
+                    'matter_grammar.lark', rel_to=__file__, start='idl', parser='lalr', propagate_positions=True,
+                    maybe_placeholders=True,
+                    # separate callbacks to ignore from regular parsing (no tokens)
+                    # while still getting notified about them
+                    lexer_callbacks={
+                        'C_COMMENT': self.transformer.c_comment,
+                    },
+                    cache=cache_path or False,
+                )
+        return self._parser
 
     def parse(self, file: str, file_name: str | None = None):
+        if not self.cache_dir:
+            return self._parse(file, file_name)
+
+        digest = hashlib.sha256(_parser_sources_digest())
+        digest.update(repr((self.skip_meta, self.merge_globals)).encode())
+        digest.update(file.encode())
+        cache_path = os.path.join(self.cache_dir, digest.hexdigest() + '.idl.pickle')
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Concurrent parses of the same content (e.g. several generators run in
+        # parallel on the same .matter file) parse it only once
+        with FileLock(cache_path + '.lock'):
+            idl = None
+            try:
+                with open(cache_path, 'rb') as f:
+                    idl = pickle.load(f)
+                LOGGER.debug("Loaded IDL of '%s' from cache %s", file_name, cache_path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                LOGGER.warning("Ignoring invalid IDL cache entry %s: %s", cache_path, e)
+
+            if idl is None:
+                idl = self._parse(file)
+                with AtomicWrite(cache_path) as f:
+                    pickle.dump(idl, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        idl.parse_file_name = file_name
+        return idl
+
+    def _parse(self, file: str, file_name: str | None = None):
         idl = self.transformer.transform(self.parser.parse(file))
         idl.parse_file_name = file_name
 
@@ -761,7 +825,7 @@ class ParserWithLines:
         return idl
 
 
-def CreateParser(skip_meta: bool = False, merge_globals=True):
+def CreateParser(skip_meta: bool = False, merge_globals=True, cache_dir: str | None = None):
     """
     Generates a parser that will process a ".matter" file into a IDL
 
@@ -775,8 +839,14 @@ def CreateParser(skip_meta: bool = False, merge_globals=True):
                        are self-sufficient. Useful as a backwards-compatible
                        code generation if global definitions are not supported.
 
+       cache_dir - directory where the parser tables and the IDL parsed from
+                   each input are cached, so that processes parsing the same
+                   content only parse it once. The cache is keyed by the
+                   content and by the parser sources, stale entries are never
+                   used.
+
     """
-    return ParserWithLines(skip_meta, merge_globals)
+    return ParserWithLines(skip_meta, merge_globals, cache_dir)
 
 
 # Supported log levels, mapping string values required for argument
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from matter.idl.file_cache import AtomicWrite, FileLock
+
+
+class TestFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'entry')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_atomic_write(self):
+        with AtomicWrite(self.path) as f:
+            f.write(b'first')
+        with AtomicWrite(self.path) as f:
+            f.write(b'second')
+            # The previous content stays in place until the new one is complete
+            with open(self.path, 'rb') as current:
+                self.assertEqual(current.read(), b'first')
+
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), b'second')
+        self.assertEqual(os.listdir(self.tmpdir.name), ['entry'])
+
+    def test_atomic_write_failure(self):
+        with self.assertRaises(RuntimeError), AtomicWrite(self.path) as f:
+            f.write(b'partial')
+            raise RuntimeError('failed')
+
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+    def test_file_lock(self):
+        lock_path = self.path + '.lock'
+        with FileLock(lock_path):
+            self.assertTrue(os.path.exists(lock_path))
+        # Released locks can be taken again
+        with FileLock(lock_path):
+            pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,7 @@ except ImportError:
     sys.path.append(str(Path(__file__).resolve().parent / ".." / ".."))
     from matter.idl.matter_idl_parser import CreateParser
 
+from matter.idl.generators import InMemoryBytecodeCache, SetJinjaBytecodeCache
 from matter.idl.generators.cpp.application import CppApplicationGenerator
 from matter.idl.generators.cpp.tlvmeta import TLVMetaDataGenerator
 from matter.idl.generators.java import JavaClassGenerator, JavaJNIGenerator
@@ -175,6 +176,23 @@ class TestGenerators(unittest.TestCase):
             with self.subTest(generator=test.generator_name):
                 test.run_test_cases(self)
 
+    def test_generators_with_shared_bytecode_cache(self):
+        with open(os.path.join(TESTS_DIR, "available_tests.yaml")) as stream:
+            yaml_data = yaml.safe_load(stream)
+
+        cache = InMemoryBytecodeCache()
+        SetJinjaBytecodeCache(cache)
+        try:
+            # Second round renders from the templates compiled in the first one
+            for _ in range(2):
+                for test in build_tests(yaml_data):
+                    with self.subTest(generator=test.generator_name):
+                        test.run_test_cases(self)
+        finally:
+            SetJinjaBytecodeCache(None)
+
+        self.assertTrue(cache._bytecode)
+
 
 if __name__ == '__main__':
     if 'IDL_GOLDEN_REGENERATE' in os.environ:
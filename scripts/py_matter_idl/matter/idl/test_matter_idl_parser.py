@@ -14,7 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
+import tempfile
 from difflib import unified_diff
 from pathlib import Path
 
@@ -1238,6 +1240,35 @@ server cluster A = 1 { /* Test comment */ }
         self.assertTrue(actual.clusters[0].commands[0].is_optional)
         self.assertTrue(actual.clusters[0].commands[1].is_optional)
 
+    def test_cache(self):
+        txt = """
+            /** Doc comments are part of the cached content */
+            server cluster MyCluster = 0x123 {
+                attribute int16u someAttr = 1;
+                readonly attribute nullable int32u other = 2;
+            }
+        """
+        expected = CreateParser().parse(txt, file_name="a.matter")
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold = CreateParser(cache_dir=cache_dir).parse(txt, file_name="a.matter")
+            entries = [name for name in os.listdir(cache_dir) if name.endswith('.idl.pickle')]
+            self.assertEqual(len(entries), 1)
+
+            warm_parser = CreateParser(cache_dir=cache_dir)
+            warm = warm_parser.parse(txt, file_name="b.matter")
+            # Served from the cache without building the parser
+            self.assertIsNone(warm_parser._parser)
+
+            self.assertIdlEqual(cold, expected)
+            self.assertEqual(warm.parse_file_name, "b.matter")
+            self.assertEqual(warm.clusters, expected.clusters)
+            self.assertEqual(warm.clusters[0].description, "Doc comments are part of the cached content")
+
+            # Parser options are part of the cache key
+            self.assertIdlEqual(CreateParser(skip_meta=True, cache_dir=cache_dir).parse(txt), parseText(txt))
+            self.assertEqual(len([name for name in os.listdir(cache_dir) if name.endswith('.idl.pickle')]), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
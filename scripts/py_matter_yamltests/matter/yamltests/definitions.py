@@ -15,14 +15,26 @@
 
 import enum
 import glob
+import hashlib
 import io
+import logging
+import os
+import pickle
+import sys
 
+from matter.idl.file_cache import AtomicWrite, FileLock
 from matter.idl.matter_idl_types import (Attribute, Bitmap, Cluster, Command, Enum, Event, FieldQuality, Struct, StructQuality,
                                          StructTag)
 from matter.idl.zapxml import ParseSource, ParseXmls
 
 from .pseudo_clusters.pseudo_clusters import PseudoClusters
 
+log = logging.getLogger(__name__)
+
+# Bump when the content of SpecDefinitions changes in a way the sources digest does not capture.
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_CACHE_DIR_ENV = 'MATTER_YAMLTESTS_SPEC_CACHE_DIR'
+
 
 class _ItemType(enum.Enum):
     Cluster = 0
@@ -288,7 +300,93 @@ class SpecDefinitions:
         return global_target | target
 
 
-def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: PseudoClusters | None = PseudoClusters([])):
+def _SourcesDigest() -> bytes:
+    """Digest of the code that turns the XML files into SpecDefinitions."""
+    digest = hashlib.sha256(repr((_SNAPSHOT_VERSION, sys.version_info[:2])).encode())
+    zapxml_dir = os.path.dirname(sys.modules[ParseSource.__module__].__file__)
+    code = [__file__, os.path.join(os.path.dirname(zapxml_dir), 'matter_idl_types.py')]
+    code += sorted(glob.glob(os.path.join(zapxml_dir, '**', '*.py'), recursive=True))
+    for name in code:
+        with open(name, 'rb') as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+def _SnapshotKey(sources: list[ParseSource]) -> str:
+    """Key of the snapshot of the definitions parsed from the given sources.
+
+    Files are identified by their path, modification time and size, streams
+    (e.g. pseudo clusters) by their content. The order of the sources is part
+    of the key since it is the parsing order.
+    """
+    digest = hashlib.sha256(_SourcesDigest())
+    for source in sources:
+        if isinstance(source.source, str):
+            stat = os.stat(source.source)
+            entry = ('file', os.path.abspath(source.source), stat.st_mtime_ns, stat.st_size)
+        else:
+            entry = ('stream', source.name, hashlib.sha256(source.source.getvalue().encode()).hexdigest())
+        digest.update(repr(entry).encode())
+    return digest.hexdigest()
+
+
+def _LoadSnapshot(path: str) -> SpecDefinitions | None:
+    try:
+        with open(path, 'rb') as f:
+            version, definitions = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning("Ignoring invalid definitions snapshot %s: %s", path, e)
+        return None
+
+    if version != _SNAPSHOT_VERSION or not isinstance(definitions, SpecDefinitions):
+        log.warning("Ignoring definitions snapshot %s of version %r", path, version)
+        return None
+    return definitions
+
+
+def _SaveSnapshot(path: str, definitions: SpecDefinitions):
+    with AtomicWrite(path) as f:
+        pickle.dump((_SNAPSHOT_VERSION, definitions), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def SpecDefinitionsFromSources(sources: list[ParseSource], cache_dir: str | None = None) -> SpecDefinitions:
+    """Builds the definitions of the given sources, using a snapshot stored in cache_dir if possible.
+
+    The snapshot is keyed on the set of XML files (paths, modification times
+    and sizes), the content of streamed sources and the parsing code, and is
+    rebuilt whenever any of those changes. Without a cache_dir, the sources
+    are always parsed.
+    """
+    if not cache_dir:
+        return SpecDefinitions(sources)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, _SnapshotKey(sources) + '.definitions.pickle')
+
+    definitions = _LoadSnapshot(path)
+    if definitions is not None:
+        return definitions
+
+    # Runners started concurrently with a cold cache wait for the first one to
+    # build the snapshot instead of all parsing the XML files
+    with FileLock(path + '.lock'):
+        # Another process may have built the snapshot while waiting for the lock
+        definitions = _LoadSnapshot(path)
+        if definitions is None:
+            definitions = SpecDefinitions(sources)
+            _SaveSnapshot(path, definitions)
+    return definitions
+
+
+def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: PseudoClusters | None = PseudoClusters([]),
+                             cache_dir: str | None = None):
+    """Builds the definitions of the XML files matching paths, and of the pseudo clusters.
+
+    cache_dir defaults to the MATTER_YAMLTESTS_SPEC_CACHE_DIR environment
+    variable, see SpecDefinitionsFromSources.
+    """
     filenames = []
     for path in paths:
         if '*' in path or '?' in path:
@@ -305,4 +403,6 @@ def SpecDefinitionsFromPaths(paths: str, pseudo_clusters: PseudoClusters | None
             sources = (
                 sources + [ParseSource(source=io.StringIO(definition), name=name)])
 
-    return SpecDefinitions(sources)
+    if cache_dir is None:
+        cache_dir = os.environ.get(_SNAPSHOT_CACHE_DIR_ENV)
+    return SpecDefinitionsFromSources(sources, cache_dir)
@@ -290,3 +290,16 @@ class WebSocketRunnerHooks:
             How long we will wait before retrying to connect, in seconds.
         """
         pass
+
+    def latencies(self, server_startup, round_trip):
+        """
+        This method is called when the runner is closed, with the latencies it observed.
+
+        Parameters
+        ----------
+        server_startup: LatencyHistogram
+            How long it took to start the websocket server, in milliseconds, for each start.
+        round_trip: LatencyHistogram
+            How long it took to receive the response of each request, in milliseconds.
+        """
+        pass
@@ -775,6 +775,16 @@ class TestStep:
     def is_attribute(self):
         return self._test.is_attribute
 
+    @property
+    def saves_variables(self) -> bool:
+        '''Indicates whether post processing the response of this step saves runtime variables.'''
+        if self._test.save_response_as:
+            return True
+        return any(key in value
+                   for response in self.responses
+                   for value in response.get('values', [])
+                   for key in ('saveAs', 'saveDataVersionAs'))
+
     @property
     def is_event(self):
         return self._test.is_event
@@ -1459,6 +1469,17 @@ class TestParserConfig:
     pics: str = None
     definitions: SpecDefinitions = None
     config_override: dict = field(default_factory=dict)
+    _pics_checker: tuple[str, PICSChecker] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def pics_checker(self) -> PICSChecker:
+        '''
+        The checker of the PICS file, loaded once and shared by all the tests
+        parsed with this configuration.
+        '''
+        if self._pics_checker is None or self._pics_checker[0] != self.pics:
+            self._pics_checker = (self.pics, PICSChecker(self.pics))
+        return self._pics_checker[1]
 
 
 class TestParser:
@@ -1475,7 +1496,7 @@ class TestParser:
         self.tests = YamlTests(
             config,
             parser_config.definitions,
-            PICSChecker(parser_config.pics),
+            parser_config.pics_checker,
             tests
         )
         self.timeout = config['timeout']
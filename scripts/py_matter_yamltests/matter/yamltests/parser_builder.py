@@ -13,8 +13,10 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import asyncio
 import copy
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 from .hooks import TestParserHooks
@@ -30,8 +32,14 @@ class TestParserBuilderOptions:
     stop_on_error: If set to False the parser will continue parsing
                    the next test instead of aborting if an error is
                    encountered while parsing a particular test file.
+
+    parse_ahead: If set to a positive number, up to that many of the
+                 upcoming tests are parsed in a background thread while
+                 the current one is being used. The hooks are still
+                 called in order, as each test is handed out.
     """
     stop_on_error: bool = True
+    parse_ahead: int = 0
 
 
 @dataclass
@@ -60,46 +68,103 @@ class TestParserBuilderConfig:
 class TestParserBuilder:
     """
     TestParserBuilder is an iterator over a set of tests using a common configuration.
+
+    It can also be iterated asynchronously, which waits for the tests parsed
+    in the background without blocking the event loop.
     """
 
     def __init__(self, config: TestParserBuilderConfig = TestParserBuilderConfig()):
         self.__tests = copy.copy(config.tests)
         self.__config = config
         self.__duration = 0
+        self.__pending: list[tuple[str, Future]] = []
+        self.__executor = None
         self.done = False
 
+        if config.options.parse_ahead > 0:
+            self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='TestParserBuilder')
+
     def __iter__(self):
         self.__config.hooks.parsing_start(len(self.__tests))
         return self
 
     def __next__(self):
-        if len(self.__tests):
-            return self.__get_test_parser(self.__tests.pop(0))
+        pending = self.__next_pending()
+        if pending is not None:
+            test_file, future = pending
+            stop, parser = self.__report(test_file, *future.result())
+            if not stop:
+                return parser
+
+        self.__finish()
+        raise StopIteration
 
+    def __aiter__(self):
+        self.__config.hooks.parsing_start(len(self.__tests))
+        return self
+
+    async def __anext__(self):
+        pending = self.__next_pending()
+        if pending is not None:
+            test_file, future = pending
+            stop, parser = self.__report(test_file, *await asyncio.wrap_future(future))
+            if not stop:
+                return parser
+
+        self.__finish()
+        raise StopAsyncIteration
+
+    def close(self):
+        """
+        Stops parsing the upcoming tests in the background.
+        """
+        for _, future in self.__pending:
+            future.cancel()
+        self.__pending = []
+        if self.__executor:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    def __next_pending(self) -> tuple[str, Future] | None:
+        if self.__executor:
+            while self.__tests and len(self.__pending) <= self.__config.options.parse_ahead:
+                test_file = self.__tests.pop(0)
+                self.__pending.append((test_file, self.__executor.submit(self.__parse, test_file)))
+        elif self.__tests:
+            test_file = self.__tests.pop(0)
+            future = Future()
+            future.set_result(self.__parse(test_file))
+            self.__pending.append((test_file, future))
+
+        return self.__pending.pop(0) if self.__pending else None
+
+    def __finish(self):
+        self.close()
         if not self.done:
             self.__config.hooks.parsing_stop(round(self.__duration))
         self.done = True
 
-        raise StopIteration
-
-    def __get_test_parser(self, test_file: str) -> TestParser:
+    def __parse(self, test_file: str) -> tuple[TestParser | None, Exception | None, float]:
         start = time.time()
 
         parser = None
         exception = None
         try:
-            self.__config.hooks.test_parsing_start(test_file)
             parser = TestParser(test_file, self.__config.parser_config)
         except Exception as e:
             exception = e
 
         duration = round((time.time() - start) * 1000, 0)
+        return parser, exception, duration
+
+    def __report(self, test_file: str, parser: TestParser | None, exception: Exception | None,
+                 duration: float) -> tuple[bool, TestParser | None]:
+        self.__config.hooks.test_parsing_start(test_file)
+
         self.__duration += duration
         if exception:
             self.__config.hooks.test_parsing_failure(exception, duration)
-            if self.__config.options.stop_on_error:
-                raise StopIteration
-            return None
+            return self.__config.options.stop_on_error, None
 
         self.__config.hooks.test_parsing_success(duration)
-        return parser
+        return False, parser
@@ -13,13 +13,16 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import functools
 import unicodedata
+from collections.abc import Callable
 
 _COMMENT_CHARACTER = '#'
 _VALUE_SEPARATOR = '='
 _VALUE_DISABLED = '0'
 _VALUE_ENABLED = '1'
 _CONTROL_CHARACTER_IDENTIFIER = 'C'
+_COMPILED_EXPRESSIONS_CACHE_SIZE = 4096
 
 
 class InvalidPICSConfigurationError(Exception):
@@ -37,12 +40,117 @@ class InvalidPICSParsingError(Exception):
     pass
 
 
+def _tokenize(expression: str) -> list[str]:
+    token = ''
+    tokens = []
+
+    for c in expression:
+        if c == ' ' or c == '\t' or c == '\n':
+            pass
+        elif c == '(' or c == ')' or c == '!':
+            if token:
+                tokens.append(token)
+                token = ''
+            tokens.append(c)
+        elif c == '&' or c == '|':
+            if token and token[-1] == c:
+                token = token[:-1]
+                if token:
+                    tokens.append(token)
+                    token = ''
+                tokens.append(c + c)
+            else:
+                token += c
+        else:
+            token += c
+
+    if token:
+        tokens.append(token)
+        token = ''
+
+    return tokens
+
+
+@functools.lru_cache(maxsize=_COMPILED_EXPRESSIONS_CACHE_SIZE)
+def _compile(expression: str) -> Callable[[dict], bool]:
+    """
+    Compiles a PICS expression into a function evaluating it against a PICS
+    dictionary.
+
+    '&&' and '||' have the same precedence and group to the right, i.e.
+    'A && B || C' is 'A && (B || C)'. Tokens following the expression are
+    ignored.
+    """
+    tokens = _tokenize(expression)
+    index = 0
+
+    def compile_expression():
+        nonlocal index
+        left = compile_sub_expression()
+        if index >= len(tokens):
+            return left
+
+        token = tokens[index]
+
+        if token == ')':
+            return left
+
+        if token == '&&':
+            index += 1
+            right = compile_expression()
+            return lambda pics: left(pics) and right(pics)
+
+        if token == '||':
+            index += 1
+            right = compile_expression()
+            return lambda pics: left(pics) or right(pics)
+
+        raise InvalidPICSParsingError(f'Unknown token: {token}')
+
+    def compile_sub_expression():
+        nonlocal index
+        token = tokens[index]
+        if token == '(':
+            index += 1
+            expr = compile_expression()
+            if tokens[index] != ')':
+                raise KeyError('Missing ")"')
+
+            index += 1
+            return expr
+
+        if token == '!':
+            index += 1
+            expr = compile_sub_expression()
+            return lambda pics: not expr(pics)
+
+        index += 1
+
+        # Convert to all-lowercase so people who mess up cases don't have things
+        # break on them in subtle ways.
+        # TODO strip off "(Additional Context)" bits from the end of the code.
+        item = token.lower()
+
+        # By default, let's consider that if a PICS item is not defined, it is |false|.
+        # It allows to create a file that only contains enabled features.
+        return lambda pics: pics.get(item, False)
+
+    return compile_expression()
+
+
 class PICSChecker:
-    """Class to compute a PICS expression"""
+    """
+    Class to compute a PICS expression
+
+    The expressions are compiled once and the result of each expression is
+    remembered, so checking the steps of many tests against the same checker
+    costs a dictionary lookup per step. A checker can be used from several
+    threads at once.
+    """
 
     def __init__(self, pics_file: str):
         self.__pics = {}
-        self.__expression_index = 0
+        self.__results: dict[str, bool] = {}
 
         if pics_file is not None:
             self.__pics = self.__parse(pics_file)
@@ -51,9 +159,11 @@ class PICSChecker:
         if pics is None:
             return True
 
-        self.__expression_index = 0
-        tokens = self.__tokenize(pics)
-        return self.__evaluate_expression(tokens, self.__pics)
+        result = self.__results.get(pics)
+        if result is None:
+            result = _compile(pics)(self.__pics)
+            self.__results[pics] = result
+        return result
 
     def __parse(self, pics_file: str):
         pics = {}
@@ -78,86 +188,6 @@ class PICSChecker:
                 line = f.readline()
         return pics
 
-    def __evaluate_expression(self, tokens: list[str], pics: dict):
-        leftExpr = self.__evaluate_sub_expression(tokens, pics)
-        if self.__expression_index >= len(tokens):
-            return leftExpr
-
-        token = tokens[self.__expression_index]
-
-        if token == ')':
-            return leftExpr
-
-        token = tokens[self.__expression_index]
-
-        if token == '&&':
-            self.__expression_index += 1
-            rightExpr = self.__evaluate_expression(tokens, pics)
-            return leftExpr and rightExpr
-
-        if token == '||':
-            self.__expression_index += 1
-            rightExpr = self.__evaluate_expression(tokens, pics)
-            return leftExpr or rightExpr
-
-        raise InvalidPICSParsingError(f'Unknown token: {token}')
-
-    def __evaluate_sub_expression(self, tokens: list[str], pics: dict):
-        token = tokens[self.__expression_index]
-        if token == '(':
-            self.__expression_index += 1
-            expr = self.__evaluate_expression(tokens, pics)
-            if tokens[self.__expression_index] != ')':
-                raise KeyError('Missing ")"')
-
-            self.__expression_index += 1
-            return expr
-
-        if token == '!':
-            self.__expression_index += 1
-            expr = self.__evaluate_sub_expression(tokens, pics)
-            return not expr
-
-        token = self.__normalize(token)
-        self.__expression_index += 1
-
-        if pics.get(token) is None:
-            # By default, let's consider that if a PICS item is not defined, it is |false|.
-            # It allows to create a file that only contains enabled features.
-            return False
-
-        return pics.get(token)
-
-    def __tokenize(self, expression: str):
-        token = ''
-        tokens = []
-
-        for c in expression:
-            if c == ' ' or c == '\t' or c == '\n':
-                pass
-            elif c == '(' or c == ')' or c == '!':
-                if token:
-                    tokens.append(token)
-                    token = ''
-                tokens.append(c)
-            elif c == '&' or c == '|':
-                if token and token[-1] == c:
-                    token = token[:-1]
-                    if token:
-                        tokens.append(token)
-                        token = ''
-                    tokens.append(c + c)
-                else:
-                    token += c
-            else:
-                token += c
-
-        if token:
-            tokens.append(token)
-            token = ''
-
-        return tokens
-
     def __preprocess_input(self, value: str):
         value = self.__remove_comments(value)
         value = self.__remove_control_characters(value)
@@ -175,10 +205,3 @@ class PICSChecker:
 
     def __make_lowercase(self, value: str) -> str:
         return value.lower()
-
-    def __normalize(self, token: str):
-        # Convert to all-lowercase so people who mess up cases don't have things
-        # break on them in subtle ways.
-        return self.__make_lowercase(token)
-
-        # TODO strip off "(Additional Context)" bits from the end of the code.
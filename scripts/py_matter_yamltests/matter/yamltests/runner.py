@@ -15,9 +15,12 @@
 
 import ast
 import asyncio
+import dataclasses
+import inspect
 import time
 from abc import ABC, abstractmethod
 from asyncio import CancelledError
+from collections import deque
 from dataclasses import dataclass, field
 
 from .adapter import TestAdapter
@@ -48,11 +51,19 @@ class TestRunnerOptions:
 
     delay_in_ms:  If set to any value that is not zero the runner will
                   wait for the given time between steps.
+
+    pipeline_depth: If set to a number greater than 1, up to that many
+                    consecutive attribute reads are sent before the
+                    response of the first one is received. The steps are
+                    still reported in order. A read saving a variable is
+                    completed before the next step is sent. Pipelining
+                    is disabled when delay_in_ms is set.
     """
     stop_on_error: bool = True
     stop_on_warning: bool = False
     stop_at_number: int = -1
     delay_in_ms: int = 0
+    pipeline_depth: int = 1
 
 
 @dataclass
@@ -74,6 +85,7 @@ class TestRunnerConfig:
 
     auto_start_stop: Indicates whether the run method should start and stop
             the runner of if that will be handled outside of that method.
+            If set, the runner is also closed once the suite is done.
     """
     adapter: TestAdapter = None
     pseudo_clusters: PseudoClusters = PseudoClusters([])
@@ -133,24 +145,46 @@ class TestRunner(TestRunnerBase):
     async def execute(self, request):
         return request
 
+    async def send(self, request) -> asyncio.Future:
+        """
+        This method sends a request without waiting for its response, and
+        returns a future resolving to the response. Runners which can not
+        have several requests in flight execute the request right away.
+        """
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(await self.execute(request))
+        return future
+
     async def stop(self):
         return
 
+    async def close(self):
+        """
+        This method is called once all the test files have run, to release
+        what the runner keeps across tests.
+        """
+        return
+
     async def run(self, parser_builder_config: TestParserBuilderConfig, runner_config: TestRunnerConfig):
         if runner_config and runner_config.hooks:
             start = time.time()
             runner_config.hooks.start(len(parser_builder_config.tests))
 
         parser_builder = TestParserBuilder(parser_builder_config)
-        for parser in parser_builder:
-            if not parser or not runner_config:
-                continue
+        try:
+            for parser in parser_builder:
+                if not parser or not runner_config:
+                    continue
 
-            result = await self._run_with_timeout(parser, runner_config)
-            if isinstance(result, (Exception, CancelledError)):
-                raise (result)
-            if not result:
-                return False
+                result = await self._run_with_timeout(parser, runner_config)
+                if isinstance(result, (Exception, CancelledError)):
+                    raise (result)
+                if not result:
+                    return False
+        finally:
+            parser_builder.close()
+            if runner_config and runner_config.auto_start_stop:
+                await self.close()
 
         if runner_config and runner_config.hooks:
             duration = round((time.time() - start) * 1000)
@@ -195,7 +229,29 @@ class TestRunner(TestRunnerBase):
             hooks.test_start(parser.filename, parser.name, parser.tests.count)
 
             test_duration = 0
+            pipelined = deque()
             for idx, request in enumerate(parser.tests):
+                if self._can_pipeline(request, config):
+                    encoded_request = config.adapter.encode(request)
+                    pipelined.append((idx, request, await self.send(encoded_request), time.time()))
+
+                    # The next steps may depend on the variables saved by this one.
+                    must_complete = request.saves_variables or (idx + 1) == config.options.stop_at_number
+                    keep = 0 if must_complete else config.options.pipeline_depth - 1
+                    duration, stop_status = await self._complete_pipelined_steps(pipelined, keep, config)
+                    test_duration += duration
+                    if stop_status is not None:
+                        status = stop_status
+                        break
+                    continue
+
+                # Any other step runs once the steps in flight are done.
+                duration, stop_status = await self._complete_pipelined_steps(pipelined, 0, config)
+                test_duration += duration
+                if stop_status is not None:
+                    status = stop_status
+                    break
+
                 # Handle skipping tests where PICS do not apply.
                 if not request.is_pics_enabled:
                     hooks.step_skipped(request.label, request.pics)
@@ -249,27 +305,18 @@ class TestRunner(TestRunnerBase):
                 duration = round((time.time() - start) * 1000, 2)
                 test_duration += duration
 
-                logger = request.post_process_response(responses)
-
-                if logger.is_failure():
-                    hooks.step_failure(logger, logs, duration,
-                                       request, responses)
-                else:
-                    hooks.step_success(logger, logs, duration, request)
-
-                if logger.is_failure() and config.options.stop_on_error:
-                    status = False
-                    break
-
-                if logger.warnings and config.options.stop_on_warning:
-                    status = False
-                    break
-
-                if (idx + 1) == config.options.stop_at_number:
+                stop_status = self._post_process_step(idx, request, responses, logs, duration, config)
+                if stop_status is not None:
+                    status = stop_status
                     break
 
                 if config.options.delay_in_ms:
                     await asyncio.sleep(config.options.delay_in_ms / 1000)
+            else:
+                duration, stop_status = await self._complete_pipelined_steps(pipelined, 0, config)
+                test_duration += duration
+                if stop_status is not None:
+                    status = stop_status
 
             hooks.test_stop(round(test_duration))
 
@@ -277,3 +324,176 @@ class TestRunner(TestRunnerBase):
             status = exception
         finally:
             return status
+
+    def _can_pipeline(self, request, config: TestRunnerConfig) -> bool:
+        options = config.options
+        return (options.pipeline_depth > 1 and not options.delay_in_ms and config.adapter is not None and
+                request.is_pics_enabled and request.is_revision_condition_passed and
+                request.command == 'readAttribute' and request.wait_for is None and
+                not config.pseudo_clusters.supports(request) and not config.pseudo_clusters.is_manual_step(request))
+
+    async def _complete_pipelined_steps(self, pipelined: deque, keep: int, config: TestRunnerConfig):
+        """
+        Waits for the responses of the pipelined steps, oldest first, until at
+        most `keep` steps are left in flight.
+
+        Returns the duration of the completed steps, and None to go on with
+        the test or the status of the test to stop it.
+        """
+        total_duration = 0
+        while len(pipelined) > keep:
+            idx, request, future, start = pipelined.popleft()
+            responses, logs = config.adapter.decode(await future)
+            duration = round((time.time() - start) * 1000, 2)
+            total_duration += duration
+
+            config.hooks.step_start(request)
+            stop_status = self._post_process_step(idx, request, responses, logs, duration, config)
+            if stop_status is not None:
+                return total_duration, stop_status
+        return total_duration, None
+
+    def _post_process_step(self, idx: int, request, responses, logs, duration: float, config: TestRunnerConfig):
+        """
+        Validates the responses of a step and reports the result to the hooks.
+
+        Returns None to go on with the test, or the status of the test to stop it.
+        """
+        hooks = config.hooks
+        logger = request.post_process_response(responses)
+
+        if logger.is_failure():
+            hooks.step_failure(logger, logs, duration,
+                               request, responses)
+        else:
+            hooks.step_success(logger, logs, duration, request)
+
+        if logger.is_failure() and config.options.stop_on_error:
+            return False
+
+        if logger.warnings and config.options.stop_on_warning:
+            return False
+
+        if (idx + 1) == config.options.stop_at_number:
+            return True
+
+        return None
+
+
+class _BufferedTestRunnerHooks:
+    """
+    Records the hook calls made while running a test, so that they can be
+    replayed on the wrapped hooks once the test is done and the output of
+    tests running concurrently is not interleaved.
+
+    The interactive hooks (step_manual, show_prompt) can not be deferred: the
+    calls recorded so far are replayed first, and the hook is called while
+    holding the output lock shared by all the tests.
+    """
+
+    def __init__(self, hooks: TestRunnerHooks, output_lock: asyncio.Lock):
+        self._hooks = hooks
+        self._output_lock = output_lock
+        self._calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self._hooks, name)
+        if not callable(method):
+            return method
+
+        if inspect.iscoroutinefunction(method):
+            async def interactive(*args, **kwargs):
+                async with self._output_lock:
+                    self.flush()
+                    return await method(*args, **kwargs)
+            return interactive
+
+        def record(*args, **kwargs):
+            self._calls.append((method, args, kwargs))
+        return record
+
+    def flush(self):
+        calls, self._calls = self._calls, []
+        for method, args, kwargs in calls:
+            method(*args, **kwargs)
+
+
+class TestRunnerPool:
+    """
+    TestRunnerPool runs the test files of a suite concurrently, each one on
+    the first of its runners that is idle.
+
+    The runners must be independent, e.g. WebSocketRunner instances each
+    using its own server port, and so must be the tests: two tests running at
+    the same time must not target the same device.
+
+    While running, the hook calls of each test are held back and replayed at
+    once when the test is done, so the output of a test is never interleaved
+    with the output of another one. The upcoming tests are parsed in the
+    background while the current ones run.
+
+    As for TestRunner, a failing test stops the suite: no further test is
+    started, and the run returns once the tests already running are done.
+    """
+    __test__ = False
+
+    def __init__(self, runners: list[TestRunner]):
+        if not runners:
+            raise ValueError('TestRunnerPool needs at least one runner')
+        self._runners = runners
+
+    async def run(self, parser_builder_config: TestParserBuilderConfig, runner_config: TestRunnerConfig) -> bool:
+        if runner_config and runner_config.hooks:
+            start = time.time()
+            runner_config.hooks.start(len(parser_builder_config.tests))
+
+        options = dataclasses.replace(
+            parser_builder_config.options,
+            parse_ahead=max(parser_builder_config.options.parse_ahead, len(self._runners)))
+        parser_builder = TestParserBuilder(dataclasses.replace(parser_builder_config, options=options))
+        parsers = aiter(parser_builder)
+        parsing_lock = asyncio.Lock()
+        output_lock = asyncio.Lock()
+        failures = []
+
+        async def run_tests(runner: TestRunner):
+            while not failures:
+                # Tests are handed out one at a time, so that the parsing hooks are called in order.
+                async with parsing_lock:
+                    try:
+                        parser = await anext(parsers)
+                    except StopAsyncIteration:
+                        return
+                if not parser or not runner_config:
+                    continue
+
+                config = runner_config
+                if runner_config.hooks:
+                    config = dataclasses.replace(
+                        runner_config, hooks=_BufferedTestRunnerHooks(runner_config.hooks, output_lock))
+                result = await runner._run_with_timeout(parser, config)
+                if runner_config.hooks:
+                    async with output_lock:
+                        config.hooks.flush()
+
+                if isinstance(result, (Exception, CancelledError)) or not result:
+                    failures.append(result)
+
+        try:
+            await asyncio.gather(*(run_tests(runner) for runner in self._runners))
+        finally:
+            parser_builder.close()
+            if runner_config and runner_config.auto_start_stop:
+                await asyncio.gather(*(runner.close() for runner in self._runners))
+
+        for result in failures:
+            if isinstance(result, (Exception, CancelledError)):
+                raise (result)
+        if failures:
+            return False
+
+        if runner_config and runner_config.hooks:
+            duration = round((time.time() - start) * 1000)
+            runner_config.hooks.stop(duration)
+
+        return parser_builder.done
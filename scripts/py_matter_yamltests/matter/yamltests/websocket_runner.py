@@ -14,12 +14,15 @@
 #    limitations under the License.
 
 import asyncio
+import contextlib
+import itertools
 import logging
 import re
 import select
 import subprocess
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 
 import websockets
 
@@ -36,6 +39,48 @@ _WEBSOCKET_SERVER_MESSAGE_TIMEOUT = 60  # seconds
 _WEBSOCKET_SERVER_TERMINATE_TIMEOUT = 10  # seconds
 
 
+class LatencyHistogram:
+    """
+    Counts durations, in milliseconds, in buckets whose upper bounds are
+    powers of two.
+    """
+
+    def __init__(self):
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float):
+        bound = 1
+        while bound < duration:
+            bound *= 2
+        self.buckets[bound] = self.buckets.get(bound, 0) + 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """Returns the upper bound of the bucket holding the given percentile."""
+        rank = self.count * percent / 100
+        seen = 0
+        for bound in sorted(self.buckets):
+            seen += self.buckets[bound]
+            if seen >= rank:
+                return bound
+        return 0
+
+    def __str__(self):
+        if not self.count:
+            return 'no samples'
+        return (f'{self.count} samples, mean {self.mean:.1f} ms, p50 <= {self.percentile(50)} ms, '
+                f'p99 <= {self.percentile(99)} ms, max {self.max:.1f} ms')
+
+
 @dataclass
 class WebSocketRunnerConfig:
     server_address: str = 'localhost'
@@ -43,13 +88,41 @@ class WebSocketRunnerConfig:
     server_path: str = None
     server_arguments: str = None
     hooks: WebSocketRunnerHooks = WebSocketRunnerHooks()
+    # Keep the server started by start() running until close(), instead of restarting it for every test.
+    persistent_server: bool = False
+
+
+@dataclass
+class _InFlightRequest:
+    sequence: int
+    future: asyncio.Future
+    sent_at: float = field(default_factory=time.time)
 
 
 class WebSocketRunner(TestRunner):
+    """
+    Runs the tests against a websocket server, e.g. chip-tool started as an interactive server.
+
+    The server handles the requests one at a time and answers them in the
+    order they are received. Requests are numbered as they are sent and the
+    responses, read by a background task, are matched to them in that order,
+    which allows several requests to be in flight (see send()).
+
+    The round trip of each request and the startup time of the server are
+    collected in LatencyHistograms, reported to the hooks on close().
+    """
+
     def __init__(self, config: WebSocketRunnerConfig):
         self._client = None
         self._server = None
+        self._receiver = None
         self._hooks = config.hooks
+        self._persistent_server = config.persistent_server
+        self._sequence = itertools.count()
+        self._in_flight: deque[_InFlightRequest] = deque()
+
+        self.server_startup_latency = LatencyHistogram()
+        self.round_trip_latency = LatencyHistogram()
 
         self._server_connection_url = self._make_server_connection_url(
             config.server_address, config.server_port)
@@ -64,21 +137,80 @@ class WebSocketRunner(TestRunner):
         return self._client.state == websockets.protocol.State.OPEN
 
     async def start(self):
+        if self._persistent_server and self.is_connected and (self._server is None or self._server.poll() is None):
+            return
+
+        # A persistent server may have died or closed the connection since the last test.
+        await self._stop()
+
+        start = time.time()
         self._server = await self._start_server(self._server_startup_command, self._server_connection_url)
+        if self._server:
+            self.server_startup_latency.add((time.time() - start) * 1000)
         self._client = await self._start_client(self._server_connection_url)
+        self._receiver = asyncio.create_task(self._receive_responses(self._client))
 
     async def stop(self):
+        if not self._persistent_server:
+            await self._stop()
+
+    async def close(self):
+        await self._stop()
+        self._hooks.latencies(self.server_startup_latency, self.round_trip_latency)
+
+    async def send(self, request) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        instance = self._client
+        if not instance:
+            future.set_result(None)
+            return future
+
+        in_flight = _InFlightRequest(next(self._sequence), future)
+        self._in_flight.append(in_flight)
+        try:
+            await instance.send(request)
+        except BaseException:
+            self._in_flight.remove(in_flight)
+            raise
+        return future
+
+    async def execute(self, request):
+        return await (await self.send(request))
+
+    async def _stop(self):
+        if self._receiver:
+            self._receiver.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._receiver
         await self._stop_client(self._client)
         await self._stop_server(self._server)
+        self._fail_in_flight(ConnectionError(f'Connection to {self._server_connection_url} closed.'))
+        self._receiver = None
         self._client = None
         self._server = None
 
-    async def execute(self, request):
-        instance = self._client
-        if instance:
-            await instance.send(request)
-            return await instance.recv()
-        return None
+    async def _receive_responses(self, instance):
+        error = ConnectionError(f'Connection to {self._server_connection_url} closed.')
+        try:
+            async for message in instance:
+                if not self._in_flight:
+                    LOGGER.warning('Dropping a message received while no request is in flight')
+                    continue
+                in_flight = self._in_flight.popleft()
+                self.round_trip_latency.add((time.time() - in_flight.sent_at) * 1000)
+                LOGGER.debug('Received the response to request %d', in_flight.sequence)
+                if not in_flight.future.done():
+                    in_flight.future.set_result(message)
+        except websockets.exceptions.ConnectionClosed as e:
+            error = e
+        finally:
+            self._fail_in_flight(error)
+
+    def _fail_in_flight(self, error: Exception):
+        while self._in_flight:
+            future = self._in_flight.popleft().future
+            if not future.done():
+                future.set_exception(error)
 
     async def _start_client(self, url, max_retries=_CONNECT_MAX_RETRIES_DEFAULT, interval_between_retries=1):
         if max_retries:
@@ -106,8 +238,6 @@ class WebSocketRunner(TestRunner):
     async def _start_server(self, command, url):
         instance = None
         if command:
-            start_time = time.time()
-
             instance = subprocess.Popen(    # noqa: ASYNC220
                 command,
                 bufsize=0,                  # unbuffered
@@ -116,35 +246,39 @@ class WebSocketRunner(TestRunner):
                 stderr=subprocess.STDOUT,
             )
 
-            # Loop to read the subprocess output with a timeout
-            lines = []
-            while True:
-                if time.time() - start_time > _WEBSOCKET_SERVER_MESSAGE_TIMEOUT:
-                    for line in lines:
-                        print(line.decode('utf-8', errors='replace'), end='')
-                    self._hooks.abort(url)
-                    await self._stop_server(instance)
-                    raise Exception(
-                        f'Connecting to {url} failed. WebSocket startup has not been detected.')
-
-                ready, _, _ = select.select([instance.stdout], [], [], 1)
-                if ready:
-                    line = instance.stdout.readline()
-                    if line:
-                        lines.append(line)
-                        if re.search(_WEBSOCKET_SERVER_MESSAGE, line.decode('utf-8', errors='replace')):
-                            break  # Exit the loop if the pattern is found
-                else:
-                    continue
+            # Wait for the server in a thread, so that other runners sharing the event loop are not blocked
+            ready, lines = await asyncio.to_thread(self._wait_for_server_ready, instance)
+            if not ready:
+                for line in lines:
+                    print(line.decode('utf-8', errors='replace'), end='')
+                self._hooks.abort(url)
+                await self._stop_server(instance)
+                raise Exception(
+                    f'Connecting to {url} failed. WebSocket startup has not been detected.')
             instance.stdout.close()
 
         return instance
 
+    def _wait_for_server_ready(self, instance) -> tuple[bool, list[bytes]]:
+        start_time = time.time()
+
+        # Loop to read the subprocess output with a timeout
+        lines = []
+        while time.time() - start_time <= _WEBSOCKET_SERVER_MESSAGE_TIMEOUT:
+            ready, _, _ = select.select([instance.stdout], [], [], 1)
+            if ready:
+                line = instance.stdout.readline()
+                if line:
+                    lines.append(line)
+                    if re.search(_WEBSOCKET_SERVER_MESSAGE, line.decode('utf-8', errors='replace')):
+                        return True, lines
+        return False, lines
+
     async def _stop_server(self, instance):
         if instance:
             instance.terminate()  # sends SIGTERM
             try:
-                instance.wait(_WEBSOCKET_SERVER_TERMINATE_TIMEOUT)
+                await asyncio.to_thread(instance.wait, _WEBSOCKET_SERVER_TERMINATE_TIMEOUT)
             except subprocess.TimeoutExpired:
                 LOGGER.debug(
                     'Subprocess did not terminate on SIGTERM, killing it now')
@@ -14,12 +14,13 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import asyncio
 import unittest
 from unittest.mock import mock_open, patch
 
 from matter.yamltests.hooks import TestParserHooks
 from matter.yamltests.parser import TestParser
-from matter.yamltests.parser_builder import TestParserBuilder, TestParserBuilderConfig
+from matter.yamltests.parser_builder import TestParserBuilder, TestParserBuilderConfig, TestParserBuilderOptions
 
 simple_yaml = '''
 name: Hello World
@@ -202,6 +203,40 @@ class TestSuiteParserBuilder(unittest.TestCase):
         self.assertEqual(hooks.test_success_count, 0)
         self.assertEqual(hooks.test_failure_count, 1)
 
+    def test_parser_builder_parse_ahead(self):
+        tests = [valid_yaml, invalid_yaml, valid_yaml]
+        hooks = TestHooks()
+        options = TestParserBuilderOptions(stop_on_error=False, parse_ahead=2)
+        parser_builder = TestParserBuilder(TestParserBuilderConfig(tests, hooks=hooks, options=options))
+
+        parsers = list(parser_builder)
+        self.assertIsInstance(parsers[0], TestParser)
+        self.assertIsNone(parsers[1])
+        self.assertIsInstance(parsers[2], TestParser)
+
+        self.assertEqual(hooks.start_count, 1)
+        self.assertEqual(hooks.stop_count, 1)
+        self.assertEqual(hooks.test_start_count, 3)
+        self.assertEqual(hooks.test_success_count, 2)
+        self.assertEqual(hooks.test_failure_count, 1)
+
+    def test_parser_builder_async_iteration(self):
+        tests = [valid_yaml, invalid_yaml, valid_yaml]
+        hooks = TestHooks()
+        options = TestParserBuilderOptions(parse_ahead=1)
+        parser_builder = TestParserBuilder(TestParserBuilderConfig(tests, hooks=hooks, options=options))
+
+        async def collect():
+            return [parser async for parser in parser_builder]
+
+        # The parsing stops at the first error.
+        parsers = asyncio.run(collect())
+        self.assertEqual(len(parsers), 1)
+        self.assertIsInstance(parsers[0], TestParser)
+        self.assertTrue(parser_builder.done)
+        self.assertEqual(hooks.test_start_count, 2)
+        self.assertEqual(hooks.test_failure_count, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
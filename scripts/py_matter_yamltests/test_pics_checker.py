@@ -15,9 +15,11 @@
 #    limitations under the License.
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import mock_open, patch
 
-from matter.yamltests.pics_checker import InvalidPICSConfigurationError, InvalidPICSConfigurationValueError, PICSChecker
+from matter.yamltests.pics_checker import (InvalidPICSConfigurationError, InvalidPICSConfigurationValueError,
+                                           InvalidPICSParsingError, PICSChecker)
 
 empty_config = ''
 
@@ -183,6 +185,29 @@ class TestPICSChecker(unittest.TestCase):
         self.assertFalse(pics_checker.check(
             '( !CC.S.F00 && !CC.S.F01 && !CC.S.F02 && !CC.S.F03 && !CC.S.F04 )'))
 
+    @patch('builtins.open', mock_open(read_data=simple_config))
+    def test_logical_operators_group_to_the_right(self):
+        pics_checker = PICSChecker('')
+        # 'A.A && A.B || A.C' is 'A.A && (A.B || A.C)'
+        self.assertFalse(pics_checker.check('A.A && A.B || A.B'))
+        self.assertTrue(pics_checker.check('A.B || A.A && A.C'))
+
+    @patch('builtins.open', mock_open(read_data=simple_config))
+    def test_invalid_expressions(self):
+        pics_checker = PICSChecker('')
+        self.assertRaises(InvalidPICSParsingError, pics_checker.check, 'A.B ! A.C')
+        self.assertRaises(IndexError, pics_checker.check, '(A.B')
+        # Errors are reported every time, not only when the expression is first seen.
+        self.assertRaises(IndexError, pics_checker.check, '(A.B')
+
+    @patch('builtins.open', mock_open(read_data=simple_config))
+    def test_concurrent_checks(self):
+        pics_checker = PICSChecker('')
+        expressions = ['!A.A && (A.B || A.C)', 'A.A || A.C', '!(A.B && !A.C)'] * 100
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(pics_checker.check, expressions))
+        self.assertEqual(results, [True, False, False] * 100)
+
 
 if __name__ == '__main__':
     unittest.main()
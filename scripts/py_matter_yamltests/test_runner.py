@@ -0,0 +1,218 @@
+#!/usr/bin/env -S python3 -B
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the 'License');
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an 'AS IS' BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import unittest
+from unittest.mock import mock_open, patch
+
+from matter.yamltests.adapter import TestAdapter
+from matter.yamltests.hooks import TestRunnerHooks
+from matter.yamltests.parser_builder import TestParserBuilderConfig
+from matter.yamltests.runner import TestRunner, TestRunnerConfig, TestRunnerOptions, TestRunnerPool
+
+valid_yaml = '''
+name: TestOnOff
+
+tests:
+    - label: "Toggle the light"
+      cluster: "OnOff"
+      command: "Toggle"
+
+    - label: "Toggle the light"
+      cluster: "OnOff"
+      command: "Toggle"
+'''
+
+reads_yaml = '''
+name: TestReads
+
+tests:
+    - label: "Read OnOff"
+      cluster: "OnOff"
+      command: "readAttribute"
+      attribute: "OnOff"
+
+    - label: "Read OnTime"
+      cluster: "OnOff"
+      command: "readAttribute"
+      attribute: "OnTime"
+      response:
+          saveAs: onTime
+
+    - label: "Read OnOff again"
+      cluster: "OnOff"
+      command: "readAttribute"
+      attribute: "OnOff"
+
+    - label: "Read OffWaitTime"
+      cluster: "OnOff"
+      command: "readAttribute"
+      attribute: "OffWaitTime"
+
+    - label: "Toggle the light"
+      cluster: "OnOff"
+      command: "Toggle"
+'''
+
+save_response_yaml = '''
+name: TestSaveResponse
+
+tests:
+    - label: "Read OnTime"
+      cluster: "OnOff"
+      command: "readAttribute"
+      attribute: "OnTime"
+      saveResponseAs: onTimeResponse
+
+    - label: "Read OnOff"
+      cluster: "OnOff"
+      command: "readAttribute"
+      attribute: "OnOff"
+
+    - label: "Read OffWaitTime"
+      cluster: "OnOff"
+      command: "readAttribute"
+      attribute: "OffWaitTime"
+'''
+
+
+def mock_open_with_parameter_content(content):
+    file_object = mock_open(read_data=content).return_value
+    file_object.__iter__.return_value = content.splitlines(True)
+    return file_object
+
+
+class FakeAdapter(TestAdapter):
+    def encode(self, request):
+        return request
+
+    def decode(self, response):
+        return [{}], []
+
+
+class FakeRunner(TestRunner):
+    running = 0
+    max_running = 0
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    async def execute(self, request):
+        FakeRunner.running += 1
+        FakeRunner.max_running = max(FakeRunner.max_running, FakeRunner.running)
+        await asyncio.sleep(0.01)
+        FakeRunner.running -= 1
+        if self.fail:
+            raise RuntimeError('execute failed')
+        return request
+
+
+class PipeliningRunner(TestRunner):
+    def __init__(self):
+        self.in_flight = 0
+        self.in_flight_when_sent = []
+
+    async def send(self, request):
+        self.in_flight_when_sent.append(self.in_flight)
+        self.in_flight += 1
+        future = asyncio.get_running_loop().create_future()
+
+        def respond():
+            self.in_flight -= 1
+            future.set_result(request)
+        asyncio.get_running_loop().call_later(0.01, respond)
+        return future
+
+    async def execute(self, request):
+        return await (await self.send(request))
+
+
+class TestHooks(TestRunnerHooks):
+    def __init__(self):
+        self.calls = []
+
+    def start(self, count):
+        self.calls.append('start')
+
+    def stop(self, duration):
+        self.calls.append('stop')
+
+    def test_start(self, filename, name, count, steps=[]):
+        self.calls.append('test_start')
+
+    def step_success(self, logger, logs, duration, request):
+        self.calls.append('step_success')
+
+    def test_stop(self, duration):
+        self.calls.append('test_stop')
+
+
+@patch('builtins.open', new=mock_open_with_parameter_content)
+class TestRunnerPoolTests(unittest.TestCase):
+    def setUp(self):
+        FakeRunner.max_running = 0
+
+    def test_tests_run_concurrently(self):
+        hooks = TestHooks()
+        pool = TestRunnerPool([FakeRunner() for _ in range(3)])
+        success = asyncio.run(pool.run(TestParserBuilderConfig([valid_yaml] * 7),
+                                       TestRunnerConfig(adapter=FakeAdapter(), hooks=hooks)))
+
+        self.assertTrue(success)
+        self.assertEqual(FakeRunner.max_running, 3)
+        # The output of each test is not interleaved with the output of the others.
+        test_calls = ['test_start', 'step_success', 'step_success', 'test_stop']
+        self.assertEqual(hooks.calls, ['start'] + test_calls * 7 + ['stop'])
+
+    def test_failure_stops_the_suite(self):
+        hooks = TestHooks()
+        pool = TestRunnerPool([FakeRunner(), FakeRunner(fail=True)])
+        with self.assertRaises(RuntimeError):
+            asyncio.run(pool.run(TestParserBuilderConfig([valid_yaml] * 10),
+                                 TestRunnerConfig(adapter=FakeAdapter(), hooks=hooks)))
+        self.assertNotIn('stop', hooks.calls)
+        self.assertLess(hooks.calls.count('test_start'), 10)
+
+    def test_requires_runners(self):
+        self.assertRaises(ValueError, TestRunnerPool, [])
+
+
+@patch('builtins.open', new=mock_open_with_parameter_content)
+class TestRunnerPipeliningTests(unittest.TestCase):
+    def run_reads(self, pipeline_depth, content=reads_yaml, steps=5):
+        hooks = TestHooks()
+        runner = PipeliningRunner()
+        options = TestRunnerOptions(pipeline_depth=pipeline_depth)
+        success = asyncio.run(runner.run(TestParserBuilderConfig([content]),
+                                         TestRunnerConfig(adapter=FakeAdapter(), hooks=hooks, options=options)))
+        self.assertTrue(success)
+        self.assertEqual(hooks.calls, ['start', 'test_start'] + ['step_success'] * steps + ['test_stop', 'stop'])
+        return runner.in_flight_when_sent
+
+    def test_reads_are_pipelined(self):
+        # The read saving a variable is completed before the next step is sent, and the command is not pipelined.
+        self.assertEqual(self.run_reads(pipeline_depth=4), [0, 1, 0, 1, 0])
+
+    def test_save_response_as_is_not_pipelined(self):
+        # The read saving its whole response is completed before the next step is sent.
+        self.assertEqual(self.run_reads(pipeline_depth=4, content=save_response_yaml, steps=3), [0, 0, 1])
+
+    def test_pipelining_disabled(self):
+        self.assertEqual(self.run_reads(pipeline_depth=1), [0, 0, 0, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,9 +15,13 @@
 #    limitations under the License.
 
 import io
+import os
+import tempfile
 import unittest
+from unittest import mock
 
-from matter.yamltests.definitions import Attribute, Bitmap, Command, Enum, Event, ParseSource, SpecDefinitions, Struct
+from matter.yamltests.definitions import (Attribute, Bitmap, Command, Enum, Event, ParseSource, SpecDefinitions,
+                                          SpecDefinitionsFromPaths, Struct)
 
 source_cluster = '''<?xml version="1.0"?>
   <configurator>
@@ -474,6 +478,28 @@ class TestSpecDefinitions(unittest.TestCase):
         events = definitions.get_event_names('test')
         self.assertEqual(events, [])
 
+    def test_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            xml_path = os.path.join(tmpdir, 'cluster.xml')
+            with open(xml_path, 'w') as f:
+                f.write(source_command)
+            cache_dir = os.path.join(tmpdir, 'cache')
+
+            definitions = SpecDefinitionsFromPaths([xml_path], cache_dir=cache_dir)
+            self.assertEqual(definitions.get_command_names('Test'), ['TestCommand'])
+
+            with mock.patch('matter.yamltests.definitions.ParseXmls') as parse:
+                definitions = SpecDefinitionsFromPaths([xml_path], cache_dir=cache_dir)
+                parse.assert_not_called()
+            self.assertEqual(definitions.get_command_names('Test'), ['TestCommand'])
+
+            # A modified file invalidates the snapshot.
+            with open(xml_path, 'w') as f:
+                f.write(source_cluster)
+            os.utime(xml_path, ns=(0, 0))
+            definitions = SpecDefinitionsFromPaths([xml_path], cache_dir=cache_dir)
+            self.assertEqual(definitions.get_command_names('Test'), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env -S python3 -B
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the 'License');
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an 'AS IS' BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import unittest
+
+import websockets
+
+from matter.yamltests.hooks import WebSocketRunnerHooks
+from matter.yamltests.websocket_runner import LatencyHistogram, WebSocketRunner, WebSocketRunnerConfig
+
+
+class LatencyHooks(WebSocketRunnerHooks):
+    def __init__(self):
+        self.round_trip = None
+
+    def latencies(self, server_startup, round_trip):
+        self.round_trip = round_trip
+
+
+async def serve_sequentially(connection):
+    # Like the chip-tool interactive server: one request at a time, answered in order.
+    async for message in connection:
+        await asyncio.sleep(0.005)
+        await connection.send('response to ' + message)
+
+
+class TestWebSocketRunner(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = await websockets.serve(serve_sequentially, 'localhost', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_pipelined_requests(self):
+        hooks = LatencyHooks()
+        runner = WebSocketRunner(WebSocketRunnerConfig(server_port=self.port, hooks=hooks))
+        await runner.start()
+
+        futures = [await runner.send(f'request {i}') for i in range(5)]
+        self.assertEqual(await asyncio.gather(*futures), [f'response to request {i}' for i in range(5)])
+        self.assertEqual(await runner.execute('request 5'), 'response to request 5')
+
+        await runner.stop()
+        await runner.close()
+        self.assertEqual(hooks.round_trip.count, 6)
+
+    async def test_persistent_server(self):
+        runner = WebSocketRunner(WebSocketRunnerConfig(server_port=self.port, persistent_server=True))
+        await runner.start()
+        client = runner._client
+        await runner.stop()
+        await runner.start()
+        self.assertIs(runner._client, client)
+        self.assertTrue(runner.is_connected)
+
+        await runner.close()
+        self.assertFalse(runner.is_connected)
+
+    async def test_requests_fail_when_the_connection_is_closed(self):
+        runner = WebSocketRunner(WebSocketRunnerConfig(server_port=self.port))
+        await runner.start()
+        future = await runner.send('request')
+        await runner.stop()
+        with self.assertRaises(ConnectionError):
+            await future
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for duration in [0.5, 3, 3, 3, 12, 100]:
+            histogram.add(duration)
+        self.assertEqual(histogram.buckets, {1: 1, 4: 3, 16: 1, 128: 1})
+        self.assertEqual(histogram.percentile(50), 4)
+        self.assertEqual(histogram.percentile(99), 128)
+        self.assertEqual(histogram.max, 100)
+        self.assertEqual(str(LatencyHistogram()), 'no samples')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,14 +15,21 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import logging
 import os
+import pickle
 import pty
 import queue
 import re
 import shlex
 import subprocess
+import tempfile
 import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from typing import TYPE_CHECKING, Any, BinaryIO, Protocol
 
 import python_path
@@ -37,6 +44,83 @@ with python_path.PythonPath('../../../src/python_testing/matter_testing_infrastr
     # Import all symbols used downstream not only those we use ourselves
     from matter.testing.tasks import SubprocessInfo, SubprocessKind  # noqa: F401
 
+# Default number of lines of a capture kept in memory, see CaptureBuffer.
+CAPTURE_MAX_LINES_DEFAULT = 10000
+
+
+class CaptureBuffer:
+    """
+    Lines captured from a subprocess, indexed from 0 in the order in which they were appended.
+
+    At most maxLinesInMemory of the most recent lines are kept in memory. Older lines are spilled, in compressed chunks,
+    to an anonymous temporary file and only read back when a lookup reaches them. A maxLinesInMemory of None keeps all
+    lines in memory.
+
+    CaptureBuffer is not thread-safe, users serialize appending and reading. Once the lines are not looked up anymore,
+    close() releases the spill file.
+    """
+
+    def __init__(self, maxLinesInMemory: int | None = CAPTURE_MAX_LINES_DEFAULT):
+        self.maxLinesInMemory = maxLinesInMemory
+        self.lines: deque[str] = deque()
+        self.spilledLines = 0
+        # (number of lines, offset in spillFile, compressed size) of every spilled chunk, in order.
+        self.spilledChunks: list[tuple[int, int, int]] = []
+        self.spillFile: BinaryIO | None = None
+        self.closed = False
+
+    def __len__(self) -> int:
+        return self.spilledLines + len(self.lines)
+
+    def append(self, line: str):
+        if self.closed:
+            return
+        self.lines.append(line)
+        if self.maxLinesInMemory is not None and len(self.lines) > self.maxLinesInMemory:
+            self.__spill()
+
+    def __spill(self):
+        assert self.maxLinesInMemory is not None
+        # Spill down to half of the budget, so that chunks are large enough to compress well.
+        chunk = [self.lines.popleft() for _ in range(len(self.lines) - self.maxLinesInMemory // 2)]
+        data = zlib.compress(pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL))
+        if self.spillFile is None:
+            self.spillFile = tempfile.TemporaryFile(prefix='chiptest-capture-')  # noqa: SIM115
+        offset = self.spillFile.seek(0, os.SEEK_END)
+        self.spillFile.write(data)
+        self.spilledChunks.append((len(chunk), offset, len(data)))
+        self.spilledLines += len(chunk)
+
+    def __readChunk(self, offset: int, size: int) -> list[str]:
+        assert self.spillFile is not None
+        self.spillFile.seek(offset)
+        return pickle.loads(zlib.decompress(self.spillFile.read(size)))
+
+    def Lines(self, start: int = 0) -> Iterator[str]:
+        """Iterate over the lines from index start on. The buffer must not be appended to while iterating."""
+        first = 0
+        for count, offset, size in self.spilledChunks:
+            if first + count > start:
+                yield from self.__readChunk(offset, size)[max(start - first, 0):]
+            first += count
+        yield from itertools.islice(self.lines, max(start - self.spilledLines, 0), None)
+
+    def ReversedLines(self) -> Iterator[str]:
+        """Iterate over the lines from the most recent one. The buffer must not be appended to while iterating."""
+        yield from reversed(self.lines)
+        for _, offset, size in reversed(self.spilledChunks):
+            yield from reversed(self.__readChunk(offset, size))
+
+    def close(self):
+        """Release the spill file and the lines kept in memory. Lines appended afterwards are dropped."""
+        self.closed = True
+        self.lines.clear()
+        self.spilledChunks.clear()
+        self.spilledLines = 0
+        if self.spillFile is not None:
+            self.spillFile.close()
+            self.spillFile = None
+
 
 class LogPipe(threading.Thread):
     """Create PTY-based PIPE for IPC.
@@ -48,9 +132,12 @@ class LogPipe(threading.Thread):
     pseudoterminal (PTY).
     """
 
-    def __init__(self, level: int, capture_delegate: ExecutionCapture | None = None, name: str | None = None):
+    def __init__(self, level: int, capture_delegate: ExecutionCapture | None = None, name: str | None = None,
+                 capture_max_lines: int | None = CAPTURE_MAX_LINES_DEFAULT):
         """
         Setup the object with a logger and a loglevel and start the thread.
+
+        At most capture_max_lines captured lines are kept in memory, see CaptureBuffer.
         """
         threading.Thread.__init__(self, name=name)
 
@@ -58,22 +145,64 @@ class LogPipe(threading.Thread):
         self.level = level
         self.fd_read, self.fd_write = pty.openpty()
         self.reader = open(self.fd_read, encoding='utf-8', errors='ignore')  # noqa: SIM115
-        self.captured_logs: list[str] = []
+        self.captured_logs = CaptureBuffer(capture_max_lines)
         self.capture_delegate = capture_delegate
+        # Guards captured_logs, notified whenever a line is captured or the pipe is closed.
+        self.cv_captured = threading.Condition()
+        self.finished = False
 
         self.start()
 
-    def CapturedLogContains(self, txt: str, index: int = 0) -> tuple[bool, int]:
-        for i, line in enumerate(self.captured_logs[index:]):
-            if txt in line:
-                return True, index + i
-        return False, len(self.captured_logs)
+    def WaitForPatterns(self, patterns: Iterable[str], index: int = 0, timeout: float | None = None,
+                        abort: Callable[[], bool] | None = None, abortCheckInterval: float = 0.1) -> int | None:
+        """
+        Wait until each of the patterns is contained in a line captured at or after index.
+
+        Lines are matched as they are captured, each of them once. The waiter wakes up as soon as a line arrives,
+        and every abortCheckInterval seconds to call abort().
+
+        Returns the index of the last line among the first lines containing each pattern, or None on timeout, when
+        abort() returns True or when the pipe is closed before all patterns are found.
+        """
+        remaining = list(dict.fromkeys(patterns))
+        lastIndex = index - 1
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self.cv_captured:
+                lines = list(self.captured_logs.Lines(index))
+                finished = self.finished
+                if not lines and not finished:
+                    waitFor = abortCheckInterval
+                    if deadline is not None:
+                        waitFor = min(waitFor, deadline - time.monotonic())
+                    if waitFor > 0:
+                        self.cv_captured.wait(waitFor)
+                    lines = list(self.captured_logs.Lines(index))
+                    finished = self.finished
+
+            for line in lines:
+                found = [p for p in remaining if p in line]
+                if found:
+                    remaining = [p for p in remaining if p not in found]
+                    lastIndex = index
+                    if not remaining:
+                        return lastIndex
+                index += 1
+
+            if finished:
+                return None
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            if abort is not None and abort():
+                return None
 
     def FindLastMatchingLine(self, matcher: str):
-        for line in reversed(self.captured_logs):
-            match = re.match(matcher, line)
-            if match:
-                return match
+        with self.cv_captured:
+            for line in self.captured_logs.ReversedLines():
+                match = re.match(matcher, line)
+                if match:
+                    return match
         return None
 
     def fileno(self):
@@ -92,15 +221,25 @@ class LogPipe(threading.Thread):
             except OSError:
                 break
             log.log(self.level, line.strip())
-            self.captured_logs.append(line)
+            with self.cv_captured:
+                self.captured_logs.append(line)
+                self.cv_captured.notify_all()
             if self.capture_delegate:
                 self.capture_delegate.Log(self.name, line)
         self.reader.close()
+        with self.cv_captured:
+            self.finished = True
+            self.cv_captured.notify_all()
 
     def close(self):
         """Close the write end of the pipe."""
         os.close(self.fd_write)
 
+    def ReleaseCapture(self):
+        """Release the captured lines, once they are not looked up anymore."""
+        with self.cv_captured:
+            self.captured_logs.close()
+
 
 class Process(Protocol):
     @property
@@ -158,9 +297,11 @@ class Executor(contextlib.ExitStack):
 
 class Runner:
     def __init__(self, executor: Executor,
-                 capture_delegate: ExecutionCapture | None = None):
+                 capture_delegate: ExecutionCapture | None = None,
+                 capture_max_lines: int | None = CAPTURE_MAX_LINES_DEFAULT):
         self.executor = executor
         self.capture_delegate = capture_delegate
+        self.capture_max_lines = capture_max_lines
 
     def RunSubprocess(self, subproc: SubprocessInfo, name: str, wait: bool = True, dependencies: list[AppsRegister] | None = None,
                       timeout_seconds: int | None = None, stdin: BinaryIO | None = None
@@ -168,8 +309,10 @@ class Runner:
         cmd = subproc.to_cmd()
         log.info('RunSubprocess starting application %s', " ".join(cmd))
 
-        outpipe = LogPipe(logging.DEBUG, capture_delegate=self.capture_delegate, name=name + ' STDOUT')
-        errpipe = LogPipe(logging.INFO, capture_delegate=self.capture_delegate, name=name + ' STDERR')
+        outpipe = LogPipe(logging.DEBUG, capture_delegate=self.capture_delegate, name=name + ' STDOUT',
+                          capture_max_lines=self.capture_max_lines)
+        errpipe = LogPipe(logging.INFO, capture_delegate=self.capture_delegate, name=name + ' STDERR',
+                          capture_max_lines=self.capture_max_lines)
 
         if self.capture_delegate:
             self.capture_delegate.Log(name, 'EXECUTING %r' % cmd)
@@ -181,6 +324,10 @@ class Runner:
         if not wait:
             return s, outpipe, errpipe
 
+        # The captured lines of a waited for subprocess are not looked up.
+        outpipe.ReleaseCapture()
+        errpipe.ReleaseCapture()
+
         wait_queue = RunnerWaitQueue(timeout_seconds=timeout_seconds)
         wait_queue.add_process(s)
 
@@ -31,7 +31,7 @@ from pathlib import Path
 from python_path import PythonPath
 
 from .accessories import AppsRegister
-from .runner import LogPipe, Runner, SubprocessInfo, SubprocessKind
+from .runner import CAPTURE_MAX_LINES_DEFAULT, CaptureBuffer, LogPipe, Runner, SubprocessInfo, SubprocessKind
 
 CHIP_ROOT = next(filter(lambda p: (p / 'SPECIFICATION_VERSION').is_file(), Path(__file__).parents))
 
@@ -51,6 +51,7 @@ class App:
     def __init__(self, runner: Runner, subproc: SubprocessInfo):
         self.process: subprocess.Popen[bytes] | None = None
         self.outpipe: LogPipe | None = None
+        self.errpipe: LogPipe | None = None
         self.runner = runner
         self.subproc = subproc
         self.cv_stopped = threading.Condition()
@@ -80,7 +81,7 @@ class App:
                 self.options = options
             # Make sure to assign self.process before we do any operations that
             # might fail, so attempts to kill us on failure actually work.
-            self.process, self.outpipe, _ = self.__startServer()
+            self.process, self.outpipe, self.errpipe = self.__startServer()
             self.waitForApplicationUp()
             self.__updateSetUpCode()
             with self.cv_stopped:
@@ -177,30 +178,14 @@ class App:
         assert self.process is not None and self.outpipe is not None, "__waitFor can be called only after start()"
         log.debug('Waiting for all patterns %r', patterns)
 
-        start_time = time.monotonic()
-
-        def allPatternsFound() -> int | None:
-            assert self.outpipe is not None
-            lastLogIndex = self.lastLogIndex
-            for p in patterns:
-                found, index = self.outpipe.CapturedLogContains(p, self.lastLogIndex)
-                if not found:
-                    return None
-                lastLogIndex = max(lastLogIndex, index)
-
-            return lastLogIndex
-
-        lastLogIndex = allPatternsFound()
-        while lastLogIndex is None:
+        lastLogIndex = self.outpipe.WaitForPatterns(patterns, self.lastLogIndex, timeoutInSeconds,
+                                                    abort=lambda: self.process.poll() is not None)
+        if lastLogIndex is None:
             if self.process.poll() is not None:
                 died_str = f'Server died while waiting for {patterns!r}, returncode {self.process.returncode}'
                 log.error(died_str)
                 raise RuntimeError(died_str)
-            if time.monotonic() - start_time > timeoutInSeconds:
-                raise TimeoutError(f'Timeout while waiting for {patterns!r}')
-            time.sleep(0.1)
-
-            lastLogIndex = allPatternsFound()
+            raise TimeoutError(f'Timeout while waiting for {patterns!r}')
 
         self.lastLogIndex = lastLogIndex + 1
         log.debug('Success waiting for: %r', patterns)
@@ -231,7 +216,10 @@ class App:
                 # ignoring SIGTERM, indicating something was already wrong.
                 self.process.wait(10)
             self.process = None
-            self.outpipe = None
+            for pipe in (self.outpipe, self.errpipe):
+                if pipe is not None:
+                    pipe.ReleaseCapture()
+            self.outpipe = self.errpipe = None
             self.lastLogIndex = 0
         return True
 
@@ -382,44 +370,36 @@ class SubprocessInfoRepo(dict):
         return self[key]
 
 
-@dataclass
-class CaptureLine:
-    when: datetime
-    source: str
-    line: str
-
-
 class ExecutionCapture:
     """
     Keeps track of output lines in a process, to help debug failures.
+
+    Lines are kept as formatted text in a CaptureBuffer, so at most max_lines_in_memory of them stay in memory.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_lines_in_memory: int | None = CAPTURE_MAX_LINES_DEFAULT) -> None:
         self.lock = threading.Lock()
-        self.captures: list[CaptureLine] = []
+        self.captures = CaptureBuffer(max_lines_in_memory)
 
     def Log(self, source: str, line: str):
+        when = datetime.now()
+        entry = "%02d:%02d:%02d.%03d - %-10s: %s" % (when.hour, when.minute, when.second, when.microsecond / 1000,
+                                                      source, line.strip('\n'))
         with self.lock:
-            self.captures.append(CaptureLine(
-                when=datetime.now(),
-                source=source,
-                line=line.strip('\n')
-            ))
+            self.captures.append(entry)
 
     def LogContents(self):
         log.error("================ CAPTURED LOG START ==================")
         with self.lock:
-            for entry in self.captures:
-                log.error("%02d:%02d:%02d.%03d - %-10s: %s",
-                          entry.when.hour,
-                          entry.when.minute,
-                          entry.when.second,
-                          entry.when.microsecond/1000,
-                          entry.source,
-                          entry.line
-                          )
+            for entry in self.captures.Lines():
+                log.error("%s", entry)
         log.error("================ CAPTURED LOG END ====================")
 
+    def close(self):
+        """Release the captured lines, lines logged afterwards are dropped."""
+        with self.lock:
+            self.captures.close()
+
 
 class TestTag(StrEnum):
     MANUAL = auto()          # requires manual input. Generally not run automatically
@@ -453,6 +433,8 @@ class TestJobConfig:
     test_timeout_seconds: int | None
     value_wait_extra_duration_ms: int | None
     concurrency: int
+    # Lines of each captured output kept in memory, None to keep all of them.
+    capture_max_lines: int | None = CAPTURE_MAX_LINES_DEFAULT
 
 
 @dataclass
@@ -490,7 +472,8 @@ class TestDefinition:
 
     def _RunImpl(self, target: TestTarget, runner: Runner, apps_register: AppsRegister, config: TestJobConfig,
                  thread_ba_host: str | None = None, thread_ba_port: int | None = None):
-        runner.capture_delegate = ExecutionCapture()
+        runner.capture_delegate = ExecutionCapture(config.capture_max_lines)
+        runner.capture_max_lines = config.capture_max_lines
 
         tool_storage_dir = None
 
@@ -627,4 +610,6 @@ class TestDefinition:
             if not ok and not loggedCapturedLogs:
                 log.error("!!!!!!!!!!!!!!!!!!!! ERROR !!!!!!!!!!!!!!!!!!!!!!")
                 runner.capture_delegate.LogContents()
+            runner.capture_delegate.close()
+            if not ok and not loggedCapturedLogs:
                 raise RuntimeError('Subprocess terminated abnormally')
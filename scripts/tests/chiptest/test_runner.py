@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Make chiptest importable when running from any directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# isort: split
+from chiptest.runner import CaptureBuffer, LogPipe  # noqa: E402
+
+
+class TestCaptureBuffer(unittest.TestCase):
+
+    def make_buffer(self, count: int, maxLinesInMemory: int | None = 4) -> tuple[CaptureBuffer, list[str]]:
+        buffer = CaptureBuffer(maxLinesInMemory)
+        self.addCleanup(buffer.close)
+        lines = [f'line {i}\n' for i in range(count)]
+        for line in lines:
+            buffer.append(line)
+        return buffer, lines
+
+    def test_spill(self):
+        buffer, lines = self.make_buffer(20)
+
+        self.assertEqual(len(buffer), 20)
+        self.assertLessEqual(len(buffer.lines), 4)
+        # Spilled down to half of the budget at a time, so over several chunks
+        self.assertGreater(len(buffer.spilledChunks), 2)
+        self.assertEqual(sum(count for count, _, _ in buffer.spilledChunks), buffer.spilledLines)
+        self.assertEqual(list(buffer.Lines()), lines)
+
+    def test_lines_from_index(self):
+        buffer, lines = self.make_buffer(20)
+        firstChunkLines = buffer.spilledChunks[0][0]
+        secondChunkLines = buffer.spilledChunks[1][0]
+
+        for start in (0, 1, firstChunkLines, firstChunkLines + secondChunkLines - 1, buffer.spilledLines,
+                      buffer.spilledLines + 1, 19, 20, 25):
+            self.assertEqual(list(buffer.Lines(start)), lines[start:], f'start {start}')
+
+        # Lines keep their index when appended after being read
+        buffer.append('line 20\n')
+        self.assertEqual(list(buffer.Lines(firstChunkLines + 1)), lines[firstChunkLines + 1:] + ['line 20\n'])
+
+    def test_reversed_lines(self):
+        buffer, lines = self.make_buffer(20)
+        self.assertEqual(list(buffer.ReversedLines()), lines[::-1])
+
+    def test_unbounded(self):
+        buffer, lines = self.make_buffer(1000, maxLinesInMemory=None)
+
+        self.assertEqual(len(buffer), 1000)
+        self.assertEqual(buffer.spilledChunks, [])
+        self.assertIsNone(buffer.spillFile)
+        self.assertEqual(list(buffer.Lines(500)), lines[500:])
+        self.assertEqual(list(buffer.ReversedLines()), lines[::-1])
+
+    def test_close(self):
+        buffer, _ = self.make_buffer(20)
+        spillFile = buffer.spillFile
+        buffer.close()
+
+        self.assertTrue(spillFile.closed)
+        self.assertIsNone(buffer.spillFile)
+        # Lines appended once closed are dropped, and not spilled again
+        for i in range(20):
+            buffer.append(f'late {i}\n')
+        self.assertEqual(len(buffer), 0)
+        self.assertIsNone(buffer.spillFile)
+        buffer.close()
+
+
+class TestLogPipeWaitForPatterns(unittest.TestCase):
+
+    def setUp(self):
+        self.pipe = LogPipe(logging.DEBUG, name='TEST')
+        self.closed = False
+        self.addCleanup(self.pipe.join, 5)
+        self.addCleanup(self.close)
+
+    def write(self, *lines: str):
+        for line in lines:
+            os.write(self.pipe.fileno(), (line + '\n').encode('utf-8'))
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.pipe.close()
+
+    def test_pattern_arriving_later(self):
+        self.write('starting')
+        threading.Timer(0.2, self.write, ('still starting', 'ready')).start()
+
+        self.assertEqual(self.pipe.WaitForPatterns(['ready'], timeout=5), 2)
+
+    def test_patterns_in_one_line(self):
+        self.write('first', 'second: found a and b', 'a again')
+
+        self.assertEqual(self.pipe.WaitForPatterns(['a', 'b'], timeout=5), 1)
+        # Only lines from index on are matched
+        self.assertEqual(self.pipe.WaitForPatterns(['a'], index=2, timeout=5), 2)
+
+    def test_patterns_in_several_lines(self):
+        self.write('b', 'a', 'b')
+
+        # The index of the last of the first lines containing each pattern
+        self.assertEqual(self.pipe.WaitForPatterns(['a', 'b'], timeout=5), 1)
+
+    def test_timeout(self):
+        self.write('something else')
+
+        start = time.monotonic()
+        self.assertIsNone(self.pipe.WaitForPatterns(['never'], timeout=0.2))
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_abort(self):
+        aborted = threading.Event()
+        threading.Timer(0.2, aborted.set).start()
+
+        start = time.monotonic()
+        self.assertIsNone(self.pipe.WaitForPatterns(['never'], abort=aborted.is_set, abortCheckInterval=0.05))
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_pipe_closed(self):
+        self.write('a', 'last line')
+        threading.Timer(0.2, self.close).start()
+
+        # Lines captured before the pipe is closed are still matched
+        self.assertEqual(self.pipe.WaitForPatterns(['last'], timeout=5), 1)
+        start = time.monotonic()
+        self.assertIsNone(self.pipe.WaitForPatterns(['a', 'never'], timeout=30))
+        self.assertLess(time.monotonic() - start, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,6 +21,7 @@ import contextlib
 import importlib
 import os
 import sys
+import tempfile
 import traceback
 from dataclasses import dataclass
 
@@ -34,7 +35,7 @@ from matter.yamltests.parser import TestParserConfig
 from matter.yamltests.parser_builder import TestParserBuilderConfig
 from matter.yamltests.parser_config import TestConfigParser
 from matter.yamltests.pseudo_clusters.pseudo_clusters import PseudoClusters, get_default_pseudo_clusters
-from matter.yamltests.runner import TestRunner, TestRunnerConfig, TestRunnerOptions
+from matter.yamltests.runner import TestRunner, TestRunnerConfig, TestRunnerOptions, TestRunnerPool
 from matter.yamltests.websocket_runner import WebSocketRunner, WebSocketRunnerConfig
 
 #
@@ -69,6 +70,9 @@ def test_parser_options(f):
                      help='Path to the directory containing the tests configuration.')(f)
     f = click.option('--specifications_paths', type=click.Path(), show_default=True, default=_DEFAULT_SPECIFICATIONS_DIR,
                      help='Path to a set of files containing clusters definitions.')(f)
+    f = click.option('--specifications_cache_dir', type=click.Path(file_okay=False), default=None,
+                     envvar='MATTER_YAMLTESTS_SPEC_CACHE_DIR',
+                     help='Directory in which to keep a snapshot of the parsed clusters definitions.')(f)
     f = click.option('--PICS', type=click.Path(exists=True), show_default=True, default=_DEFAULT_PICS_FILE,
                      help='Path to the PICS file to use.')(f)
     f = click.option('--stop_on_error', type=bool, show_default=True, default=True,
@@ -109,6 +113,14 @@ def websocket_runner_options(f):
                      help='Name of a websocket server to run at launch.')(f)
     f = click.option('--server_path', type=click.Path(exists=True), default=None,
                      help='Path to a websocket server to run at launch.')(f)
+    f = click.option('--concurrency', type=click.IntRange(min=1), default=1, show_default=True,
+                     help='Number of tests to run at once, each against its own websocket server listening on consecutive ports from --server_port. The tests must not share a device.')(f)
+    f = click.option('--persistent_server', type=bool, default=False, show_default=True,
+                     help='Keep the websocket server running across test files instead of restarting it for each one.')(f)
+    f = click.option('--pipeline_depth', type=click.IntRange(min=1), default=1, show_default=True,
+                     help='Number of consecutive attribute reads sent before the response of the first one is received.')(f)
+    f = click.option('--server_storage_arguments', type=str, default=None,
+                     help='With --concurrency, arguments added to those of each websocket server started at launch to give it its own storage. {storage_directory} is replaced by a temporary directory private to the server.')(f)
     return click.option('--server_arguments', type=str, default=None,
                         help='Optional arguments to pass to the websocket server at launch.')(f)
 
@@ -212,6 +224,7 @@ CONTEXT_SETTINGS = {
             'adapter': 'chipyaml.adapters.chiptool.adapter',
             'server_name': 'chip-tool',
             'server_arguments': 'interactive server',
+            'server_storage_arguments': '--storage-directory {storage_directory}',
         },
         'darwinframeworktool': {
             'adapter': 'chipyaml.adapters.chiptool.adapter',
@@ -223,12 +236,14 @@ CONTEXT_SETTINGS = {
             'adapter': 'chipyaml.adapters.placeholder.adapter',
             'server_name': 'chip-app1',
             'server_arguments': '--interactive',
+            'server_storage_arguments': '--KVS {storage_directory}/chip_kvs',
         },
         'app2': {
             'configuration_directory': 'examples/placeholder/linux/apps/app2',
             'adapter': 'chipyaml.adapters.placeholder.adapter',
             'server_name': 'chip-app2',
             'server_arguments': '--interactive',
+            'server_storage_arguments': '--KVS {storage_directory}/chip_kvs',
         },
     },
     'max_content_width': 120,
@@ -239,10 +254,11 @@ CONTEXT_SETTINGS = {
 @click.argument('test_name')
 @test_parser_options
 @click.pass_context
-def runner_base(ctx, configuration_directory: str, test_name: str, configuration_name: str, pics: str, specifications_paths: str, stop_on_error: bool, use_default_pseudo_clusters: bool, additional_pseudo_clusters_directory: str, valueWaitExtraDurationMs: int, **kwargs):
+def runner_base(ctx, configuration_directory: str, test_name: str, configuration_name: str, pics: str, specifications_paths: str, specifications_cache_dir: str | None, stop_on_error: bool, use_default_pseudo_clusters: bool, additional_pseudo_clusters_directory: str, valueWaitExtraDurationMs: int, **kwargs):
     pseudo_clusters = get_custom_pseudo_clusters(
         additional_pseudo_clusters_directory) if use_default_pseudo_clusters else PseudoClusters([])
-    specifications = SpecDefinitionsFromPaths(specifications_paths.split(','), pseudo_clusters)
+    specifications = SpecDefinitionsFromPaths(specifications_paths.split(','), pseudo_clusters,
+                                              cache_dir=specifications_cache_dir)
     tests_finder = TestsFinder(configuration_directory, configuration_name)
 
     test_list = tests_finder.get(test_name)
@@ -296,10 +312,10 @@ def run(parser_group: ParserGroup, adapter: str, stop_on_error: bool, stop_on_wa
 @test_runner_options
 @websocket_runner_options
 @pass_parser_group
-def websocket(parser_group: ParserGroup, adapter: str, stop_on_error: bool, stop_on_warning: bool, stop_at_number: int, show_adapter_logs: bool, show_adapter_logs_on_error: bool, use_test_harness_log_format: bool, delay_in_ms: int, server_address: str, server_port: int, server_path: str, server_name: str, server_arguments: str):
+def websocket(parser_group: ParserGroup, adapter: str, stop_on_error: bool, stop_on_warning: bool, stop_at_number: int, show_adapter_logs: bool, show_adapter_logs_on_error: bool, use_test_harness_log_format: bool, delay_in_ms: int, server_address: str, server_port: int, server_path: str, server_name: str, server_arguments: str, concurrency: int, persistent_server: bool, pipeline_depth: int, server_storage_arguments: str):
     """Run the test suite using websockets."""
     adapter = __import__(adapter, fromlist=[None]).Adapter(parser_group.builder_config.parser_config.definitions)
-    runner_options = TestRunnerOptions(stop_on_error, stop_on_warning, stop_at_number, delay_in_ms)
+    runner_options = TestRunnerOptions(stop_on_error, stop_on_warning, stop_at_number, delay_in_ms, pipeline_depth)
     runner_hooks = TestRunnerLogger(show_adapter_logs, show_adapter_logs_on_error, use_test_harness_log_format)
     runner_config = TestRunnerConfig(adapter, parser_group.pseudo_clusters, runner_options, runner_hooks)
 
@@ -308,9 +324,28 @@ def websocket(parser_group: ParserGroup, adapter: str, stop_on_error: bool, stop
         server_path = paths_finder.get(server_name)
 
     websocket_runner_hooks = WebSocketRunnerLogger()
+    if concurrency > 1:
+        # Servers sharing their storage would race on it, and share the same commissioner identity.
+        if server_path and not server_storage_arguments:
+            raise ValueError('--concurrency requires --server_storage_arguments for the servers started at launch.')
+
+        with contextlib.ExitStack() as stack:
+            runners = []
+            for i in range(concurrency):
+                arguments = server_arguments
+                if server_path:
+                    storage_directory = stack.enter_context(tempfile.TemporaryDirectory(prefix=f'chipyaml-server-{i}-'))
+                    arguments = ' '.join(filter(None, [server_arguments, server_storage_arguments.format(
+                        storage_directory=storage_directory)]))
+                runners.append(WebSocketRunner(WebSocketRunnerConfig(
+                    server_address, server_port + i, server_path, arguments, websocket_runner_hooks, persistent_server)))
+            return asyncio.run(TestRunnerPool(runners).run(parser_group.builder_config, runner_config))
+
     websocket_runner_config = WebSocketRunnerConfig(
-        server_address, server_port, server_path, server_arguments, websocket_runner_hooks)
+        server_address, server_port, server_path, server_arguments, websocket_runner_hooks, persistent_server)
 
+    # Parse the next test while the current one runs.
+    parser_group.builder_config.options.parse_ahead = 1
     runner = WebSocketRunner(websocket_runner_config)
     return asyncio.run(runner.run(parser_group.builder_config, runner_config))
 
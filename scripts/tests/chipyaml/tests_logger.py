@@ -336,6 +336,7 @@ class WebSocketRunnerStrings:
     success = click.style(f'\r{_SUCCESS} {{duration}}ms', fg='white')
     failure = click.style(f'\r{_WARNING} {{duration}}ms', fg='white')
     retry = click.style('\t\t  Retrying in {interval} seconds.', fg='white')
+    latencies = click.style('\t\tServer startup: {server_startup}\n\t\tRound trip: {round_trip}', fg='white')
 
 
 class WebSocketRunnerLogger(WebSocketRunnerHooks):
@@ -358,6 +359,9 @@ class WebSocketRunnerLogger(WebSocketRunnerHooks):
     def retry(self, interval_between_retries_in_seconds: int):
         print(self.__strings.retry.format(interval=interval_between_retries_in_seconds))
 
+    def latencies(self, server_startup, round_trip):
+        print(self.__strings.latencies.format(server_startup=server_startup, round_trip=round_trip))
+
 
 #
 # Everything below this comment is for testing purposes only.
@@ -3,7 +3,6 @@
 import io
 import json
 import logging
-import time
 from pathlib import Path
 from subprocess import PIPE
 
@@ -25,38 +24,37 @@ class DarwinToolRunner:
     def __init__(self, runner, application):
         self.process = None
         self.outpipe = None
+        self.errpipe = None
         self.runner = runner
         self.lastLogIndex = 0
         self.application = application
         self.stdin = None
 
     def start(self):
-        self.process, self.outpipe, errpipe = self.runner.RunSubprocess(self.application,
-                                                                        name='DARWIN-TOOL',
-                                                                        wait=False,
-                                                                        stdin=PIPE)
+        self.process, self.outpipe, self.errpipe = self.runner.RunSubprocess(self.application,
+                                                                             name='DARWIN-TOOL',
+                                                                             wait=False,
+                                                                             stdin=PIPE)
         self.stdin = io.TextIOWrapper(self.process.stdin, line_buffering=True)
 
     def stop(self):
         if self.process:
             self.process.kill()
+            self.outpipe.ReleaseCapture()
+            self.errpipe.ReleaseCapture()
 
     def waitForMessage(self, message):
         log.debug("Waiting for '%s'", message)
 
-        start_time = time.monotonic()
-        ready, self.lastLogIndex = self.outpipe.CapturedLogContains(
-            message, self.lastLogIndex)
-        while not ready:
+        index = self.outpipe.WaitForPatterns([message], self.lastLogIndex, 10,
+                                             abort=lambda: self.process.poll() is not None)
+        if index is None:
             if self.process.poll() is not None:
                 died_str = f'Process died while waiting for {message}, returncode {self.process.returncode}'
                 log.error(died_str)
                 raise RuntimeError(died_str)
-            if time.monotonic() - start_time > 10:
-                raise TimeoutError(f'Timeout while waiting for {message}')
-            time.sleep(0.1)
-            ready, self.lastLogIndex = self.outpipe.CapturedLogContains(
-                message, self.lastLogIndex)
+            raise TimeoutError(f'Timeout while waiting for {message}')
+        self.lastLogIndex = index
 
         log.debug("Success waiting for: '%s'", message)
 
@@ -193,6 +191,7 @@ def cmd_run(context, darwin_framework_tool, ota_requestor_app, ota_data_file, ot
         apps_register.kill_all()
         apps_register.factory_reset_all()
         apps_register.remove_all()
+        runner.capture_delegate.close()
         apps_register.uninit()
 
 
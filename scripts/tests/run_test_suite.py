@@ -36,7 +36,7 @@ from chiptest.concurrency.worker import GenericWorkerProcess, WorkerConfig, Work
 from chiptest.glob_matcher import GlobMatcher
 from chiptest.log_config import LOG_LEVELS, LogConfig, LogMessageCounter
 from chiptest.results import ResultError, ResultProcessingThread, RunSummary, TestResult, TestStatus
-from chiptest.runner import SubprocessKind
+from chiptest.runner import CAPTURE_MAX_LINES_DEFAULT, SubprocessKind
 from chiptest.status import PeriodicStatusThread
 from chiptest.test_definition import CommissioningMethod, SubprocessInfoRepo, TestDefinition, TestJobConfig, TestRunTime, TestTag
 from chipyaml.paths_finder import PathsFinder
@@ -366,6 +366,13 @@ def cmd_list(context: click.Context) -> None:
     type=click.IntRange(min=0),
     help=('Periodically show the status of test execution. '
           '0: turn off, other values: periodicity of report in number of logged messages.'))
+@click.option(
+    '--capture-max-lines',
+    default=CAPTURE_MAX_LINES_DEFAULT,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help=('Number of output lines of each application and tool kept in memory, older lines are spilled to compressed '
+          'temporary files. 0: keep all lines in memory.'))
 @click.option(
     '--clear-worker-state',
     is_flag=True,
@@ -423,7 +430,7 @@ def cmd_list(context: click.Context) -> None:
 def cmd_run(context: click.Context, dry_run: bool, iterations: int, app_path: list[str], tool_path: list[str], discover_paths: bool,
             help_paths: bool, pics_file: Path, keep_going: bool, test_timeout_seconds: int | None,
             value_wait_extra_duration_ms: int | None, expected_failures: int, commissioning_method: CommissioningMethod,
-            summary_file: Path | None, periodic_status: int, clear_worker_state: bool,
+            summary_file: Path | None, periodic_status: int, capture_max_lines: int, clear_worker_state: bool,
             # Deprecated CLI flags
             all_clusters_app: Path | None, lock_app: Path | None, ota_provider_app: Path | None, ota_requestor_app: Path | None,
             fabric_bridge_app: Path | None, tv_app: Path | None, bridge_app: Path | None, lit_icd_app: Path | None,
@@ -509,7 +516,7 @@ def cmd_run(context: click.Context, dry_run: bool, iterations: int, app_path: li
     # For now, we have only one worker process.
     test_config = TestJobConfig(
         commissioning_method, dry_run, subproc_info_repo, pics_file, context.obj.runtime, test_timeout_seconds,
-        value_wait_extra_duration_ms, concurrency=1)
+        value_wait_extra_duration_ms, concurrency=1, capture_max_lines=capture_max_lines or None)
     worker_config = WorkerConfig.from_test_job_config(
         context.obj.log_config, test_config, tmp_dir_clear=clear_worker_state).with_formatted_name()
 
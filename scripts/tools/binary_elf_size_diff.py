@@ -26,7 +26,7 @@
 # ]
 # ///
 #
-# Processes 2 ELF files via `nm` and outputs the
+# Processes the symbol tables of 2 ELF files (as `nm` would) and outputs the
 # diferences in size. Example calls:
 #
 #  uv run --script scripts/tools/binary_elf_size_diff.py \
@@ -40,12 +40,10 @@
 #     ./out/master_build.elf
 #
 
-import contextlib
 import csv
 import logging
 import os
 import re
-import subprocess
 import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
@@ -54,9 +52,9 @@ from typing import Any
 
 import click
 import coloredlogs
-import cxxfilt
 import plotly.graph_objects as go
 import tabulate
+from elf_symbols import read_sized_symbols
 from lark import Lark
 from lark.visitors import Transformer, v_args
 
@@ -91,26 +89,14 @@ __OUTPUT_TYPES__ = {
 }
 
 
-def get_sizes(p: Path, no_demangle: bool):
-    output = subprocess.check_output(
-        ["nm", "--print-size", "--size-sort", "--radix=d", p.as_posix()]
-    ).decode("utf8")
-
+def get_sizes(p: Path, no_demangle: bool, cache_dir: str | None = None):
     result = {}
 
-    for line in output.split("\n"):
-        if not line.strip():
-            continue
-
-        _, size, t, name = line.split(" ")
-        size = int(size, 10)
-
-        if not no_demangle:
-            # Keep non-demangled name if we cannot have a nice name.
-            with contextlib.suppress(cxxfilt.InvalidName):
-                name = cxxfilt.demangle(name)
-
-        result[name] = Symbol(symbol_type=t, name=name, size=size)
+    # Same symbols, in the same order, as `nm --print-size --size-sort`
+    for symbol in read_sized_symbols(p.as_posix(), cache_dir, demangle=not no_demangle):
+        # demangled keeps the non-demangled name if we cannot have a nice name.
+        name = symbol.name if no_demangle else symbol.demangled
+        result[name] = Symbol(symbol_type=symbol.nm_type, name=name, size=symbol.size)
 
     return result
 
@@ -385,6 +371,12 @@ def sankey_diagram(input_list: list, sankey_rules: Any | None, skip_name_transfo
     type=int,
     help="Truncate function name to this length (for table output only). use <= 10 to disable",
 )
+@click.option(
+    "--symbol-cache-dir",
+    default=None,
+    type=click.Path(file_okay=False),
+    help="Directory where the symbols read from the ELF files are cached, by build-id",
+)
 @click.argument("f1", type=Path)
 @click.argument("f2", type=Path)
 def main(
@@ -396,14 +388,15 @@ def main(
     skip_name_transform,
     style: str,
     name_truncate: int,
+    symbol_cache_dir: str | None,
     f1: Path,
     f2: Path,
 ):
     log_fmt = "%(asctime)s %(levelname)-7s %(message)s"
     coloredlogs.install(level=__LOG_LEVELS__[log_level], fmt=log_fmt)
 
-    r1 = get_sizes(f1, no_demangle)
-    r2 = get_sizes(f2, no_demangle)
+    r1 = get_sizes(f1, no_demangle, symbol_cache_dir)
+    r2 = get_sizes(f2, no_demangle, symbol_cache_dir)
 
     output_type = __OUTPUT_TYPES__[output]
 
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the wall time of code generators with and without a persistent cache
+of compiled templates (`codegen.py --jinja-cache-dir`).
+
+Every sample runs a generator in a fresh interpreter, like a codegen.py
+invocation does, rendering into memory. The IDL is served from a warm IDL
+cache, so the samples measure template compilation and rendering.
+
+    scripts/tools/codegen_template_benchmark.py --runs 5 --generator java-class --generator kotlin-class
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import click
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_IDL = os.path.join(os.path.dirname(SCRIPTS_DIR), 'src', 'controller', 'data_model', 'controller-clusters.matter')
+
+GENERATE = """
+import sys
+
+import jinja2
+from matter.idl.generators import SetJinjaBytecodeCache
+from matter.idl.generators.registry import CodeGenerator
+from matter.idl.generators.storage import GeneratorStorage
+from matter.idl.matter_idl_parser import CreateParser
+
+
+class DiscardStorage(GeneratorStorage):
+    def get_existing_data(self, relative_path):
+        return None
+
+    def write_new_data(self, relative_path, content):
+        pass
+
+
+generator, idl_path, idl_cache_dir, jinja_cache_dir = sys.argv[1:]
+if jinja_cache_dir:
+    SetJinjaBytecodeCache(jinja2.FileSystemBytecodeCache(jinja_cache_dir))
+with open(idl_path) as f:
+    idl = CreateParser(cache_dir=idl_cache_dir).parse(f.read(), file_name=idl_path)
+CodeGenerator.FromString(generator).Create(DiscardStorage(), idl=idl).render(dry_run=False)
+"""
+
+
+def RunGenerator(generator: str, idl_path: str, idl_cache_dir: str, jinja_cache_dir: str) -> float:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.join(SCRIPTS_DIR, 'py_matter_idl'), env.get('PYTHONPATH')]))
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', GENERATE, generator, idl_path, idl_cache_dir, jinja_cache_dir], env=env, check=True)
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option('--runs', default=5, help='Number of samples per generator and mode')
+@click.option('--generator', 'generators', multiple=True, default=['java-jni', 'java-class', 'kotlin-class'],
+              help='Generators to measure')
+@click.option('--idl', 'idl_path', default=DEFAULT_IDL, type=click.Path(exists=True), help='IDL to generate code for')
+def main(runs, generators, idl_path):
+    with tempfile.TemporaryDirectory() as idl_cache_dir, tempfile.TemporaryDirectory() as jinja_cache_dir:
+        for generator in generators:
+            # Warm up the IDL cache and the cache of compiled templates
+            RunGenerator(generator, idl_path, idl_cache_dir, jinja_cache_dir)
+
+            # Alternate between the modes, so that a change of the machine load affects both alike
+            modes = {'no template cache': '', 'template cache': jinja_cache_dir}
+            samples = {mode: [] for mode in modes}
+            for _ in range(runs):
+                for mode, cache_dir in modes.items():
+                    samples[mode].append(RunGenerator(generator, idl_path, idl_cache_dir, cache_dir))
+
+            for mode, mode_samples in samples.items():
+                print(f"{generator:>14} {mode:>18}: min {min(mode_samples) * 1000:8.1f} ms, "
+                      f"median {statistics.median(mode_samples) * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,502 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+# Reads the symbol table of ELF files in-process, for the size tools
+# (`file_size_from_nm.py`, `binary_elf_size_diff.py`) instead of running and
+# parsing the output of `nm`, `objdump --syms` and `strings`.
+#
+# The file is memory mapped and the symbol table decoded with `struct`. Symbol
+# names are demangled once per unique name. The decoded symbols can be kept in
+# a cache directory, keyed by the GNU build-id of the binary (or the SHA-256 of
+# its content when it has none), so that reports over the same binaries do not
+# read them again.
+#
+
+import contextlib
+import gzip
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import tempfile
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import cxxfilt
+
+log = logging.getLogger(__name__)
+
+# Bump when the content of the cache files changes
+CACHE_VERSION = 1
+
+# Section types
+SHT_SYMTAB = 2
+SHT_NOTE = 7
+SHT_NOBITS = 8
+SHT_SYMTAB_SHNDX = 18
+
+# Section flags
+SHF_WRITE = 0x1
+SHF_ALLOC = 0x2
+SHF_EXECINSTR = 0x4
+
+# Special section indexes
+SHN_UNDEF = 0
+SHN_ABS = 0xFFF1
+SHN_COMMON = 0xFFF2
+SHN_XINDEX = 0xFFFF
+
+# Symbol bindings
+STB_LOCAL = 0
+STB_GLOBAL = 1
+STB_WEAK = 2
+STB_GNU_UNIQUE = 10
+
+# Symbol types
+STT_OBJECT = 1
+STT_SECTION = 3
+STT_FILE = 4
+STT_GNU_IFUNC = 10
+
+NT_GNU_BUILD_ID = 3
+
+# Symbol type letters of `nm` for well known section names (prefixes), see coff_section_type in binutils bfd/syms.c
+_NM_SECTION_TYPES = [
+    ("*DEBUG*", "N"),
+    (".bss", "b"),
+    ("zerovars", "b"),
+    (".data", "d"),
+    ("vars", "d"),
+    (".rdata", "r"),
+    (".rodata", "r"),
+    (".sbss", "s"),
+    (".scommon", "c"),
+    (".sdata", "g"),
+    (".text", "t"),
+    ("code", "t"),
+]
+
+_SPECIAL_SECTION_NAMES = {
+    SHN_UNDEF: "*UND*",
+    SHN_ABS: "*ABS*",
+    SHN_COMMON: "*COM*",
+}
+
+
+@dataclass(frozen=True)
+class ElfSection:
+    name: str
+    section_type: int
+    flags: int
+    address: int
+    offset: int
+    size: int
+    link: int
+
+
+class ElfSymbol(NamedTuple):
+    name: str
+    demangled: str  # C++ demangled name, same as name if it is not mangled
+    value: int
+    size: int
+    symbol_type: int  # STT_*
+    binding: int  # STB_*
+    section: str  # section name, or *UND*, *ABS* or *COM* as displayed by objdump
+    nm_type: str  # symbol type letter as displayed by nm
+
+
+class ElfFile:
+    """
+    A memory mapped ELF file, 32 or 64 bits, little or big endian.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._parse_header()
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def close(self):
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _parse_header(self):
+        ident = self._data[:16]
+        if len(ident) < 16 or ident[:4] != b"\x7fELF":
+            raise ValueError(f"{self.path} is not an ELF file")
+        if ident[4] not in (1, 2) or ident[5] not in (1, 2):
+            raise ValueError(f"{self.path} has an unsupported ELF class or data encoding")
+
+        self.is_64 = ident[4] == 2
+        self._endian = "<" if ident[5] == 1 else ">"
+        if self.is_64:
+            header = struct.unpack_from(self._endian + "HHIQQQIHHHHHH", self._data, 16)
+            self._section_format = struct.Struct(self._endian + "IIQQQQIIQQ")
+            self._symbol_format = struct.Struct(self._endian + "IBBHQQ")
+        else:
+            header = struct.unpack_from(self._endian + "HHIIIIIHHHHHH", self._data, 16)
+            self._section_format = struct.Struct(self._endian + "IIIIIIIIII")
+            self._symbol_format = struct.Struct(self._endian + "IIIBBH")
+
+        section_offset, section_entry_size, section_count, names_index = header[5], header[10], header[11], header[12]
+        raw_sections = []
+        if section_offset:
+            first = self._section_format.unpack_from(self._data, section_offset)
+            # Extended numbering: the real values are stored in the first section header
+            if section_count == 0:
+                section_count = first[5]
+            if names_index == SHN_XINDEX:
+                names_index = first[6]
+            raw_sections = [self._section_format.unpack_from(self._data, section_offset + i * section_entry_size)
+                            for i in range(section_count)]
+
+        names = self._section_data(raw_sections[names_index]) if names_index < len(raw_sections) else b""
+        self.sections = [
+            ElfSection(
+                name=self._string(names, s[0]),
+                section_type=s[1],
+                flags=s[2],
+                address=s[3],
+                offset=s[4],
+                size=s[5],
+                link=s[6],
+            )
+            for s in raw_sections
+        ]
+        self._entry_sizes = [s[9] for s in raw_sections]
+
+    def _section_data(self, raw_section) -> bytes:
+        if raw_section[1] == SHT_NOBITS:
+            return b""
+        return self._data[raw_section[4]:raw_section[4] + raw_section[5]]
+
+    def section_data(self, section: ElfSection) -> bytes:
+        if section.section_type == SHT_NOBITS:
+            return b""
+        return self._data[section.offset:section.offset + section.size]
+
+    @staticmethod
+    def _string(table: bytes, offset: int) -> str:
+        end = table.find(b"\0", offset)
+        return table[offset:end if end >= 0 else len(table)].decode("utf8", errors="replace")
+
+    @property
+    def symbol_table(self) -> ElfSection | None:
+        for section in self.sections:
+            if section.section_type == SHT_SYMTAB:
+                return section
+        return None
+
+    @property
+    def build_id(self) -> str | None:
+        """The GNU build-id of the file as a hex string, if any."""
+        for section in self.sections:
+            if section.section_type != SHT_NOTE:
+                continue
+            data = self.section_data(section)
+            pos = 0
+            while pos + 12 <= len(data):
+                name_size, desc_size, note_type = struct.unpack_from(self._endian + "III", data, pos)
+                name_start = pos + 12
+                desc_start = name_start + ((name_size + 3) & ~3)
+                if note_type == NT_GNU_BUILD_ID and data[name_start:name_start + name_size] == b"GNU\0":
+                    return data[desc_start:desc_start + desc_size].hex()
+                pos = desc_start + ((desc_size + 3) & ~3)
+        return None
+
+    def raw_symbols(self):
+        """
+        Yields the entries of the symbol table, in table order, as (name, value, size, type, binding, section index).
+        The null first entry is skipped.
+        """
+        symtab = self.symbol_table
+        if symtab is None:
+            return
+
+        symtab_index = self.sections.index(symtab)
+        names = self.section_data(self.sections[symtab.link]) if symtab.link < len(self.sections) else b""
+        extended_indexes = None
+        for section in self.sections:
+            if section.section_type == SHT_SYMTAB_SHNDX and section.link == symtab_index:
+                data = self.section_data(section)
+                extended_indexes = struct.unpack(f"{self._endian}{len(data) // 4}I", data)
+
+        entry_size = self._entry_sizes[symtab_index] or self._symbol_format.size
+        data = self.section_data(symtab)
+        data = data[:len(data) - len(data) % entry_size]
+        for index, entry in enumerate(struct.iter_unpack(self._symbol_format.format, data)):
+            if index == 0:
+                continue
+            if self.is_64:
+                name_offset, info, _, section_index, value, size = entry
+            else:
+                name_offset, value, size, info, _, section_index = entry
+            if section_index == SHN_XINDEX and extended_indexes is not None:
+                section_index = extended_indexes[index]
+            yield self._string(names, name_offset), value, size, info & 0xF, info >> 4, section_index
+
+    def section_name(self, section_index: int) -> str:
+        if section_index in _SPECIAL_SECTION_NAMES:
+            return _SPECIAL_SECTION_NAMES[section_index]
+        if section_index < len(self.sections):
+            return self.sections[section_index].name
+        return "*UNKNOWN*"
+
+    def nm_type(self, symbol_type: int, binding: int, section_index: int) -> str:
+        """The type letter `nm` displays for a symbol, see bfd_decode_symclass in binutils bfd/syms.c"""
+        if section_index == SHN_COMMON:
+            return "C"
+        if section_index == SHN_UNDEF:
+            if binding == STB_WEAK:
+                return "v" if symbol_type == STT_OBJECT else "w"
+            return "U"
+        if symbol_type == STT_GNU_IFUNC:
+            return "i"
+        if binding == STB_WEAK:
+            return "V" if symbol_type == STT_OBJECT else "W"
+        if binding == STB_GNU_UNIQUE:
+            return "u"
+        if binding not in (STB_LOCAL, STB_GLOBAL):
+            return "?"
+
+        if section_index == SHN_ABS:
+            letter = "a"
+        elif section_index < len(self.sections):
+            letter = _nm_section_type(self.sections[section_index])
+        else:
+            return "?"
+        return letter.upper() if binding == STB_GLOBAL else letter
+
+    def symbols(self, demangle: bool = True) -> list[ElfSymbol]:
+        raw = list(self.raw_symbols())
+        demangled = demangle_all(entry[0] for entry in raw) if demangle else {}
+
+        # Few distinct (type, binding, section) combinations, decode each once
+        classes = {}
+        symbols = []
+        for name, value, size, symbol_type, binding, section_index in raw:
+            key = (symbol_type, binding, section_index)
+            if key not in classes:
+                classes[key] = (self.section_name(section_index), self.nm_type(symbol_type, binding, section_index))
+            section, nm_type = classes[key]
+            if symbol_type == STT_SECTION and not name:
+                name = section
+            symbols.append(ElfSymbol(name, demangled.get(name, name), value, size, symbol_type, binding, section, nm_type))
+        return symbols
+
+    def strings(self, min_length: int = 4):
+        """Yields the runs of printable ASCII characters of the file, as `strings --all` does."""
+        for m in re.finditer(rb"[\t\x20-\x7e]{%d,}" % min_length, self._data):
+            yield m.group().decode("ascii")
+
+    def cache_key(self) -> str:
+        symtab = self.symbol_table
+        build_id = self.build_id
+        if build_id:
+            # Stripping a binary keeps its build-id, tell the copies apart by their symbol table
+            return f"build-id-{build_id}-{symtab.size if symtab else 0}"
+        return f"sha256-{hashlib.sha256(self._data).hexdigest()}"
+
+
+def _nm_section_type(section: ElfSection) -> str:
+    for prefix, letter in _NM_SECTION_TYPES:
+        if section.name.startswith(prefix):
+            return letter
+
+    # See decode_section_type in binutils bfd/syms.c
+    if section.flags & SHF_EXECINSTR:
+        return "t"
+    if section.section_type == SHT_NOBITS:
+        return "b"
+    if section.flags & SHF_ALLOC:
+        return "d" if section.flags & SHF_WRITE else "r"
+    if section.name.startswith((".debug", ".zdebug", ".gnu.linkonce.wi.", ".stab", ".line")):
+        return "N"
+    if not section.flags & SHF_WRITE:
+        return "n"
+    return "?"
+
+
+def demangle_all(names) -> dict[str, str]:
+    """
+    Demangles the C++ names among the given ones, each unique name once.
+
+    Returns the demangled names, by mangled name. Names that are not mangled, or cannot be demangled, are not included.
+    """
+    result = {}
+    for name in set(names):
+        if not name.startswith("_Z"):
+            continue
+        with contextlib.suppress(cxxfilt.InvalidName):
+            result[name] = cxxfilt.demangle(name)
+    return result
+
+
+def _cache_path(cache_dir: str, key: str) -> str:
+    return os.path.join(cache_dir, f"v{CACHE_VERSION}-{key}.json.gz")
+
+
+def _load_cached_symbols(path: str) -> list[ElfSymbol] | None:
+    try:
+        with gzip.open(path, "rt", encoding="utf8") as f:
+            rows = json.load(f)
+    except (OSError, ValueError) as e:
+        if not isinstance(e, FileNotFoundError):
+            log.warning("Ignoring unreadable symbol cache %s: %s", path, e)
+        return None
+
+    return [
+        ElfSymbol(name, name if demangled is None else demangled, value, size, symbol_type, binding, section, nm_type)
+        for name, demangled, value, size, symbol_type, binding, section, nm_type in rows
+    ]
+
+
+def _store_cached_symbols(path: str, symbols: list[ElfSymbol]):
+    rows = [
+        [s.name, None if s.demangled == s.name else s.demangled, s.value, s.size, s.symbol_type, s.binding, s.section,
+         s.nm_type]
+        for s in symbols
+    ]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf8", compresslevel=1) as f:
+            json.dump(rows, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_symbols(elf_file: str, cache_dir: str | None = None, demangle: bool = True) -> list[ElfSymbol]:
+    """
+    Returns all the symbols of the symbol table of the given ELF file, in table order, with their demangled names.
+
+    If cache_dir is set, the symbols are read from, or stored into, a cache file for the binary in that directory.
+    Cached symbols are always demangled, otherwise demangle=False leaves demangled as the raw name.
+    """
+    with ElfFile(elf_file) as elf:
+        if cache_dir is None:
+            return elf.symbols(demangle)
+
+        path = _cache_path(cache_dir, elf.cache_key())
+        symbols = _load_cached_symbols(path)
+        if symbols is not None:
+            log.debug("Using cached symbols of %s from %s", elf_file, path)
+            return symbols
+
+        symbols = elf.symbols()
+
+    _store_cached_symbols(path, symbols)
+    log.debug("Cached symbols of %s in %s", elf_file, path)
+    return symbols
+
+
+def read_sized_symbols(elf_file: str, cache_dir: str | None = None, demangle: bool = True) -> list[ElfSymbol]:
+    """
+    Returns the defined symbols with a size, sorted by size: the symbols listed by `nm --print-size --size-sort`.
+    """
+    symbols = [
+        s for s in read_symbols(elf_file, cache_dir, demangle=cache_dir is not None)
+        if s.size > 0 and s.nm_type not in ("U", "w", "v") and s.symbol_type not in (STT_SECTION, STT_FILE)
+    ]
+    if cache_dir is None and demangle:
+        # Without a cache, only demangle the symbols that are kept
+        demangled = demangle_all(s.name for s in symbols)
+        symbols = [ElfSymbol(s.name, demangled.get(s.name, s.name), *s[2:]) for s in symbols]
+    # nm orders the symbols of the same size by name
+    symbols.sort(key=lambda s: (s.size, s.name))
+    return symbols
+
+
+def read_strings(elf_file: str, min_length: int = 4) -> list[str]:
+    with ElfFile(elf_file) as elf:
+        return list(elf.strings(min_length))
+
+
+# TO run the tests, install pytest and do
+# pytest elf_symbols.py
+def _compile_test_binary(tmp_path, extra_flags=()):
+    import shutil
+    import subprocess
+
+    import pytest
+
+    if not shutil.which("g++") or not shutil.which("nm"):
+        pytest.skip("g++ and nm are required")
+
+    source = tmp_path / "test.cpp"
+    source.write_text("""
+namespace chip { namespace app {
+int Counter = 3;
+const char Name[] = "some name";
+static char Buffer[128];
+template <typename T> T Twice(T value) { return value * 2; }
+int Use() { Buffer[0] = Name[0]; return Twice(Counter) + Twice<long>(Counter); }
+} }
+__attribute__((weak)) int WeakFunction() { return 1; }
+int main() { return chip::app::Use() + WeakFunction(); }
+""")
+    binary = tmp_path / "test.elf"
+    subprocess.check_call(["g++", "-O0", "-Wl,--build-id", *extra_flags, "-o", str(binary), str(source)])
+    return str(binary)
+
+
+def test_sized_symbols_match_nm(tmp_path):
+    import subprocess
+
+    elf_file = _compile_test_binary(tmp_path)
+    output = subprocess.check_output(["nm", "--print-size", "--size-sort", "--radix=d", elf_file]).decode("utf8")
+    expected = [tuple(line.split(" ")[1:]) for line in output.splitlines() if line.strip()]
+
+    symbols = read_sized_symbols(elf_file)
+    assert [(f"{s.size:016d}", s.nm_type, s.name) for s in symbols] == expected
+    assert read_sized_symbols(elf_file, str(tmp_path / "cache")) == symbols
+
+    demangled = {s.demangled for s in symbols}
+    assert "chip::app::Use()" in demangled
+    assert "long chip::app::Twice<long>(long)" in demangled
+
+
+def test_symbols_cache(tmp_path):
+    elf_file = _compile_test_binary(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    with ElfFile(elf_file) as elf:
+        assert elf.build_id
+        key = elf.cache_key()
+
+    symbols = read_symbols(elf_file, str(cache_dir))
+    assert os.listdir(cache_dir) == [os.path.basename(_cache_path(str(cache_dir), key))]
+    assert read_symbols(elf_file, str(cache_dir)) == symbols
+    assert read_symbols(elf_file) == symbols
+
+
+def test_strings(tmp_path):
+    elf_file = _compile_test_binary(tmp_path)
+    assert "some name" in read_strings(elf_file)
@@ -25,7 +25,8 @@
 # ]
 # ///
 #
-# Displays a treemap code size as read by `nm` over a binary
+# Displays a treemap code size as read by `nm` over a binary. The symbol table of
+# the binary is read in-process (see elf_symbols.py), no `nm` or `objdump` is run.
 #
 # Example call:
 #
@@ -44,11 +45,9 @@
 #   good way to disambiguate
 #
 
-import contextlib
 import fnmatch
 import logging
 import re
-import subprocess
 from collections.abc import Callable
 from dataclasses import dataclass, replace
 from enum import Enum, auto
@@ -57,6 +56,7 @@ import click
 import coloredlogs
 import cxxfilt
 import plotly.express as px
+from elf_symbols import STT_FILE, read_sized_symbols, read_strings, read_symbols
 
 log = logging.getLogger(__name__)
 
@@ -131,16 +131,12 @@ _CLUSTER_EXPRESSIONS = [
 
 def tree_display_name(name: str) -> list[str]:
     """
-    Convert the given name from NM into a tree path.
+    Convert the given (demangled) name from NM into a tree path.
 
     It splits the name by C++ namespaces, however it also specifically handles
     'emberAf' prefixes to make them common and uses 'vtable for' information
     """
 
-    # Allow to display the name as-is in case of failure.
-    with contextlib.suppress(cxxfilt.InvalidName):
-        name = cxxfilt.demangle(name)
-
     if name.startswith("non-virtual thunk to "):
         name = name[21:]
     if name.startswith("vtable for "):
@@ -523,14 +519,15 @@ def build_treemap(
     fig.show()
 
 
-def symbols_from_objdump(elf_file: str) -> list[Symbol]:
+def symbols_from_objdump(elf_file: str, cache_dir: str | None = None) -> list[Symbol]:
+    """Symbols grouped by source file, from the symbol table as `objdump --syms --demangle` lists it."""
 
     sources = {}
     SOURCE_RE = re.compile(r'^(.*third_party/connectedhomeip/)?(?P<path>.*\.(cpp|c|asm)$)')
 
     # First try to figure out `source paths`. Do the "ugly" way and search for all strings that
     # seem to match a 'source'
-    for line in subprocess.check_output(["strings", elf_file]).decode("utf8").split('\n'):
+    for line in read_strings(elf_file):
         if '/' not in line:
             # want directory paths...
             continue
@@ -555,67 +552,25 @@ def symbols_from_objdump(elf_file: str) -> list[Symbol]:
 
         sources[parts[-1]] = parts
 
-    items = subprocess.check_output(
-        [
-            "objdump",
-            "--syms",
-            "--demangle",
-            elf_file,
-        ]
-    ).decode("utf8")
-
-    # The format looks like:
+    # The symbol table, in order, looks like (as displayed by objdump):
     #
-    #     out/qpg-qpg6200-light/chip-qpg6200-lighting-example.out:     file format elf32-little                                                                                          │
-    #                                                                                                                                                                                │
-    #     SYMBOL TABLE:                                                                                                                                                                  │
-    #     04000010 l    d  .bl_user_license   00000000 .bl_user_license                                                                                                                  │
-    #     04000800 l    d  .datajumptable 00000000 .datajumptable                                                                                                                        │
-    #     04000840 l    d  .flashjumptable    00000000 .flashjumptable                                                                                                                   │
-    #     04001600 l    d  .m_flashjumptable  00000000 .m_flashjumptable                                                                                                                 │
-    #     04001800 l    d  .bootloader    00000000 .bootloader                                                                                                                           │
-    #     04003d00 l    d  .rt_flash  00000000 .rt_flash                                                                                                                                 │
-    #     04007000 l    d  .upgrade_image_user_license    00000000 .upgrade_image_user_license                                                                                           │
-    #     04008000 l    d  .loaded_user_license   00000000 .loaded_user_license                                                                                                          │
-    #     04008080 l    d  .extended_user_license 00000000 .extended_user_license                                                                                                        │
-    #     04008100 l    d  .isr_vector    00000000 .isr_vector                                                                                                                           │
-    #     040081c4 l    d  firmware_datafirmwaredata  00000000 firmware_datafirmwaredata
+    #     00000000 l    df *ABS*  00000000 gpJumpTables_DataTable.c
+    #     04080384 l       .text  00000000 $t
+    #     0408038c l       .text  00000000 $d
+    #     04000800 l       .datajumptable 00000000 $d
+    #     00000000 l    df *ABS*  00000000 gpJumpTables_RomLib_FlashJump_gcc.o
     #     ....
-    #     00000000 l    df *ABS*  00000000 gpJumpTables_DataTable.c                                                                                                                      │
-    #     04080384 l       .text  00000000 $t                                                                                                                                            │
-    #     0408038c l       .text  00000000 $d                                                                                                                                            │
-    #     04000800 l       .datajumptable 00000000 $d                                                                                                                                    │
-    #     00000000 l    df *ABS*  00000000 gpJumpTables_RomLib_FlashJump_gcc.o                                                                                                           │
-    #     ....
-    #     00000000 l    df *ABS*  00000000 ember-io-storage.cpp                                                                                                                          │
-    #     04012106 l       .text  00000000 $t                                                                                                                                            │
-    #     04012122 l       .text  00000000 $d                                                                                                                                            │
-    #     0401212a l       .text  00000000 $t                                                                                                                                            │
-    #     04012136 l       .text  00000000 $d                                                                                                                                            │
-    #     2003aa70 l       .data  00000000 $d                                                                                                                                            │
-    #     200417a0 l       .bss   00000000 $d                                                                                                                                            │
-    #     04012167 l       .text  00000000 $d                                                                                                                                            │
-    #     04012168 l       .text  00000000 $t
+    #     00000000 l    df *ABS*  00000000 ember-io-storage.cpp
+    #     04012106 l       .text  00000000 $t
+    #     04012122 l       .text  00000000 $d
+    #     2003aa70 l       .data  00000000 $d
+    #     200417a0 l       .bss   00000000 $d
     #     ...
     #     200417a0 g     O .bss   00000103 chip::app::Compatibility::Internal::attributeIOBuffer
     #     04012107 g     F .text  0000008a chip::app::Compatibility::Internal::AttributeBaseType(unsigned char)
     #
-    # Documentation at https://sourceware.org/binutils/docs/binutils/objdump.html
-    #
-    # Format is:
-    #    - Address
-    #    - set of character and spaces for flags
-    #    - section (or *ABS* or *UND*)
-    #    - alignment or size (common symbos: alignment, otherwise size)
-    #    - Symbol name
-    # Flags are:
-    #   - l,g,u,! => local,global,unique global, none (space) or both local and global (!)
-    #   - w - weak (space is strong)
-    #   - C - constructor
-    #   - W - warning
-    #   - I/i - indirect reference/evaluated during relocation processing
-    #   - D/d - debugging symbol/dynamic debugging symbol
-    #   - F/f/O - name of a function, or a file (F) or an object (O)
+    # i.e. address, flags, section (or *ABS* or *UND*), size and name of each symbol.
+    # File symbols ("df" flags) are followed by the local symbols of that file.
 
     # Logic generally is:
     #    - can capture segment (.text, .data, .bss seem interesting)
@@ -623,25 +578,18 @@ def symbols_from_objdump(elf_file: str) -> list[Symbol]:
     #      if may be slightly off - we need to track these as .text seem to potentially be aligned
     #    - symbols are have size
 
-    LINE_RE = re.compile(r'^(?P<offset>[0-9a-f]{8})\s(?P<flags>.{7})\s+(?P<section>\S+)\s+(?P<size>\S+)\s*(?P<name>.*)$')
     current_file_name = None
 
     offset_file_map = {}
     symbols = []
     unknown_file_names = set()
 
-    for line in items.split("\n"):
-        line = line.strip()
-
-        m = LINE_RE.match(line)
-        if not m:
-            continue
-
-        captures = m.groupdict()
-        size = int(captures['size'], 16)
-        offset = int(captures['offset'], 16)
-        if captures['flags'].endswith('df') and captures['section'] == '*ABS*' and size == 0:
-            current_file_name = captures['name']
+    for symbol in read_symbols(elf_file, cache_dir):
+        name = symbol.demangled
+        size = symbol.size
+        offset = symbol.value
+        if symbol.symbol_type == STT_FILE and symbol.section == '*ABS*' and size == 0:
+            current_file_name = name
             continue
 
         if size == 0:
@@ -660,13 +608,13 @@ def symbols_from_objdump(elf_file: str) -> list[Symbol]:
             if symbol_file_name not in unknown_file_names:
                 log.warning('Source %r is not known', symbol_file_name)
                 unknown_file_names.add(symbol_file_name)
-            path = [captures['section'], 'UNKNOWN', symbol_file_name, captures['name']]
+            path = [symbol.section, 'UNKNOWN', symbol_file_name, name]
         else:
-            path = [captures['section']] + sources[symbol_file_name] + [captures['name']]
+            path = [symbol.section] + sources[symbol_file_name] + [name]
 
         s = Symbol(
-            name=captures['name'],
-            symbol_type=captures['section'],
+            name=name,
+            symbol_type=symbol.section,
             size=size,
             tree_path=path,
         )
@@ -676,27 +624,12 @@ def symbols_from_objdump(elf_file: str) -> list[Symbol]:
     return symbols
 
 
-def symbols_from_nm(elf_file: str) -> list[Symbol]:
-    items = subprocess.check_output(
-        [
-            "nm",
-            "--print-size",
-            "--size-sort",  # Filters out empty entries
-            "--radix=d",
-            elf_file,
-        ]
-    ).decode("utf8")
-
+def symbols_from_nm(elf_file: str, cache_dir: str | None = None) -> list[Symbol]:
+    """Sized symbols, as `nm --print-size --size-sort` lists them."""
     symbols = []
 
-    # OUTPUT FORMAT:
-    # <offset> <size> <type> <name>
-    for line in items.split("\n"):
-        if not line.strip():
-            continue
-        _, size, t, name = line.split(" ")
-
-        size = int(size, 10)
+    for symbol in read_sized_symbols(elf_file, cache_dir):
+        name, t = symbol.name, symbol.nm_type
 
         if t in {
             # Text section
@@ -715,8 +648,8 @@ def symbols_from_nm(elf_file: str) -> list[Symbol]:
             "v",
             "V",
         }:
-            log.debug("Found '%s' of size %d", name, size)
-            symbols.append(Symbol(name=name, symbol_type=t, size=size, tree_path=tree_display_name(name)))
+            log.debug("Found '%s' of size %d", name, symbol.size)
+            symbols.append(Symbol(name=name, symbol_type=t, size=symbol.size, tree_path=tree_display_name(symbol.demangled)))
         elif t in {
             # BSS - 0-initialized, not code
             "b",
@@ -729,14 +662,15 @@ def symbols_from_nm(elf_file: str) -> list[Symbol]:
     return symbols
 
 
-def fetch_symbols(elf_file: str, fetch: FetchStyle, glob_filter: str | None) -> tuple[list[Symbol], str]:
+def fetch_symbols(elf_file: str, fetch: FetchStyle, glob_filter: str | None,
+                  cache_dir: str | None = None) -> tuple[list[Symbol], str]:
     """Returns the sumbol list and the separator used to split symbols
     """
     match fetch:
         case FetchStyle.NM:
-            symbols, separator = symbols_from_nm(elf_file), "::"
+            symbols, separator = symbols_from_nm(elf_file, cache_dir), "::"
         case FetchStyle.OBJDUMP:
-            symbols, separator = symbols_from_objdump(elf_file), '/'
+            symbols, separator = symbols_from_objdump(elf_file, cache_dir), '/'
     if glob_filter is not None:
         symbols = [s for s in symbols if fnmatch.fnmatch(s.name, glob_filter)]
 
@@ -864,6 +798,12 @@ def compute_symbol_diff(orig: list[Symbol], base: list[Symbol]) -> list[Symbol]:
     type=click.Path(file_okay=True, dir_okay=False, exists=True),
     help="Diff against the given file (changes symbols to increase/decrease)",
 )
+@click.option(
+    "--symbol-cache-dir",
+    default=None,
+    type=click.Path(file_okay=False),
+    help="Directory where the symbols read from the ELF files are cached, by build-id",
+)
 @click.argument("elf-file", type=click.Path(file_okay=True, dir_okay=False, exists=True))
 def main(
     log_level,
@@ -876,18 +816,19 @@ def main(
     strip: str | None,
     diff: str | None,
     glob_filter: str | None,
+    symbol_cache_dir: str | None,
 ):
     log_fmt = "%(asctime)s %(levelname)-7s %(message)s"
     coloredlogs.install(level=__LOG_LEVELS__[log_level], fmt=log_fmt)
 
-    symbols, separator = fetch_symbols(elf_file, __FETCH_STYLES__[fetch_via], glob_filter)
+    symbols, separator = fetch_symbols(elf_file, __FETCH_STYLES__[fetch_via], glob_filter, symbol_cache_dir)
     title = elf_file
 
     if glob_filter:
         title += f" FILTER {glob_filter}"
 
     if diff:
-        diff_symbols, _ = fetch_symbols(diff, __FETCH_STYLES__[fetch_via], glob_filter)
+        diff_symbols, _ = fetch_symbols(diff, __FETCH_STYLES__[fetch_via], glob_filter, symbol_cache_dir)
         symbols = compute_symbol_diff(symbols, diff_symbols)
         title += f" COMPARED TO {diff}"
 
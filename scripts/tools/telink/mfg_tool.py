@@ -19,21 +19,41 @@ import argparse
 import base64
 import binascii
 import csv
+import datetime
+import functools
 import json
 import logging
 import os
 import random
+import secrets
 import shlex
 import shutil
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 import cbor2 as cbor
 import cryptography.hazmat.backends
+import cryptography.hazmat.primitives.asymmetric.ec
+import cryptography.hazmat.primitives.hashes
+import cryptography.hazmat.primitives.serialization
 import cryptography.x509
 import pyqrcode
 from intelhex import IntelHex
 
+# The SPAKE2+ verifiers and the onboarding codes are computed in-process in the batch mode (--jobs)
+MATTER_ROOT = os.path.dirname(os.path.realpath(__file__))[:-len(os.path.join('scripts', 'tools', 'telink'))]
+sys.path.insert(0, os.path.join(MATTER_ROOT, 'scripts', 'tools', 'spake2p'))
+sys.path.insert(0, os.path.join(MATTER_ROOT, 'src', 'setup_payload', 'python'))
+try:
+    from SetupPayload import CommissioningFlow, SetupPayload
+    from spake2p import generate_verifier
+except ImportError:
+    no_batch_modules = True
+else:
+    no_batch_modules = False
+
 TOOLS = {
     'spake2p': None,
     'chip-cert': None,
@@ -56,6 +76,16 @@ ROTATING_DEVICE_ID_UNIQUE_ID_LEN = 16
 HEX_PREFIX = "hex:"
 DEV_SN_CSV_HDR = "Serial Number,\n"
 
+LOG_FORMAT = '[%(asctime)s] [%(levelname)7s] - %(message)s'
+
+# Matter vendor and product id attributes of the DAC subject
+OID_MATTER_VID = cryptography.x509.ObjectIdentifier('1.3.6.1.4.1.37244.2.1')
+OID_MATTER_PID = cryptography.x509.ObjectIdentifier('1.3.6.1.4.1.37244.2.2')
+# Lifetime, in days, of a certificate with no well defined expiration date
+NO_WELL_DEFINED_EXPIRATION_LIFETIME = 4294967295
+# Number of devices queued per worker process in the batch mode
+BATCH_QUEUE_DEPTH = 4
+
 NVS_MEMORY = {}
 
 
@@ -74,6 +104,10 @@ def nvs_memory_update(key, value):
 
 
 def check_tools_exists(args):
+    if args.jobs:
+        check_batch_tools_exists(args)
+        return
+
     if args.spake2_path:
         TOOLS['spake2p'] = shutil.which(args.spake2_path)
     else:
@@ -107,6 +141,25 @@ def check_tools_exists(args):
     log.debug("chip-tool:  '%s'", TOOLS['chip-tool'])
 
 
+def check_batch_tools_exists(args):
+    if no_batch_modules:
+        log.error("Batch mode requires the Python modules of scripts/tools/spake2p and src/setup_payload/python, "
+                  "please install their requirements")
+        sys.exit(1)
+    # Only the PAI generated from the PAA, once for the whole batch, uses chip-cert
+    if args.paa:
+        if args.chip_cert_path:
+            TOOLS['chip-cert'] = shutil.which(args.chip_cert_path)
+        else:
+            TOOLS['chip-cert'] = shutil.which('chip-cert')
+        if TOOLS['chip-cert'] is None:
+            log.error("chip-cert not found, please specify --chip-cert-path argument")
+            sys.exit(1)
+
+    log.debug("Using following tools:")
+    log.debug("chip-cert:  '%s'", TOOLS['chip-cert'])
+
+
 def execute_cmd(cmd):
     log.debug("Executing Command: %s", shlex.join(cmd))
     status = subprocess.run(cmd, capture_output=True)
@@ -189,9 +242,27 @@ def convert_x509_cert_from_pem_to_der(pem_file, out_der_file):
         f.write(der_cert)
 
 
+def generate_random_passcode():
+    while True:
+        passcode = secrets.randbelow(0x5F5E0FE) + 1
+        if passcode not in INVALID_PASSCODES:
+            return passcode
+
+
 def generate_passcode(args, out_dirs):
     salt_len_max = 32
 
+    if args.jobs:
+        # Same output as 'spake2p gen-verifier'
+        passcode = args.passcode if args.passcode else generate_random_passcode()
+        salt = os.urandom(salt_len_max)
+        verifier = generate_verifier(passcode, salt, args.spake2_it)
+        with open(os.sep.join([out_dirs['output'], 'pin.csv']), 'w') as fd:
+            fd.write('Index,PIN Code,Iteration Count,Salt,Verifier\n')
+            fd.write('0,{:08},{},{},{}\n'.format(passcode, args.spake2_it, base64.b64encode(salt).decode('utf-8'),
+                                                base64.b64encode(verifier).decode('utf-8')))
+        return
+
     cmd = [
         TOOLS['spake2p'], 'gen-verifier',
         '--iteration-count', str(args.spake2_it),
@@ -301,6 +372,101 @@ def generate_keypair_bin(pem_file, out_privkey_bin, out_pubkey_bin):
         f.write(public_number_y.to_bytes(32, byteorder='big'))
 
 
+@functools.lru_cache
+def load_ca(ca_key, ca_cert):
+    with open(ca_key, 'rb') as f:
+        key = cryptography.hazmat.primitives.serialization.load_pem_private_key(f.read(), None)
+    with open(ca_cert, 'rb') as f:
+        cert = cryptography.x509.load_pem_x509_certificate(f.read())
+    return key, cert
+
+
+def get_cert_validity(args):
+    if args.valid_from:
+        valid_from = None
+        for time_format in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d'):
+            try:
+                valid_from = datetime.datetime.strptime(args.valid_from.strip(), time_format)
+                break
+            except ValueError:
+                pass
+        if valid_from is None:
+            log.error("Invalid certificate validity start date '%s'", args.valid_from)
+            sys.exit(1)
+    else:
+        valid_from = datetime.datetime.combine(datetime.datetime.now(datetime.UTC).date(), datetime.time())
+
+    if args.lifetime == NO_WELL_DEFINED_EXPIRATION_LIFETIME:
+        valid_to = datetime.datetime(9999, 12, 31, 23, 59, 59)
+    else:
+        valid_to = valid_from + datetime.timedelta(days=args.lifetime, seconds=-1)
+
+    return valid_from.replace(tzinfo=datetime.UTC), valid_to.replace(tzinfo=datetime.UTC)
+
+
+def generate_dac_cert_in_process(iteration, args, out_dirs, ca_key, ca_cert):
+    """
+    Generates the DAC like 'chip-cert gen-att-cert --type d' does, without running the tool.
+    """
+    out_key_pem = os.sep.join([out_dirs['internal'], 'DAC_key.pem'])
+    out_cert_pem = out_key_pem.replace('key.pem', 'cert.pem')
+    out_cert_der = out_key_pem.replace('key.pem', 'cert.der')
+    out_private_key_bin = out_key_pem.replace('key.pem', 'private_key.bin')
+    out_public_key_bin = out_key_pem.replace('key.pem', 'public_key.bin')
+
+    pai_key, pai_cert = load_ca(ca_key, ca_cert)
+    key = cryptography.hazmat.primitives.asymmetric.ec.generate_private_key(cryptography.hazmat.primitives.asymmetric.ec.SECP256R1())
+    valid_from, valid_to = get_cert_validity(args)
+
+    subject = [
+        cryptography.x509.NameAttribute(cryptography.x509.oid.NameOID.COMMON_NAME, get_dac_subject_cn(args, iteration)),
+        cryptography.x509.NameAttribute(OID_MATTER_VID, '{:04X}'.format(args.vendor_id)),
+    ]
+    if args.product_id:
+        subject.append(cryptography.x509.NameAttribute(OID_MATTER_PID, '{:04X}'.format(args.product_id)))
+
+    pai_skid = pai_cert.extensions.get_extension_for_class(cryptography.x509.SubjectKeyIdentifier).value
+    cert = (cryptography.x509.CertificateBuilder()
+            .subject_name(cryptography.x509.Name(subject))
+            .issuer_name(pai_cert.subject)
+            .public_key(key.public_key())
+            .serial_number(secrets.randbits(63) or 1)
+            .not_valid_before(valid_from)
+            .not_valid_after(valid_to)
+            .add_extension(cryptography.x509.BasicConstraints(ca=False, path_length=None), critical=True)
+            .add_extension(cryptography.x509.KeyUsage(digital_signature=True, content_commitment=False,
+                                                      key_encipherment=False, data_encipherment=False,
+                                                      key_agreement=False, key_cert_sign=False, crl_sign=False,
+                                                      encipher_only=False, decipher_only=False), critical=True)
+            .add_extension(cryptography.x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False)
+            .add_extension(cryptography.x509.AuthorityKeyIdentifier.from_issuer_subject_key_identifier(pai_skid),
+                           critical=False)
+            .sign(pai_key, cryptography.hazmat.primitives.hashes.SHA256()))
+
+    with open(out_key_pem, 'wb') as f:
+        f.write(key.private_bytes(cryptography.hazmat.primitives.serialization.Encoding.PEM,
+                                  cryptography.hazmat.primitives.serialization.PrivateFormat.TraditionalOpenSSL,
+                                  cryptography.hazmat.primitives.serialization.NoEncryption()))
+    with open(out_cert_pem, 'wb') as f:
+        f.write(cert.public_bytes(cryptography.hazmat.primitives.serialization.Encoding.PEM))
+    log.info("Generated DAC certificate: '%s'", out_cert_pem)
+    log.info("Generated DAC private key: '%s'", out_key_pem)
+
+    with open(out_cert_der, 'wb') as f:
+        f.write(cert.public_bytes(cryptography.hazmat.primitives.serialization.Encoding.DER))
+    log.info("Generated DAC certificate in DER format: '%s'", out_cert_der)
+
+    generate_keypair_bin(out_key_pem, out_private_key_bin, out_public_key_bin)
+    log.info("Generated DAC private key in binary format: '%s'", out_private_key_bin)
+    log.info("Generated DAC public key in binary format: '%s'", out_public_key_bin)
+
+    return out_cert_der, out_private_key_bin, out_public_key_bin
+
+
+def get_dac_subject_cn(args, iteration):
+    return '"{} DAC {}"'.format(args.cn_prefix, iteration)
+
+
 def generate_dac_cert(iteration, args, out_dirs, discriminator, passcode, ca_key, ca_cert):
     out_key_pem = os.sep.join([out_dirs['internal'], 'DAC_key.pem'])
     out_cert_pem = out_key_pem.replace('key.pem', 'cert.pem')
@@ -311,7 +477,7 @@ def generate_dac_cert(iteration, args, out_dirs, discriminator, passcode, ca_key
     cmd = [
         TOOLS['chip-cert'], 'gen-att-cert',
         '--type', 'd',
-        '--subject-cn', '"{} DAC {}"'.format(args.cn_prefix, iteration),
+        '--subject-cn', get_dac_subject_cn(args, iteration),
         '--out-key', out_key_pem,
         '--out', out_cert_pem,
     ]
@@ -414,10 +580,16 @@ def get_chip_manualcode(chip_tool, vid, pid, flow, discriminator, passcode):
 
 
 def generate_onboarding_data(args, out_dirs, discriminator, passcode):
-    chip_manualcode = get_chip_manualcode(TOOLS['chip-tool'], args.vendor_id, args.product_id,
-                                          args.commissioning_flow, discriminator, passcode)
-    chip_qrcode = get_chip_qrcode(TOOLS['chip-tool'], args.vendor_id, args.product_id,
-                                  args.commissioning_flow, discriminator, passcode, args.discovery_mode)
+    if args.jobs:
+        payload = SetupPayload(discriminator, passcode, 1 << args.discovery_mode,
+                               CommissioningFlow(args.commissioning_flow), args.vendor_id, args.product_id)
+        chip_manualcode = payload.generate_manualcode()
+        chip_qrcode = payload.generate_qrcode()
+    else:
+        chip_manualcode = get_chip_manualcode(TOOLS['chip-tool'], args.vendor_id, args.product_id,
+                                              args.commissioning_flow, discriminator, passcode)
+        chip_qrcode = get_chip_qrcode(TOOLS['chip-tool'], args.vendor_id, args.product_id,
+                                      args.commissioning_flow, discriminator, passcode, args.discovery_mode)
 
     log.info("Generated QR code: '%s'", chip_qrcode)
     log.info("Generated manual code: '%s'", chip_manualcode)
@@ -453,6 +625,9 @@ def write_device_unique_data(args, out_dirs, pai_cert):
         if args.paa or args.pai:
             if args.dac_key is not None and args.dac_cert is not None:
                 dacs = use_dac_cert_from_args(args, out_dirs)
+            elif args.jobs:
+                dacs = generate_dac_cert_in_process(int(row['Index']), args, out_dirs,
+                                                    pai_cert['key_pem'], pai_cert['cert_pem'])
             else:
                 dacs = generate_dac_cert(int(row['Index']), args, out_dirs, int(row['Discriminator']),
                                          int(row['PIN Code']), pai_cert['key_pem'], pai_cert['cert_pem'])
@@ -523,6 +698,8 @@ def generate_json_summary(args, out_dirs, pai_certs, dacs_cert, serial_num: str)
     with open(os.sep.join([out_dirs['output'], 'summary.json']), 'w') as json_file:
         json.dump(json_dict, json_file, indent=4)
 
+    return json_dict
+
 
 def add_additional_kv(args, serial_num):
     # Device instance information
@@ -571,6 +748,10 @@ def get_and_validate_args():
     general_args = parser.add_argument_group('General options')
     general_args.add_argument('-n', '--count', type=allow_any_int, default=1,
                               help='The number of manufacturing partition binaries to generate. Default is 1.')
+    general_args.add_argument('-j', '--jobs', type=allow_any_int, default=0,
+                              help='Generate the devices in this number of worker processes, computing the SPAKE2+ verifiers, '
+                              'onboarding codes and DACs in-process instead of running spake2p, chip-tool and chip-cert '
+                              'for each device. Default is 0: sequential generation using the tools.')
     general_args.add_argument("--output", type=str, required=False, default="out",
                               help="[string] Output path where generated data will be stored.")
     general_args.add_argument("--spake2-path", type=str, required=False,
@@ -652,6 +833,9 @@ def get_and_validate_args():
     if args.count > 1 and args.in_tree:
         log.error("Option --in-tree can not be use together with --count > 1")
         sys.exit(1)
+    if args.jobs < 0:
+        log.error("Option --jobs can not be negative")
+        sys.exit(1)
 
     # Validate discriminator and passcode
     check_int_range(args.discriminator, 0x0000, 0x0FFF, 'Discriminator')
@@ -705,8 +889,53 @@ def get_and_validate_args():
     return args
 
 
+def setup_logging():
+    logging.basicConfig(format=LOG_FORMAT, level=logging.INFO)
+
+
+def generate_device(args, out_dir_top, serial_num_str: str, pai_cert=None):
+    """
+    Generates the factory data of one device, returns its summary.
+
+    The PAI certificate is set up for the device if pai_cert is None.
+    """
+    log.info("Generating for '%s'", serial_num_str)
+    NVS_MEMORY.clear()
+    out_dirs = setup_out_dir(out_dir_top, args, serial_num_str)
+    add_additional_kv(args, serial_num_str)
+    generate_passcode(args, out_dirs)
+    generate_discriminator(args, out_dirs)
+    if pai_cert is None:
+        pai_cert = setup_root_certificates(args, out_dirs) if (args.paa or args.pai) else {}
+    dacs_cert = write_device_unique_data(args, out_dirs, pai_cert)
+    generate_partition(args, out_dirs)
+    return generate_json_summary(args, out_dirs, pai_cert, dacs_cert, serial_num_str)
+
+
+def generate_devices_in_parallel(args, out_dir_top, serial_nums):
+    """
+    Generates the devices in a pool of args.jobs worker processes, yields their summaries in the order of serial_nums.
+
+    The PAI certificate is set up once, for all the devices. Only a few devices per worker are queued at any time.
+    """
+    pai_cert = {}
+    if args.paa or args.pai:
+        internal_dir = os.sep.join([out_dir_top, 'internal'])
+        os.makedirs(internal_dir, exist_ok=True)
+        pai_cert = setup_root_certificates(args, {'internal': internal_dir})
+
+    with ProcessPoolExecutor(args.jobs, initializer=setup_logging) as executor:
+        pending = deque()
+        for serial_num_str in serial_nums:
+            pending.append(executor.submit(generate_device, args, out_dir_top, serial_num_str, pai_cert))
+            if len(pending) >= args.jobs * BATCH_QUEUE_DEPTH:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def main():
-    logging.basicConfig(format='[%(asctime)s] [%(levelname)7s] - %(message)s', level=logging.INFO)
+    setup_logging()
     args = get_and_validate_args()
     check_tools_exists(args)
 
@@ -728,23 +957,22 @@ def main():
     out_dir_top = os.path.realpath(args.output)
     os.makedirs(out_dir_top, exist_ok=True)
 
-    with open(os.sep.join([out_dir_top, "device_sn.csv"]), "w") as f:
+    serial_nums = [format(serial_num_int + i, 'x') for i in range(args.count)]
+    if args.jobs:
+        summaries = generate_devices_in_parallel(args, out_dir_top, serial_nums)
+    else:
+        summaries = (generate_device(args, out_dir_top, serial_num_str) for serial_num_str in serial_nums)
+
+    # The serial numbers and the summaries of the devices are written as soon as they are generated
+    with open(os.sep.join([out_dir_top, "device_sn.csv"]), "w") as f, \
+            open(os.sep.join([out_dir_top, "summary.jsonl"]), "w") as summary_file:
         f.write(DEV_SN_CSV_HDR)
 
-        for i in range(args.count):
-            pai_cert = {}
-            serial_num_str = format(serial_num_int + i, 'x')
-            log.info("Generating for '%s'", serial_num_str)
+        for serial_num_str, summary in zip(serial_nums, summaries):
             f.write(serial_num_str + '\n')
-            out_dirs = setup_out_dir(out_dir_top, args, serial_num_str)
-            add_additional_kv(args, serial_num_str)
-            generate_passcode(args, out_dirs)
-            generate_discriminator(args, out_dirs)
-            if args.paa or args.pai:
-                pai_cert = setup_root_certificates(args, out_dirs)
-            dacs_cert = write_device_unique_data(args, out_dirs, pai_cert)
-            generate_partition(args, out_dirs)
-            generate_json_summary(args, out_dirs, pai_cert, dacs_cert, serial_num_str)
+            f.flush()
+            summary_file.write(json.dumps(summary) + '\n')
+            summary_file.flush()
 
 
 if __name__ == "__main__":
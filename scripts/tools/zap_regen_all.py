@@ -16,6 +16,9 @@
 #
 
 import argparse
+import functools
+import hashlib
+import json
 import logging
 import multiprocessing
 import os
@@ -38,6 +41,26 @@ CHIP_ROOT_DIR = os.path.realpath(
 # TODO: Can we share this constant definition with generate.py?
 DEFAULT_DATA_MODEL_DESCRIPTION_FILE = 'src/app/zap-templates/zcl/zcl.json'
 
+DEFAULT_MANIFEST_FILE = 'out/zap_regen_all.manifest.json'
+
+# Inputs of every ZAP generation: the zap version and the tooling running it,
+# the data model XML and the common templates.
+ZAP_TOOLING_INPUTS = [
+    'scripts/setup/zap.json',
+    'scripts/setup/zap.version',
+    'scripts/tools/zap/clang_format.py',
+    'scripts/tools/zap/generate.py',
+    'scripts/tools/zap/zap_execution.py',
+    'src/app/zap-templates',
+]
+
+# Inputs of every codegen.py generation
+CODEGEN_TOOLING_INPUTS = [
+    'scripts/codegen.py',
+    'scripts/pregenerate/formatting.py',
+    'scripts/py_matter_idl/matter/idl',
+]
+
 
 class TargetType(Flag):
     """Type of targets that can be re-generated"""
@@ -107,6 +130,10 @@ class ZapInput:
 
         return "chef" in self.zap_file
 
+    def input_paths(self) -> list[str]:
+        """Files this input is read from."""
+        return _JsonWithReferencedFiles(self.zap_file or self.properties_json)
+
     def build_command(self, script: str) -> list[str]:
         """What command to execute for this zap input. """
         if self.zap_file:
@@ -177,6 +204,12 @@ class ZAPGenerateTarget:
             return ZapDistinctOutput(input_template=None, output_directory=self.zap_config.value)
         return ZapDistinctOutput(input_template=self.template, output_directory=self.output_dir)
 
+    def input_paths(self) -> list[str]:
+        paths = ZAP_TOOLING_INPUTS + self.zap_config.input_paths()
+        if self.template:
+            paths += _JsonWithReferencedFiles(self.template)
+        return paths
+
     def log_command(self):
         """Log the command that will get run for this target
         """
@@ -262,6 +295,10 @@ class GoldenTestImageTarget:
         # Fake output - this is a single target that generates golden images
         return ZapDistinctOutput(input_template='GOLDEN_IMAGES', output_directory='GOLDEN_IMAGES')
 
+    def input_paths(self) -> list[str]:
+        # Test inputs, templates and golden images are all within scripts/tools/zap
+        return ZAP_TOOLING_INPUTS + ['scripts/tools/zap']
+
     def log_command(self):
         log.info("  %s", shlex.join(self.command))
 
@@ -293,10 +330,101 @@ class JinjaCodegenTarget:
         # Fake output - this is a single target that generates golden images
         return ZapDistinctOutput(input_template=f'{self.generator}{self.idl_path}', output_directory=self.output_directory)
 
+    def input_paths(self) -> list[str]:
+        return CODEGEN_TOOLING_INPUTS + [self.idl_path]
+
     def log_command(self):
         log.info("  %s", shlex.join(self.command))
 
 
+def _JsonWithReferencedFiles(path: str) -> list[str]:
+    """The given JSON file (.zap, zcl.json, templates.json) along with every
+    file it references, i.e. every string in it that is the path of an
+    existing file relative to the JSON file.
+    """
+    paths = [path]
+    directory = os.path.dirname(path)
+
+    def collect(value):
+        if isinstance(value, dict):
+            for item in value.values():
+                collect(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect(item)
+        elif isinstance(value, str) and value.endswith(('.json', '.xml', '.zapt', '.js')):
+            candidate = os.path.normpath(os.path.join(directory, value))
+            if os.path.isfile(candidate):
+                paths.append(candidate)
+
+    with open(path) as f:
+        collect(json.load(f))
+    return paths
+
+
+@functools.cache
+def _FileDigest(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def _InputsDigest(paths: list[str]) -> str:
+    """Hash of the content of the given files and directories (recursively)."""
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = [d for d in dirs if d != '__pycache__']
+                files.update(os.path.join(root, name) for name in names)
+        else:
+            files.add(os.path.normpath(path))
+
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        digest.update(name.encode())
+        # missing inputs are part of the hash as well
+        digest.update(_FileDigest(name) if os.path.exists(name) else b'missing')
+    return digest.hexdigest()
+
+
+class RegenManifest:
+    """Records the hash of the inputs of every generated target, so that
+    targets whose inputs did not change since they were last generated
+    can be skipped.
+
+    Only inputs are tracked: after editing generated files by hand, use
+    `--force` to regenerate them.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.digests: dict[str, str] = {}
+        try:
+            with open(path) as f:
+                self.digests = json.load(f)['targets']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("Ignoring invalid manifest '%s': %s", path, e)
+
+    @staticmethod
+    def key(target) -> str:
+        output = target.distinct_output()
+        return f"{output.input_template}:{output.output_directory}"
+
+    def is_up_to_date(self, target, digest: str) -> bool:
+        return self.digests.get(self.key(target)) == digest
+
+    def record(self, target, digest: str):
+        self.digests[self.key(target)] = digest
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path + '.tmp', 'w') as f:
+            json.dump({'targets': self.digests}, f, indent=2, sort_keys=True)
+        os.replace(self.path + '.tmp', self.path)
+
+
 def setupArgumentsParser():
     parser = argparse.ArgumentParser(
         description='Generate content from ZAP files')
@@ -308,6 +436,10 @@ def setupArgumentsParser():
                         help='Automatically run ZAP bootstrap. By default the bootstrap is not triggered')
     parser.add_argument('--parallel', action=argparse.BooleanOptionalAction, default=True)
     parser.add_argument('--rerun-in-env', action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument('--force', default=False, action='store_true',
+                        help='Regenerate all targets, even the ones whose inputs did not change since the last run')
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST_FILE,
+                        help='File recording the inputs of the generated targets (default: %(default)s)')
     args = parser.parse_args()
 
     # Convert a list of target_types (as strings)
@@ -486,29 +618,50 @@ def main():
         subprocess.check_call(os.path.join(
             CHIP_ROOT_DIR, "scripts/tools/zap/zap_bootstrap.sh"), shell=True)
 
-    timings = []
+    manifest = RegenManifest(args.manifest)
+
+    # There is a sequencing here:
+    #   - ZAP will generate ".matter" files
+    #   - various codegen may generate from ".matter" files (like java)
+    # We split codegen into two generations to not be racy, and so that the
+    # inputs of the second generation are only hashed once they are generated.
+    first, second = [], []
+    for target in targets:
+        if isinstance(target, ZAPGenerateTarget) and target.is_matter_idl_generation:
+            first.append(target)
+        else:
+            second.append(target)
+
     if args.parallel:
         # Ensure each zap run is independent
         os.environ['ZAP_TEMPSTATE'] = '1'
 
-        # There is a sequencing here:
-        #   - ZAP will generate ".matter" files
-        #   - various codegen may generate from ".matter" files (like java)
-        # We split codegen into two generations to not be racy
-        first, second = [], []
-        for target in targets:
-            if isinstance(target, ZAPGenerateTarget) and target.is_matter_idl_generation:
-                first.append(target)
+    timings = []
+    skipped = []
+    for items in [first, second]:
+        # Inputs may have been generated by the previous items
+        _FileDigest.cache_clear()
+
+        digests = {}
+        for target in items:
+            digest = _InputsDigest(target.input_paths())
+            if not args.force and manifest.is_up_to_date(target, digest):
+                skipped.append(target)
             else:
-                second.append(target)
+                digests[target] = digest
+        items = list(digests.keys())
 
-        for items in [first, second]:
+        if args.parallel:
             with multiprocessing.Pool() as pool:
                 for timing in pool.imap_unordered(_ParallelGenerateOne, items):
                     timings.append(timing)
-    else:
-        for target in targets:
-            timings.append(target.generate())
+        else:
+            for target in items:
+                timings.append(target.generate())
+
+        for target, digest in digests.items():
+            manifest.record(target, digest)
+        manifest.save()
 
     timings.sort(key=lambda t: t.generate_time)
 
@@ -531,6 +684,12 @@ def main():
             ".." + tmpl[len(tmpl) - 48:] if len(tmpl) > 50 else tmpl,
         ))
 
+    if skipped:
+        log.info("Skipped targets whose inputs did not change (use --force to regenerate them):")
+        for target in skipped:
+            target.log_command()
+    log.info("Regenerated %d targets, skipped %d targets", len(timings), len(skipped))
+
 
 if __name__ == '__main__':
     main()
@@ -58,6 +58,7 @@ from .crypto import p256keypair
 from .exceptions import ChipStackError
 from .interaction_model import SessionParameters, SessionParametersStruct
 from .native import PyChipError
+from .SubscriptionManager import SubscriptionManager
 
 __all__ = ["ChipDeviceController", "CommissioningParameters",
            "AttributeReadRequest", "AttributeReadRequestList", "SubscriptionTargetList"]
@@ -2294,7 +2295,8 @@ class ChipDeviceControllerBase:
         eventNumberFilter: int | None = None,
         returnClusterObject: bool = False, reportInterval: tuple[int, int] | None = None,
         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True,
-        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD,
+        onSubscriptionEstablished: typing.Callable[[ClusterAttribute.SubscriptionTransaction], None] | None = None
     ):
         '''
         Read a list of attributes and/or events from a target node
@@ -2344,6 +2346,9 @@ class ChipDeviceControllerBase:
         autoResubscribe: Automatically resubscribe to the subscription if subscription is lost. The automatic re-subscription only
             applies if the subscription establishes on first try. If the first subscription establishment attempt fails the function
             returns right away.
+        onSubscriptionEstablished: Called on the event loop with the SubscriptionTransaction once the subscription is established,
+            before any report or error of the subscription is delivered to its callbacks. Set the callbacks there so that none is
+            missed until this function returns.
 
         Returns:
             - AsyncReadTransaction.ReadResponse. Please see ReadAttribute and ReadEvent for examples of how to access data.
@@ -2388,7 +2393,8 @@ class ChipDeviceControllerBase:
 
             allowLargePayload = payloadCapability in (TransportPayloadCapability.LARGE_PAYLOAD,
                                                       TransportPayloadCapability.MRP_OR_TCP_PAYLOAD)
-            transaction = ClusterAttribute.AsyncReadTransaction(future, eventLoop, self, returnClusterObject, nodeId=nodeId)
+            transaction = ClusterAttribute.AsyncReadTransaction(future, eventLoop, self, returnClusterObject, nodeId=nodeId,
+                                                                subscriptionEstablishedCallback=onSubscriptionEstablished)
             ClusterAttribute.Read(transaction, device=device.deviceProxy,
                                   attributes=attributePaths, dataVersionFilters=clusterDataVersionFilters, events=eventPaths,
                                   eventNumberFilter=eventNumberFilter,
@@ -2403,6 +2409,103 @@ class ChipDeviceControllerBase:
 
         return await self._run_with_session_retry(nodeId, _read_impl)
 
+    async def ReadMany(
+        self,
+        nodeIds: typing.Iterable[int],
+        attributes: list[
+            None  # Empty tuple, all wildcard
+            | tuple[int]  # Endpoint
+            | tuple[type[ClusterObjects.Cluster]]  # Wildcard endpoint, Cluster id present
+            | tuple[type[ClusterObjects.ClusterAttributeDescriptor]]  # Wildcard endpoint, Cluster + Attribute present
+            | tuple[int, type[ClusterObjects.Cluster]]  # Wildcard attribute id
+            | tuple[int, type[ClusterObjects.ClusterAttributeDescriptor]]  # Concrete path
+            | ClusterAttribute.AttributePath  # Directly specified attribute path
+        ] | None = None,
+        dataVersionFilters: list[tuple[int, type[ClusterObjects.Cluster], int]] | None = None, events: list[
+            None  # Empty tuple, all wildcard
+            | tuple[str, int]  # all wildcard with urgency set
+            | tuple[int, int]  # Endpoint
+            | tuple[type[ClusterObjects.Cluster], int]  # Wildcard endpoint, Cluster id present
+            | tuple[type[ClusterObjects.ClusterEvent], int]  # Wildcard endpoint, Cluster + Event present
+            | tuple[int, type[ClusterObjects.Cluster], int]  # Wildcard event id
+            | tuple[int, type[ClusterObjects.ClusterEvent], int]  # Concrete path
+        ] | None = None,
+        eventNumberFilter: int | None = None,
+        returnClusterObject: bool = False, fabricFiltered: bool = True, maxInFlight: int = 32,
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+    ) -> typing.AsyncIterator[tuple[int, ClusterAttribute.AsyncReadTransaction.ReadResponse | Exception]]:
+        '''
+        Read the same list of attributes and/or events from many nodes.
+
+        Up to maxInFlight nodes are handled at the same time, so establishing sessions (existing sessions are reused) and
+        reading are pipelined across nodes. The paths are parsed and encoded only once for all nodes.
+
+        nodeIds: Targets' Node IDs
+        maxInFlight: The maximum number of nodes being connected to or read from at the same time.
+
+        The other arguments are the same as for Read(). ReadMany only sends read requests, no subscriptions.
+
+        Returns:
+            - An async iterator of (nodeId, result) tuples, in the order the nodes respond. The result is the
+              AsyncReadTransaction.ReadResponse of the node, or the exception raised when reading from it.
+
+            e.g.
+                async for nodeId, result in devCtrl.ReadMany(nodeIds, [(0, Clusters.BasicInformation)]):
+                    ...
+        '''
+        self.CheckIsActive()
+        if maxInFlight < 1:
+            raise ValueError("maxInFlight must be at least 1")
+
+        eventLoop = asyncio.get_running_loop()
+        encodedPaths = ClusterAttribute.EncodedReadPaths.Encode(
+            [self._parseAttributePathTuple(v) for v in attributes] if attributes else None,
+            [self._parseDataVersionFilterTuple(v) for v in dataVersionFilters] if dataVersionFilters else None,  # type: ignore[arg-type]
+            [self._parseEventPathTuple(v) for v in events] if events else None)
+        allowLargePayload = payloadCapability in (TransportPayloadCapability.LARGE_PAYLOAD,
+                                                  TransportPayloadCapability.MRP_OR_TCP_PAYLOAD)
+
+        async def _read_node(nodeId: int):
+            async def _read_impl():
+                future = eventLoop.create_future()
+                device = await self.GetConnectedDevice(nodeId, payloadCapability=payloadCapability)
+                transaction = ClusterAttribute.AsyncReadTransaction(future, eventLoop, self, returnClusterObject, nodeId=nodeId)
+                ClusterAttribute.Read(transaction, device=device.deviceProxy, eventNumberFilter=eventNumberFilter,
+                                      fabricFiltered=fabricFiltered, allowLargePayload=allowLargePayload,
+                                      encodedPaths=encodedPaths).raise_on_error()
+                await future
+                return transaction.GetReadResponse()
+
+            return await self._run_with_session_retry(nodeId, _read_impl)
+
+        # The workers take the next node from the shared iterator once they are done with the previous one, and block
+        # while the consumer is maxInFlight results behind.
+        pendingNodeIds = iter(nodeIds)
+        results: asyncio.Queue = asyncio.Queue(maxsize=maxInFlight)
+
+        async def _worker():
+            for nodeId in pendingNodeIds:
+                try:
+                    result = await _read_node(nodeId)
+                except Exception as ex:
+                    result = ex
+                await results.put((nodeId, result))
+            await results.put(None)
+
+        workers = [eventLoop.create_task(_worker()) for _ in range(maxInFlight)]
+        try:
+            remainingWorkers = len(workers)
+            while remainingWorkers:
+                item = await results.get()
+                if item is None:
+                    remainingWorkers -= 1
+                    continue
+                yield item
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
     async def ReadAttribute(
         self,
         nodeId: int,
@@ -2557,6 +2660,22 @@ class ChipDeviceControllerBase:
             return res
         return res.events
 
+    def CreateSubscriptionManager(self, maxConcurrentEstablishments: int = 16,
+                                  establishmentIntervalSec: float = 0.0) -> SubscriptionManager:
+        '''
+        Creates a SubscriptionManager, which establishes and tracks subscriptions to many nodes and delivers the reports
+        of all of them, batched per report, through a single asyncio queue.
+
+        maxConcurrentEstablishments: The maximum number of subscriptions being established at the same time.
+        establishmentIntervalSec: The minimum time between the start of two subscription establishments.
+
+        Returns:
+            - SubscriptionManager (SubscriptionManager.py)
+        '''
+        self.CheckIsActive()
+        return SubscriptionManager(self, maxConcurrentEstablishments=maxConcurrentEstablishments,
+                                   establishmentIntervalSec=establishmentIntervalSec)
+
     def SetIpk(self, ipk: bytes):
         '''
         Sets the Identity Protection Key (IPK) for the device controller.
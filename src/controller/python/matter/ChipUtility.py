@@ -23,6 +23,7 @@
 
 
 import binascii
+import weakref
 from ctypes import c_byte, c_void_p, cast, memmove
 
 
@@ -69,3 +70,19 @@ class ChipUtility:
 class classproperty(property):
     def __get__(self, cls, owner):
         return classmethod(self.fget).__get__(None, owner)()
+
+
+class cachedclassproperty(classproperty):
+    '''A classproperty whose value is computed on first access and then reused for each class it is accessed on.'''
+
+    def __init__(self, fget, *args, **kwargs):
+        super().__init__(fget, *args, **kwargs)
+        self._values = weakref.WeakKeyDictionary()
+
+    def __get__(self, cls, owner):
+        try:
+            return self._values[owner]
+        except KeyError:
+            value = super().__get__(cls, owner)
+            self._values[owner] = value
+            return value
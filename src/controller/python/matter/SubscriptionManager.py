@@ -0,0 +1,286 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+"""Subscriptions to many nodes, with all reports delivered through a single asyncio queue."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .clusters.Attribute import EventReadResult, SubscriptionTransaction, TypedAttributePath
+
+if TYPE_CHECKING:
+    from .ChipDeviceCtrl import ChipDeviceControllerBase
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class SubscriptionReport:
+    '''
+    The attribute changes and events carried by one report of a subscription.
+
+    ReceivedAt is the time.monotonic() timestamp of the end of the report.
+    '''
+    NodeId: int
+    Subscription: SubscriptionTransaction
+    Attributes: list[TypedAttributePath] = field(default_factory=list)
+    Events: list[EventReadResult] = field(default_factory=list)
+    ReceivedAt: float = 0.0
+
+
+@dataclass
+class SubscriptionStats:
+    '''
+    Counters of the subscription to a node.
+
+    The lag of a report is the time between the end of the report and it being taken from the queue of the
+    SubscriptionManager, i.e. how far the consumer of the reports is behind.
+    '''
+    EstablishedAt: float
+    Reports: int = 0
+    AttributeChanges: int = 0
+    Events: int = 0
+    Errors: int = 0
+    ResubscriptionAttempts: int = 0
+    DeliveredReports: int = 0
+    LastLagSec: float = 0.0
+    MaxLagSec: float = 0.0
+    TotalLagSec: float = 0.0
+
+    @property
+    def ReportsPerSecond(self) -> float:
+        elapsed = time.monotonic() - self.EstablishedAt
+        return self.Reports / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def AverageLagSec(self) -> float:
+        return self.TotalLagSec / self.DeliveredReports if self.DeliveredReports else 0.0
+
+
+class _NodeSubscription:
+    '''
+    Collects the changes of each report of one subscription and hands the report over to the SubscriptionManager.
+
+    The subscription callbacks run on the Matter thread, only complete reports are passed to the event loop.
+    '''
+
+    def __init__(self, manager: SubscriptionManager, nodeId: int, subscription: SubscriptionTransaction):
+        self.nodeId = nodeId
+        self.subscription = subscription
+        self.stats = SubscriptionStats(EstablishedAt=time.monotonic())
+        self._manager = manager
+        self._report: SubscriptionReport | None = None
+
+        subscription.SetReportBeginCallback(self._OnReportBegin)
+        subscription.SetAttributeUpdateCallback(self._OnAttributeChange)
+        subscription.SetEventUpdateCallback(self._OnEvent)
+        subscription.SetReportEndCallback(self._OnReportEnd)
+        subscription.SetErrorCallback(self._OnError)
+        subscription.SetResubscriptionAttemptedCallback(self._OnResubscriptionAttempted)
+
+    def _PendingReport(self) -> SubscriptionReport:
+        if self._report is None:
+            self._report = SubscriptionReport(NodeId=self.nodeId, Subscription=self.subscription)
+        return self._report
+
+    def _OnReportBegin(self, transaction: SubscriptionTransaction):
+        self._report = SubscriptionReport(NodeId=self.nodeId, Subscription=self.subscription)
+
+    def _OnAttributeChange(self, path: TypedAttributePath, transaction: SubscriptionTransaction):
+        self._PendingReport().Attributes.append(path)
+
+    def _OnEvent(self, event: EventReadResult, transaction: SubscriptionTransaction):
+        self._PendingReport().Events.append(event)
+
+    def _OnReportEnd(self, transaction: SubscriptionTransaction):
+        report = self._PendingReport()
+        self._report = None
+        report.ReceivedAt = time.monotonic()
+        self._manager._loop.call_soon_threadsafe(self._manager._Enqueue, self, report)
+
+    def _OnError(self, chipError: int, transaction: SubscriptionTransaction):
+        LOGGER.debug("Subscription to node %d failed with error %d", self.nodeId, chipError)
+        self.stats.Errors += 1
+
+    def _OnResubscriptionAttempted(self, transaction: SubscriptionTransaction, terminationError: int,
+                                   nextResubscribeIntervalMsec: int):
+        LOGGER.debug("Re-subscribing to node %d in %d ms after error %d",
+                     self.nodeId, nextResubscribeIntervalMsec, terminationError)
+        self.stats.ResubscriptionAttempts += 1
+
+
+class SubscriptionManager:
+    '''
+    Establishes and tracks subscriptions to many nodes of a controller.
+
+    Instead of invoking callbacks per subscription, the attribute changes and events of every report (between
+    OnReportBegin and OnReportEnd) are batched into a SubscriptionReport, and the reports of all subscriptions are
+    delivered through a single asyncio queue:
+
+        manager = devCtrl.CreateSubscriptionManager(maxConcurrentEstablishments=32, establishmentIntervalSec=0.05)
+        failures = await manager.Subscribe(nodeIds, attributes=[(0, Clusters.BasicInformation)], reportInterval=(0, 60))
+        async for report in manager:
+            for path in report.Attributes:
+                value = report.Subscription.GetAttribute(path)
+
+    The data of the priming report of a subscription is available from SubscriptionTransaction.GetAttributes(),
+    only the reports received once the subscription is established are queued.
+
+    Use SubscriptionManager from the event loop it was first used in.
+    '''
+
+    def __init__(self, devCtrl: ChipDeviceControllerBase, maxConcurrentEstablishments: int = 16,
+                 establishmentIntervalSec: float = 0.0):
+        if maxConcurrentEstablishments < 1:
+            raise ValueError("maxConcurrentEstablishments must be at least 1")
+        self._devCtrl = devCtrl
+        self._establishmentIntervalSec = establishmentIntervalSec
+        self._establishmentSemaphore = asyncio.Semaphore(maxConcurrentEstablishments)
+        self._establishmentLock = asyncio.Lock()
+        self._nextEstablishment = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[_NodeSubscription, SubscriptionReport]] = asyncio.Queue()
+        self._nodes: dict[int, _NodeSubscription] = {}
+
+    async def Subscribe(self, nodeIds: Iterable[int], attributes: list[Any] | None = None, events: list[Any] | None = None,
+                        reportInterval: tuple[int, int] = (0, 60), **kwargs) -> dict[int, Exception]:
+        '''
+        Establishes subscriptions to the given nodes concurrently.
+
+        At most maxConcurrentEstablishments subscriptions are being established at any time, and consecutive
+        establishments are started at least establishmentIntervalSec apart, so that a large number of nodes does not
+        flood the network at once. A node that is already tracked by this manager is subscribed again.
+
+        attributes, events and reportInterval are as for ChipDeviceControllerBase.Read(), further keyword
+        arguments (e.g. returnClusterObject or keepSubscriptions) are passed to it as well.
+
+        Returns:
+            - The errors of the nodes to which no subscription could be established, by node id.
+        '''
+        self._loop = asyncio.get_running_loop()
+        failures: dict[int, Exception] = {}
+
+        async def establish(nodeId: int):
+            node: _NodeSubscription | None = None
+
+            def onEstablished(subscription: SubscriptionTransaction):
+                # Set the callbacks before any report of the subscription is delivered, rather than once Read() returns.
+                nonlocal node
+                node = _NodeSubscription(self, nodeId, subscription)
+
+            async with self._establishmentSemaphore:
+                await self._WaitForEstablishmentSlot()
+                try:
+                    subscription = await self._devCtrl.Read(nodeId, attributes=attributes, events=events,
+                                                            reportInterval=reportInterval,
+                                                            onSubscriptionEstablished=onEstablished, **kwargs)
+                except Exception as ex:
+                    LOGGER.warning("Failed to subscribe to node %d: %s", nodeId, ex)
+                    failures[nodeId] = ex
+                    return
+                if node is None or node.subscription is not subscription:
+                    node = _NodeSubscription(self, nodeId, subscription)
+                previous = self._nodes.get(nodeId)
+                if previous is not None and previous.subscription is not subscription:
+                    self._Shutdown(previous)
+                self._nodes[nodeId] = node
+
+        await asyncio.gather(*(establish(nodeId) for nodeId in dict.fromkeys(nodeIds)))
+        return failures
+
+    async def _WaitForEstablishmentSlot(self):
+        async with self._establishmentLock:
+            delay = self._nextEstablishment - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._nextEstablishment = time.monotonic() + self._establishmentIntervalSec
+
+    def _Enqueue(self, node: _NodeSubscription, report: SubscriptionReport):
+        node.stats.Reports += 1
+        node.stats.AttributeChanges += len(report.Attributes)
+        node.stats.Events += len(report.Events)
+        self._queue.put_nowait((node, report))
+
+    def _Delivered(self, node: _NodeSubscription, report: SubscriptionReport) -> SubscriptionReport:
+        lag = time.monotonic() - report.ReceivedAt
+        stats = node.stats
+        stats.DeliveredReports += 1
+        stats.LastLagSec = lag
+        stats.TotalLagSec += lag
+        stats.MaxLagSec = max(stats.MaxLagSec, lag)
+        return report
+
+    async def NextReport(self) -> SubscriptionReport:
+        '''
+        Waits for the next report of any of the subscriptions.
+        '''
+        return self._Delivered(*await self._queue.get())
+
+    def DrainReports(self) -> list[SubscriptionReport]:
+        '''
+        Returns all reports that are queued, without waiting.
+        '''
+        reports = []
+        while not self._queue.empty():
+            reports.append(self._Delivered(*self._queue.get_nowait()))
+        return reports
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> SubscriptionReport:
+        return await self.NextReport()
+
+    @property
+    def PendingReports(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def Subscriptions(self) -> dict[int, SubscriptionTransaction]:
+        return {nodeId: node.subscription for nodeId, node in self._nodes.items()}
+
+    @property
+    def Stats(self) -> dict[int, SubscriptionStats]:
+        return {nodeId: node.stats for nodeId, node in self._nodes.items()}
+
+    def _Shutdown(self, node: _NodeSubscription):
+        try:
+            node.subscription.Shutdown()
+        except Exception as ex:
+            # Benign: the subscription might already be terminated by the C++ stack or the node.
+            LOGGER.info("Failed to shut down subscription to node %d: %s", node.nodeId, ex)
+
+    def Unsubscribe(self, nodeId: int):
+        '''
+        Shuts down the subscription to a node and stops tracking it.
+        '''
+        node = self._nodes.pop(nodeId, None)
+        if node is not None:
+            self._Shutdown(node)
+
+    def Shutdown(self):
+        '''
+        Shuts down all subscriptions of this manager.
+        '''
+        for nodeId in list(self._nodes):
+            self.Unsubscribe(nodeId)
@@ -20,11 +20,10 @@ from __future__ import annotations
 
 import builtins
 import ctypes
-import inspect
 import logging
-import sys
 from asyncio.futures import Future
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_size_t, c_uint8, c_uint16, c_uint32, c_uint64, c_void_p, cast, py_object
 from dataclasses import dataclass, field
 from enum import Enum, unique
@@ -38,7 +37,7 @@ from ..interaction_model import (AttributePathIBstruct, DataVersionFilterIBstruc
 from ..interaction_model import Status as InteractionModelStatus
 from ..native import ErrorSDKPart, GetLibraryHandle, NativeLibraryHandleMethodArguments, PyChipError
 from ..tlv import TLVReader
-from . import Objects as GeneratedObjects  # noqa: F401
+from . import ClusterObjects
 from .ClusterObjects import Cluster, ClusterAttributeDescriptor, ClusterEvent
 
 LOGGER = logging.getLogger(__name__)
@@ -118,18 +117,12 @@ class TypedAttributePath:
                 "Either ClusterType and AttributeType OR Path must be provided.")
 
         # if ClusterType and AttributeType were provided we can continue onwards to deriving the label.
-        # Otherwise, we'll need to walk the attribute index to find the right type information.
+        # Otherwise, we'll need to look up the right type information in the cluster object registries.
 
         # If Path is provided, derive ClusterType and AttributeType from it
         if self.Path is not None:
-            for cluster, attribute in _AttributeIndex:
-                attributeType = _AttributeIndex[(cluster, attribute)][0]
-                clusterType = _AttributeIndex[(cluster, attribute)][1]
-
-                if clusterType.id == self.Path.ClusterId and attributeType.attribute_id == self.Path.AttributeId:
-                    self.ClusterType = clusterType
-                    self.AttributeType = attributeType
-                    break
+            self.ClusterType = ClusterObjects.ALL_CLUSTERS.get(self.Path.ClusterId)
+            self.AttributeType = ClusterObjects.ALL_ATTRIBUTES.get(self.Path.ClusterId, {}).get(self.Path.AttributeId)
 
             if self.ClusterType is None or self.AttributeType is None:
                 raise KeyError(f"No Schema found for Attribute {self.Path}")
@@ -245,43 +238,6 @@ class EventReadResult(EventStatus):
     Data: Any = None
 
 
-_AttributeIndex = {}
-_EventIndex = {}
-_ClusterIndex = {}
-
-
-def _BuildAttributeIndex():
-    ''' Build internal attribute index for locating the corresponding cluster object by path in the future.
-        We do this because this operation will take a long time when there are lots of attributes,
-        it takes about 300ms for a single query.
-        This is acceptable during init, but unacceptable when the server returns lots of attributes at the same time.
-    '''
-    for clusterName, obj in inspect.getmembers(sys.modules['matter.clusters.Objects']):
-        if ('matter.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and (('Attributes') in str(subclass)):
-                    for attributeName, attribute in inspect.getmembers(subclass):
-                        if inspect.isclass(attribute):
-                            base_classes = inspect.getmro(attribute)
-
-                            # Only match on classes that extend the ClusterAttributeDescriptor class
-                            matched = [
-                                value for value in base_classes if 'ClusterAttributeDescriptor' in str(value)]
-                            if (matched == []):
-                                continue
-
-                            _AttributeIndex[(attribute.cluster_id, attribute.attribute_id)] = (eval(
-                                'GeneratedObjects.' + clusterName + '.Attributes.' + attributeName), obj)
-
-
-def _BuildClusterIndex():
-    ''' Build internal cluster index for locating the corresponding cluster object by path in the future.
-    '''
-    for clusterName, obj in inspect.getmembers(sys.modules['matter.clusters.Objects']):
-        if ('matter.clusters.Objects' in str(obj)) and inspect.isclass(obj) and issubclass(obj, Cluster):
-            _ClusterIndex[obj.id] = obj
-
-
 @dataclass
 class SubscriptionParameters:
     MinReportIntervalFloorSeconds: int
@@ -295,6 +251,27 @@ class DataVersion:
     pass
 
 
+class _DecodedViewCache(dict):
+    ''' The decoded views of the clusters on one endpoint, for an AttributeCache with maxDecodedClusters set.
+
+        Looking up a view records its use for the LRU policy of the cache. Views that were evicted are decoded
+        again from the TLV data when they are looked up.
+    '''
+
+    def __init__(self, cache: AttributeCache, endpointId: int):
+        super().__init__()
+        self._cache = cache
+        self._endpointId = endpointId
+
+    def __getitem__(self, clusterType):
+        value = super().__getitem__(clusterType)
+        self._cache._TouchDecodedView(self._endpointId, clusterType)
+        return value
+
+    def __missing__(self, clusterType):
+        return self._cache._ReloadDecodedView(self._endpointId, clusterType)
+
+
 @dataclass
 class AttributeCache:
     ''' A cache that stores data & errors returned in read/subscribe reports, but organizes it topologically
@@ -313,17 +290,29 @@ class AttributeCache:
                 Clusters.UnitTesting.Attributes.Int16u is the listeral key for indexing an attribute in the test cluster.
 
         This strongly typed keys permit a more natural and safer form of indexing.
+
+        The cluster object format is updated incrementally: only the attributes reported since the last retrieval are
+        decoded again, and attributes reported again with an unchanged DataVersion and value are skipped.
+
+        To bound the memory used by long-running subscriptions to large nodes, maxDecodedClusters limits how many
+        decoded clusters are kept. The least recently used ones are dropped (their TLV data is kept) and decoded again
+        when they are next looked up, so they are not listed when iterating over the clusters of an endpoint.
     '''
     returnClusterObject: bool = False
     attributeTLVCache: dict[int, dict[int, dict[int, bytes]]] = field(
         default_factory=lambda: {})
     versionList: dict[int, dict[int, dict[int, int]]] = field(
         default_factory=lambda: {})
+    maxDecodedClusters: int | None = None
 
-    _attributeCacheUpdateNeeded: set[AttributePath] = field(
-        default_factory=lambda: set())
+    # The attribute ids that changed since the last update of the decoded views, per (endpoint id, cluster id).
+    _attributeCacheUpdateNeeded: dict[tuple[int, int], set[int]] = field(
+        default_factory=lambda: {})
     _attributeCache: dict[int, list[Cluster]] = field(
         default_factory=lambda: {})
+    # The (endpoint id, cluster type) of the decoded views, from least to most recently used.
+    _decodedViews: OrderedDict[tuple[int, type], None] = field(
+        default_factory=OrderedDict)
 
     def UpdateTLV(self, path: AttributePath, dataVersion: int, data: bytes | ValueDecodeFailure):
         ''' Store data in TLV since that makes it easiest to eventually convert to either the
@@ -340,18 +329,22 @@ class AttributeCache:
         if (path.ClusterId not in endpointCache):
             endpointCache[path.ClusterId] = {}
 
+        clusterCache = endpointCache[path.ClusterId]
+
+        # The DataVersion of a cluster changes whenever any of its attributes does, so an attribute reported again
+        # at the version we already hold (e.g. when a subscription is re-established) does not need to be decoded again.
+        if (dataVersion is not None and endpointVersion.get(path.ClusterId) == dataVersion
+                and path.AttributeId in clusterCache and clusterCache[path.AttributeId] == data):
+            return
+
         # All attributes from the same cluster instance should have the same dataVersion,
         # so we can set the dataVersion of the cluster to the dataVersion with a random attribute.
         endpointVersion[path.ClusterId] = dataVersion
 
-        clusterCache = endpointCache[path.ClusterId]
-        if (path.AttributeId not in clusterCache):
-            clusterCache[path.AttributeId] = None
-
         clusterCache[path.AttributeId] = data
 
         # For this path the attribute cache still requires an update.
-        self._attributeCacheUpdateNeeded.add(path)
+        self._attributeCacheUpdateNeeded.setdefault((path.EndpointId, path.ClusterId), set()).add(path.AttributeId)
 
     def GetUpdatedAttributeCache(self) -> dict[int, list[Cluster]]:
         ''' This converts the raw TLV data into a cluster object format.
@@ -371,64 +364,96 @@ class AttributeCache:
             defaults are used. If a cluster cannot be decoded,
             instead of a cluster object value, a ValueDecodeFailure shall be present.
         '''
+        for (endpointId, clusterId), attributeIds in self._attributeCacheUpdateNeeded.items():
+            endpointCache = self._GetEndpointCache(endpointId)
 
-        def handle_cluster_view(endpointId, clusterId, clusterType):
-            try:
-                decodedData = clusterType.FromDict(
-                    data=clusterType.descriptor.TagDictToLabelDict([], self.attributeTLVCache[endpointId][clusterId]))
-                decodedData.SetDataVersion(
-                    self.versionList.get(endpointId, {}).get(clusterId))
-                return decodedData
-            except Exception as ex:
-                return ValueDecodeFailure(self.attributeTLVCache[endpointId][clusterId], ex)
-
-        def handle_attribute_view(endpointId, clusterId, attributeId, attributeType):
-            value = self.attributeTLVCache[endpointId][clusterId][attributeId]
-            if isinstance(value, ValueDecodeFailure):
-                return value
-            try:
-                return attributeType.FromTagDictOrRawValue(value)
-            except Exception as ex:
-                return ValueDecodeFailure(value, ex)
-
-        for attributePath in self._attributeCacheUpdateNeeded:
-            endpointId, clusterId, attributeId = attributePath.EndpointId, attributePath.ClusterId, attributePath.AttributeId
-
-            if endpointId not in self._attributeCache:
-                self._attributeCache[endpointId] = {}
-            endpointCache = self._attributeCache[endpointId]
-
-            if clusterId not in _ClusterIndex:
+            clusterType = ClusterObjects.ALL_CLUSTERS.get(clusterId)
+            if clusterType is None:
                 #
                 # #22599 tracks dealing with unknown clusters more
                 # gracefully so that clients can still access this data.
                 #
                 continue
 
-            clusterType = _ClusterIndex[clusterId]
+            # dict.get() does not reload evicted views, those are decoded from scratch below.
+            endpointCache[clusterType] = self._DecodeView(
+                endpointId, clusterId, clusterType, dict.get(endpointCache, clusterType), attributeIds)
+            self._TouchDecodedView(endpointId, clusterType)
+        self._attributeCacheUpdateNeeded.clear()
+        return self._attributeCache
 
-            if self.returnClusterObject:
-                endpointCache[clusterType] = handle_cluster_view(
-                    endpointId, clusterId, clusterType)
-            else:
-                if clusterType not in endpointCache:
-                    endpointCache[clusterType] = {}
-                clusterCache = endpointCache[clusterType]
-                clusterCache[DataVersion] = self.versionList.get(
-                    endpointId, {}).get(clusterId)
+    def _GetEndpointCache(self, endpointId: int) -> dict:
+        endpointCache = self._attributeCache.get(endpointId)
+        if endpointCache is None:
+            endpointCache = {} if self.maxDecodedClusters is None else _DecodedViewCache(self, endpointId)
+            self._attributeCache[endpointId] = endpointCache
+        return endpointCache
 
-                if (clusterId, attributeId) not in _AttributeIndex:
+    def _DecodeView(self, endpointId: int, clusterId: int, clusterType: type[Cluster], previous: Any,
+                    attributeIds: Iterable[int] | None) -> Any:
+        ''' Returns the decoded view of a cluster, updating the previous view with the given attributes if there is one.
+        '''
+        clusterTLV = self.attributeTLVCache[endpointId][clusterId]
+        dataVersion = self.versionList.get(endpointId, {}).get(clusterId)
+
+        if not self.returnClusterObject:
+            if previous is None:
+                previous = {}
+                attributeIds = clusterTLV.keys()
+            previous[DataVersion] = dataVersion
+            for attributeId in attributeIds:
+                attributeType = ClusterObjects.ALL_ATTRIBUTES.get(clusterId, {}).get(attributeId)
+                if attributeType is None:
                     #
                     # #22599 tracks dealing with unknown clusters more
                     # gracefully so that clients can still access this data.
                     #
                     continue
+                value = clusterTLV[attributeId]
+                if not isinstance(value, ValueDecodeFailure):
+                    try:
+                        value = attributeType.FromTagDictOrRawValue(value)
+                    except Exception as ex:
+                        value = ValueDecodeFailure(value, ex)
+                previous[attributeType] = value
+            return previous
 
-                attributeType = _AttributeIndex[(clusterId, attributeId)][0]
-                clusterCache[attributeType] = handle_attribute_view(
-                    endpointId, clusterId, attributeId, attributeType)
-        self._attributeCacheUpdateNeeded.clear()
-        return self._attributeCache
+        if isinstance(previous, Cluster) and attributeIds is not None:
+            changedTLV = {attributeId: clusterTLV[attributeId] for attributeId in attributeIds}
+            if not any(isinstance(value, ValueDecodeFailure) for value in changedTLV.values()):
+                try:
+                    decodedData = previous.UpdatedFromTagDict(changedTLV)
+                    decodedData.SetDataVersion(dataVersion)
+                    return decodedData
+                except Exception:
+                    # Decode the whole cluster below, which reports the error the same way as a full decode.
+                    pass
+
+        try:
+            decodedData = clusterType.FromTagDict(clusterTLV)
+            decodedData.SetDataVersion(dataVersion)
+            return decodedData
+        except Exception as ex:
+            return ValueDecodeFailure(clusterTLV, ex)
+
+    def _TouchDecodedView(self, endpointId: int, clusterType: type[Cluster]):
+        if self.maxDecodedClusters is None:
+            return
+        key = (endpointId, clusterType)
+        self._decodedViews[key] = None
+        self._decodedViews.move_to_end(key)
+        while len(self._decodedViews) > self.maxDecodedClusters:
+            (evictedEndpointId, evictedClusterType), _ = self._decodedViews.popitem(last=False)
+            dict.pop(self._attributeCache[evictedEndpointId], evictedClusterType, None)
+
+    def _ReloadDecodedView(self, endpointId: int, clusterType: type[Cluster]) -> Any:
+        clusterId = getattr(clusterType, 'id', None)
+        if clusterId not in self.attributeTLVCache.get(endpointId, {}):
+            raise KeyError(clusterType)
+        view = self._DecodeView(endpointId, clusterId, clusterType, None, None)
+        dict.__setitem__(self._attributeCache[endpointId], clusterType, view)
+        self._TouchDecodedView(endpointId, clusterType)
+        return view
 
 
 class SubscriptionTransaction:
@@ -674,29 +699,6 @@ def DefaultReportEndCallback(transaction: SubscriptionTransaction):
     pass
 
 
-def _BuildEventIndex():
-    ''' Build internal event index for locating the corresponding cluster object by path in the future.
-    We do this because this operation will take a long time when there are lots of events, it takes about 300ms for a single query.
-    This is acceptable during init, but unacceptable when the server returns lots of events at the same time.
-    '''
-    for clusterName, obj in inspect.getmembers(sys.modules['matter.clusters.Objects']):
-        if ('matter.clusters.Objects' in str(obj)) and inspect.isclass(obj):
-            for objName, subclass in inspect.getmembers(obj):
-                if inspect.isclass(subclass) and objName == "Events":
-                    for eventName, event in inspect.getmembers(subclass):
-                        if inspect.isclass(event):
-                            base_classes = inspect.getmro(event)
-
-                            # Only match on classes that extend the ClusterEvent class
-                            matched = [
-                                value for value in base_classes if 'ClusterEvent' in str(value)]
-                            if (matched == []):
-                                continue
-
-                            _EventIndex[str(EventPath(ClusterId=event.cluster_id, EventId=event.event_id))] = eval(
-                                'GeneratedObjects.' + clusterName + '.Events.' + eventName)
-
-
 class AsyncReadTransaction:
     @dataclass
     class ReadResponse:
@@ -704,7 +706,8 @@ class AsyncReadTransaction:
         events: list[ClusterEvent]
         tlvAttributes: dict[int, Any]
 
-    def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool, nodeId: int | None = None):
+    def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool, nodeId: int | None = None,
+                 subscriptionEstablishedCallback: Callable[[SubscriptionTransaction], None] | None = None):
         self._event_loop = eventLoop
         self._future = future
         self._subscription_handler = None
@@ -715,6 +718,7 @@ class AsyncReadTransaction:
         self._pReadClient = None
         self._resultError: PyChipError | None = None
         self._notify_subscription_still_active_callback = None
+        self._subscription_established_callback = subscriptionEstablishedCallback
         self._nodeId = nodeId
 
     def SetClientObjPointers(self, pReadClient):
@@ -754,7 +758,7 @@ class AsyncReadTransaction:
 
     def handleEventData(self, header: EventHeader, path: EventPath, data: bytes, status: int):
         try:
-            eventType = _EventIndex.get(str(path))
+            eventType = ClusterObjects.ALL_EVENTS.get(path.ClusterId, {}).get(path.EventId)
             eventValue = None
 
             if data:
@@ -798,8 +802,11 @@ class AsyncReadTransaction:
 
     def _handleSubscriptionEstablished(self, subscriptionId):
         if not self._future.done():
-            self._subscription_handler = SubscriptionTransaction(
-                self, subscriptionId, self._devCtrl)
+            subscription = SubscriptionTransaction(self, subscriptionId, self._devCtrl)
+            # Called before the Matter thread sees the subscription, so that the callbacks set on it get every report.
+            if self._subscription_established_callback is not None:
+                self._subscription_established_callback(subscription)
+            self._subscription_handler = subscription
             self._future.set_result(self)
         else:
             self._subscription_handler._subscriptionId = subscriptionId
@@ -1168,81 +1175,110 @@ _ReadParams = construct.Struct(
 )
 
 
+@dataclass
+class EncodedReadPaths:
+    ''' Attribute paths, data version filters and event paths of a read or subscribe request, encoded for the
+        native read client.
+
+        Encoding them once allows the same paths to be requested from many nodes, see Read(encodedPaths=...).
+    '''
+    Attributes: list[bytes] | None = None
+    DataVersionFilters: list[bytes] | None = None
+    Events: list[bytes] | None = None
+
+    @classmethod
+    def Encode(cls, attributes: list[AttributePath] | None = None, dataVersionFilters: list[DataVersionFilter] | None = None,
+               events: list[EventPath] | None = None, isSubscription: bool = False) -> EncodedReadPaths:
+        if (not attributes) and dataVersionFilters:
+            raise ValueError(
+                "Must provide valid attribute list when data version filters is not null")
+
+        encodedAttributes = None
+        if attributes is not None:
+            encodedAttributes = []
+            for attr in attributes:
+                path = AttributePathIBstruct.parse(
+                    b'\xff' * AttributePathIBstruct.sizeof())
+                if attr.EndpointId is not None:
+                    path.EndpointId = attr.EndpointId
+                if attr.ClusterId is not None:
+                    path.ClusterId = attr.ClusterId
+                if attr.AttributeId is not None:
+                    path.AttributeId = attr.AttributeId
+                encodedAttributes.append(AttributePathIBstruct.build(path))
+
+        encodedDataVersionFilters = None
+        if dataVersionFilters is not None:
+            encodedDataVersionFilters = []
+            for f in dataVersionFilters:
+                flt = DataVersionFilterIBstruct.parse(
+                    b'\xff' * DataVersionFilterIBstruct.sizeof())
+                if f.EndpointId is not None:
+                    flt.EndpointId = f.EndpointId
+                else:
+                    raise ValueError(
+                        "DataVersionFilter must provide EndpointId.")
+                if f.ClusterId is not None:
+                    flt.ClusterId = f.ClusterId
+                else:
+                    raise ValueError(
+                        "DataVersionFilter must provide ClusterId.")
+                if f.DataVersion is not None:
+                    flt.DataVersion = f.DataVersion
+                else:
+                    raise ValueError(
+                        "DataVersionFilter must provide DataVersion.")
+                encodedDataVersionFilters.append(DataVersionFilterIBstruct.build(flt))
+
+        encodedEvents = None
+        if events is not None:
+            encodedEvents = []
+            for event in events:
+                path = EventPathIBstruct.parse(
+                    b'\xff' * EventPathIBstruct.sizeof())
+                if event.EndpointId is not None:
+                    path.EndpointId = event.EndpointId
+                if event.ClusterId is not None:
+                    path.ClusterId = event.ClusterId
+                if event.EventId is not None:
+                    path.EventId = event.EventId
+                if event.Urgent is not None and isSubscription:
+                    path.Urgent = event.Urgent
+                else:
+                    path.Urgent = 0
+                encodedEvents.append(EventPathIBstruct.build(path))
+
+        return cls(Attributes=encodedAttributes, DataVersionFilters=encodedDataVersionFilters, Events=encodedEvents)
+
+
+def _EncodedListForCffi(encoded: list[bytes] | None):
+    if encoded is None:
+        return None
+    encodedForCffi = (c_void_p * len(encoded))()
+    for idx, item in enumerate(encoded):
+        encodedForCffi[idx] = cast(ctypes.c_char_p(item), c_void_p)
+    return encodedForCffi
+
+
 def Read(transaction: AsyncReadTransaction, device,
          attributes: list[AttributePath] | None = None, dataVersionFilters: list[DataVersionFilter] | None = None,
          events: list[EventPath] | None = None, eventNumberFilter: int | None = None,
          subscriptionParameters: SubscriptionParameters | None = None,
-         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True, allowLargePayload: None | bool = None) -> PyChipError:
-    if (not attributes) and dataVersionFilters:
-        raise ValueError(
-            "Must provide valid attribute list when data version filters is not null")
+         fabricFiltered: bool = True, keepSubscriptions: bool = False, autoResubscribe: bool = True, allowLargePayload: None | bool = None,
+         encodedPaths: EncodedReadPaths | None = None) -> PyChipError:
+    ''' Sends a read or subscribe request.
+
+        The paths are either given by attributes, dataVersionFilters and events, or already encoded by encodedPaths.
+    '''
+    if encodedPaths is None:
+        encodedPaths = EncodedReadPaths.Encode(attributes, dataVersionFilters, events,
+                                               isSubscription=subscriptionParameters is not None)
 
     handle = GetLibraryHandle()
 
-    attributePathsForCffi = None
-    if attributes is not None:
-        numberOfAttributePaths = len(attributes)
-        attributePathsForCffiArrayType = c_void_p * numberOfAttributePaths
-        attributePathsForCffi = attributePathsForCffiArrayType()
-        for idx, attr in enumerate(attributes):
-            path = AttributePathIBstruct.parse(
-                b'\xff' * AttributePathIBstruct.sizeof())
-            if attr.EndpointId is not None:
-                path.EndpointId = attr.EndpointId
-            if attr.ClusterId is not None:
-                path.ClusterId = attr.ClusterId
-            if attr.AttributeId is not None:
-                path.AttributeId = attr.AttributeId
-            path = AttributePathIBstruct.build(path)
-            attributePathsForCffi[idx] = cast(ctypes.c_char_p(path), c_void_p)
-
-    dataVersionFiltersForCffi = None
-    if dataVersionFilters is not None:
-        numberOfDataVersionFilters = len(dataVersionFilters)
-        dataVersionFiltersForCffiArrayType = c_void_p * numberOfDataVersionFilters
-        dataVersionFiltersForCffi = dataVersionFiltersForCffiArrayType()
-        for idx, f in enumerate(dataVersionFilters):
-            flt = DataVersionFilterIBstruct.parse(
-                b'\xff' * DataVersionFilterIBstruct.sizeof())
-            if f.EndpointId is not None:
-                flt.EndpointId = f.EndpointId
-            else:
-                raise ValueError(
-                    "DataVersionFilter must provide EndpointId.")
-            if f.ClusterId is not None:
-                flt.ClusterId = f.ClusterId
-            else:
-                raise ValueError(
-                    "DataVersionFilter must provide ClusterId.")
-            if f.DataVersion is not None:
-                flt.DataVersion = f.DataVersion
-            else:
-                raise ValueError(
-                    "DataVersionFilter must provide DataVersion.")
-            flt = DataVersionFilterIBstruct.build(flt)
-            dataVersionFiltersForCffi[idx] = cast(
-                ctypes.c_char_p(flt), c_void_p)
-
-    eventPathsForCffi = None
-    if events is not None:
-        numberOfEvents = len(events)
-        eventPathsForCffiArrayType = c_void_p * numberOfEvents
-        eventPathsForCffi = eventPathsForCffiArrayType()
-        for idx, event in enumerate(events):
-            path = EventPathIBstruct.parse(
-                b'\xff' * EventPathIBstruct.sizeof())
-            if event.EndpointId is not None:
-                path.EndpointId = event.EndpointId
-            if event.ClusterId is not None:
-                path.ClusterId = event.ClusterId
-            if event.EventId is not None:
-                path.EventId = event.EventId
-            if event.Urgent is not None and subscriptionParameters is not None:
-                path.Urgent = event.Urgent
-            else:
-                path.Urgent = 0
-            path = EventPathIBstruct.build(path)
-            eventPathsForCffi[idx] = cast(ctypes.c_char_p(path), c_void_p)
+    attributePathsForCffi = _EncodedListForCffi(encodedPaths.Attributes)
+    dataVersionFiltersForCffi = _EncodedListForCffi(encodedPaths.DataVersionFilters)
+    eventPathsForCffi = _EncodedListForCffi(encodedPaths.Events)
 
     readClientObj = ctypes.POINTER(c_void_p)()
 
@@ -1268,12 +1304,12 @@ def Read(transaction: AsyncReadTransaction, device,
             device,
             ctypes.c_char_p(params),
             attributePathsForCffi,
-            ctypes.c_size_t(0 if attributes is None else len(attributes)),
+            ctypes.c_size_t(0 if encodedPaths.Attributes is None else len(encodedPaths.Attributes)),
             dataVersionFiltersForCffi,
             ctypes.c_size_t(
-                0 if dataVersionFilters is None else len(dataVersionFilters)),
+                0 if encodedPaths.DataVersionFilters is None else len(encodedPaths.DataVersionFilters)),
             eventPathsForCffi,
-            ctypes.c_size_t(0 if events is None else len(events)),
+            ctypes.c_size_t(0 if encodedPaths.Events is None else len(encodedPaths.Events)),
             eventNumberFilterPtr,
             ctypes.c_bool(allowLargePayload or False)))
 
@@ -1327,7 +1363,3 @@ def Init():
         _OnReadAttributeDataCallback, _OnReadEventDataCallback,
         _OnSubscriptionEstablishedCallback, _OnResubscriptionAttemptedCallback, _OnReadErrorCallback, _OnReadDoneCallback,
         _OnReportBeginCallback, _OnReportEndCallback, _OnNotifySubscriptionStillActiveCallback)
-
-    _BuildAttributeIndex()
-    _BuildClusterIndex()
-    _BuildEventIndex()
@@ -15,7 +15,9 @@
 #    limitations under the License.
 #
 
+import copy
 import enum
+import importlib
 import types
 import typing
 from collections.abc import Mapping
@@ -52,11 +54,42 @@ def GetUnionUnderlyingType(typeToCheck, matchingType=None):
     return None
 
 
+@dataclass
+class _FieldPlan:
+    ''' Type information of a ClusterObjectFieldDescriptor, computed once and reused for every value of the field. '''
+    # Whether the field accepts NullValue and None respectively.
+    Nullable: bool
+    Optional: bool
+    # The type of the field with Nullable and None stripped from unions, or the type itself if it is not a union
+    # with any other type.
+    ElementType: Any
+    # The type of the values used when decoding, None if it is a union without any data model type.
+    ValueType: Any
+    # The type of list elements if ValueType is a list, None otherwise.
+    ListElementType: Any
+
+
 @dataclass
 class ClusterObjectFieldDescriptor:
     Label: str = ''
     Tag: int | None = None
     Type: type = type(None)
+    _plan: _FieldPlan | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _GetPlan(self) -> _FieldPlan:
+        if self._plan is None:
+            underlyingType = GetUnionUnderlyingType(self.Type)
+            if typing.get_origin(self.Type) in (typing.Union, types.UnionType):
+                valueType = underlyingType
+            else:
+                valueType = self.Type
+            self._plan = _FieldPlan(
+                Nullable=GetUnionUnderlyingType(self.Type, Nullable) is not None,
+                Optional=GetUnionUnderlyingType(self.Type, type(None)) is not None,
+                ElementType=underlyingType if underlyingType is not None else self.Type,
+                ValueType=valueType,
+                ListElementType=typing.get_args(valueType)[0] if typing.get_origin(valueType) == list else None)
+        return self._plan
 
     def _PutSingleElementToTLV(self, tag, val, elementType, writer: tlv.TLVWriter, debugPath: str = '?'):
         if issubclass(elementType, ClusterObject):
@@ -75,14 +108,15 @@ class ClusterObjectFieldDescriptor:
         writer.put(tag, val)
 
     def PutFieldToTLV(self, tag, val, writer: tlv.TLVWriter, debugPath: str = '?'):
+        plan = self._GetPlan()
         if (val == NullValue):
-            if (GetUnionUnderlyingType(self.Type, Nullable) is None):
+            if not plan.Nullable:
                 raise ValueError(
                     f"Field {debugPath}.{self.Label} was not nullable, but got a null")
 
             writer.put(tag, None)
         elif (val is None):
-            if (GetUnionUnderlyingType(self.Type, type(None)) is None):
+            if not plan.Optional:
                 raise ValueError(
                     f"Field {debugPath}.{self.Label} was not optional, but encountered None")
         else:
@@ -91,17 +125,13 @@ class ClusterObjectFieldDescriptor:
             # So, let's get at the 'real' type within that union before proceeding,
             # since at this point, we're guarenteed to not get None or Null as values.
             #
-            elementType = GetUnionUnderlyingType(self.Type)
-            if (elementType is None):
-                elementType = self.Type
+            elementType = plan.ElementType
 
             if not isinstance(val, list):
                 self._PutSingleElementToTLV(
                     tag, val, elementType, writer, debugPath)
                 return
 
-            writer.startArray(tag)
-
             # Get the type of the list. This is a generic, which has its sub-type information of the list element
             # inside its type argument.
             try:
@@ -111,15 +141,81 @@ class ClusterObjectFieldDescriptor:
                     f"Failed to decode field {debugPath} of type {self.Type}: Failed to find type of elements in {elementType}")
             elementType = listGenericArg
 
+            # Integer lists (e.g. group ids, ACL subjects) are encoded in bulk. If any element fails to convert,
+            # fall through to the per-element encoding below to report which one.
+            if elementType is tlv.uint or elementType is int:
+                try:
+                    intVals = [elementType(v) for v in val]
+                except Exception:
+                    intVals = None
+                if intVals is not None:
+                    if elementType is int:
+                        writer.putSignedIntArray(tag, intVals)
+                    else:
+                        writer.putUnsignedIntArray(tag, intVals)
+                    return
+
+            writer.startArray(tag)
             for i, v in enumerate(val):
                 self._PutSingleElementToTLV(
                     None, v, elementType, writer, debugPath + f'[{i}]')
             writer.endContainer()
 
 
+def _CompileNonArrayConverter(elementType, toObjects: bool) -> typing.Callable[[Any], Any]:
+    ''' Returns a function converting a decoded TLV value to elementType, equivalent to
+        ClusterObjectDescriptor._ConvertNonArray but without any debug information.
+
+        Structs are converted to label dicts, or to instances of their ClusterObject class if toObjects is set.
+    '''
+    if not isinstance(elementType, type):
+        def convertInvalid(value):
+            raise ValueError("not a data model type")
+        return convertInvalid
+
+    if issubclass(elementType, ClusterObject):
+        def convertStruct(value):
+            if not isinstance(value, Mapping):
+                raise ValueError("struct expected")
+            if toObjects:
+                return elementType(**elementType.descriptor._DecodeWithPlan(value, toObjects=True))
+            return elementType.descriptor._DecodeWithPlan(value)
+        return convertStruct
+
+    if issubclass(elementType, enum.Enum):
+        # Enum construction either returns an enum member or raises.
+        return elementType
+
+    def convertValue(value):
+        if not isinstance(value, elementType):
+            raise ValueError("unexpected type")
+        return value
+    return convertValue
+
+
+def _CompileFieldConverter(fieldDescriptor: ClusterObjectFieldDescriptor, toObjects: bool) -> typing.Callable[[Any], Any]:
+    ''' Returns a function converting the decoded non-null TLV value of a field to its data model representation. '''
+    plan = fieldDescriptor._GetPlan()
+    if plan.ValueType is None:
+        def convertInvalid(value):
+            raise ValueError("no valid underlying data model type")
+        return convertInvalid
+
+    if plan.ListElementType is not None:
+        convertElement = _CompileNonArrayConverter(plan.ListElementType, toObjects)
+        return lambda value: [convertElement(v) for v in value]
+
+    return _CompileNonArrayConverter(plan.ValueType, toObjects)
+
+
 @dataclass
 class ClusterObjectDescriptor:
     Fields: list[ClusterObjectFieldDescriptor]
+    # Lazily built mappings of tag to (label, converter), converting structs to label dicts and to objects respectively.
+    _decodePlan: dict[int | None, tuple[str, typing.Callable[[Any], Any]]] | None = field(
+        default=None, init=False, repr=False, compare=False)
+    _objectDecodePlan: dict[int | None, tuple[str, typing.Callable[[Any], Any]]] | None = field(
+        default=None, init=False, repr=False, compare=False)
 
     def GetFieldByTag(self, tag: int) -> ClusterObjectFieldDescriptor | None:
         for _field in self.Fields:
@@ -147,7 +243,40 @@ class ClusterObjectDescriptor:
                 f"Failed to decode field {debugPath}, struct expected.")
         return elementType.descriptor.TagDictToLabelDict(debugPath, value)
 
-    def TagDictToLabelDict(self, debugPath: str, tlvData: dict[int, Any]) -> dict[str, Any]:
+    def _GetDecodePlan(self, toObjects: bool) -> dict[int | None, tuple[str, typing.Callable[[Any], Any]]]:
+        plan = self._objectDecodePlan if toObjects else self._decodePlan
+        if plan is None:
+            plan = {}
+            for _field in self.Fields:
+                if _field.Tag not in plan:
+                    plan[_field.Tag] = (_field.Label, _CompileFieldConverter(_field, toObjects))
+            if toObjects:
+                self._objectDecodePlan = plan
+            else:
+                self._decodePlan = plan
+        return plan
+
+    def _DecodeWithPlan(self, tlvData: Mapping, toObjects: bool = False) -> dict[Any, Any]:
+        ''' Converts a tag dict to a label dict through the precompiled plan.
+
+            With toObjects, nested structs are converted to ClusterObject instances instead of label dicts and
+            fields unknown to the descriptor are dropped, so the result can be passed to the object constructor.
+        '''
+        plan = self._GetDecodePlan(toObjects)
+        ret: dict[Any, Any] = {}
+        for tag, value in tlvData.items():
+            entry = plan.get(tag)
+            if entry is None:
+                # We do not have enough information for this field.
+                if not toObjects:
+                    ret[tag] = value
+            elif value is None:
+                ret[entry[0]] = NullValue
+            else:
+                ret[entry[0]] = entry[1](value)
+        return ret
+
+    def _TagDictToLabelDictWithDebugPath(self, debugPath: str, tlvData: dict[int, Any]) -> dict[str, Any]:
         ret: dict[Any, Any] = {}
         for tag, value in tlvData.items():
             descriptor = self.GetFieldByTag(tag)
@@ -181,6 +310,15 @@ class ClusterObjectDescriptor:
                 f'{debugPath}.{descriptor.Label}', valueType, value)
         return ret
 
+    def TagDictToLabelDict(self, debugPath: str, tlvData: dict[int, Any]) -> dict[str, Any]:
+        # Conversion goes through the precompiled plan, which carries no debug information. When it fails,
+        # convert again with the reflection based implementation to report which field is invalid.
+        try:
+            return self._DecodeWithPlan(tlvData)
+        except Exception:
+            pass
+        return self._TagDictToLabelDictWithDebugPath(debugPath, tlvData)
+
     def TLVToDict(self, tlvBuf: bytes) -> dict[str, Any]:
         tlvData = tlv.TLVReader(tlvBuf).get().get('Any', {})
         return self.TagDictToLabelDict('', tlvData)
@@ -199,6 +337,13 @@ class ClusterObjectDescriptor:
 
 
 class ClusterObject:
+    def __init_subclass__(cls, *args, **kwargs) -> None:
+        """Cache the descriptor of a subclass, so its encode/decode plans are built only once."""
+        super().__init_subclass__(*args, **kwargs)
+        descriptor = cls.__dict__.get('descriptor')
+        if type(descriptor) is ChipUtility.classproperty:
+            cls.descriptor = ChipUtility.cachedclassproperty(descriptor.fget)
+
     def ToTLV(self):
         return self.descriptor.DictToTLV(asdict(self))
 
@@ -208,7 +353,21 @@ class ClusterObject:
 
     @classmethod
     def FromTLV(cls, data: bytes):
-        return cls.FromDict(data=cls.descriptor.TLVToDict(data))
+        return cls.FromTagDict(tlv.TLVReader(data).get().get('Any', {}))
+
+    @classmethod
+    def FromTagDict(cls, tlvData: Mapping, debugPath: str = ''):
+        ''' Builds an object from decoded TLV data keyed by field tags.
+
+            This is equivalent to FromDict(descriptor.TagDictToLabelDict(...)), but objects are built directly through
+            the precompiled decode plan of the descriptor. When that fails, the conversion is done again the slow way
+            to report which field is invalid.
+        '''
+        try:
+            return cls(**cls.descriptor._DecodeWithPlan(tlvData, toObjects=True))
+        except Exception:
+            pass
+        return cls.FromDict(data=cls.descriptor.TagDictToLabelDict(debugPath, tlvData))
 
     @ChipUtility.classproperty
     def descriptor(cls):
@@ -217,12 +376,40 @@ class ClusterObject:
 
 # The below dictionaries will be filled dynamically
 # and are used for quick lookup/mapping from cluster/attribute id to the correct class
-ALL_CLUSTERS: dict = {}
-ALL_ATTRIBUTES: dict = {}
+_ALL_CLUSTERS: dict = {}
+_ALL_ATTRIBUTES: dict = {}
 # These need to be separate because there can be overlap in command ids for commands and responses.
-ALL_ACCEPTED_COMMANDS: dict = {}
-ALL_GENERATED_COMMANDS: dict = {}
-ALL_EVENTS: dict = {}
+_ALL_ACCEPTED_COMMANDS: dict = {}
+_ALL_GENERATED_COMMANDS: dict = {}
+_ALL_EVENTS: dict = {}
+
+_REGISTRIES = {
+    'ALL_CLUSTERS': _ALL_CLUSTERS,
+    'ALL_ATTRIBUTES': _ALL_ATTRIBUTES,
+    'ALL_ACCEPTED_COMMANDS': _ALL_ACCEPTED_COMMANDS,
+    'ALL_GENERATED_COMMANDS': _ALL_GENERATED_COMMANDS,
+    'ALL_EVENTS': _ALL_EVENTS,
+}
+
+if typing.TYPE_CHECKING:
+    ALL_CLUSTERS: dict
+    ALL_ATTRIBUTES: dict
+    ALL_ACCEPTED_COMMANDS: dict
+    ALL_GENERATED_COMMANDS: dict
+    ALL_EVENTS: dict
+
+
+def __getattr__(name: str):
+    ''' Exposes the dictionaries above as ALL_CLUSTERS, ALL_ATTRIBUTES, etc.
+
+        The generated cluster objects are loaded lazily, so the first lookup makes sure they are
+        imported (and thus registered) before any of the dictionaries are handed out.
+    '''
+    if name not in _REGISTRIES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    importlib.import_module('.Objects', __package__)
+    globals().update(_REGISTRIES)
+    return _REGISTRIES[name]
 
 
 class ClusterCommand(ClusterObject):
@@ -231,13 +418,13 @@ class ClusterCommand(ClusterObject):
         super().__init_subclass__(*args, **kwargs)
         try:
             if cls.is_client:
-                if cls.cluster_id not in ALL_ACCEPTED_COMMANDS:
-                    ALL_ACCEPTED_COMMANDS[cls.cluster_id] = {}
-                ALL_ACCEPTED_COMMANDS[cls.cluster_id][cls.command_id] = cls
+                if cls.cluster_id not in _ALL_ACCEPTED_COMMANDS:
+                    _ALL_ACCEPTED_COMMANDS[cls.cluster_id] = {}
+                _ALL_ACCEPTED_COMMANDS[cls.cluster_id][cls.command_id] = cls
             else:
-                if cls.cluster_id not in ALL_GENERATED_COMMANDS:
-                    ALL_GENERATED_COMMANDS[cls.cluster_id] = {}
-                ALL_GENERATED_COMMANDS[cls.cluster_id][cls.command_id] = cls
+                if cls.cluster_id not in _ALL_GENERATED_COMMANDS:
+                    _ALL_GENERATED_COMMANDS[cls.cluster_id] = {}
+                _ALL_GENERATED_COMMANDS[cls.cluster_id][cls.command_id] = cls
         except NotImplementedError:
             # handle case where the ClusterAttribute class is not (fully) subclassed
             # and accessing the id property throws a NotImplementedError.
@@ -275,7 +462,7 @@ class Cluster(ClusterObject):
         """Register a subclass."""
         super().__init_subclass__(*args, **kwargs)
         # register this cluster in the ALL_CLUSTERS dict for quick lookups
-        ALL_CLUSTERS[cls.id] = cls
+        _ALL_CLUSTERS[cls.id] = cls
 
     @property
     def data_version(self) -> int:
@@ -294,6 +481,16 @@ class Cluster(ClusterObject):
     def SetDataVersion(self, version: int) -> None:
         self._data_version = version
 
+    def UpdatedFromTagDict(self, tlvData: Mapping) -> 'Cluster':
+        ''' Returns a copy of this cluster object with only the attributes present in tlvData decoded again.
+
+            Unlike FromTagDict, invalid data is not reported per attribute, the decode error is raised as is.
+        '''
+        updated = copy.copy(self)
+        for label, value in self.descriptor._DecodeWithPlan(tlvData, toObjects=True).items():
+            setattr(updated, label, value)
+        return updated
+
 
 class ClusterAttributeDescriptor:
     '''
@@ -309,11 +506,15 @@ class ClusterAttributeDescriptor:
     def __init_subclass__(cls, *args, **kwargs) -> None:
         """Register a subclass."""
         super().__init_subclass__(*args, **kwargs)
+        # Cache the field descriptor, so its encode/decode plans are built only once.
+        attributeType = cls.__dict__.get('attribute_type')
+        if type(attributeType) is ChipUtility.classproperty:
+            cls.attribute_type = ChipUtility.cachedclassproperty(attributeType.fget)
         if cls.standard_attribute:
-            if cls.cluster_id not in ALL_ATTRIBUTES:
-                ALL_ATTRIBUTES[cls.cluster_id] = {}
+            if cls.cluster_id not in _ALL_ATTRIBUTES:
+                _ALL_ATTRIBUTES[cls.cluster_id] = {}
             # register this clusterattribute in the ALL_ATTRIBUTES dict for quick lookups
-            ALL_ATTRIBUTES[cls.cluster_id][cls.attribute_id] = cls
+            _ALL_ATTRIBUTES[cls.cluster_id][cls.attribute_id] = cls
 
     @classmethod
     def ToTLV(cls, tag: int | None, value):
@@ -325,14 +526,11 @@ class ClusterAttributeDescriptor:
 
     @classmethod
     def FromTLV(cls, tlvBuffer: bytes):
-        obj_class = cls._cluster_object
-        return obj_class.FromDict(
-            obj_class.descriptor.TagDictToLabelDict('', {0: tlv.TLVReader(tlvBuffer).get().get('Any', {})})).Value
+        return cls._cluster_object.FromTagDict({0: tlv.TLVReader(tlvBuffer).get().get('Any', {})}).Value
 
     @classmethod
     def FromTagDictOrRawValue(cls, val: Any):
-        obj_class = cls._cluster_object
-        return obj_class.FromDict(obj_class.descriptor.TagDictToLabelDict('', {0: val})).Value
+        return cls._cluster_object.FromTagDict({0: val}).Value
 
     @ChipUtility.classproperty
     def cluster_id(self) -> int:
@@ -354,7 +552,7 @@ class ClusterAttributeDescriptor:
     def standard_attribute(cls) -> bool:
         return True
 
-    @ChipUtility.classproperty
+    @ChipUtility.cachedclassproperty
     def _cluster_object(cls) -> ClusterObject:
         return make_dataclass('InternalClass',
                               [
@@ -377,10 +575,10 @@ class ClusterEvent(ClusterObject):
         """Register a subclass."""
         super().__init_subclass__(*args, **kwargs)
 
-        if cls.cluster_id not in ALL_EVENTS:
-            ALL_EVENTS[cls.cluster_id] = {}
+        if cls.cluster_id not in _ALL_EVENTS:
+            _ALL_EVENTS[cls.cluster_id] = {}
         # register this clusterattribute in the ALL_ATTRIBUTES dict for quick lookups
-        ALL_EVENTS[cls.cluster_id][cls.event_id] = cls
+        _ALL_EVENTS[cls.cluster_id][cls.event_id] = cls
 
     @ChipUtility.classproperty
     def cluster_id(self) -> int:
@@ -17,7 +17,6 @@
 
 import builtins
 import ctypes
-import inspect
 import logging
 from asyncio.futures import Future
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_char_p, c_size_t, c_uint8, c_uint16, c_uint32, c_void_p, cast, py_object
@@ -27,8 +26,8 @@ from ..interaction_model import InteractionModelError, PyInvokeRequestData
 from ..interaction_model import Status as InteractionModelStatus
 from ..interaction_model import TestOnlyPyBatchCommandsOverrides, TestOnlyPyOnDoneInfo
 from ..native import GetLibraryHandle, NativeLibraryHandleMethodArguments, PyChipError
-from . import Objects as GeneratedObjects
-from .ClusterObjects import Cluster, ClusterCommand
+from . import ClusterObjects
+from .ClusterObjects import ClusterCommand
 
 logger = logging.getLogger('matter.cluster.Command')
 logger.setLevel(logging.ERROR)
@@ -68,13 +67,8 @@ def FindCommandClusterObject(isClientSideCommand: bool, path: CommandPath):
 
         Returns the type of the cluster object if one is found. Otherwise, returns None.
     '''
-    for clusterName in GeneratedObjects.__all__:
-        obj = getattr(GeneratedObjects, clusterName)
-        if issubclass(obj, Cluster) and obj.id == path.ClusterId:
-            for _, cmd in inspect.getmembers(getattr(obj, "Commands", None), inspect.isclass):
-                if issubclass(cmd, ClusterCommand) and cmd.command_id == path.CommandId and cmd.is_client == isClientSideCommand:
-                    return cmd
-    return None
+    commands = ClusterObjects.ALL_ACCEPTED_COMMANDS if isClientSideCommand else ClusterObjects.ALL_GENERATED_COMMANDS
+    return commands.get(path.ClusterId, {}).get(path.CommandId)
 
 
 class AsyncCommandTransaction:
@@ -0,0 +1,183 @@
+'''
+/*
+ *
+ *    Copyright (c) 2022 Project CHIP Authors
+ *
+ *    Licensed under the Apache License, Version 2.0 (the "License");
+ *    you may not use this file except in compliance with the License.
+ *    You may obtain a copy of the License at
+ *
+ *        http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *    Unless required by applicable law or agreed to in writing, software
+ *    distributed under the License is distributed on an "AS IS" BASIS,
+ *    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *    See the License for the specific language governing permissions and
+ *    limitations under the License.
+ */
+
+// THIS FILE IS GENERATED BY ZAP
+'''
+
+# This file contains a generated manifest of the clusters defined in Objects.py, keyed by cluster id.
+# It lets matter.clusters know which cluster objects exist without having to import Objects.py,
+# which is only loaded once one of the cluster objects is first accessed.
+
+CLUSTER_NAMES = {
+    0x00000003: "Identify",
+    0x00000004: "Groups",
+    0x00000006: "OnOff",
+    0x00000008: "LevelControl",
+    0x0000001C: "PulseWidthModulation",
+    0x0000001D: "Descriptor",
+    0x0000001E: "Binding",
+    0x0000001F: "AccessControl",
+    0x00000025: "Actions",
+    0x00000028: "BasicInformation",
+    0x00000029: "OtaSoftwareUpdateProvider",
+    0x0000002A: "OtaSoftwareUpdateRequestor",
+    0x0000002B: "LocalizationConfiguration",
+    0x0000002C: "TimeFormatLocalization",
+    0x0000002D: "UnitLocalization",
+    0x0000002E: "PowerSourceConfiguration",
+    0x0000002F: "PowerSource",
+    0x00000030: "GeneralCommissioning",
+    0x00000031: "NetworkCommissioning",
+    0x00000032: "DiagnosticLogs",
+    0x00000033: "GeneralDiagnostics",
+    0x00000034: "SoftwareDiagnostics",
+    0x00000035: "ThreadNetworkDiagnostics",
+    0x00000036: "WiFiNetworkDiagnostics",
+    0x00000037: "EthernetNetworkDiagnostics",
+    0x00000038: "TimeSynchronization",
+    0x00000039: "BridgedDeviceBasicInformation",
+    0x0000003B: "Switch",
+    0x0000003C: "AdministratorCommissioning",
+    0x0000003E: "OperationalCredentials",
+    0x0000003F: "GroupKeyManagement",
+    0x00000040: "FixedLabel",
+    0x00000041: "UserLabel",
+    0x00000042: "ProxyConfiguration",
+    0x00000043: "ProxyDiscovery",
+    0x00000044: "ProxyValid",
+    0x00000045: "BooleanState",
+    0x00000046: "IcdManagement",
+    0x00000048: "OvenCavityOperationalState",
+    0x00000049: "OvenMode",
+    0x0000004A: "LaundryDryerControls",
+    0x0000004B: "TemperatureControlledCabinetTopology",
+    0x00000050: "ModeSelect",
+    0x00000051: "LaundryWasherMode",
+    0x00000052: "RefrigeratorAndTemperatureControlledCabinetMode",
+    0x00000053: "LaundryWasherControls",
+    0x00000054: "RvcRunMode",
+    0x00000055: "RvcCleanMode",
+    0x00000056: "TemperatureControl",
+    0x00000057: "RefrigeratorAlarm",
+    0x00000059: "DishwasherMode",
+    0x0000005B: "AirQuality",
+    0x0000005C: "SmokeCoAlarm",
+    0x0000005D: "DishwasherAlarm",
+    0x0000005E: "MicrowaveOvenMode",
+    0x0000005F: "MicrowaveOvenControl",
+    0x00000060: "OperationalState",
+    0x00000061: "RvcOperationalState",
+    0x00000062: "ScenesManagement",
+    0x00000065: "Groupcast",
+    0x00000071: "HepaFilterMonitoring",
+    0x00000072: "ActivatedCarbonFilterMonitoring",
+    0x00000079: "WaterTankLevelMonitoring",
+    0x00000080: "BooleanStateConfiguration",
+    0x00000081: "ValveConfigurationAndControl",
+    0x00000090: "ElectricalPowerMeasurement",
+    0x00000091: "ElectricalEnergyMeasurement",
+    0x00000094: "WaterHeaterManagement",
+    0x00000095: "CommodityPrice",
+    0x00000097: "Messages",
+    0x00000098: "DeviceEnergyManagement",
+    0x00000099: "EnergyEvse",
+    0x0000009B: "EnergyPreference",
+    0x0000009C: "PowerTopology",
+    0x0000009D: "EnergyEvseMode",
+    0x0000009E: "WaterHeaterMode",
+    0x0000009F: "DeviceEnergyManagementMode",
+    0x000000A0: "ElectricalGridConditions",
+    0x000000A1: "ElectricalAlarm",
+    0x000000A2: "ElectricalDistribution",
+    0x000000A3: "ElectricalProtectionAlarm",
+    0x00000101: "DoorLock",
+    0x00000102: "WindowCovering",
+    0x00000104: "ClosureControl",
+    0x00000105: "ClosureDimension",
+    0x00000150: "ServiceArea",
+    0x00000200: "PumpConfigurationAndControl",
+    0x00000201: "Thermostat",
+    0x00000202: "FanControl",
+    0x00000204: "ThermostatUserInterfaceConfiguration",
+    0x00000205: "Humidistat",
+    0x00000300: "ColorControl",
+    0x00000301: "BallastConfiguration",
+    0x00000305: "DynamicLighting",
+    0x00000400: "IlluminanceMeasurement",
+    0x00000402: "TemperatureMeasurement",
+    0x00000403: "PressureMeasurement",
+    0x00000404: "FlowMeasurement",
+    0x00000405: "RelativeHumidityMeasurement",
+    0x00000406: "OccupancySensing",
+    0x0000040C: "CarbonMonoxideConcentrationMeasurement",
+    0x0000040D: "CarbonDioxideConcentrationMeasurement",
+    0x00000413: "NitrogenDioxideConcentrationMeasurement",
+    0x00000415: "OzoneConcentrationMeasurement",
+    0x0000042A: "Pm25ConcentrationMeasurement",
+    0x0000042B: "FormaldehydeConcentrationMeasurement",
+    0x0000042C: "Pm1ConcentrationMeasurement",
+    0x0000042D: "Pm10ConcentrationMeasurement",
+    0x0000042E: "TotalVolatileOrganicCompoundsConcentrationMeasurement",
+    0x0000042F: "RadonConcentrationMeasurement",
+    0x00000430: "SoilMeasurement",
+    0x00000431: "AmbientContextSensing",
+    0x00000432: "AmbientSensingUnion",
+    0x00000433: "ProximityRanging",
+    0x00000434: "SmokeConcentrationMeasurement",
+    0x00000450: "NetworkIdentityManagement",
+    0x00000451: "WiFiNetworkManagement",
+    0x00000452: "ThreadBorderRouterManagement",
+    0x00000453: "ThreadNetworkDirectory",
+    0x00000455: "CommissioningProxy",
+    0x00000503: "WakeOnLan",
+    0x00000504: "Channel",
+    0x00000505: "TargetNavigator",
+    0x00000506: "MediaPlayback",
+    0x00000507: "MediaInput",
+    0x00000508: "LowPower",
+    0x00000509: "KeypadInput",
+    0x0000050A: "ContentLauncher",
+    0x0000050B: "AudioOutput",
+    0x0000050C: "ApplicationLauncher",
+    0x0000050D: "ApplicationBasic",
+    0x0000050E: "AccountLogin",
+    0x0000050F: "ContentControl",
+    0x00000510: "ContentAppObserver",
+    0x00000511: "MediaFileManagement",
+    0x00000512: "AudioControl",
+    0x00000550: "ZoneManagement",
+    0x00000551: "CameraAvStreamManagement",
+    0x00000552: "CameraAvSettingsUserLevelManagement",
+    0x00000553: "WebRTCTransportProvider",
+    0x00000554: "WebRTCTransportRequestor",
+    0x00000555: "PushAvStreamTransport",
+    0x00000556: "Chime",
+    0x00000557: "AvAnalysis",
+    0x00000700: "CommodityTariff",
+    0x00000750: "EcosystemInformation",
+    0x00000751: "CommissionerControl",
+    0x00000752: "JointFabricDatastore",
+    0x00000753: "JointFabricAdministrator",
+    0x00000801: "TlsCertificateManagement",
+    0x00000802: "TlsClientManagement",
+    0x00000B06: "MeterIdentification",
+    0x00000B07: "CommodityMetering",
+    0xFFF1FC05: "UnitTesting",
+    0xFFF1FC06: "FaultInjection",
+    0xFFF1FC20: "SampleMei",
+}
@@ -15,5 +15,26 @@
 #    limitations under the License.
 #
 
-from . import Attribute, CHIPClusters, Command, Objects  # noqa: F401
-from .Objects import *  # noqa: F401, F403
+import importlib
+
+from . import Attribute, CHIPClusters, Command  # noqa: F401
+from .ObjectsManifest import CLUSTER_NAMES
+
+# The generated cluster objects are only imported from Objects.py once one of them is first accessed,
+# as defining all of them takes a significant part of the start-up time.
+_GENERATED_OBJECTS = frozenset(("Globals", *CLUSTER_NAMES.values()))
+
+__all__ = ["Attribute", "CHIPClusters", "Command", "Objects", "Globals"]
+__all__ += list(CLUSTER_NAMES.values())
+
+
+def __getattr__(name: str):
+    if name != "Objects" and name not in _GENERATED_OBJECTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    objects = importlib.import_module(".Objects", __name__)
+    globals().update((objectName, getattr(objects, objectName)) for objectName in objects.__all__)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -20,7 +20,9 @@ import copy
 import ctypes
 import json
 import logging
+import os
 import re
+import threading
 from abc import ABC, abstractmethod
 from configparser import ConfigParser
 from ctypes import CFUNCTYPE, POINTER, c_bool, c_char, c_char_p, c_uint16, c_void_p, py_object
@@ -387,3 +389,186 @@ class PersistentStorageINI(PersistentStorageBase):
                 config.write(f)
         except Exception as ex:
             LOGGER.critical("Could not save configuration to INI file: %s", ex)
+
+
+# Markers of a deleted key and of a key without changes among the pending changes of PersistentStorageJSONLog.
+_DELETED = object()
+_NOT_PENDING = object()
+
+
+class PersistentStorageJSONLog(PersistentStorageBase):
+    """Persistent storage back-end which appends changes to a JSON lines log.
+
+    Instead of rewriting the whole configuration on every commit, only the keys
+    changed since the last flush are appended to the log, one JSON array per
+    line: [section, key, value] for a set and [section, key] for a delete, with
+    section being 'repl-config' or 'sdk-config'. Each batch of changes ends with
+    a ['commit', count] record.
+
+    With a non-zero flushIntervalSec, commits are write-behind: the changes are
+    collected in memory and appended by a background timer at most that many
+    seconds later, so a burst of SetSdkKey() calls (e.g. while commissioning)
+    is written as a single batch in which repeated writes of a key collapse.
+    Flush() writes the pending changes immediately, Shutdown() flushes as well.
+    With flushIntervalSec=0, every commit is written before it returns.
+
+    Each batch is fsync'ed and applied on load only once its commit record is
+    read, so a batch that was only partially written when the process crashed
+    is ignored as a whole. Loading stops at the first invalid record: the
+    records after it are ignored as well, and the log is rewritten without
+    them. If appending a batch fails, its changes are kept pending and the next
+    flush rewrites the whole log instead.
+    Once the log holds more than compactionRatio times as many records as there
+    are keys, it is compacted by writing a snapshot of all keys into a new file
+    which atomically replaces the log.
+    """
+
+    _REPL_SECTION = 'repl-config'
+    _SDK_SECTION = 'sdk-config'
+    _COMMIT = 'commit'
+
+    def __init__(self, path: str, flushIntervalSec: float = 0.5, compactionRatio: float = 4.0):
+        LOGGER.info("Loading configuration from JSON log file: %s", path)
+        self._path = path
+        self._flushIntervalSec = flushIntervalSec
+        self._compactionRatio = compactionRatio
+        self._lock = threading.RLock()
+        self._flushTimer: threading.Timer | None = None
+        self._pending: dict[tuple[str, str], Any] = {}
+        self._records = 0
+        # Set when an append failed, the log may then end with part of a batch.
+        self._appendFailed = False
+        invalidRecords = False
+        data, sdkData = {}, {}
+        sections = {self._REPL_SECTION: data, self._SDK_SECTION: sdkData}
+        batch = []
+        try:
+            with open(self._path, 'rb') as f:
+                for lineNumber, line in enumerate(f, start=1):
+                    try:
+                        if not line.endswith(b'\n'):
+                            raise ValueError("truncated record")
+                        record = json.loads(line)
+                        if record[0] == self._COMMIT:
+                            if record[1] != len(batch):
+                                raise ValueError(f"commit of {record[1]} records after {len(batch)} records")
+                            for section, key, *value in batch:
+                                if value:
+                                    sections[section][key] = value[0]
+                                else:
+                                    sections[section].pop(key, None)
+                            self._records += len(batch)
+                            batch = []
+                            continue
+                        if record[0] not in sections or len(record) not in (2, 3):
+                            raise ValueError("unknown record")
+                        batch.append(record)
+                    except Exception as ex:
+                        LOGGER.warning("Ignoring JSON log file from line %d on, invalid record: %s", lineNumber, ex)
+                        invalidRecords = True
+                        break
+        except FileNotFoundError:
+            LOGGER.info("Configuration file not found, using empty configuration")
+        except Exception as ex:
+            LOGGER.critical("Could not load configuration from JSON log file: %s", ex)
+        if batch:
+            LOGGER.warning("Ignoring %d records of an uncommitted batch of JSON log file", len(batch))
+            invalidRecords = True
+        super().__init__(data, sdkData)
+        # Start from a clean log, so batches appended later never follow ignored records.
+        if invalidRecords or self._NeedsCompaction():
+            self.Compact()
+
+    def _WriteBatch(self, f, records: list):
+        f.writelines(json.dumps(record, ensure_ascii=True, separators=(',', ':')) + '\n'
+                     for record in records + [[self._COMMIT, len(records)]])
+        f.flush()
+        os.fsync(f.fileno())
+
+    def _Change(self, section: str, key: str, value: Any, apply, *args):
+        # The change has to be pending before it is applied, since applying it commits.
+        with self._lock:
+            previous = self._pending.get((section, key), _NOT_PENDING)
+            self._pending[(section, key)] = value
+            try:
+                apply(*args)
+            except Exception:
+                if previous is _NOT_PENDING:
+                    del self._pending[(section, key)]
+                else:
+                    self._pending[(section, key)] = previous
+                raise
+
+    def SetKey(self, key: str, value: Any):
+        self._Change(self._REPL_SECTION, key, copy.deepcopy(value), super().SetKey, key, value)
+
+    def DeleteKey(self, key: str):
+        self._Change(self._REPL_SECTION, key, _DELETED, super().DeleteKey, key)
+
+    def SetSdkKey(self, key: str, value: bytes):
+        encoded = base64.b64encode(value).decode("utf-8") if value is not None else None
+        self._Change(self._SDK_SECTION, key, encoded, super().SetSdkKey, key, value)
+
+    def DeleteSdkKey(self, key: str):
+        self._Change(self._SDK_SECTION, key, _DELETED, super().DeleteSdkKey, key)
+
+    def Commit(self):
+        if self._flushIntervalSec <= 0:
+            self.Flush()
+            return
+        with self._lock:
+            if self._flushTimer is None and self._pending:
+                self._flushTimer = threading.Timer(self._flushIntervalSec, self.Flush)
+                self._flushTimer.daemon = True
+                self._flushTimer.start()
+
+    def Flush(self):
+        """Write the pending changes to the log."""
+        with self._lock:
+            if self._flushTimer is not None:
+                self._flushTimer.cancel()
+                self._flushTimer = None
+            if not self._pending:
+                return
+            if self._appendFailed:
+                # The snapshot holds the pending changes and replaces a partially appended batch.
+                self.Compact()
+                return
+            records = [[section, key] if value is _DELETED else [section, key, value]
+                       for (section, key), value in self._pending.items()]
+            try:
+                with open(self._path, 'a', encoding='utf-8') as f:
+                    self._WriteBatch(f, records)
+            except Exception as ex:
+                LOGGER.critical("Could not save configuration to JSON log file: %s", ex)
+                self._appendFailed = True
+                return
+            self._pending.clear()
+            self._records += len(records)
+            if self._NeedsCompaction():
+                self.Compact()
+
+    def _NeedsCompaction(self) -> bool:
+        return self._records > self._compactionRatio * max(len(self._data) + len(self._sdkData), 1)
+
+    def Compact(self):
+        """Rewrite the log with a single record per key."""
+        with self._lock:
+            tmpPath = self._path + '.tmp'
+            records = [[self._REPL_SECTION, key, value] for key, value in self._data.items()]
+            records += [[self._SDK_SECTION, key, value] for key, value in self._sdkData.items()]
+            try:
+                with open(tmpPath, 'w', encoding='utf-8') as f:
+                    self._WriteBatch(f, records)
+                os.replace(tmpPath, self._path)
+            except Exception as ex:
+                LOGGER.critical("Could not compact JSON log file: %s", ex)
+                return
+            self._records = len(records)
+            self._appendFailed = False
+            # Changes made before the compaction are part of the snapshot.
+            self._pending.clear()
+
+    def Shutdown(self):
+        self.Flush()
+        super().Shutdown()
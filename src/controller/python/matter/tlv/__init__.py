@@ -25,7 +25,7 @@
 
 
 import struct
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from collections.abc import Mapping, Sequence
 from enum import Enum
 
@@ -56,6 +56,8 @@ TLVBoolean_True = TLV_TYPE_BOOLEAN + 1
 
 TLVEndOfContainer = 0x18
 
+TLV_CONTAINER_TYPES = (TLV_TYPE_STRUCTURE, TLV_TYPE_ARRAY, TLV_TYPE_PATH)
+
 INT8_MIN = -128
 INT16_MIN = -32768
 INT32_MIN = -2147483648
@@ -134,6 +136,67 @@ class float32(float):
     pass
 
 
+# (min, max, packer) for each width of signed and unsigned TLV integers, narrowest first.
+_SIGNED_INT_STRUCTS = (
+    (INT8_MIN, INT8_MAX, struct.Struct("<b")),
+    (INT16_MIN, INT16_MAX, struct.Struct("<h")),
+    (INT32_MIN, INT32_MAX, struct.Struct("<l")),
+    (INT64_MIN, INT64_MAX, struct.Struct("<q")),
+)
+_UNSIGNED_INT_STRUCTS = (
+    (0, UINT8_MAX, struct.Struct("<B")),
+    (0, UINT16_MAX, struct.Struct("<H")),
+    (0, UINT32_MAX, struct.Struct("<L")),
+    (0, UINT64_MAX, struct.Struct("<Q")),
+)
+_FLOAT32 = struct.Struct("<f")
+_FLOAT64 = struct.Struct("<d")
+
+# Packers for a control byte followed by a tag, for each tag form.
+_CONTEXT_TAG = struct.Struct("<BB")
+_PROFILE_TAG_2BYTES = struct.Struct("<BH")
+_PROFILE_TAG_4BYTES = struct.Struct("<BL")
+_FULLY_QUALIFIED_TAG_6BYTES = struct.Struct("<BHHH")
+_FULLY_QUALIFIED_TAG_8BYTES = struct.Struct("<BHHL")
+
+# Encoded control byte of anonymous elements.
+_CONTROL_BYTES = tuple(bytes((controlByte,)) for controlByte in range(256))
+
+# Element type bits encoding the width of a value or of a length field.
+_LEN_FIELD_BITS = {1: 0, 2: 1, 4: 2, 8: 3}
+
+# Packers for a control byte followed by an integer value, for each integer packer.
+_ANONYMOUS_INT_STRUCTS = {
+    valStruct: struct.Struct("<B" + valStruct.format[1:])
+    for (_, _, valStruct) in _SIGNED_INT_STRUCTS + _UNSIGNED_INT_STRUCTS
+}
+
+
+def _intStruct(intStructs, val):
+    """Return the packer of the narrowest width able to represent val."""
+    for (low, high, valStruct) in intStructs:
+        if low <= val <= high:
+            return valStruct
+    raise ValueError("Integer value out of range")
+
+
+def _packAnonymousInts(ctl, valStruct, vals):
+    """Encode vals as consecutive anonymous TLV integers of the width of valStruct.
+
+    The values are packed at once and then interleaved with their control bytes through
+    strided slice assignments, avoiding any per-value work in Python.
+    """
+    width = valStruct.size
+    stride = width + 1
+    count = len(vals)
+    packed = struct.pack("<%d%s" % (count, valStruct.format[-1]), *vals)
+    out = bytearray(stride * count)
+    out[0::stride] = _CONTROL_BYTES[ctl | _LEN_FIELD_BITS[width]] * count
+    for i in range(width):
+        out[i + 1::stride] = packed[i::width]
+    return out
+
+
 class TLVWriter:
     def __init__(self, encoding=None, implicitProfile=None):
         self._encoding = encoding if encoding is not None else bytearray()
@@ -238,70 +301,57 @@ class TLVWriter:
 
     def putSignedInt(self, tag, val):
         """Write a value as a TLV signed integer with the specified TLV tag."""
-        if val >= INT8_MIN and val <= INT8_MAX:
-            fmt = "<b"
-        elif val >= INT16_MIN and val <= INT16_MAX:
-            fmt = "<h"
-        elif val >= INT32_MIN and val <= INT32_MAX:
-            fmt = "<l"
-        elif val >= INT64_MIN and val <= INT64_MAX:
-            fmt = "<q"
-        else:
-            raise ValueError("Integer value out of range")
-        val = struct.pack(fmt, val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_SIGNED_INTEGER, tag, lenOfLenOrVal=len(val)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        valStruct = _intStruct(_SIGNED_INT_STRUCTS, val)
+        self._encoding.extend(self._encodeControlAndTag(
+            TLV_TYPE_SIGNED_INTEGER, tag, lenOfLenOrVal=valStruct.size
+        ))
+        self._encoding.extend(valStruct.pack(val))
 
     def putUnsignedInt(self, tag, val):
         """Write a value as a TLV unsigned integer with the specified TLV tag."""
-        val = self._encodeUnsignedInt(val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_UNSIGNED_INTEGER, tag, lenOfLenOrVal=len(val)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        valStruct = _intStruct(_UNSIGNED_INT_STRUCTS, val)
+        self._encoding.extend(self._encodeControlAndTag(
+            TLV_TYPE_UNSIGNED_INTEGER, tag, lenOfLenOrVal=valStruct.size
+        ))
+        self._encoding.extend(valStruct.pack(val))
+
+    def putSignedIntArray(self, tag, vals):
+        """Write a sequence of integers as a TLV array of signed integers with the specified TLV tag.
+
+        The encoding is identical to putting each value as a signed integer within an array, but
+        arrays whose values all have the same encoded width are packed in a single pass.
+        """
+        self._putIntArray(tag, vals, _SIGNED_INT_STRUCTS, TLV_TYPE_SIGNED_INTEGER)
+
+    def putUnsignedIntArray(self, tag, vals):
+        """Write a sequence of integers as a TLV array of unsigned integers with the specified TLV tag.
+
+        The encoding is identical to putting each value as an unsigned integer within an array, but
+        arrays whose values all have the same encoded width are packed in a single pass.
+        """
+        self._putIntArray(tag, vals, _UNSIGNED_INT_STRUCTS, TLV_TYPE_UNSIGNED_INTEGER)
 
     def putFloat(self, tag, val):
         """Write a value as a TLV float with the specified TLV tag."""
-        val = struct.pack("f", val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=len(val)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        self._encoding.extend(self._encodeControlAndTag(
+            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=_FLOAT32.size
+        ))
+        self._encoding.extend(_FLOAT32.pack(val))
 
     def putDouble(self, tag, val):
         """Write a value as a TLV double with the specified TLV tag."""
-        val = struct.pack("d", val)
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=len(val)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(val)
+        self._encoding.extend(self._encodeControlAndTag(
+            TLV_TYPE_FLOATING_POINT_NUMBER, tag, lenOfLenOrVal=_FLOAT64.size
+        ))
+        self._encoding.extend(_FLOAT64.pack(val))
 
     def putString(self, tag, val):
         """Write a value as a TLV string with the specified TLV tag."""
-        val = val.encode("utf-8")
-        valLen = self._encodeUnsignedInt(len(val))
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_UTF8_STRING, tag, lenOfLenOrVal=len(valLen)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(valLen)
-        self._encoding.extend(val)
+        self._putLengthPrefixed(TLV_TYPE_UTF8_STRING, tag, val.encode("utf-8"))
 
     def putBytes(self, tag, val):
         """Write a value as a TLV byte string with the specified TLV tag."""
-        valLen = self._encodeUnsignedInt(len(val))
-        controlAndTag = self._encodeControlAndTag(
-            TLV_TYPE_BYTE_STRING, tag, lenOfLenOrVal=len(valLen)
-        )
-        self._encoding.extend(controlAndTag)
-        self._encoding.extend(valLen)
-        self._encoding.extend(val)
+        self._putLengthPrefixed(TLV_TYPE_BYTE_STRING, tag, val)
 
     def putBool(self, tag, val):
         """Write a value as a TLV boolean with the specified TLV tag."""
@@ -326,7 +376,7 @@ class TLVWriter:
         self._verifyValidContainerType(containerType)
         controlAndTag = self._encodeControlAndTag(containerType, tag)
         self._encoding.extend(controlAndTag)
-        self._containerStack.insert(0, containerType)
+        self._containerStack.append(containerType)
 
     def startStructure(self, tag):
         """Start writing a TLV structure with the specified TLV tag."""
@@ -342,28 +392,43 @@ class TLVWriter:
 
     def endContainer(self):
         """End writing the current TLV container."""
-        self._containerStack.pop(0)
-        controlAndTag = self._encodeControlAndTag(TLVEndOfContainer, None)
-        self._encoding.extend(controlAndTag)
+        self._containerStack.pop()
+        self._encoding.append(TLVEndOfContainer)
+
+    def _putLengthPrefixed(self, ctl, tag, val):
+        lenStruct = _intStruct(_UNSIGNED_INT_STRUCTS, len(val))
+        self._encoding.extend(self._encodeControlAndTag(ctl, tag, lenOfLenOrVal=lenStruct.size))
+        self._encoding.extend(lenStruct.pack(len(val)))
+        self._encoding.extend(val)
+
+    def _putIntArray(self, tag, vals, intStructs, ctl):
+        self.startArray(tag)
+        if vals:
+            lowStruct = _intStruct(intStructs, min(vals))
+            highStruct = _intStruct(intStructs, max(vals))
+            # Unsigned widths are contiguous ranges, so all values share the width of the extremes.
+            # Signed widths are nested ranges, so this only holds when the extremes are 1-byte wide.
+            if lowStruct is highStruct and (ctl == TLV_TYPE_UNSIGNED_INTEGER or lowStruct is intStructs[0][2]):
+                self._encoding.extend(_packAnonymousInts(ctl, lowStruct, vals))
+            else:
+                for val in vals:
+                    valStruct = _intStruct(intStructs, val)
+                    self._encoding.extend(_ANONYMOUS_INT_STRUCTS[valStruct].pack(
+                        ctl | _LEN_FIELD_BITS[valStruct.size], val))
+        self.endContainer()
 
     def _encodeControlAndTag(self, ctl, tag, lenOfLenOrVal=0):
-        controlByte = ctl
-        if lenOfLenOrVal == 2:
-            controlByte |= 1
-        elif lenOfLenOrVal == 4:
-            controlByte |= 2
-        elif lenOfLenOrVal == 8:
-            controlByte |= 3
+        controlByte = ctl | _LEN_FIELD_BITS.get(lenOfLenOrVal, 0)
         if tag is None:
             if (
                 ctl != TLVEndOfContainer
                 and len(self._containerStack) != 0
-                and self._containerStack[0] == TLV_TYPE_STRUCTURE
+                and self._containerStack[-1] == TLV_TYPE_STRUCTURE
             ):
                 raise ValueError(
                     "Attempt to encode anonymous tag within TLV structure")
             controlByte |= TLV_TAG_CONTROL_ANONYMOUS
-            return struct.pack("<B", controlByte)
+            return _CONTROL_BYTES[controlByte]
         if isinstance(tag, int):
             if tag < 0 or tag > UINT8_MAX:
                 raise ValueError(
@@ -372,12 +437,12 @@ class TLVWriter:
                 raise ValueError(
                     "Attempt to encode context-specific TLV tag at top level"
                 )
-            if self._containerStack[0] == TLV_TYPE_ARRAY:
+            if self._containerStack[-1] == TLV_TYPE_ARRAY:
                 raise ValueError(
                     "Attempt to encode context-specific tag within TLV array"
                 )
             controlByte |= TLV_TAG_CONTROL_CONTEXT_SPECIFIC
-            return struct.pack("<BB", controlByte, tag)
+            return _CONTEXT_TAG.pack(controlByte, tag)
         if isinstance(tag, tuple):
             (profile, tagNum) = tag
             if not isinstance(tagNum, int):
@@ -391,7 +456,7 @@ class TLVWriter:
                     raise ValueError("TLV profile id value out of range")
             if (
                 len(self._containerStack) != 0
-                and self._containerStack[0] == TLV_TYPE_ARRAY
+                and self._containerStack[-1] == TLV_TYPE_ARRAY
             ):
                 raise ValueError(
                     "Attempt to encode profile-specific tag within TLV array"
@@ -399,39 +464,27 @@ class TLVWriter:
             if profile is None or profile == self._implicitProfile:
                 if tagNum <= UINT16_MAX:
                     controlByte |= TLV_TAG_CONTROL_IMPLICIT_PROFILE_2Bytes
-                    return struct.pack("<BH", controlByte, tagNum)
+                    return _PROFILE_TAG_2BYTES.pack(controlByte, tagNum)
                 controlByte |= TLV_TAG_CONTROL_IMPLICIT_PROFILE_4Bytes
-                return struct.pack("<BL", controlByte, tagNum)
+                return _PROFILE_TAG_4BYTES.pack(controlByte, tagNum)
             if profile == 0:
                 if tagNum <= UINT16_MAX:
                     controlByte |= TLV_TAG_CONTROL_COMMON_PROFILE_2Bytes
-                    return struct.pack("<BH", controlByte, tagNum)
+                    return _PROFILE_TAG_2BYTES.pack(controlByte, tagNum)
                 controlByte |= TLV_TAG_CONTROL_COMMON_PROFILE_4Bytes
-                return struct.pack("<BL", controlByte, tagNum)
+                return _PROFILE_TAG_4BYTES.pack(controlByte, tagNum)
             vendorId = (profile >> 16) & 0xFFFF
             profileNum = (profile >> 0) & 0xFFFF
             if tagNum <= UINT16_MAX:
                 controlByte |= TLV_TAG_CONTROL_FULLY_QUALIFIED_6Bytes
-                return struct.pack("<BHHH", controlByte, vendorId, profileNum, tagNum)
+                return _FULLY_QUALIFIED_TAG_6BYTES.pack(controlByte, vendorId, profileNum, tagNum)
             controlByte |= TLV_TAG_CONTROL_FULLY_QUALIFIED_8Bytes
-            return struct.pack("<BHHL", controlByte, vendorId, profileNum, profile, tagNum)
+            return _FULLY_QUALIFIED_TAG_8BYTES.pack(controlByte, vendorId, profileNum, tagNum)
         raise ValueError("Invalid object given for TLV tag")
 
     @staticmethod
     def _encodeUnsignedInt(val):
-        if val < 0:
-            raise ValueError("Integer value out of range")
-        if val <= UINT8_MAX:
-            fmt = "<B"
-        elif val <= UINT16_MAX:
-            fmt = "<H"
-        elif val <= UINT32_MAX:
-            fmt = "<L"
-        elif val <= UINT64_MAX:
-            fmt = "<Q"
-        else:
-            raise ValueError("Integer value out of range")
-        return struct.pack(fmt, val)
+        return _intStruct(_UNSIGNED_INT_STRUCTS, val).pack(val)
 
     @staticmethod
     def _verifyValidContainerType(containerType):
@@ -443,253 +496,380 @@ class TLVWriter:
             raise ValueError("Invalid TLV container type")
 
 
+# Tag forms, indexed by the tag control field (upper 3 bits) of the control byte.
+_TAG_FORM_ANONYMOUS = 0
+_TAG_FORM_CONTEXT = 1
+_TAG_FORM_COMMON_PROFILE = 2
+_TAG_FORM_IMPLICIT_PROFILE = 3
+_TAG_FORM_FULLY_QUALIFIED = 4
+
+# (tag form, unpacker for the tag field) for each tag control value.
+_TAG_DECODERS = {
+    TLV_TAG_CONTROL_ANONYMOUS: (_TAG_FORM_ANONYMOUS, None),
+    TLV_TAG_CONTROL_CONTEXT_SPECIFIC: (_TAG_FORM_CONTEXT, struct.Struct("<B")),
+    TLV_TAG_CONTROL_COMMON_PROFILE_2Bytes: (_TAG_FORM_COMMON_PROFILE, struct.Struct("<H")),
+    TLV_TAG_CONTROL_COMMON_PROFILE_4Bytes: (_TAG_FORM_COMMON_PROFILE, struct.Struct("<L")),
+    TLV_TAG_CONTROL_IMPLICIT_PROFILE_2Bytes: (_TAG_FORM_IMPLICIT_PROFILE, struct.Struct("<H")),
+    TLV_TAG_CONTROL_IMPLICIT_PROFILE_4Bytes: (_TAG_FORM_IMPLICIT_PROFILE, struct.Struct("<L")),
+    TLV_TAG_CONTROL_FULLY_QUALIFIED_6Bytes: (_TAG_FORM_FULLY_QUALIFIED, struct.Struct("<HHH")),
+    TLV_TAG_CONTROL_FULLY_QUALIFIED_8Bytes: (_TAG_FORM_FULLY_QUALIFIED, struct.Struct("<HHL")),
+}
+
+# Value forms, derived from the element type field (lower 5 bits) of the control byte.
+_VALUE_FORM_SCALAR = 0
+_VALUE_FORM_CONSTANT = 1
+_VALUE_FORM_UTF8_STRING = 2
+_VALUE_FORM_BYTE_STRING = 3
+_VALUE_FORM_STRUCTURE = 4
+_VALUE_FORM_ARRAY = 5
+_VALUE_FORM_PATH = 6
+_VALUE_FORM_END_OF_CONTAINER = 7
+
+# (value form, unpacker for the value or string length field, scalar type or constant value)
+# for each element type.
+_VALUE_DECODERS = {
+    0x00: (_VALUE_FORM_SCALAR, struct.Struct("<b"), None),
+    0x01: (_VALUE_FORM_SCALAR, struct.Struct("<h"), None),
+    0x02: (_VALUE_FORM_SCALAR, struct.Struct("<l"), None),
+    0x03: (_VALUE_FORM_SCALAR, struct.Struct("<q"), None),
+    0x04: (_VALUE_FORM_SCALAR, struct.Struct("<B"), uint),
+    0x05: (_VALUE_FORM_SCALAR, struct.Struct("<H"), uint),
+    0x06: (_VALUE_FORM_SCALAR, struct.Struct("<L"), uint),
+    0x07: (_VALUE_FORM_SCALAR, struct.Struct("<Q"), uint),
+    0x08: (_VALUE_FORM_CONSTANT, None, False),
+    0x09: (_VALUE_FORM_CONSTANT, None, True),
+    0x0A: (_VALUE_FORM_SCALAR, struct.Struct("<f"), float32),
+    0x0B: (_VALUE_FORM_SCALAR, struct.Struct("<d"), None),
+    0x0C: (_VALUE_FORM_UTF8_STRING, struct.Struct("<B"), None),
+    0x0D: (_VALUE_FORM_UTF8_STRING, struct.Struct("<H"), None),
+    0x0E: (_VALUE_FORM_UTF8_STRING, struct.Struct("<L"), None),
+    0x0F: (_VALUE_FORM_UTF8_STRING, struct.Struct("<Q"), None),
+    0x10: (_VALUE_FORM_BYTE_STRING, struct.Struct("<B"), None),
+    0x11: (_VALUE_FORM_BYTE_STRING, struct.Struct("<H"), None),
+    0x12: (_VALUE_FORM_BYTE_STRING, struct.Struct("<L"), None),
+    0x13: (_VALUE_FORM_BYTE_STRING, struct.Struct("<Q"), None),
+    0x14: (_VALUE_FORM_CONSTANT, None, None),
+    0x15: (_VALUE_FORM_STRUCTURE, None, None),
+    0x16: (_VALUE_FORM_ARRAY, None, None),
+    0x17: (_VALUE_FORM_PATH, None, None),
+    0x18: (_VALUE_FORM_END_OF_CONTAINER, None, None),
+}
+
+
+def _buildControlByteTable():
+    """Build the 256-entry table mapping a control byte to its tag and value decoders.
+
+    Each entry is a (tagForm, tagStruct, valueForm, valueStruct, valueArg) tuple, or None
+    when the element type field of the control byte is reserved.
+    """
+    table = []
+    for controlByte in range(256):
+        valueDecoder = _VALUE_DECODERS.get(controlByte & 0x1F)
+        if valueDecoder is None:
+            table.append(None)
+            continue
+        table.append(_TAG_DECODERS[controlByte & 0xE0] + valueDecoder)
+    return tuple(table)
+
+
+_CONTROL_BYTE_TABLE = _buildControlByteTable()
+
+
+def _baseElementType(elementType):
+    """Return the TLV type of an element type, with its width/length and boolean value bits cleared."""
+    if elementType in (TLVBoolean_False, TLVBoolean_True):
+        return TLV_TYPE_BOOLEAN
+    if elementType in (0x0A, 0x0B):
+        return TLV_TYPE_FLOATING_POINT_NUMBER
+    if elementType < TLV_TYPE_NULL:
+        return elementType & 0x1C
+    return elementType
+
+
+_BASE_ELEMENT_TYPES = {elementType: _baseElementType(elementType) for elementType in _VALUE_DECODERS}
+
+
+def _decodeElement(buf, offset):
+    """Decode the control byte, the tag and, for primitive elements, the value of the element at offset.
+
+    Return a (controlByte, tagForm, tag, valueForm, value, strDataLen, offset) tuple, where offset is just
+    past the decoded bytes. For containers and end of container elements, value is None and offset is that
+    of the first member or of the next element.
+    """
+    controlByte = buf[offset]
+    entry = _CONTROL_BYTE_TABLE[controlByte]
+    if entry is None:
+        raise ValueError("Attempt to decode unsupported TLV type")
+    tagForm, tagStruct, valueForm, valueStruct, valueArg = entry
+    offset += 1
+
+    if tagForm == _TAG_FORM_ANONYMOUS:
+        tag = None
+    elif tagForm == _TAG_FORM_CONTEXT:
+        (tag,) = tagStruct.unpack_from(buf, offset)
+        offset += 1
+    elif tagForm == _TAG_FORM_FULLY_QUALIFIED:
+        (vendorId, profileNum, tagNum) = tagStruct.unpack_from(buf, offset)
+        tag = ((vendorId << 16) | profileNum, tagNum)
+        offset += tagStruct.size
+    else:
+        (tagNum,) = tagStruct.unpack_from(buf, offset)
+        tag = (0 if tagForm == _TAG_FORM_COMMON_PROFILE else None, tagNum)
+        offset += tagStruct.size
+
+    strDataLen = 0
+    if valueForm == _VALUE_FORM_SCALAR:
+        (value,) = valueStruct.unpack_from(buf, offset)
+        offset += valueStruct.size
+        if valueArg is not None:
+            value = valueArg(value)
+    elif valueForm == _VALUE_FORM_CONSTANT:
+        value = valueArg
+    elif valueForm in (_VALUE_FORM_UTF8_STRING, _VALUE_FORM_BYTE_STRING):
+        (strDataLen,) = valueStruct.unpack_from(buf, offset)
+        offset += valueStruct.size
+        stop = offset + strDataLen
+        if stop > len(buf):
+            raise ValueError("Attempt to decode truncated TLV string")
+        value = buf[offset:stop]
+        offset = stop
+        if valueForm == _VALUE_FORM_UTF8_STRING:
+            try:
+                value = str(value, "utf-8")
+            except UnicodeDecodeError:
+                value = bytes(value)
+        else:
+            value = bytes(value)
+    else:
+        value = None
+
+    return controlByte, tagForm, tag, valueForm, value, strDataLen, offset
+
+
+def _decodeElements(buf, offset, out, decodings):
+    """Decode elements from buf starting at offset into out until the end of the buffer or of
+    the enclosing container is reached, and return the offset just past the last decoded byte.
+
+    out is a dict for TLV structures (and the top level), a TLVList for TLV paths and a list
+    for TLV arrays. Elements are dispatched on the raw control byte through
+    _CONTROL_BYTE_TABLE, so no intermediate per-element state is built unless decodings is
+    a list to record it in."""
+    end = len(buf)
+    isMapping = isinstance(out, Mapping)
+    isPath = isinstance(out, TLVList)
+
+    while offset < end:
+        controlByte, tagForm, tag, valueForm, value, strDataLen, offset = _decodeElement(buf, offset)
+
+        childDecodings = None
+        if valueForm == _VALUE_FORM_END_OF_CONTAINER:
+            if decodings is not None:
+                decodings.append(_describeElement(controlByte, tag, 0, None, None))
+            return offset
+        if valueForm >= _VALUE_FORM_STRUCTURE:
+            if valueForm == _VALUE_FORM_STRUCTURE:
+                value = {}
+            elif valueForm == _VALUE_FORM_ARRAY:
+                value = []
+            else:
+                value = TLVList()
+            if decodings is not None:
+                childDecodings = []
+            offset = _decodeElements(buf, offset, value, childDecodings)
+
+        if decodings is not None:
+            decodings.append(_describeElement(controlByte, tag, strDataLen, value, childDecodings))
+
+        if tagForm >= _TAG_FORM_COMMON_PROFILE:
+            out[tag] = value
+        elif isMapping:
+            out[tag if tag is not None else "Any"] = value
+        elif isPath:
+            out.append(tag, value)
+        else:
+            out.append(value)
+
+    return offset
+
+
+def _describeElement(controlByte, tag, strDataLen, value, childDecodings):
+    """Build the debug description of a decoded element, as exposed by TLVReader.decoding."""
+    tagControl = TagControls[controlByte & 0xE0]
+    elementType = ElementTypes[controlByte & 0x1F]
+    decoding = {"tagControl": tagControl, "type": elementType}
+
+    tagStruct = _TAG_DECODERS[controlByte & 0xE0][1]
+    if tagStruct is None:
+        decoding["tag"] = None
+        decoding["tagLen"] = 0
+    elif isinstance(tag, tuple):
+        decoding["profileTag"] = tag
+        decoding["tagLen"] = 4 if tagStruct.format.endswith("L") else 2
+    else:
+        decoding["tag"] = tag
+        decoding["tagLen"] = 1
+
+    valueStruct = _VALUE_DECODERS[controlByte & 0x1F][1]
+    if "length" in elementType:
+        decoding["strDataLen"] = strDataLen
+        decoding["strDataLenLen"] = valueStruct.size
+    else:
+        decoding["strDataLen"] = 0
+        decoding["strDataLenLen"] = 0
+
+    decoding["value"] = value
+    if childDecodings is not None:
+        decoding[elementType] = childDecodings
+    return decoding
+
+
 class TLVReader:
-    def __init__(self, tlv):
+    def __init__(self, tlv, keepDecodings=False):
+        """Construct a reader over a buffer of TLV encoded data.
+
+        tlv can be any object supporting the buffer protocol (bytes, bytearray, memoryview...).
+
+        When keepDecodings is True, a per-element description of the encoding (tag control,
+        element type, lengths and value) is recorded while decoding and made available through
+        the decoding property. This is meant for debugging and is off by default since it is
+        considerably slower than plain decoding.
+        """
         self._tlv = tlv
         self._bytesRead = 0
+        self._keepDecodings = keepDecodings
         self._decodings = []
 
     @property
     def decoding(self):
+        """The per-element decoding tree, only populated when keepDecodings was requested."""
         return self._decodings
 
     def get(self):
         """Get the dictionary representation of tlv data"""
         out = {}
-        self._get(self._tlv, self._decodings, out)
+        with memoryview(self._tlv).cast("B") as buf:
+            self._bytesRead = _decodeElements(
+                buf, self._bytesRead, out, self._decodings if self._keepDecodings else None)
         return out
 
-    def _decodeControlByte(self, tlv, decoding):
-        (controlByte,) = struct.unpack(
-            "<B", tlv[self._bytesRead: self._bytesRead + 1])
-        controlTypeIndex = controlByte & 0xE0
-        decoding["tagControl"] = TagControls[controlTypeIndex]
-        elementtypeIndex = controlByte & 0x1F
-        decoding["type"] = ElementTypes[elementtypeIndex]
-        self._bytesRead += 1
-
-    def _decodeControlAndTag(self, tlv, decoding):
-        """The control byte specifies the type of a TLV element and how its tag, length and value fields are encoded.
-        The control byte consists of two subfields: an element type field which occupies the lower 5 bits,
-        and a tag control field which occupies the upper 3 bits. The element type field encodes the element’s type
-        as well as how the corresponding length and value fields are encoded.  In the case of Booleans and the
-        null value, the element type field also encodes the value itself."""
-
-        self._decodeControlByte(tlv, decoding)
-
-        if decoding["tagControl"] == "Anonymous":
-            decoding["tag"] = None
-            decoding["tagLen"] = 0
-        elif decoding["tagControl"] == "Context 1-byte":
-            (decoding["tag"],) = struct.unpack(
-                "<B", tlv[self._bytesRead: self._bytesRead + 1]
-            )
-            decoding["tagLen"] = 1
-            self._bytesRead += 1
-        elif decoding["tagControl"] == "Common Profile 2-byte":
-            profile = 0
-            (tag,) = struct.unpack(
-                "<H", tlv[self._bytesRead: self._bytesRead + 2])
-            decoding["profileTag"] = (profile, tag)
-            decoding["tagLen"] = 2
-            self._bytesRead += 2
-        elif decoding["tagControl"] == "Common Profile 4-byte":
-            profile = 0
-            (tag,) = struct.unpack(
-                "<L", tlv[self._bytesRead: self._bytesRead + 4])
-            decoding["profileTag"] = (profile, tag)
-            decoding["tagLen"] = 4
-            self._bytesRead += 4
-        elif decoding["tagControl"] == "Implicit Profile 2-byte":
-            profile = None
-            (tag,) = struct.unpack(
-                "<H", tlv[self._bytesRead: self._bytesRead + 2])
-            decoding["profileTag"] = (profile, tag)
-            decoding["tagLen"] = 2
-            self._bytesRead += 2
-        elif decoding["tagControl"] == "Implicit Profile 4-byte":
-            profile = None
-            (tag,) = struct.unpack(
-                "<L", tlv[self._bytesRead: self._bytesRead + 4])
-            decoding["profileTag"] = (profile, tag)
-            decoding["tagLen"] = 4
-            self._bytesRead += 4
-        elif decoding["tagControl"] == "Fully Qualified 6-byte":
-            (vendorId, profileNum) = struct.unpack(
-                "<HH", tlv[self._bytesRead: self._bytesRead + 4])
-            profile = (vendorId << 16) | profileNum
-            (tag,) = struct.unpack(
-                "<H", tlv[self._bytesRead + 4: self._bytesRead + 6])
-            decoding["profileTag"] = (profile, tag)
-            decoding["tagLen"] = 2
-            self._bytesRead += 6
-        elif decoding["tagControl"] == "Fully Qualified 8-byte":
-            (vendorId, profileNum) = struct.unpack(
-                "<HH", tlv[self._bytesRead: self._bytesRead + 4])
-            profile = (vendorId << 16) | profileNum
-            (tag,) = struct.unpack(
-                "<L", tlv[self._bytesRead + 4: self._bytesRead + 8])
-            decoding["profileTag"] = (profile, tag)
-            decoding["tagLen"] = 4
-            self._bytesRead += 8
-
-    def _decodeStrLength(self, tlv, decoding):
-        """UTF-8 or Byte StringLength fields are encoded in 0, 1, 2 or 4 byte widths, as specified by
-        the element type field. If the element type needs a length field grab the next bytes as length"""
-        if "length" in decoding["type"]:
-            if "1-byte" in decoding["type"]:
-                (decoding["strDataLen"],) = struct.unpack(
-                    "<B", tlv[self._bytesRead: self._bytesRead + 1]
-                )
-                decoding["strDataLenLen"] = 1
-                self._bytesRead += 1
-            elif "2-byte" in decoding["type"]:
-                (decoding["strDataLen"],) = struct.unpack(
-                    "<H", tlv[self._bytesRead: self._bytesRead + 2]
-                )
-                decoding["strDataLenLen"] = 2
-                self._bytesRead += 2
-            elif "4-byte" in decoding["type"]:
-                (decoding["strDataLen"],) = struct.unpack(
-                    "<L", tlv[self._bytesRead: self._bytesRead + 4]
-                )
-                decoding["strDataLenLen"] = 4
-                self._bytesRead += 4
-            elif "8-byte" in decoding["type"]:
-                (decoding["strDataLen"],) = struct.unpack(
-                    "<Q", tlv[self._bytesRead: self._bytesRead + 8]
-                )
-                decoding["strDataLenLen"] = 8
-                self._bytesRead += 8
-        else:
-            decoding["strDataLen"] = 0
-            decoding["strDataLenLen"] = 0
-
-    def _decodeVal(self, tlv, decoding):
-        """decode primitive tlv value to the corresponding python value, tlv array and path are decoded as
-        python list, tlv structure is decoded as python dictionary"""
-        if decoding["type"] == "Structure":
-            decoding["value"] = {}
-            decoding["Structure"] = []
-            self._get(tlv, decoding["Structure"], decoding["value"])
-        elif decoding["type"] == "Array":
-            decoding["value"] = []
-            decoding["Array"] = []
-            self._get(tlv, decoding["Array"], decoding["value"])
-        elif decoding["type"] == "Path":
-            decoding["value"] = TLVList()
-            decoding["Path"] = []
-            self._get(tlv, decoding["Path"], decoding["value"])
-        elif decoding["type"] == "Null":
-            decoding["value"] = None
-        elif decoding["type"] == "End of Collection":
-            decoding["value"] = None
-        elif decoding["type"] == "Boolean True":
-            decoding["value"] = True
-        elif decoding["type"] == "Boolean False":
-            decoding["value"] = False
-        elif decoding["type"] == "Unsigned Integer 1-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<B", tlv[self._bytesRead: self._bytesRead + 1]
-            )
-            decoding["value"] = uint(decoding["value"])
-            self._bytesRead += 1
-        elif decoding["type"] == "Signed Integer 1-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<b", tlv[self._bytesRead: self._bytesRead + 1]
-            )
-            self._bytesRead += 1
-        elif decoding["type"] == "Unsigned Integer 2-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<H", tlv[self._bytesRead: self._bytesRead + 2]
-            )
-            decoding["value"] = uint(decoding["value"])
-            self._bytesRead += 2
-        elif decoding["type"] == "Signed Integer 2-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<h", tlv[self._bytesRead: self._bytesRead + 2]
-            )
-            self._bytesRead += 2
-        elif decoding["type"] == "Unsigned Integer 4-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<L", tlv[self._bytesRead: self._bytesRead + 4]
-            )
-            decoding["value"] = uint(decoding["value"])
-            self._bytesRead += 4
-        elif decoding["type"] == "Signed Integer 4-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<l", tlv[self._bytesRead: self._bytesRead + 4]
-            )
-            self._bytesRead += 4
-        elif decoding["type"] == "Unsigned Integer 8-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<Q", tlv[self._bytesRead: self._bytesRead + 8]
-            )
-            decoding["value"] = uint(decoding["value"])
-            self._bytesRead += 8
-        elif decoding["type"] == "Signed Integer 8-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<q", tlv[self._bytesRead: self._bytesRead + 8]
-            )
-            self._bytesRead += 8
-        elif decoding["type"] == "Floating Point 4-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<f", tlv[self._bytesRead: self._bytesRead + 4]
-            )
-            decoding["value"] = float32(decoding["value"])
-            self._bytesRead += 4
-        elif decoding["type"] == "Floating Point 8-byte value":
-            (decoding["value"],) = struct.unpack(
-                "<d", tlv[self._bytesRead: self._bytesRead + 8]
-            )
-            self._bytesRead += 8
-        elif "UTF-8 String" in decoding["type"]:
-            (val,) = struct.unpack(
-                "<%ds" % decoding["strDataLen"],
-                tlv[self._bytesRead: self._bytesRead + decoding["strDataLen"]],
-            )
-            try:
-                decoding["value"] = str(val, "utf-8")
-            except Exception:
-                decoding["value"] = val
-            self._bytesRead += decoding["strDataLen"]
-        elif "Byte String" in decoding["type"]:
-            (val,) = struct.unpack(
-                "<%ds" % decoding["strDataLen"],
-                tlv[self._bytesRead: self._bytesRead + decoding["strDataLen"]],
-            )
-
-            decoding["value"] = val
-            self._bytesRead += decoding["strDataLen"]
-        else:
-            raise ValueError("Attempt to decode unsupported TLV type")
 
-    def _get(self, tlv, decodings, out):
-        endOfEncoding = False
+TLVElement = namedtuple("TLVElement", ["depth", "tag", "type", "value"])
+TLVElement.__doc__ = """An element event produced by TLVIterator.
 
-        while len(tlv[self._bytesRead:]) > 0 and endOfEncoding is False:
-            decoding = {}
-            self._decodeControlAndTag(tlv, decoding)
-            self._decodeStrLength(tlv, decoding)
-            self._decodeVal(tlv, decoding)
-            decodings.append(decoding)
+depth is the nesting level of the element (0 for top level elements).
+tag is the decoded tag: None (anonymous), an int (context-specific) or a (profile, tagNum) tuple.
+type is the base TLV type of the element (e.g. TLV_TYPE_UNSIGNED_INTEGER, TLV_TYPE_STRUCTURE),
+  or TLVEndOfContainer for the event closing a container.
+value is the decoded value for primitive elements, and None for container start and end events.
+"""
 
-            if decoding["type"] == "End of Collection":
-                endOfEncoding = True
-            else:
-                if "profileTag" in list(decoding.keys()):
-                    out[decoding["profileTag"]] = decoding["value"]
-                elif "tag" in list(decoding.keys()):
-                    if isinstance(out, Mapping):
-                        tag = decoding["tag"] if decoding["tag"] is not None else "Any"
-                        out[tag] = decoding["value"]
-                    elif isinstance(out, TLVList):
-                        tag = decoding["tag"] if decoding["tag"] is not None else None
-                        out.append(tag, decoding["value"])
-                    else:
-                        out.append(decoding["value"])
-                else:
-                    raise ValueError("Attempt to decode unsupported TLV tag")
+
+class TLVIterator:
+    """Pull-style reader yielding one TLVElement per TLV element, without building containers.
+
+    Containers are reported as a start event (type TLV_TYPE_STRUCTURE, TLV_TYPE_ARRAY or
+    TLV_TYPE_PATH) followed by the events of their members and an end event of type
+    TLVEndOfContainer at the same depth as the start event. This allows walking or filtering large
+    encodings with constant memory and stopping as soon as the wanted element has been found.
+
+    Right after a container start event, the container can either be skipped entirely with
+    skipContainer() or materialized with readContainer() (with the same representation as
+    TLVReader.get()). In both cases, the events of its members and its end event are not produced.
+
+    e.g.
+    ```
+    it = TLVIterator(encoding)
+    for element in it:
+        if element.depth == 1 and element.tag == 0xFFFB:
+            attributeList = it.readContainer()
+            break
+        if element.type in TLV_CONTAINER_TYPES:
+            it.skipContainer()
+    ```
+    """
+
+    def __init__(self, tlv):
+        self._buf = memoryview(tlv).cast("B")
+        self._offset = 0
+        self._depth = 0
+        self._containerStart = False
+        self._containerType = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        buf = self._buf
+        offset = self._offset
+        if offset >= len(buf):
+            raise StopIteration
+
+        controlByte, _, tag, valueForm, value, _, offset = _decodeElement(buf, offset)
+
+        depth = self._depth
+        self._containerStart = False
+        if valueForm == _VALUE_FORM_END_OF_CONTAINER:
+            if depth == 0:
+                # Matches TLVReader.get(), which stops at an unbalanced end of container.
+                self._offset = len(buf)
+                raise StopIteration
+            depth -= 1
+            self._depth = depth
+        elif valueForm >= _VALUE_FORM_STRUCTURE:
+            self._depth += 1
+            self._containerStart = True
+            self._containerType = _BASE_ELEMENT_TYPES[controlByte & 0x1F]
+
+        self._offset = offset
+        return TLVElement(depth, tag, _BASE_ELEMENT_TYPES[controlByte & 0x1F], value)
+
+    def _checkContainerStart(self):
+        if not self._containerStart:
+            raise ValueError("Not positioned at the start of a TLV container")
+        self._containerStart = False
+        self._depth -= 1
+
+    def skipContainer(self):
+        """Skip the members and the end of the container whose start event was just produced."""
+        self._checkContainerStart()
+        buf = self._buf
+        end = len(buf)
+        offset = self._offset
+        nesting = 1
+        while nesting and offset < end:
+            entry = _CONTROL_BYTE_TABLE[buf[offset]]
+            if entry is None:
+                raise ValueError("Attempt to decode unsupported TLV type")
+            _, tagStruct, valueForm, valueStruct, _ = entry
+            offset += 1
+            if tagStruct is not None:
+                offset += tagStruct.size
+            if valueForm == _VALUE_FORM_SCALAR:
+                offset += valueStruct.size
+            elif valueForm in (_VALUE_FORM_UTF8_STRING, _VALUE_FORM_BYTE_STRING):
+                (strDataLen,) = valueStruct.unpack_from(buf, offset)
+                offset += valueStruct.size + strDataLen
+            elif valueForm == _VALUE_FORM_END_OF_CONTAINER:
+                nesting -= 1
+            elif valueForm != _VALUE_FORM_CONSTANT:
+                nesting += 1
+        self._offset = min(offset, end)
+
+    def readContainer(self):
+        """Decode the container whose start event was just produced and return its value.
+
+        Structures are returned as dicts, arrays as lists and paths as TLVLists, as with
+        TLVReader.get().
+        """
+        self._checkContainerStart()
+        if self._containerType == TLV_TYPE_STRUCTURE:
+            value = {}
+        elif self._containerType == TLV_TYPE_ARRAY:
+            value = []
+        else:
+            value = TLVList()
+        self._offset = _decodeElements(self._buf, self._offset, value, None)
+        return value
 
 
 def tlvTagToSortKey(tag):
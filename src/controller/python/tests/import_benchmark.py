@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Measures the cold-start time of `python -c "import matter.clusters"`.
+
+Each statement is run in a fresh interpreter, so every sample includes the interpreter start-up.
+The "eager" statement also imports the generated cluster objects, which is what importing
+matter.clusters used to do before they were loaded on first access.
+
+    python3 src/controller/python/tests/import_benchmark.py --runs 10
+'''
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    "lazy": "import matter.clusters",
+    "eager": "import matter.clusters.Objects",
+    "first cluster access": "import matter.clusters; matter.clusters.OnOff",
+}
+
+
+def TimeStatement(statement: str, runs: int, env: dict) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], env=env, check=True)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of interpreter starts per statement")
+    args = parser.parse_args()
+
+    # Make the in-tree package importable when it is not installed.
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.path.dirname(os.path.dirname(os.path.abspath(__file__))), env.get("PYTHONPATH")]))
+
+    # Warm up the bytecode caches, so compilation is not attributed to the first statement measured.
+    subprocess.run([sys.executable, "-c", STATEMENTS["eager"]], env=env, check=True)
+
+    for name, statement in STATEMENTS.items():
+        samples = TimeStatement(statement, args.runs, env)
+        print(f"{name:>22}: min {min(samples) * 1000:8.1f} ms, median {statistics.median(samples) * 1000:8.1f} ms"
+              f"  ({statement})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+'''
+Compares the persistent storage back-ends under the storage load of a commissioning burst.
+
+Commissioning a node makes the SDK set a few keys for the new node (session resumption state,
+group keys, counters), each followed by a commit. The storage starts out with the keys of
+--existing-nodes already commissioned nodes, so that rewriting the whole file on every commit
+has the cost it has on a controller managing a larger fabric.
+
+    python3 src/controller/python/tests/storage_benchmark.py --nodes 200
+'''
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matter.storage import PersistentStorageJSON, PersistentStorageJSONLog  # noqa: E402
+
+# Keys set by the SDK while commissioning a node, and the size of their values.
+NODE_KEYS = {
+    "f/1/s/{node:016X}": 120,
+    "f/1/r/{node:016X}": 64,
+    "s/{node:016X}": 64,
+    "g/gcc": 4,
+    "g/gdc": 4,
+    "g/sri": 128,
+    "f/1/k/0": 48,
+    "g/fidx": 8,
+}
+
+
+def Commission(storage, nodes: range):
+    for node in nodes:
+        for key, size in NODE_KEYS.items():
+            storage.SetSdkKey(key.format(node=node), os.urandom(size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=200, help="Number of nodes commissioned in the burst")
+    parser.add_argument("--existing-nodes", type=int, default=500, help="Number of nodes already in the storage")
+    args = parser.parse_args()
+
+    backends = {
+        "JSON": lambda path: PersistentStorageJSON(path),
+        "JSON log": lambda path: PersistentStorageJSONLog(path, flushIntervalSec=0),
+        "JSON log, write-behind": lambda path: PersistentStorageJSONLog(path, flushIntervalSec=0.5),
+    }
+
+    # Only the Python side of the storage is measured, the adapter of the native library is not needed.
+    with mock.patch("matter.storage.GetLibraryHandle"), tempfile.TemporaryDirectory() as tmpdir:
+        for name, backend in backends.items():
+            path = os.path.join(tmpdir, name.replace(" ", "_").replace(",", ""))
+            with backend(path) as storage:
+                Commission(storage, range(args.existing_nodes))
+                storage.Commit()
+
+            with backend(path) as storage:
+                start = time.perf_counter()
+                Commission(storage, range(args.existing_nodes, args.existing_nodes + args.nodes))
+                storage.Shutdown()
+                elapsed = time.perf_counter() - start
+
+            print(f"{name:>24}: {elapsed * 1000:9.1f} ms, {args.nodes / elapsed:9.1f} nodes/s, "
+                  f"{os.path.getsize(path) / 1024:8.1f} KiB on disk")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import unittest
+
+import matter.clusters as Clusters
+from matter.clusters.Attribute import AttributeCache, AttributePath, DataVersion, ValueDecodeFailure
+from matter.tlv import uint
+
+
+def OnOffPath(endpointId, attribute):
+    return AttributePath(EndpointId=endpointId, ClusterId=Clusters.OnOff.id, AttributeId=attribute.attribute_id)
+
+
+class TestAttributeCache(unittest.TestCase):
+    def test_cluster_view_incremental_update(self):
+        cache = AttributeCache(returnClusterObject=True)
+        cache.UpdateTLV(OnOffPath(1, Clusters.OnOff.Attributes.OnOff), 1, True)
+        cache.UpdateTLV(OnOffPath(1, Clusters.OnOff.Attributes.OnTime), 1, uint(5))
+        before = cache.GetUpdatedAttributeCache()[1][Clusters.OnOff]
+
+        cache.UpdateTLV(OnOffPath(1, Clusters.OnOff.Attributes.OnOff), 2, False)
+        after = cache.GetUpdatedAttributeCache()[1][Clusters.OnOff]
+
+        self.assertEqual((after.onOff, after.onTime, after.data_version), (False, 5, 2))
+        # Objects handed out earlier are not modified.
+        self.assertEqual((before.onOff, before.data_version), (True, 1))
+
+        # A decode failure turns the whole cluster into a ValueDecodeFailure, as for a full decode.
+        cache.UpdateTLV(OnOffPath(1, Clusters.OnOff.Attributes.OnTime), 3, 'invalid')
+        self.assertIsInstance(cache.GetUpdatedAttributeCache()[1][Clusters.OnOff], ValueDecodeFailure)
+
+    def test_unchanged_data_version_is_skipped(self):
+        cache = AttributeCache()
+        cache.UpdateTLV(OnOffPath(1, Clusters.OnOff.Attributes.OnOff), 1, True)
+        view = cache.GetUpdatedAttributeCache()[1][Clusters.OnOff]
+
+        cache.UpdateTLV(OnOffPath(1, Clusters.OnOff.Attributes.OnOff), 1, True)
+        self.assertFalse(cache._attributeCacheUpdateNeeded)
+
+        cache.UpdateTLV(OnOffPath(1, Clusters.OnOff.Attributes.OnOff), 2, False)
+        cache.GetUpdatedAttributeCache()
+        self.assertEqual(view, {DataVersion: 2, Clusters.OnOff.Attributes.OnOff: False})
+
+    def test_max_decoded_clusters(self):
+        cache = AttributeCache(returnClusterObject=True, maxDecodedClusters=2)
+        for endpointId in range(4):
+            cache.UpdateTLV(OnOffPath(endpointId, Clusters.OnOff.Attributes.OnTime), 1, uint(endpointId))
+        views = cache.GetUpdatedAttributeCache()
+
+        self.assertEqual(sum(len(endpoint) for endpoint in views.values()), 2)
+        self.assertNotIn(Clusters.OnOff, views[0])
+        # Evicted views are decoded again from the TLV data when looked up, evicting the least recently used one.
+        self.assertEqual(views[0][Clusters.OnOff].onTime, 0)
+        self.assertNotIn(Clusters.OnOff, views[2])
+        self.assertEqual(len(cache.attributeTLVCache), 4)
+
+        with self.assertRaises(KeyError):
+            views[0][Clusters.LevelControl]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -183,6 +183,16 @@ class TestClusterObjects(unittest.TestCase):
 
         self.assertEqual(res, data)
 
+    def test_descriptor_is_cached(self):
+        self.assertIs(TestClusterObjects.C.descriptor, TestClusterObjects.C.descriptor)
+        self.assertIsNot(TestClusterObjects.C.descriptor, TestClusterObjects.StructWithArray.descriptor)
+
+    def test_decode_failure_reports_field(self):
+        with self.assertRaisesRegex(ValueError, r"field \[1\]\.X, expected type"):
+            _encode_from_native_and_then_decode(
+                {1: [{0: uint(12), 1: 34}, {0: 'not-a-uint', 1: 78}]},
+                TestClusterObjects.StructWithArrayOfStructWithArray)
+
 
 class TestAttributeDescriptor(unittest.TestCase):
     class IntAttribute(ClusterObjects.ClusterAttributeDescriptor):
@@ -1,8 +1,14 @@
+import os
+import subprocess
+import sys
 import unittest
 
 from rich.pretty import pprint
 
 import matter.clusters as Clusters
+from matter.clusters.Attribute import AttributePath, TypedAttributePath
+from matter.clusters.Command import CommandPath, FindCommandClusterObject
+from matter.clusters.ObjectsManifest import CLUSTER_NAMES
 from matter.clusters.Types import NullValue
 
 '''
@@ -105,6 +111,36 @@ class TestGeneratedClusterObjects(unittest.TestCase):
 
         self.CheckData(data)
 
+    def test_find_command_cluster_object(self):
+        path = CommandPath(EndpointId=1, ClusterId=Clusters.UnitTesting.id,
+                           CommandId=Clusters.UnitTesting.Commands.Test.command_id)
+        self.assertIs(FindCommandClusterObject(True, path), Clusters.UnitTesting.Commands.Test)
+        # Responses share command ids with requests, so they are looked up separately.
+        self.assertIs(FindCommandClusterObject(False, path), Clusters.UnitTesting.Commands.TestSpecificResponse)
+        self.assertIsNone(FindCommandClusterObject(True, CommandPath(EndpointId=1, ClusterId=0xFFF1FC00, CommandId=0)))
+
+    def test_typed_attribute_path_from_path(self):
+        path = TypedAttributePath(Path=AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id,
+                                                     AttributeId=Clusters.OnOff.Attributes.OnOff.attribute_id))
+        self.assertIs(path.ClusterType, Clusters.OnOff)
+        self.assertIs(path.AttributeType, Clusters.OnOff.Attributes.OnOff)
+        self.assertEqual(path.AttributeName, 'onOff')
+
+        with self.assertRaises(KeyError):
+            TypedAttributePath(Path=AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id, AttributeId=0xFFF0))
+
+    def test_objects_manifest(self):
+        self.assertEqual(Clusters.Objects.__all__, ["Globals", *CLUSTER_NAMES.values()])
+        for clusterId, clusterName in CLUSTER_NAMES.items():
+            self.assertEqual(getattr(Clusters, clusterName).id, clusterId)
+
+    def test_objects_loaded_on_first_access(self):
+        statement = ("import sys; import matter.clusters as Clusters; "
+                     "assert 'matter.clusters.Objects' not in sys.modules; "
+                     "assert Clusters.ClusterObjects.ALL_CLUSTERS[Clusters.OnOff.id] is Clusters.OnOff")
+        subprocess.run([sys.executable, "-c", statement], check=True,
+                       env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+
 
 if __name__ == '__main__':
     unittest.main()
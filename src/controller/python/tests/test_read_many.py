@@ -0,0 +1,182 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import ctypes
+import unittest
+from unittest import mock
+
+import matter.clusters as Clusters
+from matter.ChipDeviceCtrl import ChipDeviceControllerBase
+from matter.clusters.Attribute import (AsyncReadTransaction, AttributePath, DataVersionFilter, EncodedReadPaths, EventPath,
+                                       _EncodedListForCffi)
+from matter.interaction_model import AttributePathIBstruct, DataVersionFilterIBstruct, EventPathIBstruct
+
+
+class TestEncodedReadPaths(unittest.TestCase):
+    def test_attribute_paths(self):
+        encoded = EncodedReadPaths.Encode([
+            AttributePath(EndpointId=1, ClusterId=6, AttributeId=0),
+            AttributePath(ClusterId=0x28),
+            AttributePath(),
+        ])
+        self.assertIsNone(encoded.DataVersionFilters)
+        self.assertIsNone(encoded.Events)
+
+        paths = [AttributePathIBstruct.parse(path) for path in encoded.Attributes]
+        self.assertEqual([(p.EndpointId, p.ClusterId, p.AttributeId) for p in paths], [
+            (1, 6, 0),
+            # Missing parts of the paths are wildcards
+            (0xFFFF, 0x28, 0xFFFFFFFF),
+            (0xFFFF, 0xFFFFFFFF, 0xFFFFFFFF),
+        ])
+
+    def test_data_version_filters(self):
+        encoded = EncodedReadPaths.Encode([AttributePath(EndpointId=0, ClusterId=0x28)],
+                                          [DataVersionFilter(EndpointId=0, ClusterId=0x28, DataVersion=0x12345678)])
+        flt = DataVersionFilterIBstruct.parse(encoded.DataVersionFilters[0])
+        self.assertEqual((flt.EndpointId, flt.ClusterId, flt.DataVersion), (0, 0x28, 0x12345678))
+
+        with self.assertRaises(ValueError):
+            EncodedReadPaths.Encode(None, [DataVersionFilter(EndpointId=0, ClusterId=0x28, DataVersion=1)])
+        with self.assertRaises(ValueError):
+            EncodedReadPaths.Encode([AttributePath()], [DataVersionFilter(EndpointId=0, ClusterId=0x28)])
+
+    def test_event_paths(self):
+        events = [EventPath(EndpointId=0, ClusterId=0x28, EventId=0, Urgent=1), EventPath()]
+
+        # Urgency only applies to subscriptions
+        for isSubscription, urgent in ((False, 0), (True, 1)):
+            encoded = EncodedReadPaths.Encode(events=events, isSubscription=isSubscription)
+            self.assertIsNone(encoded.Attributes)
+            paths = [EventPathIBstruct.parse(path) for path in encoded.Events]
+            self.assertEqual([(p.EndpointId, p.ClusterId, p.EventId, p.Urgent) for p in paths], [
+                (0, 0x28, 0, urgent),
+                (0xFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0),
+            ])
+
+    def test_empty(self):
+        encoded = EncodedReadPaths.Encode([], None, [])
+        self.assertEqual(encoded, EncodedReadPaths(Attributes=[], DataVersionFilters=None, Events=[]))
+        self.assertEqual(EncodedReadPaths.Encode(), EncodedReadPaths())
+
+    def test_list_for_cffi(self):
+        self.assertIsNone(_EncodedListForCffi(None))
+        self.assertEqual(len(_EncodedListForCffi([])), 0)
+
+        encoded = EncodedReadPaths.Encode([AttributePath(EndpointId=1), AttributePath(EndpointId=2)]).Attributes
+        pointers = _EncodedListForCffi(encoded)
+        self.assertEqual([ctypes.string_at(pointer, len(path)) for pointer, path in zip(pointers, encoded)], encoded)
+
+
+class FakeReads:
+    ''' Replaces ClusterAttribute.Read, completing the read of each node after the delay given for it. '''
+
+    def __init__(self, delays, failures=()):
+        self.delays = delays
+        self.failures = set(failures)
+        self.encodedPaths = []
+        self.started = []
+        self.inFlight = 0
+        self.maxInFlight = 0
+
+    def __call__(self, transaction, device, encodedPaths=None, **kwargs):
+        nodeId = transaction._nodeId
+        self.started.append(nodeId)
+        self.encodedPaths.append(encodedPaths)
+        self.inFlight += 1
+        self.maxInFlight = max(self.maxInFlight, self.inFlight)
+
+        def complete():
+            self.inFlight -= 1
+            if nodeId in self.failures:
+                transaction._future.set_exception(TimeoutError(f"node {nodeId} did not respond"))
+            elif not transaction._future.done():
+                transaction._future.set_result(None)
+        handle = asyncio.get_running_loop().call_later(self.delays[nodeId], complete)
+        transaction._future.add_done_callback(lambda future: handle.cancel() if future.cancelled() else None)
+        return mock.Mock()
+
+
+class TestReadMany(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # The native controller is not needed, only the Python side of ReadMany is exercised.
+        self.devCtrl = ChipDeviceControllerBase.__new__(ChipDeviceControllerBase)
+        self.devCtrl._isActive = False  # nothing to shut down
+        self.devCtrl.CheckIsActive = mock.Mock()
+        self.devCtrl.GetConnectedDevice = mock.AsyncMock(side_effect=self.GetConnectedDevice)
+        self.unreachable = set()
+
+    async def GetConnectedDevice(self, nodeId, **kwargs):
+        if nodeId in self.unreachable:
+            raise TimeoutError(f"node {nodeId} unreachable")
+        return mock.Mock()
+
+    async def ReadAll(self, reads, nodeIds, **kwargs):
+        with mock.patch("matter.clusters.Attribute.Read", new=reads):
+            return [item async for item in self.devCtrl.ReadMany(nodeIds, [(0, Clusters.BasicInformation)], **kwargs)]
+
+    async def test_results_in_completion_order(self):
+        reads = FakeReads({1: 0.03, 2: 0.01, 3: 0.02})
+        results = await self.ReadAll(reads, [1, 2, 3])
+
+        self.assertEqual([nodeId for nodeId, _ in results], [2, 3, 1])
+        for _, result in results:
+            self.assertIsInstance(result, AsyncReadTransaction.ReadResponse)
+        # The paths are encoded once for all the nodes.
+        self.assertEqual(len({id(paths) for paths in reads.encodedPaths}), 1)
+        self.assertEqual(len(reads.encodedPaths[0].Attributes), 1)
+
+    async def test_max_in_flight(self):
+        reads = FakeReads(dict.fromkeys(range(10), 0.01))
+        results = await self.ReadAll(reads, range(10), maxInFlight=3)
+
+        self.assertEqual(sorted(nodeId for nodeId, _ in results), list(range(10)))
+        self.assertEqual(reads.maxInFlight, 3)
+
+        with self.assertRaises(ValueError):
+            await self.ReadAll(reads, [1], maxInFlight=0)
+
+    async def test_errors(self):
+        self.unreachable = {2}
+        reads = FakeReads({1: 0.01, 2: 0.01, 3: 0.01}, failures={3})
+        results = dict(await self.ReadAll(reads, [1, 2, 3]))
+
+        # Errors are returned as the result of their node and do not stop the other reads.
+        self.assertIsInstance(results[1], AsyncReadTransaction.ReadResponse)
+        self.assertIsInstance(results[2], TimeoutError)
+        self.assertIsInstance(results[3], TimeoutError)
+        self.assertNotIn(2, reads.started)
+
+    async def test_close_early(self):
+        reads = FakeReads({nodeId: 0.01 * (nodeId + 1) for nodeId in range(10)})
+        with mock.patch("matter.clusters.Attribute.Read", new=reads):
+            results = self.devCtrl.ReadMany(range(10), [(0, Clusters.BasicInformation)], maxInFlight=2)
+            nodeId, _ = await anext(results)
+            self.assertEqual(nodeId, 0)
+            await results.aclose()
+
+            # The workers were cancelled, no other read is started.
+            started = list(reads.started)
+            await asyncio.sleep(0.1)
+            self.assertEqual(reads.started, started)
+            self.assertLess(len(started), 10)
+            self.assertEqual([task for task in asyncio.all_tasks() if task is not asyncio.current_task()], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from matter.storage import PersistentStorageJSONLog
+
+
+# The storage adapter of the native library is not needed to exercise the Python side of the storage.
+@mock.patch("matter.storage.GetLibraryHandle", mock.MagicMock())
+class TestPersistentStorageJSONLog(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "storage.jsonl")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def ReadLines(self):
+        with open(self.path) as f:
+            return f.read().splitlines()
+
+    def ReadRecords(self):
+        """Returns the batches of the log, as lists of their records."""
+        batches, batch = [], []
+        for line in self.ReadLines():
+            record = json.loads(line)
+            if record[0] == "commit":
+                self.assertEqual(record[1], len(batch))
+                batches.append(batch)
+                batch = []
+            else:
+                batch.append(record)
+        self.assertEqual(batch, [])
+        return batches
+
+    def test_reload(self):
+        with PersistentStorageJSONLog(self.path, flushIntervalSec=0) as storage:
+            storage.SetKey("caList", {"0": [1]})
+            storage.SetSdkKey("g/fidx", b"\x01\x02")
+            storage.SetSdkKey("g/lkgt", b"\x03")
+            storage.DeleteSdkKey("g/lkgt")
+            self.assertEqual([len(batch) for batch in self.ReadRecords()], [1, 1, 1, 1])
+
+        with PersistentStorageJSONLog(self.path) as storage:
+            self.assertEqual(storage.GetKey("caList"), {"0": [1]})
+            self.assertEqual(storage.GetSdkKey("g/fidx"), b"\x01\x02")
+            self.assertIsNone(storage.GetSdkKey("g/lkgt"))
+
+    def test_write_behind(self):
+        storage = PersistentStorageJSONLog(self.path, flushIntervalSec=60)
+        for i in range(100):
+            storage.SetSdkKey("g/s/counter", i.to_bytes(4, "little"))
+        storage.SetSdkKey("g/other", b"\x00")
+        self.assertFalse(os.path.exists(self.path))
+
+        # Repeated writes of a key are collapsed into a single record.
+        storage.Flush()
+        self.assertEqual([len(batch) for batch in self.ReadRecords()], [2])
+
+        storage.SetKey("key", "value")
+        storage.Shutdown()
+        with PersistentStorageJSONLog(self.path) as reloaded:
+            self.assertEqual(reloaded.GetKey("key"), "value")
+
+        with self.assertRaises(ValueError):
+            storage.SetSdkKey("g/other", None)
+        self.assertFalse(storage._pending)
+
+    def test_compaction(self):
+        with PersistentStorageJSONLog(self.path, flushIntervalSec=0, compactionRatio=4) as storage:
+            for i in range(8):
+                storage.SetSdkKey("g/s/counter", i.to_bytes(4, "little"))
+            # The fifth record triggered a compaction into a single record.
+            self.assertEqual([len(batch) for batch in self.ReadRecords()], [1, 1, 1, 1])
+
+    def test_truncated_record(self):
+        with PersistentStorageJSONLog(self.path, flushIntervalSec=0) as storage:
+            storage.SetSdkKey("a", b"\x01")
+        with open(self.path, "a") as f:
+            f.write('["sdk-config","b","A')
+
+        with PersistentStorageJSONLog(self.path, flushIntervalSec=0) as storage:
+            self.assertEqual(storage.GetSdkKey("a"), b"\x01")
+            self.assertIsNone(storage.GetSdkKey("b"))
+            storage.SetSdkKey("c", b"\x02")
+        self.assertEqual(self.ReadRecords(), [[["sdk-config", "a", "AQ=="]], [["sdk-config", "c", "Ag=="]]])
+
+    def test_uncommitted_batch(self):
+        storage = PersistentStorageJSONLog(self.path, flushIntervalSec=60)
+        storage.SetSdkKey("a", b"\x01")
+        storage.SetSdkKey("b", b"\x02")
+        storage.Shutdown()
+        # Drop the commit record of the batch, as if the process crashed before writing it.
+        lines = self.ReadLines()
+        with open(self.path, "w") as f:
+            f.write("\n".join(lines[:-1]) + "\n")
+
+        with PersistentStorageJSONLog(self.path, flushIntervalSec=0) as storage:
+            self.assertIsNone(storage.GetSdkKey("a"))
+            self.assertIsNone(storage.GetSdkKey("b"))
+        self.assertEqual(self.ReadRecords(), [[]])
+
+    def test_invalid_record(self):
+        with PersistentStorageJSONLog(self.path, flushIntervalSec=0) as storage:
+            storage.SetSdkKey("a", b"\x01")
+            storage.SetSdkKey("b", b"\x02")
+            storage.SetSdkKey("c", b"\x03")
+        lines = self.ReadLines()
+        lines[2] = "garbage"
+        with open(self.path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+        # The batches after the invalid record are ignored, even if they are valid.
+        with PersistentStorageJSONLog(self.path, flushIntervalSec=0) as storage:
+            self.assertEqual(storage.GetSdkKey("a"), b"\x01")
+            self.assertIsNone(storage.GetSdkKey("b"))
+            self.assertIsNone(storage.GetSdkKey("c"))
+        self.assertEqual(self.ReadRecords(), [[["sdk-config", "a", "AQ=="]]])
+
+    def test_failed_flush(self):
+        storage = PersistentStorageJSONLog(self.path, flushIntervalSec=60)
+        storage.SetSdkKey("a", b"\x01")
+        with mock.patch("matter.storage.os.fsync", side_effect=OSError("disk full")):
+            storage.Flush()
+        # The changes stay pending and the next flush rewrites the partially appended log.
+        self.assertTrue(storage._pending)
+        storage.SetSdkKey("b", b"\x02")
+        storage.Shutdown()
+        self.assertEqual(self.ReadRecords(), [[["sdk-config", "a", "AQ=="], ["sdk-config", "b", "Ag=="]]])
+
+        with PersistentStorageJSONLog(self.path) as reloaded:
+            self.assertEqual(reloaded.GetSdkKey("a"), b"\x01")
+            self.assertEqual(reloaded.GetSdkKey("b"), b"\x02")
+
+
+if __name__ == '__main__':
+    unittest.main()
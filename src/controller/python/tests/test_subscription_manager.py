@@ -0,0 +1,151 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import threading
+import unittest
+
+from matter.SubscriptionManager import SubscriptionManager
+
+
+class FakeSubscription:
+    def __init__(self, nodeId):
+        self.nodeId = nodeId
+        self.isShutdown = False
+
+    def SetReportBeginCallback(self, callback):
+        self.onReportBegin = callback
+
+    def SetAttributeUpdateCallback(self, callback):
+        self.onAttributeChange = callback
+
+    def SetEventUpdateCallback(self, callback):
+        self.onEvent = callback
+
+    def SetReportEndCallback(self, callback):
+        self.onReportEnd = callback
+
+    def SetErrorCallback(self, callback):
+        self.onError = callback
+
+    def SetResubscriptionAttemptedCallback(self, callback):
+        self.onResubscriptionAttempted = callback
+
+    def Shutdown(self):
+        self.isShutdown = True
+
+    def Report(self, paths, events=()):
+        ''' Delivers a report the way the Matter thread does. '''
+        def deliver():
+            self.onReportBegin(self)
+            for event in events:
+                self.onEvent(event, self)
+            for path in paths:
+                self.onAttributeChange(path, self)
+            self.onReportEnd(self)
+        thread = threading.Thread(target=deliver)
+        thread.start()
+        thread.join()
+
+
+class FakeController:
+    def __init__(self, unreachable=()):
+        self.unreachable = set(unreachable)
+        self.subscriptions = {}
+        self.concurrentReads = 0
+        self.maxConcurrentReads = 0
+        # Called with each subscription once established, before Read() returns.
+        self.onEstablished = None
+
+    async def Read(self, nodeId, attributes=None, events=None, reportInterval=None, onSubscriptionEstablished=None,
+                   **kwargs):
+        self.concurrentReads += 1
+        self.maxConcurrentReads = max(self.maxConcurrentReads, self.concurrentReads)
+        await asyncio.sleep(0.01)
+        self.concurrentReads -= 1
+        if nodeId in self.unreachable:
+            raise TimeoutError(f"node {nodeId} unreachable")
+        subscription = self.subscriptions[nodeId] = FakeSubscription(nodeId)
+        if onSubscriptionEstablished is not None:
+            onSubscriptionEstablished(subscription)
+        if self.onEstablished is not None:
+            self.onEstablished(subscription)
+        return subscription
+
+
+class TestSubscriptionManager(unittest.IsolatedAsyncioTestCase):
+    async def test_subscribe(self):
+        devCtrl = FakeController(unreachable=[3])
+        manager = SubscriptionManager(devCtrl, maxConcurrentEstablishments=2)
+
+        failures = await manager.Subscribe(range(1, 6), attributes=[()], reportInterval=(0, 10))
+
+        self.assertEqual(list(failures), [3])
+        self.assertIsInstance(failures[3], TimeoutError)
+        self.assertEqual(sorted(manager.Subscriptions), [1, 2, 4, 5])
+        self.assertEqual(devCtrl.maxConcurrentReads, 2)
+
+    async def test_reports_are_batched(self):
+        devCtrl = FakeController()
+        manager = SubscriptionManager(devCtrl)
+        await manager.Subscribe([1, 2], attributes=[()])
+
+        devCtrl.subscriptions[1].Report(['a', 'b'], events=['e'])
+        devCtrl.subscriptions[2].Report(['c'])
+        devCtrl.subscriptions[1].Report(['d'])
+
+        reports = [await asyncio.wait_for(manager.NextReport(), 1) for _ in range(3)]
+        self.assertEqual([(r.NodeId, r.Attributes, r.Events) for r in reports],
+                         [(1, ['a', 'b'], ['e']), (2, ['c'], []), (1, ['d'], [])])
+        self.assertIs(reports[0].Subscription, devCtrl.subscriptions[1])
+        self.assertEqual(manager.DrainReports(), [])
+
+        stats = manager.Stats[1]
+        self.assertEqual((stats.Reports, stats.DeliveredReports, stats.AttributeChanges, stats.Events), (2, 2, 3, 1))
+        self.assertGreaterEqual(stats.MaxLagSec, stats.LastLagSec)
+
+    async def test_reports_before_read_returns(self):
+        devCtrl = FakeController()
+        manager = SubscriptionManager(devCtrl)
+
+        def onEstablished(subscription):
+            # The Matter thread may deliver reports and errors before the coroutine awaiting Read() resumes.
+            subscription.Report(['early'])
+            subscription.onError(1, subscription)
+        devCtrl.onEstablished = onEstablished
+        await manager.Subscribe([1], attributes=[()])
+
+        report = await asyncio.wait_for(manager.NextReport(), 1)
+        self.assertEqual((report.NodeId, report.Attributes), (1, ['early']))
+        self.assertEqual((manager.Stats[1].Reports, manager.Stats[1].Errors), (1, 1))
+
+    async def test_shutdown(self):
+        devCtrl = FakeController()
+        manager = SubscriptionManager(devCtrl)
+        await manager.Subscribe([1, 2], attributes=[()])
+
+        manager.Unsubscribe(1)
+        self.assertTrue(devCtrl.subscriptions[1].isShutdown)
+        self.assertEqual(list(manager.Subscriptions), [2])
+
+        manager.Shutdown()
+        self.assertTrue(devCtrl.subscriptions[2].isShutdown)
+        self.assertEqual(manager.Subscriptions, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
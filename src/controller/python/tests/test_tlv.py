@@ -17,7 +17,8 @@
 
 import unittest
 
-from matter.tlv import TLVList, TLVReader, TLVWriter
+from matter.tlv import (TLV_TYPE_ARRAY, TLV_TYPE_STRUCTURE, TLV_TYPE_UNSIGNED_INTEGER, TLV_TYPE_UTF8_STRING, TLVElement,
+                        TLVEndOfContainer, TLVIterator, TLVList, TLVReader, TLVWriter)
 from matter.tlv import uint as tlvUint
 
 
@@ -130,6 +131,42 @@ class TestTLVWriter(unittest.TestCase):
                                                0x18   # End of container
                                                ]))
 
+    def test_int_array(self):
+        cases = [
+            [],
+            [1, 2, 3],
+            [0x100, 0xffff],
+            [1, 0x100, 0x10000, 0x100000000],
+            [0xdeadbeefca0000fe, 0x100000000],
+        ]
+        for vals in cases:
+            writer = TLVWriter()
+            writer.putUnsignedIntArray(None, vals)
+            self.assertEqual(writer.encoding, self._getEncoded([tlvUint(v) for v in vals]))
+
+        cases = [
+            [-1, 0, 1],
+            [-0x100, 0x100],
+            [-1, 0x7fffffff, -0x5555555555555555],
+        ]
+        for vals in cases:
+            writer = TLVWriter()
+            writer.putSignedIntArray(None, vals)
+            self.assertEqual(writer.encoding, self._getEncoded(vals))
+
+        with self.assertRaises(ValueError):
+            TLVWriter().putUnsignedIntArray(None, [1, -1])
+
+    def test_profile_tag(self):
+        writer = TLVWriter()
+        writer.put(None, {(0x235A0000, 0x12345678): 1})
+        self.assertEqual(writer.encoding, bytearray([0b00010101,  # Structure, anonymous tag
+                                                     0b11100000,  # Fully qualified 8-byte tag, 1 octet signed int
+                                                     0x5a, 0x23, 0x00, 0x00, 0x78, 0x56, 0x34, 0x12,
+                                                     0x01,
+                                                     0x18  # End of container
+                                                     ]))
+
 
 class TestTLVReader(unittest.TestCase):
     def _read_case(self, data, answer):
@@ -195,6 +232,97 @@ class TestTLVReader(unittest.TestCase):
                          0x18   # End of container
                          ], TLVList([(None, 1), (None, TLVList([(None, 2), (3, 4)]))]))
 
+    def test_round_trip(self):
+        val = {
+            1: 0,
+            2: 65536,
+            3: True,
+            4: None,
+            5: "Hello!",
+            6: b'\xde\xad\xbe\xef',
+            7: ["Goodbye!", 71024724507, False, 1.5],
+            8: "x" * 300,
+            (0, 9): tlvUint(1),
+            (None, 70000): -2,
+            (0x235A0000, 42): "FOO",
+        }
+        writer = TLVWriter()
+        writer.put(None, val)
+        self.assertEqual(TLVReader(writer.encoding).get()["Any"], val)
+        self.assertEqual(TLVReader(memoryview(bytes(writer.encoding))).get()["Any"], val)
+
+    def test_string(self):
+        self._read_case([0b00001100, 0x02, 0x68, 0x69], "hi")
+        self._read_case([0b00001101, 0x02, 0x00, 0x68, 0x69], "hi")
+        # Invalid UTF-8 data is returned as raw bytes.
+        self._read_case([0b00001100, 0x02, 0xff, 0xfe], b'\xff\xfe')
+        self._read_case([0b00010000, 0x02, 0xff, 0xfe], b'\xff\xfe')
+        with self.assertRaises(ValueError):
+            TLVReader(bytearray([0b00010000, 0x04, 0xff, 0xfe])).get()
+
+    def test_unsupported_type(self):
+        with self.assertRaises(ValueError):
+            TLVReader(bytearray([0b00011001])).get()
+
+    def test_decodings(self):
+        data = bytearray([0b00010101,  # Structure, anonymous tag
+                          0b00100100, 0x01, 0x2a,  # Context specific tag `1`, 1 octet unsigned int `42`
+                          0x18  # End of container
+                          ])
+        reader = TLVReader(data)
+        reader.get()
+        self.assertEqual(reader.decoding, [])
+
+        reader = TLVReader(data, keepDecodings=True)
+        self.assertEqual(reader.get(), {"Any": {1: 42}})
+        self.assertEqual(len(reader.decoding), 1)
+        structure = reader.decoding[0]
+        self.assertEqual(structure["type"], "Structure")
+        self.assertEqual(structure["tagControl"], "Anonymous")
+        self.assertEqual([d["type"] for d in structure["Structure"]],
+                         ["Unsigned Integer 1-byte value", "End of Collection"])
+        self.assertEqual(structure["Structure"][0]["tag"], 1)
+        self.assertEqual(structure["Structure"][0]["value"], 42)
+
+
+class TestTLVIterator(unittest.TestCase):
+    def _encode(self, val):
+        writer = TLVWriter()
+        writer.put(None, val)
+        return writer.encoding
+
+    def test_events(self):
+        encoding = self._encode({1: tlvUint(2), 2: ["a"]})
+        self.assertEqual(list(TLVIterator(encoding)), [
+            TLVElement(0, None, TLV_TYPE_STRUCTURE, None),
+            TLVElement(1, 1, TLV_TYPE_UNSIGNED_INTEGER, 2),
+            TLVElement(1, 2, TLV_TYPE_ARRAY, None),
+            TLVElement(2, None, TLV_TYPE_UTF8_STRING, "a"),
+            TLVElement(1, None, TLVEndOfContainer, None),
+            TLVElement(0, None, TLVEndOfContainer, None),
+        ])
+
+    def test_skip_and_read_container(self):
+        encoding = self._encode({1: [1, {2: "b"}], 2: TLVList([(1, 2)]), 3: {4: [5]}, 6: True})
+        it = TLVIterator(encoding)
+        self.assertEqual(next(it).type, TLV_TYPE_STRUCTURE)
+        self.assertEqual(next(it).tag, 1)
+        it.skipContainer()
+        self.assertEqual(next(it).tag, 2)
+        self.assertEqual(it.readContainer(), TLVList([(1, 2)]))
+        self.assertEqual(next(it).tag, 3)
+        self.assertEqual(it.readContainer(), {4: [5]})
+        self.assertEqual(next(it), TLVElement(1, 6, 0x08, True))
+        self.assertEqual(next(it), TLVElement(0, None, TLVEndOfContainer, None))
+        self.assertEqual(list(it), [])
+
+    def test_not_at_container_start(self):
+        it = TLVIterator(self._encode({1: 2}))
+        next(it)
+        next(it)
+        with self.assertRaises(ValueError):
+            it.skipContainer()
+
 
 class TestTLVTypes(unittest.TestCase):
     def test_list(self):
@@ -38,7 +38,6 @@
 #     quiet: true
 # === END CI TEST ARGUMENTS ===
 
-import sys
 
 from mobly import asserts
 
@@ -55,7 +54,7 @@ from matter.testing.runner import default_matter_test_main
 
 
 def str_to_cluster(s):
-    return getattr(sys.modules["matter.clusters.Objects"], s)
+    return getattr(Clusters, s)
 
 
 def str_to_attribute(cluster, s):
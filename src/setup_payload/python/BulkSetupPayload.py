@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2026 Project CHIP Authors
+# All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Generates and parses the onboarding codes of many devices at once, with the
+# fields of the payloads held in numpy arrays and the bit packing, Base38 and
+# Verhoeff computations done on whole arrays.
+
+import random
+import time
+
+import Base38
+import click
+import numpy as np
+from SetupPayload import CommissioningFlow, SetupPayload
+
+QRCODE_PREFIX = 'MT:'
+QRCODE_LEN = 22
+SHORT_MANUALCODE_LEN = 11
+LONG_MANUALCODE_LEN = 21
+
+# The 11 bytes of the qrcode payload are encoded in chunks of 3 bytes (5 characters), the last one being 2 bytes (4 characters)
+QRCODE_CHUNKS = [(3, 5), (3, 5), (3, 5), (2, 4)]
+
+# Verhoeff tables, as used by stdnum.verhoeff
+VERHOEFF_MULTIPLICATION = np.array([
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 2, 3, 4, 0, 6, 7, 8, 9, 5],
+    [2, 3, 4, 0, 1, 7, 8, 9, 5, 6],
+    [3, 4, 0, 1, 2, 8, 9, 5, 6, 7],
+    [4, 0, 1, 2, 3, 9, 5, 6, 7, 8],
+    [5, 9, 8, 7, 6, 0, 4, 3, 2, 1],
+    [6, 5, 9, 8, 7, 1, 0, 4, 3, 2],
+    [7, 6, 5, 9, 8, 2, 1, 0, 4, 3],
+    [8, 7, 6, 5, 9, 3, 2, 1, 0, 4],
+    [9, 8, 7, 6, 5, 4, 3, 2, 1, 0],
+], dtype=np.uint8)
+VERHOEFF_PERMUTATION = np.array([
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 5, 7, 6, 2, 8, 3, 0, 9, 4],
+    [5, 8, 0, 3, 7, 9, 6, 1, 4, 2],
+    [8, 9, 1, 6, 0, 4, 3, 5, 2, 7],
+    [9, 4, 5, 3, 1, 2, 6, 8, 7, 0],
+    [4, 2, 8, 6, 5, 7, 3, 9, 0, 1],
+    [2, 7, 9, 3, 8, 0, 6, 4, 1, 5],
+    [7, 0, 4, 6, 9, 1, 3, 2, 5, 8],
+], dtype=np.uint8)
+VERHOEFF_INVERSE = np.array([list(row).index(0) for row in VERHOEFF_MULTIPLICATION], dtype=np.uint8)
+
+BASE38_CODES = np.frombuffer(''.join(Base38.CODES).encode('ascii'), dtype=np.uint8)
+BASE38_VALUES = np.full(256, 0xFF, dtype=np.uint8)
+BASE38_VALUES[BASE38_CODES] = np.arange(len(BASE38_CODES), dtype=np.uint8)
+
+
+def _to_strings(chars, lengths=None):
+    ''' Converts a 2D array of ascii characters, one string per row, to a list of strings. '''
+    if lengths is not None:
+        chars = np.where(np.arange(chars.shape[1]) < lengths[:, None], chars, 0).astype(np.uint8)
+    return np.ascontiguousarray(chars).view('S{}'.format(chars.shape[1])).ravel().astype(str).tolist()
+
+
+def _to_chars(codes, width):
+    ''' Converts a list of strings to a 2D array of ascii characters, zero padded to width, and the lengths of the strings. '''
+    codes = list(codes)
+    lengths = np.fromiter(map(len, codes), dtype=np.int64, count=len(codes))
+    try:
+        # Longer strings are truncated, their lengths make them invalid anyway
+        encoded = np.array(codes, dtype='S{}'.format(width))
+    except UnicodeEncodeError:
+        encoded = np.array([code.encode('ascii', errors='replace') for code in codes], dtype='S{}'.format(width))
+    return encoded.view(np.uint8).reshape(-1, width), lengths
+
+
+def _digits(values, width):
+    ''' Returns the decimal digits of the values, most significant first, zero padded to width. '''
+    values = values.astype(np.uint64)
+    digits = np.empty((len(values), width), dtype=np.uint8)
+    for i in range(width - 1, -1, -1):
+        digits[:, i] = values % 10
+        values //= 10
+    return digits
+
+
+def _number(digits):
+    ''' Returns the values of rows of decimal digits, most significant first. '''
+    values = np.zeros(len(digits), dtype=np.uint64)
+    for i in range(digits.shape[1]):
+        values = values * np.uint64(10) + digits[:, i]
+    return values
+
+
+def verhoeff_checksum(digits):
+    ''' Returns the Verhoeff checksum of rows of decimal digits, 0 for the rows ending with a valid check digit. '''
+    check = np.zeros(len(digits), dtype=np.uint8)
+    for i in range(digits.shape[1]):
+        check = VERHOEFF_MULTIPLICATION[check, VERHOEFF_PERMUTATION[i % 8][digits[:, -1 - i]]]
+    return check
+
+
+def verhoeff_check_digits(digits):
+    ''' Returns the Verhoeff check digit of rows of decimal digits. '''
+    return VERHOEFF_INVERSE[verhoeff_checksum(np.concatenate([digits, np.zeros((len(digits), 1), dtype=np.uint8)], axis=1))]
+
+
+class BulkSetupPayload:
+    '''
+    Setup payloads of many devices, each field being an array with one element per device.
+
+    Scalar arguments are broadcast to all the devices, e.g.:
+
+        payloads = BulkSetupPayload(discriminators, passcodes, vid=0xFFF1, pid=0x8000)
+        qrcodes = payloads.generate_qrcodes()
+
+    The payloads parsed from onboarding codes have a valid array flagging the codes that could be parsed, the fields
+    of the invalid ones are 0. As for SetupPayload, the payloads parsed from manual codes have no long discriminator
+    and no discovery capabilities, their vid and pid are 0 when not present.
+    '''
+
+    def __init__(self, discriminator, pincode, rendezvous=4, flow=CommissioningFlow.Standard, vid=0, pid=0):
+        arrays = np.broadcast_arrays(*(np.asarray(value, dtype=np.int64)
+                                       for value in (discriminator, pincode, rendezvous, flow, vid, pid)))
+        self.long_discriminator, self.pincode, self.discovery, self.flow, self.vid, self.pid = (
+            np.atleast_1d(array).copy() for array in arrays)
+        self.short_discriminator = self.long_discriminator >> 8
+        self.valid = np.ones(len(self.pincode), dtype=bool)
+
+    def __len__(self):
+        return len(self.pincode)
+
+    def __getitem__(self, index):
+        ''' Returns the SetupPayload of one device, None if it is not valid. '''
+        if not self.valid[index]:
+            return None
+        if self.long_discriminator is None:
+            vid_pid_present = self.flow[index] != CommissioningFlow.Standard
+            payload = SetupPayload(discriminator=int(self.short_discriminator[index]), pincode=int(self.pincode[index]),
+                                   vid=int(self.vid[index]) if vid_pid_present else None,
+                                   pid=int(self.pid[index]) if vid_pid_present else None)
+            payload.short_discriminator = int(self.short_discriminator[index])
+            payload.long_discriminator = None
+            payload.discovery = None
+            payload.flow = int(self.flow[index])
+            return payload
+        return SetupPayload(int(self.long_discriminator[index]), int(self.pincode[index]), int(self.discovery[index]),
+                            CommissioningFlow(int(self.flow[index])), int(self.vid[index]), int(self.pid[index]))
+
+    def _check_ranges(self, with_long_discriminator):
+        fields = [('pincode', self.pincode, 0x7FFFFFF), ('flow', self.flow, 2), ('vid', self.vid, 0xFFFF),
+                  ('pid', self.pid, 0xFFFF)]
+        if with_long_discriminator:
+            fields += [('discriminator', self.long_discriminator, 0xFFF), ('discovery', self.discovery, 0xFF)]
+        else:
+            fields += [('short discriminator', self.short_discriminator, 0xF)]
+        for name, values, max_value in fields:
+            if ((values < 0) | (values > max_value)).any():
+                raise ValueError('{} out of range [0, {}]'.format(name, max_value))
+
+    def generate_qrcodes(self):
+        self._check_ranges(with_long_discriminator=True)
+        u64 = np.uint64
+        pincode = self.pincode.astype(u64)
+        # Payload bits, lsb first: version (3), vid (16), pid (16), flow (2), discovery (8), discriminator (12),
+        # pincode (27) and padding (4), split into the 64 low bits and the 24 high bits
+        low = (self.vid.astype(u64) << u64(3)) | (self.pid.astype(u64) << u64(19)) | (self.flow.astype(u64) << u64(35)) | \
+            (self.discovery.astype(u64) << u64(37)) | (self.long_discriminator.astype(u64) << u64(45)) | \
+            ((pincode & u64(0x7F)) << u64(57))
+        high = pincode >> u64(7)
+        chunks = [low & u64(0xFFFFFF), (low >> u64(24)) & u64(0xFFFFFF),
+                  ((low >> u64(48)) | (high << u64(16))) & u64(0xFFFFFF), (high >> u64(8)) & u64(0xFFFF)]
+
+        chars = np.empty((len(self), QRCODE_LEN), dtype=np.uint8)
+        chars[:, :len(QRCODE_PREFIX)] = np.frombuffer(QRCODE_PREFIX.encode('ascii'), dtype=np.uint8)
+        column = len(QRCODE_PREFIX)
+        for chunk, (_, chars_in_chunk) in zip(chunks, QRCODE_CHUNKS):
+            for _ in range(chars_in_chunk):
+                chars[:, column] = BASE38_CODES[chunk % u64(Base38.RADIX)]
+                chunk //= u64(Base38.RADIX)
+                column += 1
+        return _to_strings(chars)
+
+    def generate_manualcodes(self):
+        self._check_ranges(with_long_discriminator=False)
+        vid_pid_present = self.flow != CommissioningFlow.Standard
+        pincode = self.pincode.astype(np.uint64)
+        short_discriminator = self.short_discriminator.astype(np.uint64)
+
+        digits = np.concatenate([
+            _digits((vid_pid_present.astype(np.uint64) << np.uint64(2)) | (short_discriminator >> np.uint64(2)), 1),
+            _digits(((short_discriminator & np.uint64(3)) << np.uint64(14)) | (pincode & np.uint64(0x3FFF)), 5),
+            _digits(pincode >> np.uint64(14), 4),
+            _digits(self.vid, 5),
+            _digits(self.pid, 5),
+            np.zeros((len(self), 1), dtype=np.uint8),
+        ], axis=1)
+        # The check digit follows the vid and pid of the long codes, the short codes end after the pincode
+        lengths = np.where(vid_pid_present, LONG_MANUALCODE_LEN, SHORT_MANUALCODE_LEN)
+        for length in (SHORT_MANUALCODE_LEN, LONG_MANUALCODE_LEN):
+            rows = lengths == length
+            digits[rows, length - 1] = verhoeff_check_digits(digits[rows, :length - 1])
+        return _to_strings(digits + ord('0'), lengths)
+
+    @staticmethod
+    def _from_fields(valid, **fields):
+        payloads = BulkSetupPayload.__new__(BulkSetupPayload)
+        for name, values in fields.items():
+            setattr(payloads, name, None if values is None else np.where(valid, values, 0).astype(np.int64))
+        payloads.valid = valid
+        return payloads
+
+    @staticmethod
+    def parse_qrcodes(codes):
+        chars, lengths = _to_chars(codes, QRCODE_LEN)
+        prefix = np.frombuffer(QRCODE_PREFIX.encode('ascii'), dtype=np.uint8)
+        values = BASE38_VALUES[chars[:, len(QRCODE_PREFIX):]]
+        valid = (lengths == QRCODE_LEN) & (chars[:, :len(QRCODE_PREFIX)] == prefix).all(axis=1) & (values != 0xFF).all(axis=1)
+
+        u64 = np.uint64
+        values = np.where(valid[:, None], values, 0).astype(u64)
+        chunks = []
+        column = 0
+        for bytes_in_chunk, chars_in_chunk in QRCODE_CHUNKS:
+            chunk = np.zeros(len(values), dtype=u64)
+            for i in range(chars_in_chunk - 1, -1, -1):
+                chunk = chunk * u64(Base38.RADIX) + values[:, column + i]
+            valid &= chunk < (1 << (8 * bytes_in_chunk))
+            chunks.append(chunk)
+            column += chars_in_chunk
+
+        low = chunks[0] | (chunks[1] << u64(24)) | ((chunks[2] & u64(0xFFFF)) << u64(48))
+        high = (chunks[2] >> u64(16)) | (chunks[3] << u64(8))
+        flow = (low >> u64(35)) & u64(3)
+        valid &= flow <= CommissioningFlow.Custom
+        long_discriminator = (low >> u64(45)) & u64(0xFFF)
+        return BulkSetupPayload._from_fields(
+            valid,
+            long_discriminator=long_discriminator,
+            short_discriminator=long_discriminator >> u64(8),
+            pincode=(low >> u64(57)) | ((high & u64(0xFFFFF)) << u64(7)),
+            discovery=(low >> u64(37)) & u64(0xFF),
+            flow=flow,
+            vid=(low >> u64(3)) & u64(0xFFFF),
+            pid=(low >> u64(19)) & u64(0xFFFF))
+
+    @staticmethod
+    def parse_manualcodes(codes):
+        chars, lengths = _to_chars(codes, LONG_MANUALCODE_LEN)
+        digits = chars - np.uint8(ord('0'))
+        in_code = np.arange(LONG_MANUALCODE_LEN) < lengths[:, None]
+        valid = ((digits <= 9) | ~in_code).all(axis=1)
+        digits = np.where(in_code & valid[:, None], digits, 0).astype(np.uint8)
+
+        # Version 0 only, the vid_pid_present bit tells whether it is a long code
+        first_digit = digits[:, 0]
+        vid_pid_present = (first_digit & 4) != 0
+        valid &= (first_digit <= 7) & (lengths == np.where(vid_pid_present, LONG_MANUALCODE_LEN, SHORT_MANUALCODE_LEN))
+        for length in (SHORT_MANUALCODE_LEN, LONG_MANUALCODE_LEN):
+            rows = valid & (lengths == length)
+            valid[rows] = verhoeff_checksum(digits[rows, :length]) == 0
+
+        chunk2 = _number(digits[:, 1:6])
+        chunk3 = _number(digits[:, 6:10])
+        vid = np.where(vid_pid_present, _number(digits[:, 10:15]), 0)
+        pid = np.where(vid_pid_present, _number(digits[:, 15:20]), 0)
+        valid &= (chunk2 <= 0xFFFF) & (chunk3 <= 0x1FFF) & (vid <= 0xFFFF) & (pid <= 0xFFFF)
+
+        return BulkSetupPayload._from_fields(
+            valid,
+            long_discriminator=None,
+            short_discriminator=((first_digit.astype(np.uint64) & np.uint64(3)) << np.uint64(2)) | (chunk2 >> np.uint64(14)),
+            pincode=(chunk3 << np.uint64(14)) | (chunk2 & np.uint64(0x3FFF)),
+            discovery=None,
+            flow=np.where(vid_pid_present, int(CommissioningFlow.Custom), int(CommissioningFlow.Standard)),
+            vid=vid,
+            pid=pid)
+
+
+def random_payloads(count, seed=None):
+    rng = np.random.default_rng(seed)
+    return BulkSetupPayload(rng.integers(0, 0x1000, count), rng.integers(1, 0x5F5E0FF, count),
+                            rng.integers(0, 8, count), rng.integers(0, 3, count),
+                            rng.integers(0, 0x10000, count), rng.integers(0, 0x10000, count))
+
+
+def cross_check(payloads, qrcodes, manualcodes, indices):
+    ''' Checks the codes of the given devices against the ones of SetupPayload, returns the number of mismatches. '''
+    mismatches = 0
+    for i in indices:
+        payload = payloads[i]
+        if payload.generate_qrcode() != qrcodes[i] or payload.generate_manualcode() != manualcodes[i]:
+            click.echo('Mismatch for {}: {} {}'.format(payload.qrcode_dict(), qrcodes[i], manualcodes[i]))
+            mismatches += 1
+    return mismatches
+
+
+@click.group()
+def cli():
+    pass
+
+
+@cli.command()
+@click.option('--count', '-n', type=click.IntRange(1), default=1000000, show_default=True,
+              help='Number of random payloads')
+@click.option('--check-count', type=click.IntRange(0), default=10000, show_default=True,
+              help='Number of the payloads encoded and parsed with SetupPayload, to compare the codes and the timings')
+@click.option('--seed', type=int, help='Seed of the random payloads')
+def benchmark(count, check_count, seed):
+    ''' Times the bulk encoding and parsing against SetupPayload, and cross-checks their results. '''
+    payloads = random_payloads(count, seed)
+
+    def timed(name, items, function):
+        start = time.perf_counter()
+        result = function()
+        duration = time.perf_counter() - start
+        click.echo('{:<36}: {:>9.3f} s, {:>8.2f} us per code'.format(name, duration, duration * 1e6 / max(items, 1)))
+        return result
+
+    qrcodes = timed('Bulk QR code generation', count, payloads.generate_qrcodes)
+    manualcodes = timed('Bulk manual code generation', count, payloads.generate_manualcodes)
+    parsed_qrcodes = timed('Bulk QR code parsing', count, lambda: BulkSetupPayload.parse_qrcodes(qrcodes))
+    parsed_manualcodes = timed('Bulk manual code parsing', count, lambda: BulkSetupPayload.parse_manualcodes(manualcodes))
+
+    errors = 0
+    for name in ('long_discriminator', 'pincode', 'discovery', 'flow', 'vid', 'pid'):
+        errors += not np.array_equal(getattr(parsed_qrcodes, name), getattr(payloads, name))
+    vid_pid_present = payloads.flow != CommissioningFlow.Standard
+    errors += not np.array_equal(parsed_manualcodes.short_discriminator, payloads.short_discriminator)
+    errors += not np.array_equal(parsed_manualcodes.pincode, payloads.pincode)
+    errors += not np.array_equal(parsed_manualcodes.vid, np.where(vid_pid_present, payloads.vid, 0))
+    errors += not np.array_equal(parsed_manualcodes.pid, np.where(vid_pid_present, payloads.pid, 0))
+    errors += not (parsed_qrcodes.valid.all() and parsed_manualcodes.valid.all())
+
+    indices = random.Random(seed).sample(range(count), min(check_count, count))
+    if indices:
+        timed('SetupPayload QR code generation', len(indices), lambda: [payloads[i].generate_qrcode() for i in indices])
+        timed('SetupPayload manual code generation', len(indices),
+              lambda: [payloads[i].generate_manualcode() for i in indices])
+        timed('SetupPayload QR code parsing', len(indices), lambda: [SetupPayload.parse(qrcodes[i]) for i in indices])
+        timed('SetupPayload manual code parsing', len(indices),
+              lambda: [SetupPayload.parse(manualcodes[i]) for i in indices])
+        errors += cross_check(payloads, qrcodes, manualcodes, indices)
+
+    if errors:
+        raise click.ClickException('{} mismatches between the bulk and the per code results'.format(errors))
+    click.echo('Bulk results of {} payloads consistent, {} cross-checked with SetupPayload'.format(count, len(indices)))
+
+
+if __name__ == '__main__':
+    cli()
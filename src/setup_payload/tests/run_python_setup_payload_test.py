@@ -21,6 +21,7 @@ import sys
 
 CHIP_TOPDIR = os.path.dirname(os.path.realpath(__file__))[:-len(os.path.join('src', 'setup_payload', 'tests'))]
 sys.path.insert(0, os.path.join(CHIP_TOPDIR, 'src', 'setup_payload', 'python'))
+from BulkSetupPayload import BulkSetupPayload, random_payloads  # noqa: E402
 from SetupPayload import CommissioningFlow, SetupPayload  # noqa: E402
 
 
@@ -201,11 +202,34 @@ def test_onboardingcode_parsing():
         assert payload.pid == test_payload['res']['ProductID']
 
 
+def test_bulk_onboardingcodes():
+    payloads = random_payloads(2000, seed=0)
+    qrcodes = payloads.generate_qrcodes()
+    manualcodes = payloads.generate_manualcodes()
+
+    for i in range(len(payloads)):
+        assert qrcodes[i] == payloads[i].generate_qrcode()
+        assert manualcodes[i] == payloads[i].generate_manualcode()
+
+    parsed_qrcodes = BulkSetupPayload.parse_qrcodes(qrcodes)
+    parsed_manualcodes = BulkSetupPayload.parse_manualcodes(manualcodes)
+    for i in range(len(payloads)):
+        assert vars(parsed_qrcodes[i]) == vars(SetupPayload.parse(qrcodes[i]))
+        assert vars(parsed_manualcodes[i]) == vars(SetupPayload.parse(manualcodes[i]))
+
+    # Wrong length, prefix, character, check digit and first digit
+    invalid_qrcodes = ['MT:00000CQM00KA0648G0', 'MT:00000CQM00KA0648G000', 'XX:00000CQM00KA0648G00', 'MT:00000CQM00KA0648g00']
+    assert not BulkSetupPayload.parse_qrcodes(invalid_qrcodes).valid.any()
+    invalid_manualcodes = ['3497011233', '34970112333', '84970112332', '745492075300001000014', '3497011233A']
+    assert not BulkSetupPayload.parse_manualcodes(invalid_manualcodes).valid.any()
+
+
 def main():
     if len(sys.argv) == 2:
         chip_tool = sys.argv[1]
         test_code_generation(chip_tool)
         test_onboardingcode_parsing()
+        test_bulk_onboardingcodes()
 
 
 if __name__ == '__main__':